@@ -0,0 +1,54 @@
+"""Added product stock reservations
+
+Revision ID: 3c5e1f9a7b21
+Revises: 2e1107951546
+Create Date: 2026-10-19 10:12:41.215307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e1f9a7b21'
+down_revision: Union[str, None] = '2e1107951546'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('product_stock_reservations',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('order_id', sa.Integer(), nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('variant_id', sa.Integer(), nullable=True),
+    sa.Column('qty', sa.Integer(), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('is_committed', sa.Boolean(), nullable=False),
+    sa.Column('released_at', sa.DateTime(), nullable=True),
+    sa.Column('release_reason', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['order_id'], ['product_orders.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['variant_id'], ['product_variants.id'], onupdate='CASCADE', ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_product_stock_reservations_order_id', 'product_stock_reservations', ['order_id'], unique=False)
+    # Частичный индекс для задачи снятия просроченных резервов
+    op.create_index(
+        'ix_product_stock_reservations_active_expires_at',
+        'product_stock_reservations',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_product_stock_reservations_active_expires_at', table_name='product_stock_reservations')
+    op.drop_index('ix_product_stock_reservations_order_id', table_name='product_stock_reservations')
+    op.drop_table('product_stock_reservations')
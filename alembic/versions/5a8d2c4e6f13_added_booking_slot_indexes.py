@@ -0,0 +1,28 @@
+"""Added booking slot indexes
+
+Revision ID: 5a8d2c4e6f13
+Revises: 3c5e1f9a7b21
+Create Date: 2026-10-19 11:02:17.481950
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a8d2c4e6f13'
+down_revision: Union[str, None] = '3c5e1f9a7b21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_booking_field_party_requests_active_slot', 'booking_field_party_requests', ['field_party_id', 'start_at', 'end_at'], unique=False, postgresql_where=sa.text('is_active'))
+    op.create_index('ix_booking_field_party_requests_active_reschedule_slot', 'booking_field_party_requests', ['field_party_id', 'reschedule_start_at', 'reschedule_end_at'], unique=False, postgresql_where=sa.text('is_active AND reschedule_start_at IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_booking_field_party_requests_active_reschedule_slot', table_name='booking_field_party_requests', postgresql_where=sa.text('is_active AND reschedule_start_at IS NOT NULL'))
+    op.drop_index('ix_booking_field_party_requests_active_slot', table_name='booking_field_party_requests', postgresql_where=sa.text('is_active'))
@@ -0,0 +1,48 @@
+"""Added product full text search
+
+Revision ID: 7b3e9d1f2a64
+Revises: 5a8d2c4e6f13
+Create Date: 2026-10-19 12:21:08.734105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e9d1f2a64'
+down_revision: Union[str, None] = '5a8d2c4e6f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PRODUCT_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian', coalesce(title_ru, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title_kk, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(sku, '') || ' ' || coalesce(value, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description_ru, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description_kk, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description_en, '')), 'B')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.add_column('products', sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(PRODUCT_SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True))
+    op.create_index('ix_products_search_vector', 'products', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_products_title_ru_trgm', 'products', ['title_ru'], unique=False, postgresql_using='gin', postgresql_ops={'title_ru': 'gin_trgm_ops'})
+    op.create_index('ix_products_title_kk_trgm', 'products', ['title_kk'], unique=False, postgresql_using='gin', postgresql_ops={'title_kk': 'gin_trgm_ops'})
+    op.create_index('ix_products_title_en_trgm', 'products', ['title_en'], unique=False, postgresql_using='gin', postgresql_ops={'title_en': 'gin_trgm_ops'})
+    op.create_index('ix_products_sku_trgm', 'products', ['sku'], unique=False, postgresql_using='gin', postgresql_ops={'sku': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_products_sku_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'sku': 'gin_trgm_ops'})
+    op.drop_index('ix_products_title_en_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'title_en': 'gin_trgm_ops'})
+    op.drop_index('ix_products_title_kk_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'title_kk': 'gin_trgm_ops'})
+    op.drop_index('ix_products_title_ru_trgm', table_name='products', postgresql_using='gin', postgresql_ops={'title_ru': 'gin_trgm_ops'})
+    op.drop_index('ix_products_search_vector', table_name='products', postgresql_using='gin')
+    op.drop_column('products', 'search_vector')
@@ -0,0 +1,89 @@
+"""Added unified search documents
+
+Revision ID: 9c4f2a7e5d18
+Revises: 7b3e9d1f2a64
+Create Date: 2026-10-19 13:40:52.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f2a7e5d18'
+down_revision: Union[str, None] = '7b3e9d1f2a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_DOCUMENT_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian', coalesce(title_ru, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title_kk, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(keywords, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(body_ru, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(body_kk, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(body_en, '')), 'B')"
+)
+
+SEARCH_DOCUMENT_COLUMNS = (
+    "entity_type, entity_id, image_id, city_id, title_ru, title_kk, title_en, "
+    "value, keywords, body_ru, body_kk, body_en, is_active"
+)
+
+
+def upgrade() -> None:
+    op.create_table('search_documents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('entity_type', sa.String(length=256), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('image_id', sa.Integer(), nullable=True),
+    sa.Column('city_id', sa.Integer(), nullable=True),
+    sa.Column('title_ru', sa.String(length=256), nullable=False),
+    sa.Column('title_kk', sa.String(length=256), nullable=True),
+    sa.Column('title_en', sa.String(length=256), nullable=True),
+    sa.Column('value', sa.String(length=256), nullable=False),
+    sa.Column('keywords', sa.Text(), nullable=True),
+    sa.Column('body_ru', sa.Text(), nullable=True),
+    sa.Column('body_kk', sa.Text(), nullable=True),
+    sa.Column('body_en', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=False),
+    sa.Column('search_vector', postgresql.TSVECTOR(), sa.Computed(SEARCH_DOCUMENT_SEARCH_VECTOR_EXPRESSION, persisted=True), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['city_id'], ['cities.id'], onupdate='CASCADE', ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['image_id'], ['files.id'], onupdate='CASCADE', ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('entity_type', 'entity_id', name='uq_search_documents_entity')
+    )
+    op.create_index('ix_search_documents_search_vector', 'search_documents', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index('ix_search_documents_title_ru_trgm', 'search_documents', ['title_ru'], unique=False, postgresql_using='gin', postgresql_ops={'title_ru': 'gin_trgm_ops'})
+    op.create_index('ix_search_documents_title_kk_trgm', 'search_documents', ['title_kk'], unique=False, postgresql_using='gin', postgresql_ops={'title_kk': 'gin_trgm_ops'})
+    op.create_index('ix_search_documents_title_en_trgm', 'search_documents', ['title_en'], unique=False, postgresql_using='gin', postgresql_ops={'title_en': 'gin_trgm_ops'})
+
+    # Первичное наполнение из существующих (не удалённых) записей
+    op.execute(
+        f"INSERT INTO search_documents ({SEARCH_DOCUMENT_COLUMNS}) "
+        "SELECT 'product', id, image_id, city_id, title_ru, title_kk, title_en, value, "
+        "concat_ws(' ', sku, value), description_ru, description_kk, description_en, is_active "
+        "FROM products WHERE deleted_at IS NULL"
+    )
+    for entity_type, table_name in (("field", "fields"), ("academy", "academies")):
+        op.execute(
+            f"INSERT INTO search_documents ({SEARCH_DOCUMENT_COLUMNS}) "
+            f"SELECT '{entity_type}', id, image_id, city_id, title_ru, title_kk, title_en, value, value, "
+            "nullif(concat_ws(' ', description_ru, address_ru), ''), "
+            "nullif(concat_ws(' ', description_kk, address_kk), ''), "
+            "nullif(concat_ws(' ', description_en, address_en), ''), is_active "
+            f"FROM {table_name} WHERE deleted_at IS NULL"
+        )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_search_documents_title_en_trgm', table_name='search_documents', postgresql_using='gin', postgresql_ops={'title_en': 'gin_trgm_ops'})
+    op.drop_index('ix_search_documents_title_kk_trgm', table_name='search_documents', postgresql_using='gin', postgresql_ops={'title_kk': 'gin_trgm_ops'})
+    op.drop_index('ix_search_documents_title_ru_trgm', table_name='search_documents', postgresql_using='gin', postgresql_ops={'title_ru': 'gin_trgm_ops'})
+    op.drop_index('ix_search_documents_search_vector', table_name='search_documents', postgresql_using='gin')
+    op.drop_table('search_documents')
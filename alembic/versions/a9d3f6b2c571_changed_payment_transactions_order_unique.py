@@ -0,0 +1,27 @@
+"""Changed payment_transactions.order index to unique
+
+Revision ID: a9d3f6b2c571
+Revises: e1a7c4f9b362
+Create Date: 2026-10-19 21:40:08.215634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3f6b2c571'
+down_revision: Union[str, None] = 'e1a7c4f9b362'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index(op.f('ix_payment_transactions_order'), table_name='payment_transactions')
+    op.create_index(op.f('ix_payment_transactions_order'), 'payment_transactions', ['order'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_payment_transactions_order'), table_name='payment_transactions')
+    op.create_index(op.f('ix_payment_transactions_order'), 'payment_transactions', ['order'], unique=False)
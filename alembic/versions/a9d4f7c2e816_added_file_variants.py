@@ -0,0 +1,30 @@
+"""Added file image variants
+
+Revision ID: a9d4f7c2e816
+Revises: f2c8a4e6b153
+Create Date: 2026-10-19 17:58:26.117430
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4f7c2e816'
+down_revision: Union[str, None] = 'f2c8a4e6b153'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NULL - копии ещё не создавались: существующие изображения обработает задача generate_file_variants
+    op.add_column('files', sa.Column('variants', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.create_index('ix_files_variants_pending', 'files', ['id'], unique=False, postgresql_where=sa.text('variants IS NULL AND NOT is_remote'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_files_variants_pending', table_name='files', postgresql_where=sa.text('variants IS NULL AND NOT is_remote'))
+    op.drop_column('files', 'variants')
@@ -0,0 +1,56 @@
+"""Added geography locations to fields and academies
+
+Revision ID: b2d7e4a91c35
+Revises: 9c4f2a7e5d18
+Create Date: 2026-10-19 14:25:17.604912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import geoalchemy2
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2d7e4a91c35'
+down_revision: Union[str, None] = '9c4f2a7e5d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NUMBER_PATTERN = "'^-?[0-9]+([.][0-9]+)?$'"
+GEOGRAPHY_POINT_EXPRESSION = (
+    f"CASE WHEN btrim(latitude) ~ {NUMBER_PATTERN} AND btrim(longitude) ~ {NUMBER_PATTERN} THEN "
+    "CASE WHEN abs(btrim(latitude)::double precision) <= 90 AND abs(btrim(longitude)::double precision) <= 180 THEN "
+    "ST_SetSRID(ST_MakePoint(btrim(longitude)::double precision, btrim(latitude)::double precision), 4326)::geography "
+    "END END"
+)
+
+
+def location_column() -> sa.Column:
+    # Генерируемый столбец заполняется для существующих строк при добавлении
+    return sa.Column(
+        'location',
+        geoalchemy2.types.Geography(geometry_type='POINT', srid=4326, spatial_index=False),
+        sa.Computed(GEOGRAPHY_POINT_EXPRESSION, persisted=True),
+        nullable=True,
+    )
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS postgis')
+    op.add_column('academies', sa.Column('latitude', sa.String(length=256), nullable=True))
+    op.add_column('academies', sa.Column('longitude', sa.String(length=256), nullable=True))
+    op.add_column('fields', location_column())
+    op.add_column('academies', location_column())
+    op.create_index('ix_fields_location', 'fields', ['location'], unique=False, postgresql_using='gist')
+    op.create_index('ix_academies_location', 'academies', ['location'], unique=False, postgresql_using='gist')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_academies_location', table_name='academies', postgresql_using='gist')
+    op.drop_index('ix_fields_location', table_name='fields', postgresql_using='gist')
+    op.drop_column('academies', 'location')
+    op.drop_column('fields', 'location')
+    op.drop_column('academies', 'longitude')
+    op.drop_column('academies', 'latitude')
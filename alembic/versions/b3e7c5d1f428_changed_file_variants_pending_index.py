@@ -0,0 +1,29 @@
+"""Changed file variants pending index for remote storage
+
+Revision ID: b3e7c5d1f428
+Revises: a9d4f7c2e816
+Create Date: 2026-10-19 18:34:51.620193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e7c5d1f428'
+down_revision: Union[str, None] = 'a9d4f7c2e816'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Копии создаются и для файлов в S3 (is_remote)
+    op.drop_index('ix_files_variants_pending', table_name='files', postgresql_where=sa.text('variants IS NULL AND NOT is_remote'))
+    op.create_index('ix_files_variants_pending', 'files', ['id'], unique=False, postgresql_where=sa.text('variants IS NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_files_variants_pending', table_name='files', postgresql_where=sa.text('variants IS NULL'))
+    op.create_index('ix_files_variants_pending', 'files', ['id'], unique=False, postgresql_where=sa.text('variants IS NULL AND NOT is_remote'))
@@ -0,0 +1,28 @@
+"""Added modification value indexes for product facets
+
+Revision ID: c6a1f3e8d247
+Revises: b2d7e4a91c35
+Create Date: 2026-10-19 15:10:43.290571
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6a1f3e8d247'
+down_revision: Union[str, None] = 'b2d7e4a91c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_modification_values_product_id', 'modification_values', ['product_id'], unique=False)
+    op.create_index('ix_modification_values_type_title', 'modification_values', ['modification_type_id', sa.text('lower(title_ru)')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_modification_values_type_title', table_name='modification_values')
+    op.drop_index('ix_modification_values_product_id', table_name='modification_values')
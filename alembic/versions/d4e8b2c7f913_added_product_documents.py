@@ -0,0 +1,43 @@
+"""Added materialized product documents
+
+Revision ID: d4e8b2c7f913
+Revises: c6a1f3e8d247
+Create Date: 2026-10-19 16:05:12.447180
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e8b2c7f913'
+down_revision: Union[str, None] = 'c6a1f3e8d247'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('product_documents',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('product_id', sa.Integer(), nullable=False),
+    sa.Column('payload', sa.Text(), nullable=True),
+    sa.Column('version', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('is_stale', sa.Boolean(), server_default=sa.text('true'), nullable=False),
+    sa.Column('built_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['product_id'], ['products.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('product_id', name='uq_product_documents_product_id')
+    )
+    op.create_index('ix_product_documents_stale', 'product_documents', ['product_id'], unique=False, postgresql_where=sa.text('is_stale'))
+
+    # Пустые устаревшие документы для существующих (не удалённых) товаров - их соберет задача rebuild_product_documents
+    op.execute("INSERT INTO product_documents (product_id) SELECT id FROM products WHERE deleted_at IS NULL")
+
+
+def downgrade() -> None:
+    op.drop_index('ix_product_documents_stale', table_name='product_documents', postgresql_where=sa.text('is_stale'))
+    op.drop_table('product_documents')
@@ -0,0 +1,48 @@
+"""Added notification read states
+
+Revision ID: e7b3d1a9c524
+Revises: d4e8b2c7f913
+Create Date: 2026-10-19 16:48:37.902615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d1a9c524'
+down_revision: Union[str, None] = 'd4e8b2c7f913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_read_states',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('read_until_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], onupdate='CASCADE', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', name='uq_notification_read_states_user_id')
+    )
+
+    # Повторные отметки о прочтении (select-then-insert без блокировки) - оставляем первую
+    op.execute(
+        "DELETE FROM read_notifications a USING read_notifications b "
+        "WHERE a.user_id = b.user_id AND a.notification_id = b.notification_id AND a.id > b.id"
+    )
+    op.create_unique_constraint('uq_read_notifications_user_notification', 'read_notifications', ['user_id', 'notification_id'])
+
+    op.create_index('ix_notifications_user_id_id', 'notifications', ['user_id', 'id'], unique=False)
+    op.create_index('ix_notifications_broadcast_id', 'notifications', ['id'], unique=False, postgresql_where=sa.text('user_id IS NULL AND topics IS NOT NULL'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_broadcast_id', table_name='notifications', postgresql_where=sa.text('user_id IS NULL AND topics IS NOT NULL'))
+    op.drop_index('ix_notifications_user_id_id', table_name='notifications')
+    op.drop_constraint('uq_read_notifications_user_notification', 'read_notifications', type_='unique')
+    op.drop_table('notification_read_states')
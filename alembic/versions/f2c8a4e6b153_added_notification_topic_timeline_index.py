@@ -0,0 +1,26 @@
+"""Added notification topic timeline index
+
+Revision ID: f2c8a4e6b153
+Revises: e7b3d1a9c524
+Create Date: 2026-10-19 17:21:04.385912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2c8a4e6b153'
+down_revision: Union[str, None] = 'e7b3d1a9c524'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_notifications_topic_timeline', 'notifications', ['topic_id', 'id'], unique=False, postgresql_where=sa.text('user_id IS NULL AND topics IS NOT NULL AND is_active'))
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_topic_timeline', table_name='notifications', postgresql_where=sa.text('user_id IS NULL AND topics IS NOT NULL AND is_active'))
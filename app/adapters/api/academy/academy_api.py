@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Response, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.academy.academy_dto import AcademyWithRelationsRDTO, AcademyCDTO, GetFullAcademyDTO
@@ -9,9 +9,11 @@ from app.adapters.filters.academy.academy_pagination_filter import (
     AcademyPaginationFilter,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import conditional_get
 from app.infrastructure.db import get_db
 from app.i18n.i18n_wrapper import i18n
 from app.shared.query_constants import AppQueryConstants
+from app.shared.cache_control_constants import AppCacheControlConstants
 from app.shared.route_constants import RoutePathConstants
 from app.use_case.academy.all_academies_case import AllAcademiesCase
 from app.use_case.academy.create_academy_case import CreateAcademyCase
@@ -80,7 +82,7 @@ class AcademyApi:
             "/get-full/{id}",
             response_model=GetFullAcademyDTO,
             summary="Получить полную информацию об академии",
-            description="Получение полной информации об академии с галереями и группами",
+            description="Получение полной информации об академии с галереями, группами и расписанием на текущую неделю",
         )(self.get_full_by_id)
 
         self.router.put(
@@ -167,10 +169,21 @@ class AcademyApi:
     async def get_by_id(
         self,
         id: RoutePathConstants.IDPath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> AcademyWithRelationsRDTO:
         try:
-            return await GetAcademyByIdCase(db).execute(id=id)
+            case = GetAcademyByIdCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(id=id),
+                build=lambda: case.execute(id=id),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -183,10 +196,21 @@ class AcademyApi:
     async def get_by_value(
         self,
         value: RoutePathConstants.ValuePath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> AcademyWithRelationsRDTO:
         try:
-            return await GetAcademyByValueCase(db).execute(value=value)
+            case = GetAcademyByValueCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(value=value),
+                build=lambda: case.execute(value=value),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -218,9 +242,10 @@ class AcademyApi:
         id: RoutePathConstants.IDPath,
         force_delete: bool | None = AppQueryConstants.StandardForceDeleteQuery(),
         db: AsyncSession = Depends(get_db),
-    ) -> GetFullAcademyDTO:
+    ) -> Response:
         try:
-            return await GetFullAcademyByIdCase(db).execute(id=id)
+            payload = await GetFullAcademyByIdCase(db).execute(id=id)
+            return Response(content=payload, media_type="application/json")
         except HTTPException:
             raise
         except Exception as exc:
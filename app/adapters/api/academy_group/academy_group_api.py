@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.academy_group.academy_group_dto import AcademyGroupWithRelationsRDTO, AcademyGroupCDTO
@@ -9,9 +9,11 @@ from app.adapters.filters.academy_group.academy_group_pagination_filter import (
     AcademyGroupPaginationFilter,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import conditional_get
 from app.infrastructure.db import get_db
 from app.i18n.i18n_wrapper import i18n
 from app.shared.query_constants import AppQueryConstants
+from app.shared.cache_control_constants import AppCacheControlConstants
 from app.shared.route_constants import RoutePathConstants
 from app.use_case.academy_group.all_academy_groups_case import AllAcademyGroupsCase
 from app.use_case.academy_group.create_academy_group_case import CreateAcademyGroupCase
@@ -151,10 +153,21 @@ class AcademyGroupApi:
     async def get_by_id(
         self,
         id: RoutePathConstants.IDPath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> AcademyGroupWithRelationsRDTO:
         try:
-            return await GetAcademyGroupByIdCase(db).execute(id=id)
+            case = GetAcademyGroupByIdCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(id=id),
+                build=lambda: case.execute(id=id),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -167,10 +180,21 @@ class AcademyGroupApi:
     async def get_by_value(
         self,
         value: RoutePathConstants.ValuePath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> AcademyGroupWithRelationsRDTO:
         try:
-            return await GetAcademyGroupByValueCase(db).execute(value=value)
+            case = GetAcademyGroupByValueCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(value=value),
+                build=lambda: case.execute(value=value),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.exceptions import HTTPException
 
+from app.core.conditional_response import etag_response
+from app.entities import BookingFieldPartyStatusEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.booking_field_party_status.booking_field_party_status_dto import (
     BookingFieldPartyStatusCDTO,
     BookingFieldPartyStatusWithRelationsRDTO,
@@ -78,6 +81,7 @@ class BookingFieldPartyStatusApi:
         self,
         filter: BookingFieldPartyStatusFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[BookingFieldPartyStatusWithRelationsRDTO]:
         """
         Получение полного списка статусов бронирования площадок.
@@ -90,6 +94,10 @@ class BookingFieldPartyStatusApi:
             Список всех статусов бронирования с relationships
         """
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(BookingFieldPartyStatusEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllBookingFieldPartyStatusCase(db).execute(filter=filter)
         except HTTPException:
             raise
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional_response import etag_response
+from app.entities import CityEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.city.city_dto import CityWithRelationsRDTO, CityCDTO
 from app.adapters.dto.pagination_dto import PaginationCityWithRelationsRDTO
 from app.adapters.filters.city.city_filter import CityFilter
@@ -90,8 +93,13 @@ class CityApi:
         self,
         filter: CityFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[CityWithRelationsRDTO]:
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(CityEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllCityCase(db).execute(filter)
         except HTTPException:
             raise
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional_response import etag_response
+from app.entities import CountryEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.country.country_dto import CountryRDTO, CountryCDTO
 from app.adapters.dto.pagination_dto import PaginationCountryRDTO
 from app.adapters.filters.country.country_filter import CountryFilter
@@ -92,8 +95,13 @@ class CountryApi:
         self,
         filter: CountryFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[CountryRDTO]:
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(CountryEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllCountryCase(db).execute(filter)
         except HTTPException:
             raise
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Header, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.field.field_dto import FieldWithRelationsRDTO, FieldCDTO
@@ -9,9 +9,12 @@ from app.adapters.filters.field.field_pagination_filter import (
     FieldPaginationFilter,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import conditional_get
+from app.core.fast_json_response import FastJSONResponse, fast_response
 from app.infrastructure.db import get_db
 from app.i18n.i18n_wrapper import i18n
 from app.shared.query_constants import AppQueryConstants
+from app.shared.cache_control_constants import AppCacheControlConstants
 from app.shared.route_constants import RoutePathConstants
 from app.use_case.field.all_field_case import AllFieldCase
 from app.use_case.field.create_field_case import CreateFieldCase
@@ -38,14 +41,16 @@ class FieldApi:
             response_model=PaginationFieldWithRelationsRDTO,
             summary="Список полей с пагинацией",
             description="Получение списка полей с постраничной фильтрацией",
-        )(self.paginate)
+            response_class=FastJSONResponse,
+        )(fast_response(self.paginate))
 
         self.router.get(
             RoutePathConstants.AllPathName,
             response_model=list[FieldWithRelationsRDTO],
             summary="Список всех полей",
             description="Получение полного списка полей",
-        )(self.get_all)
+            response_class=FastJSONResponse,
+        )(fast_response(self.get_all))
 
         self.router.post(
             RoutePathConstants.CreatePathName,
@@ -159,10 +164,21 @@ class FieldApi:
     async def get_by_id(
         self,
         id: RoutePathConstants.IDPath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> FieldWithRelationsRDTO:
         try:
-            return await GetFieldByIdCase(db).execute(id=id)
+            case = GetFieldByIdCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(id=id),
+                build=lambda: case.execute(id=id),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -175,10 +191,21 @@ class FieldApi:
     async def get_by_value(
         self,
         value: RoutePathConstants.ValuePath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> FieldWithRelationsRDTO:
         try:
-            return await GetFieldByValueCase(db).execute(value=value)
+            case = GetFieldByValueCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(value=value),
+                build=lambda: case.execute(value=value),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
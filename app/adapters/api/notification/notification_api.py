@@ -3,10 +3,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.notification.notification_dto import (
     NotificationCDTO,
+    NotificationFeedRDTO,
+    NotificationUnreadCountRDTO,
     NotificationWithRelationsRDTO,
 )
 from app.adapters.dto.pagination_dto import PaginationNotificationWithRelationsRDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
+from app.adapters.filters.notification.notification_feed_filter import NotificationFeedFilter
 from app.adapters.filters.notification.notification_pagination_filter import (
     NotificationPaginationFilter,
 )
@@ -29,6 +32,15 @@ from app.use_case.notification.update_notification_case import UpdateNotificatio
 from app.use_case.notification.client.get_client_notification_by_id_case import (
     GetClientNotificationByIdCase,
 )
+from app.use_case.notification.client.get_client_notification_feed_case import (
+    GetClientNotificationFeedCase,
+)
+from app.use_case.notification.client.get_client_unread_notification_count_case import (
+    GetClientUnreadNotificationCountCase,
+)
+from app.use_case.notification.client.mark_all_client_notifications_read_case import (
+    MarkAllClientNotificationsReadCase,
+)
 from app.use_case.notification.client.paginate_client_notification_case import (
     PaginateClientNotificationCase,
 )
@@ -87,6 +99,13 @@ class NotificationApi:
             description="Получение списка уведомлений текущего клиента с постраничной фильтрацией",
         )(self.paginate_client)
 
+        self.router.get(
+            "/client/feed",
+            response_model=NotificationFeedRDTO,
+            summary="Лента уведомлений клиента",
+            description="Личные уведомления и рассылки топиков текущего клиента с курсорной пагинацией",
+        )(self.get_client_feed)
+
         self.router.get(
             "/client/get/{id}",
             response_model=NotificationWithRelationsRDTO,
@@ -94,6 +113,20 @@ class NotificationApi:
             description="Получение уведомления текущего клиента по ID с автоматической отметкой о прочтении",
         )(self.get_client_by_id)
 
+        self.router.get(
+            "/client/unread-count",
+            response_model=NotificationUnreadCountRDTO,
+            summary="Количество непрочитанных уведомлений клиента",
+            description="Получение количества непрочитанных уведомлений текущего клиента",
+        )(self.get_client_unread_count)
+
+        self.router.post(
+            "/client/read-all",
+            response_model=NotificationUnreadCountRDTO,
+            summary="Прочитать все уведомления клиента",
+            description="Отметка всех уведомлений текущего клиента прочитанными",
+        )(self.mark_all_client_read)
+
     async def paginate(
         self,
         filter: NotificationPaginationFilter = Depends(),
@@ -198,6 +231,28 @@ class NotificationApi:
                 is_custom=True,
             ) from exc
 
+    async def get_client_feed(
+        self,
+        filter: NotificationFeedFilter = Depends(),
+        current_user: UserWithRelationsRDTO = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db),
+    ) -> NotificationFeedRDTO:
+        """
+        Получение ленты уведомлений текущего клиента по курсору.
+        """
+        try:
+            return await GetClientNotificationFeedCase(db).execute(
+                filter=filter, user=current_user
+            )
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message=i18n.gettext("internal_server_error"),
+                extra={"details": str(exc)},
+                is_custom=True,
+            ) from exc
+
     async def get_client_by_id(
         self,
         id: RoutePathConstants.IDPath,
@@ -219,3 +274,41 @@ class NotificationApi:
                 extra={"details": str(exc)},
                 is_custom=True,
             ) from exc
+
+    async def get_client_unread_count(
+        self,
+        current_user: UserWithRelationsRDTO = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db),
+    ) -> NotificationUnreadCountRDTO:
+        """
+        Получение количества непрочитанных уведомлений текущего клиента.
+        """
+        try:
+            return await GetClientUnreadNotificationCountCase(db).execute(user=current_user)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message=i18n.gettext("internal_server_error"),
+                extra={"details": str(exc)},
+                is_custom=True,
+            ) from exc
+
+    async def mark_all_client_read(
+        self,
+        current_user: UserWithRelationsRDTO = Depends(get_current_user),
+        db: AsyncSession = Depends(get_db),
+    ) -> NotificationUnreadCountRDTO:
+        """
+        Отметка всех уведомлений текущего клиента прочитанными.
+        """
+        try:
+            return await MarkAllClientNotificationsReadCase(db).execute(user=current_user)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message=i18n.gettext("internal_server_error"),
+                extra={"details": str(exc)},
+                is_custom=True,
+            ) from exc
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.exceptions import HTTPException
 
+from app.core.conditional_response import etag_response
+from app.entities import PaymentTransactionStatusEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.payment_transaction_status.payment_transaction_status_dto import (
     PaymentTransactionStatusRDTO,
     PaymentTransactionStatusCDTO,
@@ -115,6 +118,7 @@ class PaymentTransactionStatusApi:
         self,
         filter: PaymentTransactionStatusFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[PaymentTransactionStatusRDTO]:
         """
         Получение полного списка статусов платежных транзакций.
@@ -127,6 +131,10 @@ class PaymentTransactionStatusApi:
             Список всех статусов платежных транзакций
         """
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(PaymentTransactionStatusEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllPaymentTransactionStatusCase(db).execute(filter=filter)
         except HTTPException:
             raise
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from fastapi import APIRouter, Depends, Header, HTTPException, File, UploadFile
 from packaging.utils import _
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional_response import etag_response
+from app.entities import PermissionEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.permission.permission_dto import PermissionRDTO, PermissionCDTO
 from app.adapters.dto.pagination_dto import PaginationPermissionRDTO
 from app.adapters.filters.permission.permission_filter import PermissionFilter
@@ -102,8 +105,13 @@ class PermissionApi:
         self,
         filter: PermissionFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[PermissionRDTO]:
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(PermissionEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllPermissionCase(db).execute(filter)
         except HTTPException:
             raise
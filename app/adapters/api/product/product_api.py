@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Response, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.product.product_dto import ProductWithRelationsRDTO, ProductCDTO
 from app.adapters.dto.product.full_product_dto import FullProductRDTO
+from app.adapters.dto.product.product_facet_dto import ProductFacetsRDTO
 from app.helpers.form_helper import FormParserHelper
 from app.adapters.dto.pagination_dto import PaginationProductWithRelationsRDTO
 from app.adapters.filters.product.product_filter import ProductFilter
@@ -10,9 +11,14 @@ from app.adapters.filters.product.product_pagination_filter import (
     ProductPaginationFilter,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import conditional_get
+from app.core.streaming_export_response import StreamingExportResponse
+from app.use_case.product.export_product_case import ExportProductCase
+from app.core.fast_json_response import FastJSONResponse, fast_response
 from app.infrastructure.db import get_db
 from app.i18n.i18n_wrapper import i18n
 from app.shared.query_constants import AppQueryConstants
+from app.shared.cache_control_constants import AppCacheControlConstants
 from app.shared.route_constants import RoutePathConstants
 from app.use_case.product.all_product_case import AllProductCase
 from app.use_case.product.create_product_case import CreateProductCase
@@ -21,7 +27,8 @@ from app.use_case.product.get_product_by_id_case import GetProductByIdCase
 from app.use_case.product.get_product_by_value_case import GetProductByValueCase
 from app.use_case.product.paginate_product_case import PaginateProductCase
 from app.use_case.product.update_product_case import UpdateProductCase
-from app.use_case.product.get_full_product_by_id_case import GetFullProductByIdCase
+from app.use_case.product.get_product_document_case import GetProductDocumentCase
+from app.use_case.product.get_product_facets_case import GetProductFacetsCase
 from app.use_case.product.update_product_main_photo_case import UpdateProductMainPhotoCase
 
 
@@ -40,14 +47,29 @@ class ProductApi:
             response_model=PaginationProductWithRelationsRDTO,
             summary="Список товаров с пагинацией",
             description="Получение списка товаров с постраничной фильтрацией",
-        )(self.paginate)
+            response_class=FastJSONResponse,
+        )(fast_response(self.paginate))
 
         self.router.get(
             RoutePathConstants.AllPathName,
             response_model=list[ProductWithRelationsRDTO],
             summary="Список всех товаров",
             description="Получение полного списка товаров",
-        )(self.get_all)
+            response_class=FastJSONResponse,
+        )(fast_response(self.get_all))
+
+        self.router.get(
+            RoutePathConstants.ExportPathName,
+            summary="Выгрузка товаров",
+            description="Потоковая выгрузка всех товаров (JSON-массив или NDJSON) без загрузки таблицы в память",
+        )(self.export)
+
+        self.router.get(
+            RoutePathConstants.FacetsPathName,
+            response_model=ProductFacetsRDTO,
+            summary="Фасеты каталога товаров",
+            description="Количество товаров по категориям, городам, цене, полу и модификациям одним запросом",
+        )(self.get_facets)
 
         self.router.post(
             RoutePathConstants.CreatePathName,
@@ -130,6 +152,33 @@ class ProductApi:
                 is_custom=True,
             ) from exc
 
+    async def export(
+        self,
+        filter: ProductFilter = Depends(),
+        export_format: str = AppQueryConstants.StandardExportFormatQuery(),
+    ) -> StreamingExportResponse:
+        return StreamingExportResponse(
+            lambda db: ExportProductCase(db).execute(filter),
+            export_format=export_format,
+            filename="products",
+        )
+
+    async def get_facets(
+        self,
+        filter: ProductFilter = Depends(),
+        db: AsyncSession = Depends(get_db),
+    ) -> ProductFacetsRDTO:
+        try:
+            return await GetProductFacetsCase(db).execute(filter)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message=i18n.gettext("internal_server_error"),
+                extra={"details": str(exc)},
+                is_custom=True,
+            ) from exc
+
     async def create(
         self,
         dto: ProductCDTO = Depends(FormParserHelper.parse_product_dto_from_form),
@@ -168,10 +217,21 @@ class ProductApi:
     async def get_by_id(
         self,
         id: RoutePathConstants.IDPath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> ProductWithRelationsRDTO:
         try:
-            return await GetProductByIdCase(db).execute(id=id)
+            case = GetProductByIdCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(id=id),
+                build=lambda: case.execute(id=id),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -184,10 +244,21 @@ class ProductApi:
     async def get_by_value(
         self,
         value: RoutePathConstants.ValuePath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> ProductWithRelationsRDTO:
         try:
-            return await GetProductByValueCase(db).execute(value=value)
+            case = GetProductByValueCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(value=value),
+                build=lambda: case.execute(value=value),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.CatalogItem,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -218,9 +289,11 @@ class ProductApi:
         self,
         id: RoutePathConstants.IDPath,
         db: AsyncSession = Depends(get_db),
-    ) -> FullProductRDTO:
+    ) -> Response:
         try:
-            return await GetFullProductByIdCase(db).execute(id=id)
+            # Готовый JSON материализованной карточки отдается без повторной валидации
+            payload = await GetProductDocumentCase(db).execute(id=id)
+            return Response(content=payload, media_type="application/json")
         except HTTPException:
             raise
         except Exception as exc:
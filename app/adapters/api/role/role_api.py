@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.exceptions import HTTPException
 
+from app.core.conditional_response import etag_response
+from app.entities import RoleEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.role.role_dto import RoleRDTO, RoleCDTO
 from app.adapters.filters.role.role_filter import RoleFilter
 from app.core.app_exception_response import AppExceptionResponse
@@ -68,9 +71,14 @@ class RoleApi:
         self,
         filter: RoleFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[RoleRDTO]:
         use_case = AllRoleCase(db)
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(RoleEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await use_case.execute(filter)
         except HTTPException:
             raise
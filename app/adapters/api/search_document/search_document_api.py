@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.pagination_dto import PaginationSearchDocumentWithRelationsRDTO
+from app.adapters.filters.search_document.search_document_pagination_filter import (
+    SearchDocumentPaginationFilter,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.infrastructure.db import get_db
+from app.i18n.i18n_wrapper import i18n
+from app.shared.route_constants import RoutePathConstants
+from app.use_case.search_document.paginate_search_document_case import PaginateSearchDocumentCase
+
+
+class SearchDocumentApi:
+    def __init__(self) -> None:
+        """
+        Инициализация SearchDocumentApi.
+        Создаёт объект APIRouter и регистрирует маршрут единого поиска.
+        """
+        self.router = APIRouter()
+        self._add_routes()
+
+    def _add_routes(self) -> None:
+        self.router.get(
+            RoutePathConstants.IndexPathName,
+            response_model=PaginationSearchDocumentWithRelationsRDTO,
+            summary="Единый поиск",
+            description="Ранжированный поиск по товарам, полям и академиям одним запросом",
+        )(self.paginate)
+
+    async def paginate(
+        self,
+        filter: SearchDocumentPaginationFilter = Depends(),
+        db: AsyncSession = Depends(get_db),
+    ) -> PaginationSearchDocumentWithRelationsRDTO:
+        try:
+            return await PaginateSearchDocumentCase(db).execute(filter)
+        except HTTPException:
+            raise
+        except Exception as exc:
+            raise AppExceptionResponse.internal_error(
+                message=i18n.gettext("internal_server_error"),
+                extra={"details": str(exc)},
+                is_custom=True,
+            ) from exc
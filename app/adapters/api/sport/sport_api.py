@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional_response import etag_response
+from app.entities import SportEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.sport.sport_dto import SportRDTO, SportCDTO
 from app.adapters.dto.pagination_dto import PaginationSportRDTO
 from app.adapters.filters.sport.sport_filter import SportFilter
@@ -98,8 +101,13 @@ class SportApi:
         self,
         filter: SportFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[SportRDTO]:
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(SportEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllSportCase(db).execute(filter)
         except HTTPException:
             raise
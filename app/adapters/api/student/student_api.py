@@ -13,6 +13,8 @@ from app.adapters.filters.student.student_pagination_filter import (
     StudentPaginationFilter,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.streaming_export_response import StreamingExportResponse
+from app.use_case.student.export_student_case import ExportStudentCase
 from app.infrastructure.db import get_db
 from app.i18n.i18n_wrapper import i18n
 from app.shared.query_constants import AppQueryConstants
@@ -49,6 +51,12 @@ class StudentApi:
             description="Получение полного списка студентов",
         )(self.get_all)
 
+        self.router.get(
+            RoutePathConstants.ExportPathName,
+            summary="Выгрузка студентов",
+            description="Потоковая выгрузка всех студентов (JSON-массив или NDJSON) без загрузки таблицы в память",
+        )(self.export)
+
         self.router.post(
             RoutePathConstants.CreatePathName,
             response_model=StudentWithRelationsRDTO,
@@ -109,6 +117,17 @@ class StudentApi:
                 is_custom=True,
             ) from exc
 
+    async def export(
+        self,
+        filter: StudentFilter = Depends(),
+        export_format: str = AppQueryConstants.StandardExportFormatQuery(),
+    ) -> StreamingExportResponse:
+        return StreamingExportResponse(
+            lambda db: ExportStudentCase(db).execute(filter),
+            export_format=export_format,
+            filename="students",
+        )
+
     async def create(
         self,
         dto: StudentCDTO = Depends(FormParserHelper.parse_student_dto_from_form),
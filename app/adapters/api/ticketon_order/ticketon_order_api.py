@@ -1,6 +1,6 @@
 import urllib.parse
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.exceptions import HTTPException
 
@@ -17,8 +17,13 @@ from app.adapters.dto.alatau.alatau_after_payment_dto import AlatauBackrefRespon
 from app.adapters.filters.ticketon_order.ticketon_order_filter import TicketonOrderFilter
 from app.adapters.filters.ticketon_order.ticketon_order_pagination_filter import TicketonOrderPaginationFilter
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import conditional_get
+from app.shared.query_constants import AppQueryConstants
+from app.core.streaming_export_response import StreamingExportResponse
+from app.use_case.ticketon_order.export_ticketon_order_case import ExportTicketonOrderCase
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.db import get_db
+from app.shared.cache_control_constants import AppCacheControlConstants
 from app.shared.route_constants import RoutePathConstants
 from app.use_case.ticketon_order.all_ticketon_order_case import AllTicketonOrderCase
 from app.use_case.ticketon_order.get_ticketon_order_by_id_case import GetTicketonOrderByIdCase
@@ -71,6 +76,12 @@ class TicketonOrderApi:
             summary="Список всех заказов Ticketon",
             description="Получение полного списка заказов Ticketon",
         )(self.get_all)
+
+        self.router.get(
+            RoutePathConstants.ExportPathName,
+            summary="Выгрузка заказов Ticketon",
+            description="Потоковая выгрузка всех заказов Ticketon (JSON-массив или NDJSON) без загрузки таблицы в память",
+        )(self.export)
         
         self.router.get(
             f"{RoutePathConstants.GetByIdPathName}",
@@ -195,10 +206,34 @@ class TicketonOrderApi:
                 is_custom=True,
             ) from exc
 
+    async def export(
+        self,
+        filter: TicketonOrderFilter = Depends(),
+        export_format: str = AppQueryConstants.StandardExportFormatQuery(),
+    ) -> StreamingExportResponse:
+        """
+        Потоковая выгрузка заказов Ticketon.
+
+        Args:
+            filter: Фильтр для поиска и сортировки
+            export_format: json (массив) или ndjson
+
+        Returns:
+            Ответ, передающий заказы по частям
+        """
+        return StreamingExportResponse(
+            lambda db: ExportTicketonOrderCase(db).execute(filter),
+            export_format=export_format,
+            filename="ticketon_orders",
+        )
+
     async def get(
         self,
         id: RoutePathConstants.IDPath,
+        response: Response,
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> TicketonOrderRDTO:
         """
         Получение заказа Ticketon по ID.
@@ -208,10 +243,18 @@ class TicketonOrderApi:
             db: Сессия базы данных
             
         Returns:
-            Найденный заказ Ticketon
+            Найденный заказ Ticketon (304 без тела, если версия клиента актуальна)
         """
         try:
-            return await GetTicketonOrderByIdCase(db).execute(id=id)
+            case = GetTicketonOrderByIdCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(id=id),
+                build=lambda: case.execute(id=id),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.Order,
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -519,8 +562,11 @@ class TicketonOrderApi:
     async def client_get(
         self,
         id: RoutePathConstants.IDPath,
+        response: Response,
         user: UserWithRelationsRDTO = Depends(check_client),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
+        if_modified_since: str | None = Header(default=None, include_in_schema=False),
     ) -> TicketonOrderWithRelationsRDTO:
         """
         Получение заказа Ticketon по ID для текущего пользователя.
@@ -538,7 +584,15 @@ class TicketonOrderApi:
             # return await ClientGetTicketonOrderByIdCase(db).execute(id=id, user_id=user.id)
 
             # Временная заглушка для тестирования (не используем user_id)
-            return await ClientGetTicketonOrderByIdCase(db).execute(id=id, user_id=user.id)
+            case = ClientGetTicketonOrderByIdCase(db)
+            return await conditional_get(
+                response=response,
+                version=await case.get_version(id=id),
+                build=lambda: case.execute(id=id, user_id=user.id),
+                if_none_match=if_none_match,
+                if_modified_since=if_modified_since,
+                cache_control=AppCacheControlConstants.Order,
+            )
         except HTTPException:
             raise
         except Exception as exc:
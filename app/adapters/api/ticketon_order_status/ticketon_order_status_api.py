@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.exceptions import HTTPException
 
+from app.core.conditional_response import etag_response
+from app.entities import TicketonOrderStatusEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.ticketon_order_status.ticketon_order_status_dto import (
     TicketonOrderStatusRDTO,
     TicketonOrderStatusCDTO,
@@ -115,6 +118,7 @@ class TicketonOrderStatusApi:
         self,
         filter: TicketonOrderStatusFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[TicketonOrderStatusRDTO]:
         """
         Получение полного списка статусов заказов Ticketon.
@@ -127,6 +131,10 @@ class TicketonOrderStatusApi:
             Список всех статусов заказов Ticketon
         """
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(TicketonOrderStatusEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllTicketonOrderStatusCase(db).execute(filter=filter)
         except HTTPException:
             raise
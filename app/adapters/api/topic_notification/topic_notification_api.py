@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, Header, File, HTTPException, UploadFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.conditional_response import etag_response
+from app.entities import TopicNotificationEntity
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.adapters.dto.topic_notification.topic_notification_dto import (
     TopicNotificationCDTO,
     TopicNotificationWithRelationsRDTO,
@@ -88,8 +91,13 @@ class TopicNotificationApi:
         self,
         filter: TopicNotificationFilter = Depends(),
         db: AsyncSession = Depends(get_db),
+        if_none_match: str | None = Header(default=None, include_in_schema=False),
     ) -> list[TopicNotificationWithRelationsRDTO]:
         try:
+            # Без условий фильтра - готовый снимок справочника из памяти с ETag
+            snapshot = reference_data_registry.get_for_filter(TopicNotificationEntity, filter)
+            if snapshot is not None:
+                return etag_response(snapshot.body, snapshot.etag, if_none_match)
             return await AllTopicNotificationCase(db).execute(filter)
         except HTTPException:
             raise
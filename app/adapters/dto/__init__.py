@@ -12,6 +12,7 @@ def rebuild_all_models():
     from app.adapters.dto.academy.academy_dto import GetFullAcademyDTO
     from app.adapters.dto.academy_gallery.academy_gallery_dto import AcademyGalleryWithRelationsRDTO
     from app.adapters.dto.academy_group.academy_group_dto import AcademyGroupWithRelationsRDTO
+    from app.adapters.dto.academy_group_schedule.academy_group_schedule_dto import AcademyGroupScheduleWithRelationsRDTO
     
     # Перестраиваем модели в правильном порядке
     # Сначала базовые модели без forward references
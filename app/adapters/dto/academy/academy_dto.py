@@ -7,6 +7,7 @@ from app.shared.dto_constants import DTOConstant
 if TYPE_CHECKING:
     from app.adapters.dto.academy_gallery.academy_gallery_dto import AcademyGalleryWithRelationsRDTO
     from app.adapters.dto.academy_group.academy_group_dto import AcademyGroupWithRelationsRDTO
+    from app.adapters.dto.academy_group_schedule.academy_group_schedule_dto import AcademyGroupScheduleWithRelationsRDTO
 
 
 class AcademyDTO(BaseModel):
@@ -49,6 +50,8 @@ class AcademyCDTO(BaseModel):
     address_en: DTOConstant.StandardNullableVarcharField(
         description="Адрес на английском"
     )
+    latitude: DTOConstant.StandardNullableVarcharField(description="Широта")
+    longitude: DTOConstant.StandardNullableVarcharField(description="Долгота")
     working_time: DTOConstant.StandardWorkingTimeField(
         description="Рабочее время в формате JSON"
     )
@@ -112,6 +115,8 @@ class AcademyRDTO(AcademyDTO):
     address_en: DTOConstant.StandardNullableVarcharField(
         description="Адрес на английском"
     )
+    latitude: DTOConstant.StandardNullableVarcharField(description="Широта")
+    longitude: DTOConstant.StandardNullableVarcharField(description="Долгота")
     working_time: DTOConstant.StandardWorkingTimeField(
         description="Рабочее время в формате JSON"
     )
@@ -137,6 +142,9 @@ class AcademyRDTO(AcademyDTO):
     instagram: DTOConstant.StandardNullableVarcharField(description="Instagram")
     tik_tok: DTOConstant.StandardNullableVarcharField(description="TikTok")
     site: DTOConstant.StandardNullableVarcharField(description="Сайт")
+    distance: DTOConstant.StandardNullableFloatField(
+        description="Расстояние до точки поиска в метрах (только при геопоиске)"
+    )
 
     created_at: DTOConstant.StandardCreatedAt
     updated_at: DTOConstant.StandardUpdatedAt
@@ -155,10 +163,11 @@ class AcademyWithRelationsRDTO(AcademyRDTO):
 
 
 class GetFullAcademyDTO(BaseModel):
-    """DTO для получения полной информации об академии с галереями и группами"""
+    """DTO для получения полной информации об академии с галереями, группами и расписанием на текущую неделю"""
     academy: AcademyWithRelationsRDTO
     galleries: list["AcademyGalleryWithRelationsRDTO"] = []
     groups: list["AcademyGroupWithRelationsRDTO"] = []
+    schedules: list["AcademyGroupScheduleWithRelationsRDTO"] = []
 
     class Config:
         from_attributes = True
@@ -221,6 +230,12 @@ class AcademyUpdateDTO(BaseModel):
         DTOConstant.StandardNullableVarcharField(description="Адрес на английском")
         | None
     ) = None
+    latitude: (
+        DTOConstant.StandardNullableVarcharField(description="Широта") | None
+    ) = None
+    longitude: (
+        DTOConstant.StandardNullableVarcharField(description="Долгота") | None
+    ) = None
     working_time: (
         DTOConstant.StandardWorkingTimeField(description="Рабочее время в формате JSON") | None
     ) = None
@@ -103,6 +103,9 @@ class FieldRDTO(FieldDTO):
     telegram: DTOConstant.StandardNullableVarcharField(description="Telegram")
     instagram: DTOConstant.StandardNullableVarcharField(description="Instagram")
     tiktok: DTOConstant.StandardNullableVarcharField(description="TikTok")
+    distance: DTOConstant.StandardNullableFloatField(
+        description="Расстояние до точки поиска в метрах (только при геопоиске)"
+    )
 
     created_at: DTOConstant.StandardCreatedAt
     updated_at: DTOConstant.StandardUpdatedAt
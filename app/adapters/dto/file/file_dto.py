@@ -1,4 +1,5 @@
-from pydantic import BaseModel
+from pydantic import AliasChoices, BaseModel, Field
+
 from app.shared.dto_constants import DTOConstant
 
 
@@ -30,6 +31,16 @@ class FileRDTO(FileDTO):
     is_remote: DTOConstant.StandardBooleanFalseField(
         description="Хранится ли файл удаленно"
     )
+    # Из сущности читается variant_urls (копии со ссылками, см. FileUrlEventHandler)
+    variants: dict | None = Field(
+        default=None,
+        validation_alias=AliasChoices("variant_urls", "variants"),
+        description="Уменьшенные копии изображения (ключ - ширина, например 320w; пути и ссылки на WebP и JPEG)",
+    )
+
+    url: DTOConstant.StandardNullableTextField(
+        description="Ссылка на файл (CDN, статический сервер или подписанная ссылка S3)"
+    )
 
     created_at: DTOConstant.StandardCreatedAt
     updated_at: DTOConstant.StandardUpdatedAt
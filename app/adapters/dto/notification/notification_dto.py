@@ -98,6 +98,22 @@ class NotificationRDTO(NotificationDTO):
 
 class NotificationWithRelationsRDTO(NotificationRDTO):
     topic: TopicNotificationRDTO | None = None
+    is_read: DTOConstant.StandardNullableBooleanField(
+        description="Прочитано ли уведомление текущим пользователем (только для клиентских запросов)"
+    )
 
     class Config:
         from_attributes = True
+
+
+class NotificationUnreadCountRDTO(BaseModel):
+    unread_count: DTOConstant.StandardIntegerField(
+        description="Количество непрочитанных уведомлений текущего пользователя"
+    )
+
+
+class NotificationFeedRDTO(BaseModel):
+    items: list[NotificationWithRelationsRDTO] = []
+    next_cursor: DTOConstant.StandardNullableIntegerField(
+        description="Курсор следующей страницы (None - лента закончилась)"
+    )
@@ -5,6 +5,7 @@ from app.adapters.dto.product_order.product_order_dto import ProductOrderWithRel
 from app.adapters.dto.product_order_item.product_order_item_dto import ProductOrderItemWithRelationsRDTO
 from app.adapters.dto.booking_field_party_request.booking_field_party_request_dto import BookingFieldPartyRequestWithRelationsRDTO
 from app.adapters.dto.booking_field_party_and_payment_transaction.booking_field_party_and_payment_transaction_dto import BookingFieldPartyAndPaymentTransactionWithRelationsRDTO
+from app.adapters.dto.search_document.search_document_dto import SearchDocumentWithRelationsRDTO
 from app.adapters.dto.user_code_reset_password.user_code_reset_password_dto import \
     UserCodeResetPasswordWithRelationsRDTO
 from app.adapters.dto.user_code_verification.user_code_verification_dto import \
@@ -360,4 +361,11 @@ class PaginationYandexAfishaWidgetTicketWithRelationsRDTO(BasePageModel):
     items: list[YandexAfishaWidgetTicketWithRelationsRDTO]
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class PaginationSearchDocumentWithRelationsRDTO(BasePageModel):
+    """Пагинированный ответ единого поиска"""
+    items: list[SearchDocumentWithRelationsRDTO]
+
+    class Config:
+        from_attributes = True
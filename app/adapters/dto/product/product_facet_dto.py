@@ -0,0 +1,40 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from app.shared.dto_constants import DTOConstant
+
+
+class FacetValueRDTO(BaseModel):
+    value: int | bool | None = None
+    count: DTOConstant.StandardIntegerField(description="Количество товаров")
+
+
+class ModificationFacetValueRDTO(BaseModel):
+    modification_type_id: DTOConstant.StandardUnsignedIntegerField(
+        description="ID типа модификации"
+    )
+    title_ru: DTOConstant.StandardVarcharField(
+        description="Значение модификации (используется в фильтре как <ID типа>:<значение>)"
+    )
+    count: DTOConstant.StandardIntegerField(description="Количество товаров")
+
+
+class PriceFacetRDTO(BaseModel):
+    min_price: Decimal | None = None
+    max_price: Decimal | None = None
+    count: DTOConstant.StandardIntegerField(description="Количество товаров")
+
+
+class ProductFacetsRDTO(BaseModel):
+    """Счётчики фасетов каталога товаров для боковой панели фильтров"""
+
+    total: DTOConstant.StandardIntegerField(
+        description="Количество товаров под всеми выбранными фильтрами"
+    )
+    categories: list[FacetValueRDTO] = []
+    cities: list[FacetValueRDTO] = []
+    genders: list[FacetValueRDTO] = []
+    is_for_children: list[FacetValueRDTO] = []
+    price: PriceFacetRDTO | None = None
+    modifications: list[ModificationFacetValueRDTO] = []
@@ -0,0 +1,46 @@
+from pydantic import BaseModel
+
+from app.adapters.dto.city.city_dto import CityRDTO
+from app.adapters.dto.file.file_dto import FileRDTO
+from app.shared.dto_constants import DTOConstant
+
+
+class SearchDocumentDTO(BaseModel):
+    id: DTOConstant.StandardID()
+
+    class Config:
+        from_attributes = True
+
+
+class SearchDocumentRDTO(SearchDocumentDTO):
+    entity_type: DTOConstant.StandardVarcharField(
+        description="Тип сущности: product, field, academy"
+    )
+    entity_id: DTOConstant.StandardUnsignedIntegerField(description="ID сущности")
+    image_id: DTOConstant.StandardNullableUnsignedIntegerField(
+        description="ID главного изображения"
+    )
+    city_id: DTOConstant.StandardNullableUnsignedIntegerField(description="ID города")
+    title_ru: DTOConstant.StandardVarcharField(description="Название на русском")
+    title_kk: DTOConstant.StandardNullableVarcharField(
+        description="Название на казахском"
+    )
+    title_en: DTOConstant.StandardNullableVarcharField(
+        description="Название на английском"
+    )
+    value: DTOConstant.StandardVarcharField(description="Уникальное значение сущности")
+    is_active: DTOConstant.StandardBooleanTrueField(description="Флаг активности")
+
+    created_at: DTOConstant.StandardCreatedAt
+    updated_at: DTOConstant.StandardUpdatedAt
+
+    class Config:
+        from_attributes = True
+
+
+class SearchDocumentWithRelationsRDTO(SearchDocumentRDTO):
+    image: FileRDTO | None = None
+    city: CityRDTO | None = None
+
+    class Config:
+        from_attributes = True
@@ -1,6 +1,7 @@
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_filter import BaseFilter
+from app.adapters.filters.academy.academy_geo_search import academy_geo_search
 from app.entities import AcademyEntity
 from app.shared.query_constants import AppQueryConstants
 
@@ -46,6 +47,15 @@ class AcademyFilter(BaseFilter[AcademyEntity]):
         average_price_to: float | None = AppQueryConstants.StandardOptionalDecimalQuery(
             "Средняя цена до"
         ),
+        latitude: float | None = AppQueryConstants.StandardOptionalLatitudeQuery(
+            "Широта точки поиска (вместе с longitude возвращает distance)"
+        ),
+        longitude: float | None = AppQueryConstants.StandardOptionalLongitudeQuery(
+            "Долгота точки поиска"
+        ),
+        radius: float | None = AppQueryConstants.StandardOptionalDecimalQuery(
+            "Радиус поиска от точки в метрах"
+        ),
         is_show_deleted: bool = AppQueryConstants.StandardBooleanQuery(
             "Показывать удаленные данные?"
         ),
@@ -66,6 +76,13 @@ class AcademyFilter(BaseFilter[AcademyEntity]):
         self.average_price_from = average_price_from
         self.average_price_to = average_price_to
         self.is_show_deleted = is_show_deleted
+        self.latitude = latitude
+        self.longitude = longitude
+        self.radius = radius
+        # order_by=distance - сортировка по близости к точке (KNN), затем по id
+        self.sort_by_distance = order_by == academy_geo_search.DISTANCE_ORDER_FIELD
+        if self.sort_by_distance:
+            self.order_by = "id"
 
     def get_search_filters(self) -> list[str] | None:
         return [
@@ -83,6 +100,25 @@ class AcademyFilter(BaseFilter[AcademyEntity]):
             "email",
         ]
 
+    def has_point(self) -> bool:
+        return self.latitude is not None and self.longitude is not None
+
+    def get_options(self) -> list:
+        """
+        При переданной точке заполняет distance - расстояние до неё в метрах.
+        """
+        if self.has_point():
+            return academy_geo_search.options(self.latitude, self.longitude)
+        return []
+
+    def get_order_expressions(self) -> list:
+        """
+        При order_by=distance и переданной точке - сортировка по близости (KNN).
+        """
+        if self.sort_by_distance and self.has_point():
+            return [academy_geo_search.nearest(self.latitude, self.longitude)]
+        return []
+
     def apply(self) -> list[SQLAlchemyQuery]:
         filters = []
 
@@ -113,4 +149,7 @@ class AcademyFilter(BaseFilter[AcademyEntity]):
         if self.average_price_to is not None:
             filters.append(AcademyEntity.average_price <= self.average_price_to)
 
+        if self.radius is not None and self.has_point():
+            filters.append(academy_geo_search.within(self.latitude, self.longitude, self.radius))
+
         return filters
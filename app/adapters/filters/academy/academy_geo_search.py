@@ -0,0 +1,8 @@
+from app.adapters.filters.geo_search import GeoSearch
+from app.entities import AcademyEntity
+
+# Геопоиск академий по вычисляемой точке location
+academy_geo_search = GeoSearch(
+    location=AcademyEntity.location,
+    distance_attribute=AcademyEntity.distance,
+)
@@ -17,8 +17,13 @@ class BaseFilter(Generic[T], ABC):
         search (str | None): Строка поиска, применяемая к заданным полям.
         order_by (str | None): Поле для сортировки.
         order_direction (str): Направление сортировки ('asc' или 'desc', по умолчанию 'asc').
+        loading_profile (str | None): Профиль подгрузки связей (AppLoadingProfileConstants);
+            None - связи выводятся из DTO ответа (BaseRepository.relationships_for).
     """
 
+    # Не параметр запроса: задаётся маршрутом или use case
+    loading_profile: str | None = None
+
     def __init__(
         self,
         model: T,
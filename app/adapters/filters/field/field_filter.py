@@ -2,6 +2,7 @@ from sqlalchemy import or_, inspect
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_filter import BaseFilter
+from app.adapters.filters.field.field_geo_search import field_geo_search
 from app.entities import FieldEntity
 from app.shared.query_constants import AppQueryConstants
 
@@ -29,6 +30,15 @@ class FieldFilter(BaseFilter[FieldEntity]):
         has_cover: bool | None = AppQueryConstants.StandardOptionalBooleanQuery(
             "Фильтрация по наличию крыши"
         ),
+        latitude: float | None = AppQueryConstants.StandardOptionalLatitudeQuery(
+            "Широта точки поиска (вместе с longitude возвращает distance)"
+        ),
+        longitude: float | None = AppQueryConstants.StandardOptionalLongitudeQuery(
+            "Долгота точки поиска"
+        ),
+        radius: float | None = AppQueryConstants.StandardOptionalDecimalQuery(
+            "Радиус поиска от точки в метрах"
+        ),
         is_show_deleted: bool = AppQueryConstants.StandardBooleanQuery(
             "Показывать удаленные данные?"
         ),
@@ -43,6 +53,13 @@ class FieldFilter(BaseFilter[FieldEntity]):
         self.is_active = is_active
         self.has_cover = has_cover
         self.is_show_deleted = is_show_deleted
+        self.latitude = latitude
+        self.longitude = longitude
+        self.radius = radius
+        # order_by=distance - сортировка по близости к точке (KNN), затем по id
+        self.sort_by_distance = order_by == field_geo_search.DISTANCE_ORDER_FIELD
+        if self.sort_by_distance:
+            self.order_by = "id"
 
     def get_search_filters(self) -> list[str] | None:
         return [
@@ -67,6 +84,33 @@ class FieldFilter(BaseFilter[FieldEntity]):
             "tiktok",
         ]
 
+    def has_point(self) -> bool:
+        return self.latitude is not None and self.longitude is not None
+
+    def get_options(self) -> list:
+        """
+        При переданной точке заполняет distance - расстояние до неё в метрах.
+        """
+        if self.has_point():
+            return field_geo_search.options(self.latitude, self.longitude)
+        return []
+
+    def get_projection_columns(self) -> dict:
+        """
+        То же для выборки проекцией: distance как дополнительный столбец.
+        """
+        if self.has_point():
+            return field_geo_search.columns(self.latitude, self.longitude)
+        return {}
+
+    def get_order_expressions(self) -> list:
+        """
+        При order_by=distance и переданной точке - сортировка по близости (KNN).
+        """
+        if self.sort_by_distance and self.has_point():
+            return [field_geo_search.nearest(self.latitude, self.longitude)]
+        return []
+
     def apply(self) -> list[SQLAlchemyQuery]:
         filters = []
 
@@ -94,4 +138,7 @@ class FieldFilter(BaseFilter[FieldEntity]):
         if self.has_cover is not None:
             filters.append(self.model.has_cover.is_(self.has_cover))
 
+        if self.radius is not None and self.has_point():
+            filters.append(field_geo_search.within(self.latitude, self.longitude, self.radius))
+
         return filters
@@ -0,0 +1,8 @@
+from app.adapters.filters.geo_search import GeoSearch
+from app.entities import FieldEntity
+
+# Геопоиск полей по вычисляемой точке location
+field_geo_search = GeoSearch(
+    location=FieldEntity.location,
+    distance_attribute=FieldEntity.distance,
+)
@@ -0,0 +1,76 @@
+import re
+from typing import Any
+
+from sqlalchemy import func, literal, literal_column, or_
+
+
+class FullTextSearch:
+    """
+    Построитель условий полнотекстового поиска PostgreSQL.
+
+    Объединяет поиск по tsvector (GIN-индекс) с префиксным сопоставлением
+    для автодополнения и поиск подстроки по trigram-индексам (pg_trgm)
+    для коротких фрагментов и артикулов.
+
+    Атрибуты:
+        search_vector: Столбец tsvector с предвычисленным документом.
+        trigram_columns: Столбцы с GIN-индексом gin_trgm_ops.
+    """
+
+    # Словари PostgreSQL, по которым разбирается запрос (kk -> simple)
+    TS_CONFIGS = ("russian", "english", "simple")
+    WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+    def __init__(self, search_vector: Any, trigram_columns: list[Any] | None = None) -> None:
+        self.search_vector = search_vector
+        self.trigram_columns = trigram_columns or []
+
+    @classmethod
+    def to_prefix_query(cls, search: str) -> str | None:
+        """
+        Преобразует пользовательский ввод в безопасный tsquery с префиксами.
+
+        Например: "кроссовки най" -> "кроссовки:* & най:*".
+        """
+        words = cls.WORD_PATTERN.findall(search.lower())
+        if not words:
+            return None
+        return " & ".join(f"{word}:*" for word in words)
+
+    def ts_query(self, search: str) -> Any | None:
+        """Возвращает tsquery, объединённый по всем словарям через OR."""
+        prefix_query = self.to_prefix_query(search)
+        if prefix_query is None:
+            return None
+        query = None
+        for config in self.TS_CONFIGS:
+            # Имя словаря - константа класса, поэтому безопасно встраивается в SQL
+            config_query = func.to_tsquery(literal_column(f"'{config}'::regconfig"), prefix_query)
+            query = config_query if query is None else query.op("||")(config_query)
+        return query
+
+    def filter(self, search: str) -> Any | None:
+        """
+        Условие поиска: совпадение по tsvector ИЛИ подстрока в trigram-столбцах.
+        """
+        ts_query = self.ts_query(search)
+        conditions = []
+        if ts_query is not None:
+            conditions.append(self.search_vector.op("@@")(ts_query))
+        conditions.extend(column.ilike(f"%{search}%") for column in self.trigram_columns)
+        if not conditions:
+            return None
+        return or_(*conditions)
+
+    def rank(self, search: str) -> Any:
+        """
+        Выражение релевантности: ранг tsvector + максимальная trigram-схожесть.
+        """
+        ts_query = self.ts_query(search)
+        rank = func.ts_rank_cd(self.search_vector, ts_query) if ts_query is not None else literal(0)
+        if self.trigram_columns:
+            similarity = func.greatest(
+                *[func.coalesce(func.similarity(column, search), 0) for column in self.trigram_columns]
+            )
+            rank = rank + similarity
+        return rank
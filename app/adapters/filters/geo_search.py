@@ -0,0 +1,54 @@
+from typing import Any
+
+from geoalchemy2 import Geography
+from sqlalchemy import cast, func
+from sqlalchemy.orm import with_expression
+
+
+class GeoSearch:
+    """
+    Построитель геозапросов PostGIS по столбцу geography(POINT, 4326).
+
+    Радиус (ST_DWithin) и сортировка по близости (оператор KNN <->)
+    выполняются по GiST-индексу, расстояние в метрах подставляется
+    в query_expression-атрибут сущности.
+
+    Атрибуты:
+        location: Столбец geography с GiST-индексом.
+        distance_attribute: Атрибут query_expression() для расстояния.
+    """
+
+    # Значение order_by, включающее сортировку по близости к точке
+    DISTANCE_ORDER_FIELD = "distance"
+
+    def __init__(self, location: Any, distance_attribute: Any) -> None:
+        self.location = location
+        self.distance_attribute = distance_attribute
+
+    @staticmethod
+    def point(latitude: float, longitude: float) -> Any:
+        """Точка geography для переданных координат."""
+        return cast(
+            func.ST_SetSRID(func.ST_MakePoint(longitude, latitude), 4326),
+            Geography(geometry_type="POINT", srid=4326),
+        )
+
+    def within(self, latitude: float, longitude: float, radius: float) -> Any:
+        """Условие: объект находится не дальше radius метров от точки."""
+        return func.ST_DWithin(self.location, self.point(latitude, longitude), radius)
+
+    def distance(self, latitude: float, longitude: float) -> Any:
+        """Точное расстояние до точки в метрах."""
+        return func.ST_Distance(self.location, self.point(latitude, longitude))
+
+    def nearest(self, latitude: float, longitude: float) -> Any:
+        """Выражение сортировки k ближайших соседей (KNN по GiST-индексу)."""
+        return self.location.op("<->")(self.point(latitude, longitude))
+
+    def options(self, latitude: float, longitude: float) -> list[Any]:
+        """Опции запроса, заполняющие атрибут расстояния у загруженных сущностей."""
+        return [with_expression(self.distance_attribute, self.distance(latitude, longitude))]
+
+    def columns(self, latitude: float, longitude: float) -> dict[str, Any]:
+        """Столбец расстояния для выборки проекцией (имя поля -> выражение)."""
+        return {self.distance_attribute.key: self.distance(latitude, longitude)}
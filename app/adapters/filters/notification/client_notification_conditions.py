@@ -0,0 +1,51 @@
+from sqlalchemy import and_, exists, func, or_, select
+
+from app.entities import NotificationEntity, NotificationReadStateEntity, ReadNotificationEntity
+
+
+def broadcast_condition():
+    """Общая рассылка по топикам: user_id IS NULL AND topics IS NOT NULL."""
+    return and_(
+        NotificationEntity.user_id.is_(None),
+        NotificationEntity.topics.isnot(None),
+    )
+
+
+def visible_to_user_condition(user_id: int):
+    """
+    Уведомления, доступные пользователю: личные (user_id == пользователь)
+    или общие рассылки по топикам (user_id IS NULL AND topics IS NOT NULL).
+
+    Обе ветки покрываются индексами ix_notifications_user_id_id и
+    ix_notifications_broadcast_id.
+    """
+    return or_(NotificationEntity.user_id == user_id, broadcast_condition())
+
+
+def read_until_id_subquery(user_id: int):
+    """Отметка прочтения пользователя (0, если пользователь ещё ничего не отмечал)."""
+    return func.coalesce(
+        select(NotificationReadStateEntity.read_until_id)
+        .where(NotificationReadStateEntity.user_id == user_id)
+        .scalar_subquery(),
+        0,
+    )
+
+
+def read_by_user_condition(user_id: int):
+    """
+    Уведомление прочитано пользователем: id не выше его отметки прочтения
+    или есть запись read_notifications этого пользователя.
+
+    Проверяются только строки текущего пользователя, поэтому стоимость не
+    зависит от количества пользователей, прочитавших общую рассылку.
+    """
+    return or_(
+        NotificationEntity.id <= read_until_id_subquery(user_id),
+        exists(
+            select(ReadNotificationEntity.id).where(
+                ReadNotificationEntity.notification_id == NotificationEntity.id,
+                ReadNotificationEntity.user_id == user_id,
+            )
+        ),
+    )
@@ -0,0 +1,32 @@
+from sqlalchemy.orm import Query as SQLAlchemyQuery
+
+from app.adapters.filters.base_filter import BaseFilter
+from app.entities import NotificationEntity
+from app.shared.query_constants import AppQueryConstants
+
+
+class NotificationFeedFilter(BaseFilter[NotificationEntity]):
+    def __init__(
+        self,
+        per_page: int = AppQueryConstants.StandardPerPageQuery(
+            "Количество уведомлений на странице ленты"
+        ),
+        cursor: int | None = AppQueryConstants.StandardOptionalIntegerQuery(
+            "Курсор: next_cursor предыдущей страницы ленты"
+        ),
+        topic_ids: (
+            list[int] | None
+        ) = AppQueryConstants.StandardOptionalIntegerArrayQuery(
+            "Ограничить ленту указанными топиками"
+        ),
+    ) -> None:
+        super().__init__(model=NotificationEntity)
+        self.per_page = per_page
+        self.cursor = cursor
+        self.topic_ids = topic_ids
+
+    def get_search_filters(self) -> list[str] | None:
+        return None
+
+    def apply(self) -> list[SQLAlchemyQuery]:
+        return [self.model.id < self.cursor] if self.cursor is not None else []
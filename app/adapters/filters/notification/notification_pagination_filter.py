@@ -1,8 +1,9 @@
-from sqlalchemy import inspect, or_, exists, select
+from sqlalchemy import inspect, or_
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_pagination_filter import BasePaginationFilter
-from app.entities import NotificationEntity, ReadNotificationEntity
+from app.adapters.filters.notification.client_notification_conditions import read_by_user_condition
+from app.entities import NotificationEntity
 from app.shared.query_constants import AppQueryConstants
 
 
@@ -95,15 +96,10 @@ class NotificationPaginationFilter(BasePaginationFilter[NotificationEntity]):
 
         # Фильтр по прочитанным/непрочитанным уведомлениям
         if self.is_read is not None and self.current_user_id is not None:
-            read_exists = exists(
-                select(ReadNotificationEntity.id).where(
-                    ReadNotificationEntity.notification_id == self.model.id,
-                    ReadNotificationEntity.user_id == self.current_user_id,
-                )
-            )
+            is_read = read_by_user_condition(self.current_user_id)
             if self.is_read:
-                filters.append(read_exists)
+                filters.append(is_read)
             else:
-                filters.append(~read_exists)
+                filters.append(~is_read)
 
         return filters
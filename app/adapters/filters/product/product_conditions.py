@@ -0,0 +1,65 @@
+from typing import Any
+
+from sqlalchemy import and_
+
+from app.adapters.filters.product.product_facet import ProductFacet
+from app.adapters.filters.product.product_modification_filter import modification_value_condition
+from app.adapters.filters.product.product_search import product_search
+from app.entities import ProductEntity
+
+
+def product_common_conditions(filter: Any) -> list:
+    """
+    Условия, не являющиеся фасетами: применяются и к списку, и ко всем счётчикам.
+
+    Общие для ProductFilter и ProductPaginationFilter.
+    """
+    conditions = []
+
+    if filter.search:
+        search_condition = product_search.filter(filter.search)
+        if search_condition is not None:
+            conditions.append(search_condition)
+
+    if filter.is_recommended is not None:
+        conditions.append(ProductEntity.is_recommended.is_(filter.is_recommended))
+
+    if filter.is_active is not None:
+        conditions.append(ProductEntity.is_active.is_(filter.is_active))
+
+    return conditions
+
+
+def product_facet_conditions(filter: Any) -> dict[str, Any]:
+    """
+    Условия фасетов по имени (ProductFacet). Счётчик каждого фасета
+    считается без его собственного условия, чтобы показывать альтернативы.
+    """
+    conditions = {}
+
+    if filter.category_ids:
+        conditions[ProductFacet.Category] = ProductEntity.category_id.in_(filter.category_ids)
+
+    if filter.city_ids:
+        conditions[ProductFacet.City] = ProductEntity.city_id.in_(filter.city_ids)
+
+    price_conditions = []
+    if filter.min_price is not None:
+        price_conditions.append(ProductEntity.base_price >= filter.min_price)
+    if filter.max_price is not None:
+        price_conditions.append(ProductEntity.base_price <= filter.max_price)
+    if price_conditions:
+        conditions[ProductFacet.Price] = and_(*price_conditions)
+
+    if filter.gender is not None:
+        conditions[ProductFacet.Gender] = ProductEntity.gender == filter.gender
+
+    if filter.is_for_children is not None:
+        conditions[ProductFacet.IsForChildren] = ProductEntity.is_for_children.is_(filter.is_for_children)
+
+    for modification_type_id, titles in filter.modification_values.items():
+        conditions[ProductFacet.modification(modification_type_id)] = modification_value_condition(
+            modification_type_id, titles
+        )
+
+    return conditions
@@ -0,0 +1,20 @@
+class ProductFacet:
+    """
+    Имена фасетов каталога товаров.
+
+    Используются как ключи условий фильтра (ProductFilter.get_facet_filters)
+    и как значение столбца facet в результате ProductRepository.get_facets.
+    """
+
+    Total = "total"
+    Category = "category"
+    City = "city"
+    Price = "price"
+    Gender = "gender"
+    IsForChildren = "is_for_children"
+    Modification = "modification"
+
+    @staticmethod
+    def modification(modification_type_id: int) -> str:
+        """Ключ условия по конкретному типу модификации."""
+        return f"{ProductFacet.Modification}:{modification_type_id}"
@@ -1,8 +1,15 @@
 from decimal import Decimal
-from sqlalchemy import or_, inspect
+from typing import Any
+
 from sqlalchemy.orm import Query as SQLAlchemyQuery
 
 from app.adapters.filters.base_filter import BaseFilter
+from app.adapters.filters.product.product_conditions import (
+    product_common_conditions,
+    product_facet_conditions,
+)
+from app.adapters.filters.product.product_modification_filter import parse_modification_values
+from app.adapters.filters.product.product_search import product_search
 from app.entities import ProductEntity
 from app.shared.query_constants import AppQueryConstants
 
@@ -43,6 +50,11 @@ class ProductFilter(BaseFilter[ProductEntity]):
         is_active: bool | None = AppQueryConstants.StandardOptionalBooleanQuery(
             "Фильтрация по активности товара"
         ),
+        modification_values: (
+            list[str] | None
+        ) = AppQueryConstants.StandardOptionalStringArrayQuery(
+            "Фильтрация по значениям модификаций в формате <ID типа>:<значение>, например 3:M"
+        ),
         is_show_deleted: bool = AppQueryConstants.StandardBooleanQuery(
             "Показывать удаленные данные?"
         ),
@@ -62,6 +74,7 @@ class ProductFilter(BaseFilter[ProductEntity]):
         self.is_recommended = is_recommended
         self.is_active = is_active
         self.is_show_deleted = is_show_deleted
+        self.modification_values = parse_modification_values(modification_values)
 
     def get_search_filters(self) -> list[str] | None:
         return [
@@ -75,46 +88,26 @@ class ProductFilter(BaseFilter[ProductEntity]):
             "value",
         ]
 
-    def apply(self) -> list[SQLAlchemyQuery]:
-        filters = []
-
+    def get_order_expressions(self) -> list:
+        """
+        При поиске результаты сортируются по релевантности, затем по order_by.
+        """
         if self.search:
-            model_columns = {column.key for column in inspect(self.model).columns}
-            valid_fields = [
-                field for field in self.get_search_filters() if field in model_columns
-            ]
-            if valid_fields:
-                filters.append(
-                    or_(
-                        *[
-                            getattr(self.model, field).ilike(f"%{self.search}%")
-                            for field in valid_fields
-                        ]
-                    )
-                )
-
-        if self.category_ids:
-            filters.append(ProductEntity.category_id.in_(self.category_ids))
-
-        if self.city_ids:
-            filters.append(ProductEntity.city_id.in_(self.city_ids))
+            return [product_search.rank(self.search).desc()]
+        return []
 
-        if self.min_price is not None:
-            filters.append(ProductEntity.base_price >= self.min_price)
+    def get_common_filters(self) -> list:
+        """
+        Условия, не являющиеся фасетами: применяются и к списку, и ко всем счётчикам.
+        """
+        return product_common_conditions(self)
 
-        if self.max_price is not None:
-            filters.append(ProductEntity.base_price <= self.max_price)
+    def get_facet_filters(self) -> dict[str, Any]:
+        """
+        Условия фасетов по имени (ProductFacet). Счётчик каждого фасета
+        считается без его собственного условия, чтобы показывать альтернативы.
+        """
+        return product_facet_conditions(self)
 
-        if self.gender is not None:
-            filters.append(ProductEntity.gender == self.gender)
-
-        if self.is_for_children is not None:
-            filters.append(self.model.is_for_children.is_(self.is_for_children))
-
-        if self.is_recommended is not None:
-            filters.append(self.model.is_recommended.is_(self.is_recommended))
-
-        if self.is_active is not None:
-            filters.append(self.model.is_active.is_(self.is_active))
-
-        return filters
+    def apply(self) -> list[SQLAlchemyQuery]:
+        return self.get_common_filters() + list(self.get_facet_filters().values())
@@ -0,0 +1,48 @@
+from typing import Any
+
+from sqlalchemy import exists, func
+
+from app.entities import ModificationValueEntity, ProductEntity
+
+# Разделитель ID типа модификации и значения: "3:M"
+MODIFICATION_VALUE_SEPARATOR = ":"
+
+
+def parse_modification_values(values: list[str] | None) -> dict[int, list[str]]:
+    """
+    Группирует выбранные значения модификаций по типу.
+
+    Формат элемента: "<modification_type_id>:<title_ru>", например "3:M".
+    Некорректные элементы пропускаются.
+    """
+    grouped: dict[int, list[str]] = {}
+    for item in values or []:
+        type_id, separator, title = item.partition(MODIFICATION_VALUE_SEPARATOR)
+        if not separator or not type_id.strip().isdigit() or not title.strip():
+            continue
+        grouped.setdefault(int(type_id), []).append(title.strip().lower())
+    return grouped
+
+
+def normalized_modification_title() -> Any:
+    """
+    Значение модификации в нормализованном виде (нижний регистр).
+
+    Используется и в фильтре, и при группировке фасетов, чтобы варианты
+    написания ("M" и "m") считались одним значением.
+    """
+    return func.lower(ModificationValueEntity.title_ru)
+
+
+def modification_value_condition(modification_type_id: int, titles: list[str]) -> Any:
+    """
+    Товар имеет хотя бы одно из значений titles модификации данного типа
+    (значения внутри типа объединяются через ИЛИ, разные типы - через И).
+    """
+    return exists().where(
+        ModificationValueEntity.product_id == ProductEntity.id,
+        ModificationValueEntity.modification_type_id == modification_type_id,
+        normalized_modification_title().in_(titles),
+        ModificationValueEntity.is_active.is_(True),
+        ModificationValueEntity.deleted_at.is_(None),
+    )
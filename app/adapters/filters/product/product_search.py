@@ -0,0 +1,13 @@
+from app.adapters.filters.full_text_search import FullTextSearch
+from app.entities import ProductEntity
+
+# Поиск товаров: tsvector по названиям/описаниям/артикулу + trigram по названиям и SKU
+product_search = FullTextSearch(
+    search_vector=ProductEntity.search_vector,
+    trigram_columns=[
+        ProductEntity.title_ru,
+        ProductEntity.title_kk,
+        ProductEntity.title_en,
+        ProductEntity.sku,
+    ],
+)
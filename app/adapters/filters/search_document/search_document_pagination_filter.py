@@ -0,0 +1,79 @@
+from sqlalchemy.orm import Query as SQLAlchemyQuery
+
+from app.adapters.filters.base_pagination_filter import BasePaginationFilter
+from app.adapters.filters.search_document.search_document_search import search_document_search
+from app.entities import SearchDocumentEntity
+from app.shared.query_constants import AppQueryConstants
+
+
+class SearchDocumentPaginationFilter(BasePaginationFilter[SearchDocumentEntity]):
+    def __init__(
+        self,
+        per_page: int = AppQueryConstants.StandardPerPageQuery(
+            "Количество результатов на странице"
+        ),
+        page: int = AppQueryConstants.StandardPageQuery("Номер страницы"),
+        search: str | None = AppQueryConstants.StandardOptionalSearchQuery(
+            "Поиск по товарам, полям и академиям"
+        ),
+        order_by: str | None = AppQueryConstants.StandardSortFieldQuery(
+            "Поле сортировки"
+        ),
+        order_direction: str | None = AppQueryConstants.StandardSortDirectionQuery(
+            "Направление сортировки"
+        ),
+        entity_types: (
+            list[str] | None
+        ) = AppQueryConstants.StandardOptionalStringArrayQuery(
+            "Фильтрация по типам: product, field, academy"
+        ),
+        city_ids: (
+            list[int] | None
+        ) = AppQueryConstants.StandardOptionalIntegerArrayQuery(
+            "Фильтрация по городам"
+        ),
+        is_active: bool | None = AppQueryConstants.StandardOptionalBooleanQuery(
+            "Фильтрация по активности"
+        ),
+    ) -> None:
+        super().__init__(
+            model=SearchDocumentEntity,
+            per_page=per_page,
+            page=page,
+            search=search,
+            order_by=order_by,
+            order_direction=order_direction,
+        )
+        self.entity_types = entity_types
+        self.city_ids = city_ids
+        self.is_active = is_active
+
+    def get_search_filters(self) -> list[str] | None:
+        return ["title_ru", "title_kk", "title_en", "keywords", "body_ru", "body_kk", "body_en"]
+
+    def get_order_expressions(self) -> list:
+        """
+        При поиске результаты сортируются по релевантности, затем по order_by.
+        """
+        if self.search:
+            return [search_document_search.rank(self.search).desc()]
+        return []
+
+    def apply(self) -> list[SQLAlchemyQuery]:
+        filters = []
+
+        if self.search:
+            search_filter = search_document_search.filter(self.search)
+            if search_filter is not None:
+                filters.append(search_filter)
+
+        if self.entity_types:
+            filters.append(self.model.entity_type.in_(self.entity_types))
+
+        if self.city_ids:
+            filters.append(self.model.city_id.in_(self.city_ids))
+
+        if self.is_active is not None:
+            filters.append(self.model.is_active.is_(self.is_active))
+
+        return filters
@@ -0,0 +1,12 @@
+from app.adapters.filters.full_text_search import FullTextSearch
+from app.entities import SearchDocumentEntity
+
+# Единый поиск: tsvector по названиям/описаниям/адресам + trigram по названиям
+search_document_search = FullTextSearch(
+    search_vector=SearchDocumentEntity.search_vector,
+    trigram_columns=[
+        SearchDocumentEntity.title_ru,
+        SearchDocumentEntity.title_kk,
+        SearchDocumentEntity.title_en,
+    ],
+)
@@ -1,10 +1,12 @@
+from datetime import date
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
-from app.entities import AcademyEntity
+from app.entities import AcademyEntity, AcademyGalleryEntity, AcademyGroupEntity, AcademyGroupScheduleEntity
 
 
 class AcademyRepository(BaseRepository[AcademyEntity]):
@@ -16,3 +18,42 @@ class AcademyRepository(BaseRepository[AcademyEntity]):
             selectinload(self.model.image),
             selectinload(self.model.city),
         ]
+
+    async def get_full_profile(
+        self, id: int, schedule_from: date, schedule_to: date
+    ) -> AcademyEntity | None:
+        """
+        Загружает академию с галереями, группами и расписанием групп за период одним вызовом execute.
+
+        Связи подгружаются selectin-загрузчиками: число SQL-запросов фиксировано и не зависит от количества галерей и групп.
+        Обратные ссылки (gallery.academy, group.academy, schedule.group) берутся
+        из identity map без дополнительных запросов.
+        Мягко удалённые академии не исключаются.
+
+        Args:
+            id: ID академии
+            schedule_from: Первый день периода расписания
+            schedule_to: Последний день периода расписания
+        """
+        schedules = AcademyGroupEntity.academy_group_schedules.and_(
+            AcademyGroupScheduleEntity.training_date.between(schedule_from, schedule_to)
+        )
+        query = (
+            select(self.model)
+            .where(self.model.id == id)
+            .options(
+                *self.default_relationships(),
+                selectinload(self.model.academy_galleries).options(
+                    selectinload(AcademyGalleryEntity.academy),
+                    selectinload(AcademyGalleryEntity.group),
+                    selectinload(AcademyGalleryEntity.file),
+                ),
+                selectinload(self.model.academy_groups).options(
+                    selectinload(AcademyGroupEntity.academy),
+                    selectinload(AcademyGroupEntity.image),
+                    selectinload(schedules).selectinload(AcademyGroupScheduleEntity.group),
+                ),
+            )
+        )
+        result = await self.db.execute(query)
+        return result.scalars().first()
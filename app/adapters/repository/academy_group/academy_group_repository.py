@@ -1,5 +1,6 @@
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,3 +17,13 @@ class AcademyGroupRepository(BaseRepository[AcademyGroupEntity]):
             selectinload(self.model.academy),
             selectinload(self.model.image),
         ]
+
+    async def get_academy_ids(self, group_ids: list[int | None]) -> list[int]:
+        """Возвращает ID академий, которым принадлежат группы."""
+        group_ids = [group_id for group_id in group_ids if group_id]
+        if not group_ids:
+            return []
+        result = await self.db.execute(
+            select(self.model.academy_id).where(self.model.id.in_(group_ids)).distinct()
+        )
+        return list(result.scalars().all())
@@ -1,12 +1,18 @@
-from typing import Any, Generic, TypeVar
+from typing import Any, AsyncIterator, Generic, TypeVar
 from datetime import datetime
 from pydantic import BaseModel
-from sqlalchemy import asc, desc, func, select, update
+from sqlalchemy import asc, desc, func, insert, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Query
+from sqlalchemy.orm import Query, aliased
 from app.adapters.dto.pagination_dto import Pagination
+from app.adapters.repository.loading_profile import get_dto_load_plan
+from app.adapters.repository.projection_plan import get_projection_plan
+from app.adapters.repository.repository_loader import RepositoryLoader
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
+from app.shared.loading_profile_constants import AppLoadingProfileConstants
 
 T = TypeVar("T")
 
@@ -24,14 +30,28 @@ class BaseRepository(Generic[T]):
         options: list[Any] | None = None,
         include_deleted_filter: bool = False,
     ) -> T | None:
-        """Получение объекта по ID."""
+        """
+        Получение объекта по ID.
+
+        Без options запрос идёт через загрузчик запроса (RepositoryLoader):
+        повторное получение той же записи не обращается к базе, а вызовы
+        в одном такте (asyncio.gather) объединяются в один WHERE id IN (...).
+        """
+        if not options:
+            return await RepositoryLoader.for_session(self.model, self.db, include_deleted_filter).load(id)
         filters = [self.model.id == id]
         filters = self._apply_soft_delete_filter(filters, include_deleted_filter)
-        query = select(self.model).filter(*filters)
-        if options:
-            query = query.options(*options)
+        query = select(self.model).filter(*filters).options(*options)
         result = await self.db.execute(query)
-        return result.scalars().first()
+        obj = result.scalars().first()
+        self._prime([obj], include_deleted_filter)
+        return obj
+
+    async def get_many(self, ids: list[int], include_deleted_filter: bool = False) -> list[T]:
+        """Получение объектов по списку ID одним запросом (в порядке ids, без ненайденных)."""
+        loader = RepositoryLoader.for_session(self.model, self.db, include_deleted_filter)
+        found = await loader.load_many(ids)
+        return [found[id] for id in dict.fromkeys(ids) if found[id] is not None]
 
     async def get_all(
         self,
@@ -58,16 +78,49 @@ class BaseRepository(Generic[T]):
         order_by: str | None = None,
         order_direction: str = "asc",
         include_deleted_filter: bool = False,
+        order_expressions: list[Any] | None = None,
     ) -> list[T]:
         """Получение объектов с фильтрацией и сортировкой."""
         filters = self._apply_soft_delete_filter(filters, include_deleted_filter)
         query = select(self.model).filter(*filters)
         if options:
             query = query.options(*options)
+        if order_expressions:
+            query = query.order_by(*order_expressions)
         if order_by:
             query = self._apply_order_by(query, order_by, order_direction)
         result = await self.db.execute(query)
-        return result.scalars().all()
+        models = result.scalars().all()
+        self._prime(models, include_deleted_filter)
+        return models
+
+    async def stream_with_filters(
+        self,
+        filters: list[Any],
+        options: list[Any] | None = None,
+        order_by: str | None = None,
+        order_direction: str = "asc",
+        include_deleted_filter: bool = False,
+        order_expressions: list[Any] | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[T]:
+        """
+        Потоковое получение объектов через серверный курсор.
+
+        Строки читаются пачками по batch_size (yield_per), связи из options
+        подгружаются для каждой пачки, поэтому память не зависит от размера таблицы.
+        """
+        filters = self._apply_soft_delete_filter(filters, include_deleted_filter)
+        query = select(self.model).filter(*filters)
+        if options:
+            query = query.options(*options)
+        if order_expressions:
+            query = query.order_by(*order_expressions)
+        if order_by:
+            query = self._apply_order_by(query, order_by, order_direction)
+        result = await self.db.stream_scalars(query.execution_options(yield_per=batch_size))
+        async for model in result:
+            yield model
 
     async def get_first_with_filters(
         self,
@@ -85,7 +138,9 @@ class BaseRepository(Generic[T]):
         if order_by:
             query = self._apply_order_by(query, order_by, order_direction)
         result = await self.db.execute(query)
-        return result.scalars().first()
+        obj = result.scalars().first()
+        self._prime([obj], include_deleted_filter)
+        return obj
 
     async def paginate(
         self,
@@ -97,12 +152,19 @@ class BaseRepository(Generic[T]):
         order_by: str | None = None,
         order_direction: str = "asc",
         include_deleted_filter: bool = False,
+        order_expressions: list[Any] | None = None,
     ) -> Pagination:
-        """Пагинация объектов с фильтрацией и сортировкой."""
+        """
+        Пагинация объектов с фильтрацией и сортировкой.
+
+        order_expressions (например, релевантность поиска) применяются перед order_by.
+        """
         filters = self._apply_soft_delete_filter(filters, include_deleted_filter)
         query = select(self.model).filter(*filters)
         if options:
             query = query.options(*options)
+        if order_expressions:
+            query = query.order_by(*order_expressions)
         if order_by:
             query = self._apply_order_by(query, order_by, order_direction)
 
@@ -125,19 +187,145 @@ class BaseRepository(Generic[T]):
             total_items=total_items,
         )
 
+    async def get_projected(
+        self,
+        dto: type[BaseModel],
+        filters: list[Any] | None = None,
+        order_by: str | None = None,
+        order_direction: str = "asc",
+        include_deleted_filter: bool = False,
+        order_expressions: list[Any] | None = None,
+        extra_columns: dict[str, Any] | None = None,
+        as_dict: bool = False,
+    ) -> list[BaseModel] | list[dict]:
+        """
+        Список объектов проекцией: только столбцы, нужные dto, одним запросом.
+
+        Связи "многие к одному" из dto подтягиваются LEFT JOIN вместо
+        selectinload, ORM-объекты не создаются.
+        extra_columns - выражения для полей dto вне столбцов сущности
+        (например, distance при геопоиске).
+        При as_dict=True возвращаются словари без валидации dto.
+        """
+        filters = self._apply_soft_delete_filter(filters or [], include_deleted_filter)
+        plan, query = self._projected_query(dto, filters, extra_columns)
+        query = self._apply_projected_order(query, order_by, order_direction, order_expressions)
+        result = await self.db.execute(query)
+        return self._build_projected(plan, result.all(), dto, as_dict)
+
+    async def paginate_projected(
+        self,
+        dto: type[BaseModel],
+        page: int = 1,
+        per_page: int = 20,
+        filters: list[Any] | None = None,
+        order_by: str | None = None,
+        order_direction: str = "asc",
+        include_deleted_filter: bool = False,
+        order_expressions: list[Any] | None = None,
+        extra_columns: dict[str, Any] | None = None,
+        as_dict: bool = False,
+    ) -> Pagination:
+        """
+        Пагинация проекцией (см. get_projected).
+
+        Количество считается по таблице сущности без JOIN связей.
+        """
+        filters = self._apply_soft_delete_filter(filters or [], include_deleted_filter)
+        total_items = await self.db.scalar(
+            select(func.count()).select_from(self.model).filter(*filters)
+        )
+        total_pages = (total_items + per_page - 1) // per_page
+
+        plan, query = self._projected_query(dto, filters, extra_columns)
+        query = self._apply_projected_order(query, order_by, order_direction, order_expressions)
+        result = await self.db.execute(query.limit(per_page).offset((page - 1) * per_page))
+
+        return Pagination(
+            items=self._build_projected(plan, result.all(), dto, as_dict),
+            per_page=per_page,
+            page=page,
+            total_pages=total_pages,
+            total_items=total_items,
+        )
+
+    async def get_version(
+        self,
+        filters: list[Any],
+        relationships: list[str] | None = None,
+        include_deleted_filter: bool = False,
+    ) -> ResourceVersion | None:
+        """
+        Версия записи для условного GET: id и updated_at записи и её связей
+        "многие к одному" одним запросом, без загрузки ORM-объектов.
+        """
+        filters = self._apply_soft_delete_filter(list(filters), include_deleted_filter)
+        columns = [self.model.id, self.model.updated_at]
+        joins = []
+        for name in relationships or []:
+            alias = aliased(getattr(self.model, name).property.mapper.class_)
+            columns.append(alias.updated_at)
+            joins.append(getattr(self.model, name).of_type(alias))
+        query = select(*columns).select_from(self.model)
+        for join in joins:
+            query = query.outerjoin(join)
+        row = (await self.db.execute(query.filter(*filters).limit(1))).first()
+        if row is None:
+            return None
+        return ResourceVersion(self.model.__tablename__, row[0], list(row[1:]))
+
     async def create(self, obj: T) -> T:
-        """Создание объекта."""
+        """Создание объекта (в UnitOfWork - flush без commit)."""
         try:
             self.db.add(obj)
-            await self.db.commit()
-            await self.db.refresh(obj)
+            await self._save(obj)
+            self._prime([obj])
             return obj
         except IntegrityError as e:
-            await self.db.rollback()
+            await self._rollback()
+            raise ValueError(self._parse_integrity_error(e))
+
+    async def create_many(self, objs: list[T], commit: bool = True) -> list[T]:
+        """
+        Создание нескольких объектов одним flush.
+
+        ORM объединяет вставки одного класса в пакетный INSERT ... RETURNING,
+        обработчики событий ORM вызываются для каждого объекта. Объекты
+        не перечитываются после commit.
+        """
+        if not objs:
+            return objs
+        try:
+            self.db.add_all(objs)
+            if commit:
+                await self._save()
+            else:
+                await self.db.flush()
+            return objs
+        except IntegrityError as e:
+            await self._rollback()
+            raise ValueError(self._parse_integrity_error(e))
+
+    async def bulk_create(self, rows: list[dict], commit: bool = True) -> int:
+        """
+        Пакетная вставка строк в обход ORM (executemany).
+
+        Обработчики событий ORM не вызываются; все словари должны содержать
+        одинаковый набор полей.
+        """
+        if not rows:
+            return 0
+        try:
+            await self.db.execute(insert(self.model), rows)
+            if commit:
+                await self._save()
+            return len(rows)
+        except IntegrityError as e:
+            await self._rollback()
             raise ValueError(self._parse_integrity_error(e))
 
     async def update(self, obj: T, dto: BaseModel | dict) -> T:
-        """Обновление объекта."""
+        """Обновление объекта (в UnitOfWork - flush без commit)."""
         try:
             if isinstance(dto, dict):
                 data = dto
@@ -148,11 +336,47 @@ class BaseRepository(Generic[T]):
             for field, value in data.items():
                 if hasattr(obj, field):
                     setattr(obj, field, value)
-            await self.db.commit()
-            await self.db.refresh(obj)
+            await self._save(obj)
             return obj
         except IntegrityError as e:
-            await self.db.rollback()
+            await self._rollback()
+            raise ValueError(self._parse_integrity_error(e))
+
+    async def bulk_update(self, rows: list[dict], commit: bool = True) -> int:
+        """
+        Пакетное обновление по первичному ключу (executemany).
+
+        Каждый словарь обязан содержать "id" и обновляемые поля.
+        """
+        if not rows:
+            return 0
+        try:
+            await self.db.execute(
+                update(self.model).execution_options(synchronize_session=False), rows
+            )
+            if commit:
+                await self._save()
+            return len(rows)
+        except IntegrityError as e:
+            await self._rollback()
+            raise ValueError(self._parse_integrity_error(e))
+
+    async def update_with_filters(
+        self, filters: list[Any], values: dict, commit: bool = True
+    ) -> int:
+        """Обновление всех записей, подходящих под фильтры, одним запросом."""
+        try:
+            result = await self.db.execute(
+                update(self.model)
+                .where(*filters)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+            if commit:
+                await self._save()
+            return result.rowcount or 0
+        except IntegrityError as e:
+            await self._rollback()
             raise ValueError(self._parse_integrity_error(e))
 
     async def delete(self, id: int, force_delete: bool = False) -> bool:
@@ -166,7 +390,7 @@ class BaseRepository(Generic[T]):
         else:
             await self.db.delete(obj)
 
-        await self.db.commit()
+        await self._save()
         return True
 
     async def count(
@@ -178,6 +402,34 @@ class BaseRepository(Generic[T]):
         result = await self.db.execute(query)
         return result.scalar() or 0
 
+    async def _save(self, obj: T | None = None) -> None:
+        """
+        Фиксация записи: commit и перечитывание obj, а внутри UnitOfWork - flush.
+
+        Значения, вычисляемые базой, flush возвращает только у сущностей с
+        eager_defaults; commit выполнит UnitOfWork при выходе из блока.
+        """
+        if UnitOfWork.is_active(self.db):
+            await self.db.flush()
+            return
+        await self.db.commit()
+        if obj is not None:
+            await self.db.refresh(obj)
+
+    def _prime(self, objs: list[T | None], include_deleted_filter: bool = False) -> None:
+        """
+        Запоминает загруженные записи в загрузчике запроса, чтобы последующий
+        get(id) не обращался к базе. Записи без удалённых подходят обоим загрузчикам.
+        """
+        RepositoryLoader.for_session(self.model, self.db, include_deleted=True).prime(objs)
+        if not include_deleted_filter:
+            RepositoryLoader.for_session(self.model, self.db).prime(objs)
+
+    async def _rollback(self) -> None:
+        """Откат после ошибки; внутри UnitOfWork откатывает блок целиком при выходе."""
+        if not UnitOfWork.is_active(self.db):
+            await self.db.rollback()
+
     def _parse_integrity_error(self, error: IntegrityError) -> str:
         """Парсинг ошибок уникальности."""
         orig_msg = str(error.orig)
@@ -191,6 +443,46 @@ class BaseRepository(Generic[T]):
             return query.order_by(desc(getattr(self.model, order_by)))
         return query.order_by(asc(getattr(self.model, order_by)))
 
+    def _projected_query(
+        self,
+        dto: type[BaseModel],
+        filters: list[Any],
+        extra_columns: dict[str, Any] | None,
+    ) -> tuple[Any, Any]:
+        """Запрос плоских строк по плану проекции dto."""
+        extra_columns = extra_columns or {}
+        plan = get_projection_plan(self.model, dto, tuple(extra_columns))
+        query = select(
+            *plan.columns,
+            *(expression.label(name) for name, expression in extra_columns.items()),
+        ).select_from(self.model)
+        for join in plan.joins:
+            query = query.outerjoin(join)
+        return plan, query.filter(*filters)
+
+    def _apply_projected_order(
+        self,
+        query: Any,
+        order_by: str | None,
+        order_direction: str,
+        order_expressions: list[Any] | None,
+    ) -> Any:
+        if order_expressions:
+            query = query.order_by(*order_expressions)
+        if order_by:
+            query = self._apply_order_by(query, order_by, order_direction)
+        return query
+
+    @staticmethod
+    def _build_projected(
+        plan: Any, rows: list[Any], dto: type[BaseModel], as_dict: bool
+    ) -> list[BaseModel] | list[dict]:
+        offset = len(plan.columns)
+        items = [plan.to_dict(row, offset) for row in rows]
+        if as_dict:
+            return items
+        return [dto.model_validate(item) for item in items]
+
     def _apply_soft_delete_filter(
         self, filters: list[Any] | None, include_deleted_filter: bool = False
     ) -> list[Any]:
@@ -203,3 +495,49 @@ class BaseRepository(Generic[T]):
     def default_relationships(self) -> list[Any]:
         """Определяет список стандартных подгружаемых связей."""
         return []
+
+    def loading_profiles(self) -> dict[str, list[Any]]:
+        """
+        Именованные профили подгрузки связей (AppLoadingProfileConstants).
+
+        По умолчанию все профили, кроме minimal, совпадают с default_relationships;
+        репозиторий переопределяет профили, чьи связи различаются.
+        """
+        relationships = self.default_relationships()
+        return {
+            AppLoadingProfileConstants.Minimal: [],
+            AppLoadingProfileConstants.List: relationships,
+            AppLoadingProfileConstants.Detail: relationships,
+            AppLoadingProfileConstants.Admin: relationships,
+        }
+
+    def relationships(self, profile: str) -> list[Any]:
+        """Связи именованного профиля."""
+        profiles = self.loading_profiles()
+        if profile not in profiles:
+            raise ValueError(f"Неизвестный профиль подгрузки {profile} для {self.model.__name__}")
+        return profiles[profile]
+
+    def relationships_for(self, dto: type[BaseModel], profile: str | None = None) -> list[Any]:
+        """
+        Связи, которые сериализует dto: выводятся из полей-связей DTO
+        (get_dto_load_plan) и связей вычисляемых свойств (property_relationships).
+
+        Явно выбранный profile (например, filter.loading_profile) имеет приоритет;
+        он должен покрывать поля dto, иначе сериализация обратится к незагруженной связи.
+        """
+        if profile is not None:
+            return self.relationships(profile)
+        options = get_dto_load_plan(self.model, dto).options(self.model)
+        for name, property_options in self.property_relationships().items():
+            if name in dto.model_fields:
+                options.extend(property_options)
+        return options
+
+    def property_relationships(self) -> dict[str, list[Any]]:
+        """Связи, которые читают вычисляемые свойства сущности: {поле DTO: опции}."""
+        return {}
+
+    def version_relationships(self) -> list[str]:
+        """Связи из default_relationships, чьи updated_at входят в версию записи (get_version)."""
+        return []
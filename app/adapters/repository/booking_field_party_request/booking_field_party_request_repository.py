@@ -1,10 +1,13 @@
+from datetime import datetime
 from typing import Any
 
+from sqlalchemy import and_, func, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
-from app.entities import BookingFieldPartyRequestEntity
+from app.entities import BookingFieldPartyRequestEntity, FieldPartyScheduleEntity
+from app.shared.db_value_constants import DbValueConstants
 
 
 class BookingFieldPartyRequestRepository(BaseRepository[BookingFieldPartyRequestEntity]):
@@ -33,4 +36,81 @@ class BookingFieldPartyRequestRepository(BaseRepository[BookingFieldPartyRequest
             selectinload(self.model.field),
             selectinload(self.model.field_party),
             selectinload(self.model.payment_transaction)
-        ]
\ No newline at end of file
+        ]
+
+    async def lock_slot(self, field_party_id: int, start_at: datetime, end_at: datetime) -> None:
+        """
+        Берёт транзакционную advisory-блокировку на слот (party_id, день, начало, конец).
+
+        Блокировка снимается автоматически при commit/rollback текущей транзакции.
+        """
+        slot_key = f"{start_at:%Y-%m-%d %H:%M}-{end_at:%H:%M}"
+        await self.db.execute(
+            text("SELECT pg_advisory_xact_lock(:party_id, hashtext(:slot_key))"),
+            {"party_id": field_party_id, "slot_key": slot_key},
+        )
+
+    async def count_booked_in_slot(self, field_party_id: int, start_at: datetime, end_at: datetime) -> int:
+        """
+        Считает занятые места слота по индексу (field_party_id, start_at, end_at).
+
+        Учитываются активные заявки (ожидание оплаты/оплачено), в том числе перенесённые
+        на этот слот, и забронированные записи сгенерированного расписания.
+        """
+        active_filters = [
+            self.model.field_party_id == field_party_id,
+            self.model.is_active.is_(True),
+            self.model.deleted_at.is_(None),
+            self.model.status_id.in_([
+                DbValueConstants.BookingFieldPartyStatusCreatedAwaitingPaymentID,
+                DbValueConstants.BookingFieldPartyStatusPaidID,
+            ]),
+        ]
+        requests_count = await self.db.scalar(
+            select(func.count(self.model.id)).where(
+                *active_filters,
+                or_(
+                    and_(self.model.start_at == start_at, self.model.end_at == end_at),
+                    and_(
+                        self.model.reschedule_start_at == start_at,
+                        self.model.reschedule_end_at == end_at,
+                    ),
+                ),
+            )
+        )
+        schedules_count = await self.db.scalar(
+            select(func.count(FieldPartyScheduleEntity.id)).where(
+                FieldPartyScheduleEntity.party_id == field_party_id,
+                FieldPartyScheduleEntity.day == start_at.date(),
+                FieldPartyScheduleEntity.start_at == start_at.time(),
+                FieldPartyScheduleEntity.end_at == end_at.time(),
+                FieldPartyScheduleEntity.is_booked.is_(True),
+                FieldPartyScheduleEntity.deleted_at.is_(None),
+            )
+        )
+        return (requests_count or 0) + (schedules_count or 0)
+
+    async def create_in_slot(
+        self, obj: BookingFieldPartyRequestEntity, booked_limit: int
+    ) -> BookingFieldPartyRequestEntity | None:
+        """
+        Создаёт заявку, только если в слоте остались свободные места.
+
+        Подсчёт и вставка выполняются под advisory-блокировкой слота в одной транзакции,
+        поэтому параллельные запросы на один слот не превысят booked_limit.
+
+        Returns:
+            BookingFieldPartyRequestEntity | None: Созданная заявка или None, если слот заполнен.
+        """
+        try:
+            await self.lock_slot(obj.field_party_id, obj.start_at, obj.end_at)
+            booked_count = await self.count_booked_in_slot(obj.field_party_id, obj.start_at, obj.end_at)
+            if booked_count >= booked_limit:
+                await self._rollback()
+                return None
+            self.db.add(obj)
+            await self._save(obj)
+            return obj
+        except Exception:
+            await self._rollback()
+            raise
@@ -16,3 +16,6 @@ class FieldRepository(BaseRepository[FieldEntity]):
             selectinload(self.model.image),
             selectinload(self.model.city)
         ]
+
+    def version_relationships(self) -> list[str]:
+        return ["image", "city"]
@@ -5,6 +5,7 @@ from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
 from app.entities import FieldPartyEntity, FieldEntity, FieldPartyScheduleSettingsEntity
+from app.shared.loading_profile_constants import AppLoadingProfileConstants
 
 
 class FieldPartyRepository(BaseRepository[FieldPartyEntity]):
@@ -18,3 +19,34 @@ class FieldPartyRepository(BaseRepository[FieldPartyEntity]):
             selectinload(self.model.field).selectinload(FieldEntity.city),
             selectinload(self.model.field_party_schedule_settings),
         ]
+
+    def loading_profiles(self) -> dict[str, list[Any]]:
+        """
+        list - изображения площадки и поля, detail - плюс город и неудалённые
+        настройки расписания (active_schedule_setting), admin - все настройки.
+        """
+        card = [
+            selectinload(self.model.image),
+            selectinload(self.model.field).selectinload(FieldEntity.image),
+        ]
+        return {
+            AppLoadingProfileConstants.Minimal: [],
+            AppLoadingProfileConstants.List: card,
+            AppLoadingProfileConstants.Detail: [
+                *card,
+                selectinload(self.model.field).selectinload(FieldEntity.city),
+                self.active_schedule_settings_relationship(),
+            ],
+            AppLoadingProfileConstants.Admin: self.default_relationships(),
+        }
+
+    def property_relationships(self) -> dict[str, list[Any]]:
+        return {"active_schedule_setting": [self.active_schedule_settings_relationship()]}
+
+    def active_schedule_settings_relationship(self) -> Any:
+        """Настройки расписания без удалённых: active_schedule_setting их не рассматривает."""
+        return selectinload(
+            self.model.field_party_schedule_settings.and_(
+                FieldPartyScheduleSettingsEntity.deleted_at.is_(None)
+            )
+        )
@@ -1,10 +1,11 @@
 from typing import Any
 
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
 from app.entities import FileEntity
+from app.shared.app_file_constants import AppFileExtensionConstants
 
 
 class FileRepository(BaseRepository[FileEntity]):
@@ -13,3 +14,36 @@ class FileRepository(BaseRepository[FileEntity]):
 
     def default_relationships(self) -> list[Any]:
         return []
+
+    async def get_pending_variant_batch(self, limit: int) -> list[FileEntity]:
+        """Файлы, для которых ещё не создавались уменьшенные копии."""
+        result = await self.db.execute(
+            select(self.model)
+            .where(self.model.variants.is_(None))
+            .order_by(self.model.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
+    @staticmethod
+    def is_variant_source(file: FileEntity) -> bool:
+        """Нужны ли файлу уменьшенные копии (растровое изображение)."""
+        return file.content_type in AppFileExtensionConstants.IMAGE_VARIANT_CONTENT_TYPES
+
+    async def save_variants(self, file_id: int, file_path: str, variants: dict) -> bool:
+        """
+        Сохраняет описание копий без commit.
+
+        Запись выполняется только если файл не заменили за время обработки
+        (file_path не изменился).
+
+        Returns:
+            bool: True, если копии сохранены
+        """
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id == file_id, self.model.file_path == file_path)
+            .values(variants=variants)
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)
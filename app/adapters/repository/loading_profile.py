@@ -0,0 +1,79 @@
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import selectinload
+
+
+class DtoLoadPlan:
+    """
+    Связи, которые сериализует DTO, в виде путей selectinload.
+
+    Поля DTO, совпадающие с именами связей сущности (image, field, topic,
+    items...), подгружаются; если тип поля - DTO, обход продолжается
+    по его полям для связанной сущности. В plan попадают только конечные
+    пути: selectinload(field).selectinload(FieldEntity.city) загружает и field.
+
+    Вычисляемые свойства сущности (например, active_schedule_setting)
+    не видны по DTO - их связи репозиторий добавляет сам
+    (BaseRepository.property_relationships).
+
+    Атрибуты:
+        paths: Пути из имён связей от корневой сущности.
+    """
+
+    def __init__(self, model: Any, dto: type[BaseModel]) -> None:
+        self.paths: list[tuple[str, ...]] = []
+        self._build(model, dto, prefix=(), visited=set())
+
+    def _build(self, model: Any, dto: type[BaseModel], prefix: tuple[str, ...], visited: set) -> None:
+        # Защита от циклических DTO (связь ссылается на DTO предка)
+        visited = visited | {(model, dto)}
+        mapper = inspect(model)
+        for name, field in dto.model_fields.items():
+            relationship = mapper.relationships.get(name)
+            if relationship is None:
+                continue
+            path = (*prefix, name)
+            related_model = relationship.mapper.class_
+            related_dto = self._related_dto(field.annotation)
+            count = len(self.paths)
+            if related_dto is not None and (related_model, related_dto) not in visited:
+                self._build(related_model, related_dto, path, visited)
+            if len(self.paths) == count:
+                self.paths.append(path)
+
+    @staticmethod
+    def _related_dto(annotation: Any) -> type[BaseModel] | None:
+        """DTO связи из аннотации вида SomeRDTO | None или list[SomeRDTO]."""
+        if get_origin(annotation) in (Union, UnionType):
+            candidates = get_args(annotation)
+        else:
+            candidates = (annotation,)
+        for candidate in candidates:
+            if get_origin(candidate) is list:
+                candidate = get_args(candidate)[0] if get_args(candidate) else None
+            if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                return candidate
+        return None
+
+    def options(self, model: Any) -> list[Any]:
+        """Опции selectinload для запроса (строятся заново на каждый вызов)."""
+        options = []
+        for path in self.paths:
+            option = None
+            entity = model
+            for name in path:
+                attribute = getattr(entity, name)
+                option = selectinload(attribute) if option is None else option.selectinload(attribute)
+                entity = attribute.property.mapper.class_
+            options.append(option)
+        return options
+
+
+@lru_cache(maxsize=None)
+def get_dto_load_plan(model: Any, dto: type[BaseModel]) -> DtoLoadPlan:
+    """План строится один раз на пару (сущность, DTO) за процесс."""
+    return DtoLoadPlan(model, dto)
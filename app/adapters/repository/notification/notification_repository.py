@@ -1,10 +1,17 @@
 from typing import Any
 
+from sqlalchemy import func, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, with_expression
 
+from app.adapters.filters.notification.client_notification_conditions import (
+    broadcast_condition,
+    read_by_user_condition,
+    visible_to_user_condition,
+)
 from app.adapters.repository.base_repository import BaseRepository
 from app.entities import NotificationEntity, TopicNotificationEntity
+from app.shared.loading_profile_constants import AppLoadingProfileConstants
 
 
 class NotificationRepository(BaseRepository[NotificationEntity]):
@@ -17,5 +24,107 @@ class NotificationRepository(BaseRepository[NotificationEntity]):
                 TopicNotificationEntity.image
             ),
             selectinload(self.model.user),
-            selectinload(self.model.read_notifications),
         ]
+
+    def loading_profiles(self) -> dict[str, list[Any]]:
+        """
+        list - только топик (NotificationWithRelationsRDTO), detail - топик
+        с изображением и получатель, admin - плюс отметки прочтения read_notifications.
+        """
+        return {
+            AppLoadingProfileConstants.Minimal: [],
+            AppLoadingProfileConstants.List: [selectinload(self.model.topic)],
+            AppLoadingProfileConstants.Detail: self.default_relationships(),
+            AppLoadingProfileConstants.Admin: [
+                *self.default_relationships(),
+                selectinload(self.model.read_notifications),
+            ],
+        }
+
+    def client_relationships(self, user_id: int) -> list[Any]:
+        """Связи для клиента и признак is_read, вычисляемый в том же запросе."""
+        return [
+            *self.relationships(AppLoadingProfileConstants.List),
+            with_expression(self.model.is_read, read_by_user_condition(user_id)),
+        ]
+
+    async def count_unread(self, user_id: int) -> int:
+        """
+        Количество активных непрочитанных уведомлений, доступных пользователю.
+
+        Просматриваются только уведомления выше отметки прочтения пользователя,
+        поэтому после "прочитать все" подсчёт затрагивает лишь новые уведомления.
+        """
+        result = await self.db.scalar(
+            select(func.count(self.model.id)).where(
+                visible_to_user_condition(user_id),
+                self.model.is_active.is_(True),
+                ~read_by_user_condition(user_id),
+            )
+        )
+        return result or 0
+
+    async def get_last_visible_id(self, user_id: int) -> int | None:
+        """ID последнего доступного пользователю уведомления."""
+        return await self.db.scalar(
+            select(func.max(self.model.id)).where(visible_to_user_condition(user_id))
+        )
+
+    async def get_feed(
+        self,
+        user_id: int,
+        topic_ids: list[int],
+        cursor_filters: list,
+        limit: int,
+    ) -> list[NotificationEntity]:
+        """
+        Лента клиента: слияние личного инбокса и лент топиков (fan-out on read).
+
+        Каждая лента (личные уведомления пользователя и общие рассылки каждого
+        топика) читается отдельной веткой UNION ALL по своему индексу не более
+        чем на limit строк ниже курсора, после чего ветки сливаются по id
+        (id растёт в порядке создания). Объём чтения ограничен
+        limit * (число топиков + 1) и не зависит от длины истории рассылок.
+
+        Args:
+            user_id: ID пользователя
+            topic_ids: Топики, на которые подписан пользователь
+            cursor_filters: Условия курсора (NotificationFeedFilter.apply), применяются к каждой ветке
+            limit: Количество уведомлений на странице
+
+        Returns:
+            list[NotificationEntity]: Уведомления по убыванию id с is_read
+        """
+        timelines = [
+            select(self.model.id).where(
+                self.model.user_id == user_id,
+                self.model.is_active.is_(True),
+                *cursor_filters,
+            ),
+            *[
+                select(self.model.id).where(
+                    self.model.topic_id == topic_id,
+                    broadcast_condition(),
+                    self.model.is_active.is_(True),
+                    *cursor_filters,
+                )
+                for topic_id in topic_ids
+            ],
+        ]
+        branches = [
+            select(timeline.c.id)
+            for timeline in (
+                statement.order_by(self.model.id.desc()).limit(limit).subquery()
+                for statement in timelines
+            )
+        ]
+        feed_ids = (union_all(*branches) if len(branches) > 1 else branches[0]).subquery()
+
+        result = await self.db.execute(
+            select(self.model)
+            .where(self.model.id.in_(select(feed_ids.c.id)))
+            .order_by(self.model.id.desc())
+            .limit(limit)
+            .options(*self.client_relationships(user_id))
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,29 @@
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.base_repository import BaseRepository
+from app.entities import NotificationReadStateEntity
+
+
+class NotificationReadStateRepository(BaseRepository[NotificationReadStateEntity]):
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(NotificationReadStateEntity, db)
+
+    async def advance(self, user_id: int, read_until_id: int) -> int:
+        """
+        Поднимает отметку прочтения пользователя без commit (upsert, отметка не опускается).
+
+        Returns:
+            int: Итоговая отметка прочтения
+        """
+        statement = insert(self.model).values(user_id=user_id, read_until_id=read_until_id)
+        statement = statement.on_conflict_do_update(
+            constraint="uq_notification_read_states_user_id",
+            set_={
+                "read_until_id": func.greatest(self.model.read_until_id, statement.excluded.read_until_id),
+                "updated_at": func.now(),
+            },
+        ).returning(self.model.read_until_id)
+        result = await self.db.execute(statement)
+        return result.scalar_one()
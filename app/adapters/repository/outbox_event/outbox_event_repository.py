@@ -0,0 +1,137 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.base_repository import BaseRepository
+from app.entities import OutboxEventEntity
+
+
+class OutboxEventRepository(BaseRepository[OutboxEventEntity]):
+    """
+    Репозиторий transactional outbox.
+
+    Обработчики событий ORM накапливают события за flush (OutboxEventHandler)
+    и записывают их одним add_many_statement в конце flush - события
+    фиксируются той же транзакцией, что и основное изменение.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(OutboxEventEntity, db)
+
+    @staticmethod
+    def add_statement(event_type: str, aggregate_id: int, payload: dict[str, Any]) -> Any:
+        """
+        INSERT события outbox для выполнения внутри flush (connection.execute).
+
+        Args:
+            event_type: Тип события (AppEventConstants)
+            aggregate_id: ID сущности, к которой относится производная работа
+            payload: JSON-совместимые данные события
+        """
+        return insert(OutboxEventEntity).values(
+            event_type=event_type,
+            aggregate_id=aggregate_id,
+            payload=payload,
+            attempts=0,
+        )
+
+    @staticmethod
+    def add_many_statement(events: list[dict[str, Any]]) -> Any:
+        """
+        Один INSERT нескольких событий outbox (события, накопленные за flush).
+
+        Args:
+            events: Словари с ключами event_type, aggregate_id, payload
+        """
+        return insert(OutboxEventEntity).values([{**event, "attempts": 0} for event in events])
+
+    async def add_many(self, events: list[dict[str, Any]]) -> None:
+        """Записывает события outbox без commit (для пакетных UPDATE в обход ORM)."""
+        if events:
+            await self.db.execute(self.add_many_statement(events))
+
+    async def claim_for_dispatch(
+        self, limit: int, retry_before: datetime, max_attempts: int
+    ) -> list[Any]:
+        """
+        Отмечает пачку событий опубликованными без commit и возвращает их.
+
+        Выбираются необработанные события, которые ещё не публиковались или
+        не были обработаны с retry_before. FOR UPDATE SKIP LOCKED позволяет
+        нескольким диспетчерам работать параллельно.
+
+        Returns:
+            list[Row]: Строки (id, event_type, aggregate_id, payload, created_at)
+        """
+        claimed = (
+            select(self.model.id)
+            .where(
+                self.model.processed_at.is_(None),
+                self.model.attempts < max_attempts,
+                or_(self.model.published_at.is_(None), self.model.published_at < retry_before),
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id.in_(claimed))
+            .values(published_at=datetime.now(), attempts=self.model.attempts + 1)
+            .returning(
+                self.model.id,
+                self.model.event_type,
+                self.model.aggregate_id,
+                self.model.payload,
+                self.model.created_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return sorted(result.all(), key=lambda row: row.id)
+
+    async def lock_unprocessed(self, id: int) -> OutboxEventEntity | None:
+        """
+        Блокирует событие до конца транзакции обработчика.
+
+        Returns:
+            OutboxEventEntity | None: Событие или None, если оно уже обработано
+                (повторная доставка) или удалено.
+        """
+        result = await self.db.execute(
+            select(self.model)
+            .where(self.model.id == id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        event = result.scalars().first()
+        if event is None or event.processed_at is not None:
+            return None
+        return event
+
+    async def mark_failed(self, id: int, error: str) -> None:
+        """Сохраняет ошибку обработки без commit; событие будет опубликовано повторно."""
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(last_error=error)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def purge_processed(self, before: datetime, limit: int) -> int:
+        """Удаляет обработанные до before события (не больше limit) без commit."""
+        purged = (
+            select(self.model.id)
+            .where(self.model.processed_at < before)
+            .order_by(self.model.id)
+            .limit(limit)
+            .scalar_subquery()
+        )
+        result = await self.db.execute(
+            delete(self.model)
+            .where(self.model.id.in_(purged))
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
@@ -1,12 +1,14 @@
-import random
-import string
+from datetime import datetime
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
 from app.entities import PaymentTransactionEntity
+from app.infrastructure.service.identifier_service import identifier_service
+from app.shared.db_value_constants import DbValueConstants
 
 
 class PaymentTransactionRepository(BaseRepository[PaymentTransactionEntity]):
@@ -19,30 +21,44 @@ class PaymentTransactionRepository(BaseRepository[PaymentTransactionEntity]):
             selectinload(self.model.status)
         ]
 
-    async def generate_unique_order(self,min_len: int = 6, max_len: int = 22) -> str:
-        """
-        Генерирует уникальный order (строка из цифр длиной 6–22),
-        проверяет, что в БД такого нет.
+    async def get_pending_for_reconciliation(
+        self, created_since: datetime, limit: int
+    ) -> list[PaymentTransactionEntity]:
         """
-        while True:
-            length = random.randint(min_len, max_len)
-            new_order = ''.join(random.choices(string.digits, k=length))
+        Возвращает ожидающие оплаты транзакции для сверки со статусами Alatau.
 
-            exist = await self.get_first_with_filters(filters=[self.model.order == new_order])
-            if not exist:
-                return new_order
+        Args:
+            created_since: Нижняя граница даты создания транзакции
+            limit: Максимальный размер пакета
 
+        Returns:
+            list[PaymentTransactionEntity]: Транзакции, начиная с самых свежих
+        """
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.status_id == DbValueConstants.PaymentTransactionStatusAwaitingPaymentID,
+                self.model.is_paid.is_(False),
+                self.model.created_at >= created_since,
+                self.model.deleted_at.is_(None),
+            )
+            .order_by(self.model.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
 
+    async def generate_unique_order(self,min_len: int = 6, max_len: int = 22) -> str:
+        """
+        Генерирует уникальный order (строка из цифр длиной 6–22) без запросов к БД.
 
-    async def generate_unique_noncense(self,min_len: int = 6, max_len: int = 64) -> str:
+        Оставлен для совместимости, используйте identifier_service.generate_order().
         """
-        Генерирует уникальный new_nonce (строка из цифр длиной 6–64),
-        проверяет, что в БД такого нет.
+        return identifier_service.generate_order()
+
+    async def generate_unique_noncense(self,min_len: int = 6, max_len: int = 64) -> str:
         """
-        while True:
-            length = random.randint(min_len, max_len)
-            new_nonce = ''.join(random.choices(string.digits, k=length))
+        Генерирует уникальный nonce (строка из цифр длиной 6–64) без запросов к БД.
 
-            exist = await self.get_first_with_filters(filters=[self.model.nonce == new_nonce])
-            if not exist:
-                return new_nonce
\ No newline at end of file
+        Оставлен для совместимости, используйте identifier_service.generate_nonce().
+        """
+        return identifier_service.generate_nonce()
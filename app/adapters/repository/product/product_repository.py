@@ -1,10 +1,13 @@
 from typing import Any
 
+from sqlalchemy import Integer, Numeric, String, and_, cast, func, literal, null, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.adapters.filters.product.product_facet import ProductFacet
+from app.adapters.filters.product.product_modification_filter import normalized_modification_title
 from app.adapters.repository.base_repository import BaseRepository
-from app.entities import ProductEntity
+from app.entities import ModificationValueEntity, ProductEntity
 
 
 class ProductRepository(BaseRepository[ProductEntity]):
@@ -17,3 +20,111 @@ class ProductRepository(BaseRepository[ProductEntity]):
             selectinload(self.model.city),
             selectinload(self.model.category),
         ]
+
+    def version_relationships(self) -> list[str]:
+        return ["image", "city", "category"]
+
+    async def get_facets(
+        self,
+        common_filters: list[Any],
+        facet_filters: dict[str, Any],
+        include_deleted_filter: bool = False,
+    ) -> list[Any]:
+        """
+        Счётчики всех фасетов каталога одним запросом.
+
+        Товары, подходящие под общие условия, выбираются один раз в CTE
+        вместе с флагами выполнения условия каждого фасета. Затем по CTE
+        строятся группированные агрегаты (UNION ALL): счётчик фасета
+        учитывает все условия, кроме собственного.
+
+        Returns:
+            list[Row]: Строки (facet, group_id, key, count, min_price, max_price).
+        """
+        filters = self._apply_soft_delete_filter(list(common_filters), include_deleted_filter)
+        flag_labels = {
+            name: f"facet_flag_{index}" for index, name in enumerate(facet_filters)
+        }
+        matched = (
+            select(
+                self.model.id,
+                self.model.category_id,
+                self.model.city_id,
+                self.model.gender,
+                self.model.is_for_children,
+                self.model.base_price,
+                *[condition.label(flag_labels[name]) for name, condition in facet_filters.items()],
+            )
+            .where(*filters)
+            .cte("matched_products")
+        )
+
+        def except_facet(excluded: str | None) -> list[Any]:
+            return [matched.c[label] for name, label in flag_labels.items() if name != excluded]
+
+        def facet_select(facet: str, key: Any, count: Any, excluded: str | None, from_: Any = matched, **extra: Any):
+            return select(
+                literal(facet).label("facet"),
+                extra.get("group_id", cast(null(), Integer)).label("group_id"),
+                cast(key, String).label("key"),
+                count.label("count"),
+                extra.get("min_price", cast(null(), Numeric)).label("min_price"),
+                extra.get("max_price", cast(null(), Numeric)).label("max_price"),
+            ).select_from(from_).where(*except_facet(excluded))
+
+        branches = [
+            facet_select(ProductFacet.Total, null(), func.count(), excluded=None),
+            facet_select(
+                ProductFacet.Price, null(), func.count(), excluded=ProductFacet.Price,
+                min_price=func.min(matched.c.base_price), max_price=func.max(matched.c.base_price),
+            ),
+        ]
+        for facet, column in (
+            (ProductFacet.Category, matched.c.category_id),
+            (ProductFacet.City, matched.c.city_id),
+            (ProductFacet.Gender, matched.c.gender),
+            (ProductFacet.IsForChildren, matched.c.is_for_children),
+        ):
+            branches.append(
+                facet_select(facet, column, func.count(), excluded=facet).group_by(column)
+            )
+
+        # Значения модификаций: по одной ветке на выбранный тип и одна на все остальные
+        modification_join = matched.join(
+            ModificationValueEntity,
+            and_(
+                ModificationValueEntity.product_id == matched.c.id,
+                ModificationValueEntity.is_active.is_(True),
+                ModificationValueEntity.deleted_at.is_(None),
+            ),
+        )
+        selected_type_ids = [
+            int(name.split(":", 1)[1]) for name in facet_filters
+            if name.startswith(f"{ProductFacet.Modification}:")
+        ]
+        type_scopes = [
+            (ProductFacet.modification(type_id), ModificationValueEntity.modification_type_id == type_id)
+            for type_id in selected_type_ids
+        ]
+        type_scopes.append(
+            (None, ModificationValueEntity.modification_type_id.not_in(selected_type_ids))
+            if selected_type_ids else (None, None)
+        )
+        modification_title = normalized_modification_title()
+        for excluded, scope in type_scopes:
+            branch = facet_select(
+                ProductFacet.Modification,
+                modification_title,
+                func.count(func.distinct(matched.c.id)),
+                excluded=excluded,
+                from_=modification_join,
+                group_id=ModificationValueEntity.modification_type_id,
+            )
+            if scope is not None:
+                branch = branch.where(scope)
+            branches.append(
+                branch.group_by(ModificationValueEntity.modification_type_id, modification_title)
+            )
+
+        result = await self.db.execute(union_all(*branches))
+        return result.all()
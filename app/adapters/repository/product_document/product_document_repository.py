@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Select, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.base_repository import BaseRepository
+from app.entities import ProductDocumentEntity, ProductEntity
+
+
+class ProductDocumentRepository(BaseRepository[ProductDocumentEntity]):
+    """
+    Репозиторий материализованных карточек товаров.
+
+    ID товаров, документы которых помечены устаревшими в текущей транзакции,
+    накапливаются в session.info[INVALIDATED_IDS_KEY]; после commit
+    ProductDocumentEventHandler удаляет их ключи из Redis.
+    """
+
+    INVALIDATED_IDS_KEY = "product_document_invalidated_ids"
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(ProductDocumentEntity, db)
+
+    @staticmethod
+    def mark_stale_statement(product_ids: list[int] | Select) -> Any:
+        """
+        UPDATE, помечающий документы устаревшими и увеличивающий version.
+
+        Args:
+            product_ids: Список ID товаров или подзапрос, возвращающий ID товаров
+
+        Returns:
+            UPDATE ... RETURNING product_id
+        """
+        return (
+            update(ProductDocumentEntity)
+            .where(ProductDocumentEntity.product_id.in_(product_ids))
+            .values(is_stale=True, version=ProductDocumentEntity.version + 1)
+            .returning(ProductDocumentEntity.product_id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def mark_stale(self, product_ids: list[int] | Select) -> list[int]:
+        """Помечает документы устаревшими без commit (для пакетных UPDATE в обход ORM)."""
+        result = await self.db.execute(self.mark_stale_statement(product_ids))
+        stale_ids = list(result.scalars().all())
+        self.db.info.setdefault(self.INVALIDATED_IDS_KEY, set()).update(stale_ids)
+        return stale_ids
+
+    async def get_stale_batch(self, limit: int) -> list[Any]:
+        """
+        Возвращает (product_id, version) устаревших документов.
+
+        Документы мягко удалённых товаров пропускаются: карточка для них
+        не собирается (not_found), и иначе они навсегда занимали бы начало пакета.
+        """
+        result = await self.db.execute(
+            select(self.model.product_id, self.model.version)
+            .join(ProductEntity, ProductEntity.id == self.model.product_id)
+            .where(self.model.is_stale.is_(True), ProductEntity.deleted_at.is_(None))
+            .order_by(self.model.product_id)
+            .limit(limit)
+        )
+        return result.all()
+
+    async def get_or_create_version(self, product_id: int) -> int:
+        """
+        Возвращает текущую версию документа, создавая пустой устаревший документ при отсутствии.
+        """
+        await self.db.execute(
+            insert(self.model)
+            .values(product_id=product_id, version=0, is_stale=True)
+            .on_conflict_do_nothing(constraint="uq_product_documents_product_id")
+        )
+        return await self.db.scalar(select(self.model.version).where(self.model.product_id == product_id))
+
+    async def save_payload(self, product_id: int, version: int, payload: str) -> bool:
+        """
+        Сохраняет собранный документ без commit.
+
+        Запись выполняется только если version не изменился с начала сборки:
+        иначе документ успел устареть и будет пересобран следующим проходом.
+
+        Returns:
+            bool: True, если документ сохранён актуальным
+        """
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.product_id == product_id, self.model.version == version)
+            .values(payload=payload, is_stale=False, built_at=datetime.now())
+            .execution_options(synchronize_session=False)
+        )
+        return bool(result.rowcount)
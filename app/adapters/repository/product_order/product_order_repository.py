@@ -1,10 +1,12 @@
 from typing import Any
 
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
-from app.entities import ProductOrderEntity
+from app.entities import ProductOrderEntity, ProductOrderItemEntity
+from app.shared.db_value_constants import DbValueConstants
 
 
 class ProductOrderRepository(BaseRepository[ProductOrderEntity]):
@@ -19,4 +21,88 @@ class ProductOrderRepository(BaseRepository[ProductOrderEntity]):
             selectinload(self.model.status),
             selectinload(self.model.order_items),
             selectinload(self.model.payment_transactions),
-        ]
\ No newline at end of file
+        ]
+
+    async def get_for_update(
+        self, filters: list[Any], skip_locked: bool = False
+    ) -> list[ProductOrderEntity]:
+        """
+        Загружает заказы с блокировкой строк (SELECT ... FOR UPDATE) до конца транзакции.
+
+        Смена статуса заказа и операции с его резервами остатков выполняются под
+        этой блокировкой, поэтому оплата и отмена одного заказа не пересекаются.
+        Уже загруженные в сессию объекты перечитываются (populate_existing).
+
+        Args:
+            filters: Условия выборки.
+            skip_locked: Пропускать заказы, заблокированные другой транзакцией.
+
+        Returns:
+            list[ProductOrderEntity]: Заблокированные заказы в порядке id.
+        """
+        result = await self.db.execute(
+            select(self.model)
+            .where(*filters)
+            .order_by(self.model.id)
+            .with_for_update(skip_locked=skip_locked)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def recalculate_totals(self, order_id: int) -> None:
+        """
+        Пересчитывает total_price и refunded_total заказа по его элементам без commit.
+
+        В total_price входят неудалённые элементы не в статусе "Отменен, возвращен",
+        в refunded_total - неудалённые элементы в этом статусе.
+        """
+        items = (
+            ProductOrderItemEntity.order_id == order_id,
+            ProductOrderItemEntity.deleted_at.is_(None),
+        )
+        refunded_id = DbValueConstants.ProductOrderItemStatusCancelledRefundedID
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id == order_id)
+            .values(
+                total_price=(
+                    select(func.coalesce(func.sum(ProductOrderItemEntity.total_price), 0))
+                    .where(*items, ProductOrderItemEntity.status_id != refunded_id)
+                    .scalar_subquery()
+                ),
+                refunded_total=(
+                    select(func.coalesce(func.sum(ProductOrderItemEntity.total_price), 0))
+                    .where(*items, ProductOrderItemEntity.status_id == refunded_id)
+                    .scalar_subquery()
+                ),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def refresh_cancel_status(self, order_id: int) -> None:
+        """
+        Обновляет статус заказа по его элементам без commit:
+        - не осталось неудалённых элементов -> "Отменен" (3)
+        - элементы есть, но total_price = 0 (все отменены) -> "Отменен, ожидает возврата" (4)
+        """
+        items_count = await self.db.scalar(
+            select(func.count(ProductOrderItemEntity.id)).where(
+                ProductOrderItemEntity.order_id == order_id,
+                ProductOrderItemEntity.deleted_at.is_(None),
+            )
+        )
+        if items_count == 0:
+            status_id = DbValueConstants.ProductOrderStatusCancelledID
+        else:
+            total_price = await self.db.scalar(
+                select(self.model.total_price).where(self.model.id == order_id)
+            )
+            if total_price is None or total_price != 0:
+                return
+            status_id = DbValueConstants.ProductOrderStatusCancelledAwaitingRefundID
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id == order_id)
+            .values(status_id=status_id, is_canceled=True, is_active=False)
+            .execution_options(synchronize_session=False)
+        )
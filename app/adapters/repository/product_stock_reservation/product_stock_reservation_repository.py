@@ -0,0 +1,260 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.adapters.repository.base_repository import BaseRepository
+from app.adapters.repository.product_document.product_document_repository import ProductDocumentRepository
+from app.entities import ProductEntity, ProductStockReservationEntity, ProductVariantEntity
+
+
+class ProductStockReservationRepository(BaseRepository[ProductStockReservationEntity]):
+    """
+    Репозиторий резервов остатков.
+
+    Списание выполняется условным UPDATE (stock = stock - :qty WHERE stock >= :qty),
+    поэтому параллельные оформления заказа не могут увести остаток в минус.
+    Такие UPDATE не вызывают события ORM, поэтому карточки затронутых товаров
+    помечаются устаревшими явно.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(ProductStockReservationEntity, db)
+        self.document_repository = ProductDocumentRepository(db)
+
+    def default_relationships(self) -> list[Any]:
+        return [
+            selectinload(self.model.product),
+            selectinload(self.model.variant),
+        ]
+
+    async def reserve_for_order(
+        self,
+        order_id: int,
+        lines: list[tuple[int, int | None, int]],
+        expires_at: datetime | None,
+    ) -> bool:
+        """
+        Атомарно резервирует остатки под заказ.
+
+        Все строки списываются в одной транзакции. Если хотя бы одной позиции
+        не хватает, транзакция откатывается и ничего не списывается
+        (внутри UnitOfWork откат выполняет блок при выходе).
+
+        Args:
+            order_id: ID заказа.
+            lines: Позиции заказа (product_id, variant_id, qty).
+            expires_at: Срок удержания резерва (paid_until заказа).
+
+        Returns:
+            bool: True, если все позиции зарезервированы.
+        """
+        quantities: dict[tuple[int, int | None], int] = defaultdict(int)
+        for product_id, variant_id, qty in lines:
+            quantities[(product_id, variant_id)] += qty
+
+        try:
+            # Фиксированный порядок блокировок строк исключает взаимные блокировки
+            for (product_id, variant_id), qty in sorted(
+                quantities.items(), key=lambda line: (line[0][0], line[0][1] or 0)
+            ):
+                if not await self.decrement_stock(product_id, variant_id, qty):
+                    await self._rollback()
+                    return False
+                self.db.add(
+                    ProductStockReservationEntity(
+                        order_id=order_id,
+                        product_id=product_id,
+                        variant_id=variant_id,
+                        qty=qty,
+                        expires_at=expires_at,
+                    )
+                )
+            await self.document_repository.mark_stale(sorted({product_id for product_id, _ in quantities}))
+            await self._save()
+            return True
+        except Exception:
+            await self._rollback()
+            raise
+
+    async def commit_for_order(self, order_id: int) -> int:
+        """
+        Делает резерв окончательным после оплаты заказа.
+
+        Args:
+            order_id: ID оплаченного заказа.
+
+        Returns:
+            int: Количество подтверждённых резервов.
+        """
+        return await self.commit_for_orders([order_id])
+
+    async def commit_for_orders(self, order_ids: list[int], commit: bool = True) -> int:
+        """
+        Делает резервы окончательными для нескольких оплаченных заказов.
+
+        Args:
+            order_ids: ID оплаченных заказов.
+            commit: Фиксировать транзакцию (False - в составе внешней транзакции).
+
+        Returns:
+            int: Количество подтверждённых резервов.
+        """
+        if not order_ids:
+            return 0
+        result = await self.db.execute(
+            update(self.model)
+            .where(
+                self.model.order_id.in_(order_ids),
+                self.model.is_active.is_(True),
+            )
+            .values(is_active=False, is_committed=True)
+            .returning(self.model.id)
+            .execution_options(synchronize_session=False)
+        )
+        committed = len(result.all())
+        if commit:
+            await self._save()
+        return committed
+
+    async def reacquire_for_order(self, order_id: int) -> bool:
+        """
+        Повторно списывает остатки по снятым резервам оплаченного заказа.
+
+        Нужен, если резерв заказа был снят до того, как пришла оплата. Списание
+        условное (decrement_stock) и выполняется в точке сохранения: если хотя бы
+        одной позиции не хватает, ни один остаток не меняется.
+
+        Args:
+            order_id: ID оплаченного заказа.
+
+        Returns:
+            bool: False, если остатка недостаточно и заказ нельзя выполнить.
+        """
+        released = await self.get_with_filters(
+            filters=[
+                self.model.order_id == order_id,
+                self.model.is_committed.is_(False),
+                self.model.released_at.is_not(None),
+            ]
+        )
+        if not released:
+            return True
+
+        quantities: dict[tuple[int, int | None], int] = defaultdict(int)
+        for reservation in released:
+            quantities[(reservation.product_id, reservation.variant_id)] += reservation.qty
+
+        savepoint = await self.db.begin_nested()
+        for (product_id, variant_id), qty in sorted(
+            quantities.items(), key=lambda line: (line[0][0], line[0][1] or 0)
+        ):
+            if not await self.decrement_stock(product_id, variant_id, qty):
+                await savepoint.rollback()
+                return False
+        await self.db.execute(
+            update(self.model)
+            .where(self.model.id.in_([reservation.id for reservation in released]))
+            .values(is_committed=True, released_at=None, release_reason=None)
+            .execution_options(synchronize_session=False)
+        )
+        await savepoint.commit()
+        await self.document_repository.mark_stale(sorted({product_id for product_id, _ in quantities}))
+        await self._save()
+        return True
+
+    async def release_for_orders(self, order_ids: list[int], reason: str) -> int:
+        """
+        Снимает активные резервы заказов и возвращает остатки.
+
+        Args:
+            order_ids: ID заказов.
+            reason: Причина снятия резерва.
+
+        Returns:
+            int: Количество снятых резервов.
+        """
+        if not order_ids:
+            return 0
+        return await self._release([self.model.order_id.in_(order_ids)], reason)
+
+    async def _release(self, filters: list[Any], reason: str) -> int:
+        """
+        Деактивирует резервы и возвращает остатки одним проходом.
+
+        Условие is_active в UPDATE гарантирует, что параллельный вызов не вернёт
+        один и тот же резерв дважды.
+        """
+        try:
+            result = await self.db.execute(
+                update(self.model)
+                .where(self.model.is_active.is_(True), *filters)
+                .values(is_active=False, released_at=datetime.now(), release_reason=reason)
+                .returning(self.model.product_id, self.model.variant_id, self.model.qty)
+                .execution_options(synchronize_session=False)
+            )
+            rows = result.all()
+            product_quantities: dict[int, int] = defaultdict(int)
+            variant_quantities: dict[int, int] = defaultdict(int)
+            for row in rows:
+                product_quantities[row.product_id] += row.qty
+                if row.variant_id:
+                    variant_quantities[row.variant_id] += row.qty
+
+            for variant_id, qty in sorted(variant_quantities.items()):
+                await self.db.execute(
+                    update(ProductVariantEntity)
+                    .where(ProductVariantEntity.id == variant_id)
+                    .values(stock=ProductVariantEntity.stock + qty)
+                    .execution_options(synchronize_session=False)
+                )
+            for product_id, qty in sorted(product_quantities.items()):
+                await self.db.execute(
+                    update(ProductEntity)
+                    .where(ProductEntity.id == product_id)
+                    .values(stock=ProductEntity.stock + qty)
+                    .execution_options(synchronize_session=False)
+                )
+            if product_quantities:
+                await self.document_repository.mark_stale(sorted(product_quantities))
+            await self._save()
+            return len(rows)
+        except Exception:
+            await self._rollback()
+            raise
+
+    async def decrement_stock(
+        self, product_id: int, variant_id: int | None, qty: int
+    ) -> bool:
+        """
+        Условное списание остатка варианта (если есть) и товара без commit.
+
+        Returns:
+            bool: False, если остатка недостаточно.
+        """
+        if variant_id:
+            variant_result = await self.db.execute(
+                update(ProductVariantEntity)
+                .where(
+                    ProductVariantEntity.id == variant_id,
+                    ProductVariantEntity.product_id == product_id,
+                    ProductVariantEntity.stock >= qty,
+                )
+                .values(stock=ProductVariantEntity.stock - qty)
+                .returning(ProductVariantEntity.id)
+                .execution_options(synchronize_session=False)
+            )
+            if variant_result.scalar_one_or_none() is None:
+                return False
+
+        product_result = await self.db.execute(
+            update(ProductEntity)
+            .where(ProductEntity.id == product_id, ProductEntity.stock >= qty)
+            .values(stock=ProductEntity.stock - qty)
+            .returning(ProductEntity.id)
+            .execution_options(synchronize_session=False)
+        )
+        return product_result.scalar_one_or_none() is not None
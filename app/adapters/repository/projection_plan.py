@@ -0,0 +1,113 @@
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import BaseModel
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import aliased
+
+
+class ProjectionPlan:
+    """
+    План выборки списка в виде плоских строк под схему DTO.
+
+    Столбцы выводятся из полей DTO: поля-столбцы сущности выбираются
+    напрямую, поля-связи "многие к одному" (image, city, category...) -
+    через LEFT JOIN с меткой "<связь>__<столбец>". Строки результата
+    собираются во вложенные словари без создания ORM-объектов и identity map.
+
+    Поля DTO, которых нет среди столбцов сущности (query_expression,
+    вычисляемые поля), заполняются из extra_fields или берут значение
+    по умолчанию из DTO.
+
+    Атрибуты:
+        columns: Выбираемые столбцы с метками.
+        joins: Атрибуты связей (of_type алиаса) для LEFT JOIN в порядке вложенности.
+    """
+
+    SEPARATOR = "__"
+
+    def __init__(
+        self,
+        model: Any,
+        dto: type[BaseModel],
+        extra_fields: tuple[str, ...] = (),
+    ) -> None:
+        self.columns: list[Any] = []
+        self.joins: list[Any] = []
+        self.extra_fields = extra_fields
+        self._root = self._build(model, model, dto, prefix="", skip=set(extra_fields))
+
+    def _build(self, model: Any, entity: Any, dto: type[BaseModel], prefix: str, skip: set[str]) -> dict:
+        mapper = inspect(model)
+        node = {"fields": [], "relations": [], "pk": None}
+        for name, field in dto.model_fields.items():
+            if name in skip:
+                continue
+            column_property = mapper.column_attrs.get(name)
+            if column_property is not None and isinstance(column_property.columns[0], Column):
+                label = f"{prefix}{name}"
+                node["fields"].append((name, len(self.columns)))
+                if column_property.columns[0].primary_key:
+                    node["pk"] = len(self.columns)
+                self.columns.append(getattr(entity, name).label(label))
+                continue
+
+            relationship = mapper.relationships.get(name)
+            related_dto = self._related_dto(field.annotation)
+            if relationship is not None and not relationship.uselist and related_dto is not None:
+                alias = aliased(relationship.mapper.class_, name=f"{prefix}{name}")
+                self.joins.append(getattr(entity, name).of_type(alias))
+                child = self._build(
+                    relationship.mapper.class_,
+                    alias,
+                    related_dto,
+                    prefix=f"{prefix}{name}{self.SEPARATOR}",
+                    skip=set(),
+                )
+                node["relations"].append((name, child))
+                continue
+
+            if field.is_required():
+                raise ValueError(
+                    f"Поле {dto.__name__}.{name} нельзя получить проекцией из {model.__name__}"
+                )
+        return node
+
+    @staticmethod
+    def _related_dto(annotation: Any) -> type[BaseModel] | None:
+        """DTO связи из аннотации вида SomeRDTO | None."""
+        candidates = (
+            get_args(annotation) if get_origin(annotation) in (Union, UnionType) else (annotation,)
+        )
+        for candidate in candidates:
+            if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                return candidate
+        return None
+
+    def to_dict(self, row: Any, extra_offset: int) -> dict:
+        """
+        Собирает вложенный словарь из плоской строки результата.
+
+        Связь, первичный ключ которой NULL (LEFT JOIN не нашёл строку), - None.
+        """
+        data = self._node_to_dict(self._root, row)
+        for index, name in enumerate(self.extra_fields):
+            data[name] = row[extra_offset + index]
+        return data
+
+    def _node_to_dict(self, node: dict, row: Any) -> dict | None:
+        if node["pk"] is not None and row[node["pk"]] is None:
+            return None
+        data = {name: row[index] for name, index in node["fields"]}
+        for name, child in node["relations"]:
+            data[name] = self._node_to_dict(child, row)
+        return data
+
+
+@lru_cache(maxsize=None)
+def get_projection_plan(
+    model: Any, dto: type[BaseModel], extra_fields: tuple[str, ...] = ()
+) -> ProjectionPlan:
+    """План строится один раз на пару (сущность, DTO) за процесс."""
+    return ProjectionPlan(model, dto, extra_fields)
@@ -1,10 +1,12 @@
 from typing import Any
 
+from sqlalchemy import delete, exists, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
-from app.entities import ReadNotificationEntity
+from app.entities import NotificationReadStateEntity, ReadNotificationEntity
 
 
 class ReadNotificationRepository(BaseRepository[ReadNotificationEntity]):
@@ -16,3 +18,41 @@ class ReadNotificationRepository(BaseRepository[ReadNotificationEntity]):
             selectinload(self.model.notification),
             selectinload(self.model.user),
         ]
+
+    async def mark_read(self, user_id: int, notification_id: int) -> bool:
+        """
+        Отмечает уведомление прочитанным одним INSERT без commit.
+
+        Запись не создаётся, если уведомление уже прочитано (уникальный индекс)
+        или находится не выше отметки прочтения пользователя.
+
+        Returns:
+            bool: True, если уведомление прочитано впервые
+        """
+        covered_by_read_state = exists(
+            select(NotificationReadStateEntity.id).where(
+                NotificationReadStateEntity.user_id == user_id,
+                NotificationReadStateEntity.read_until_id >= notification_id,
+            )
+        )
+        result = await self.db.execute(
+            insert(self.model)
+            .from_select(
+                ["user_id", "notification_id"],
+                select(literal(user_id), literal(notification_id)).where(~covered_by_read_state),
+            )
+            .on_conflict_do_nothing(constraint="uq_read_notifications_user_notification")
+            .returning(self.model.id)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def delete_until(self, user_id: int, read_until_id: int) -> None:
+        """Удаляет без commit записи пользователя, покрытые отметкой прочтения."""
+        await self.db.execute(
+            delete(self.model)
+            .where(
+                self.model.user_id == user_id,
+                self.model.notification_id <= read_until_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
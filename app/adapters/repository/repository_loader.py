@@ -0,0 +1,140 @@
+import asyncio
+from typing import Any, Generic, Iterable, TypeVar
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+class RepositoryLoader(Generic[T]):
+    """
+    Пакетная загрузка записей по ID в рамках запроса (DataLoader).
+
+    Загрузчик живёт в session.info, то есть столько же, сколько сессия
+    запроса (get_db). Вызовы load(id), сделанные в одном такте цикла событий
+    (например, через asyncio.gather), объединяются в один запрос
+    WHERE id IN (...), который отправляется после этого такта. Найденные
+    записи запоминаются, и повторный load(id) в этом же запросе не обращается
+    к базе. Промахи не запоминаются: запись, созданная позже в этой же сессии
+    (в том числе пакетным INSERT мимо ORM), будет найдена.
+
+    Записи - объекты identity map сессии, поэтому изменения через ORM видны
+    сразу. Удалённые в запросе объекты (мягко или физически) загрузчик не
+    возвращает. После rollback сессии кеш очищается (объекты истекают).
+
+    Запросы разных загрузчиков одной сессии выполняются по очереди:
+    AsyncSession не допускает параллельных запросов.
+
+    Пример:
+        products = await asyncio.gather(*(product_repository.get(id) for id in ids))
+    """
+
+    LOADERS_KEY = "repository_loaders"
+    LOCK_KEY = "repository_loaders_lock"
+
+    def __init__(self, model: Any, db: AsyncSession, include_deleted: bool) -> None:
+        self.model = model
+        self.db = db
+        self.include_deleted = include_deleted
+        self.cache: dict[int, T] = {}
+        self.pending: dict[int, asyncio.Future] = {}
+        self.dispatch_tasks: set[asyncio.Task] = set()
+
+    @classmethod
+    def for_session(cls, model: Any, db: AsyncSession, include_deleted: bool = False) -> "RepositoryLoader":
+        """Загрузчик модели для сессии (создаётся при первом обращении)."""
+        loaders = db.info.setdefault(cls.LOADERS_KEY, {})
+        key = (model, include_deleted)
+        if key not in loaders:
+            loaders[key] = cls(model, db, include_deleted)
+        return loaders[key]
+
+    @classmethod
+    def register_session_events(cls):
+        """Подключает очистку загрузчиков после rollback (один раз для всех сессий)."""
+        event.listen(Session, "after_rollback", cls.after_rollback)
+
+    @staticmethod
+    def after_rollback(session: Session):
+        session.info.pop(RepositoryLoader.LOADERS_KEY, None)
+
+    async def load(self, id: int) -> T | None:
+        """Запись по ID (None - не найдена или удалена)."""
+        return (await self.load_many([id]))[id]
+
+    async def load_many(self, ids: Iterable[int]) -> dict[int, T | None]:
+        """Записи по ID одним запросом для ещё не загруженных ID."""
+        ids = list(dict.fromkeys(ids))
+        waiting = [id for id in ids if not self._is_cached(id)]
+        loaded: dict[int, T | None] = {}
+        if waiting:
+            results = await asyncio.gather(*(self._enqueue(id) for id in waiting))
+            loaded = dict(zip(waiting, results))
+        return {id: self._visible(loaded[id]) if id in loaded else self._cached(id) for id in ids}
+
+    def prime(self, objs: Iterable[T]) -> None:
+        """Запоминает записи, загруженные другими запросами репозитория."""
+        for obj in objs:
+            if obj is not None:
+                self.cache[obj.id] = obj
+
+    def _enqueue(self, id: int) -> asyncio.Future:
+        if id not in self.pending:
+            loop = asyncio.get_running_loop()
+            if not self.pending:
+                # Пакет отправляется после текущего такта: ID, запрошенные другими
+                # корутинами этого такта, попадут в тот же запрос
+                loop.call_soon(self._schedule_dispatch)
+            self.pending[id] = loop.create_future()
+        return self.pending[id]
+
+    def _schedule_dispatch(self) -> None:
+        task = asyncio.ensure_future(self._dispatch())
+        self.dispatch_tasks.add(task)
+        task.add_done_callback(self.dispatch_tasks.discard)
+
+    async def _dispatch(self) -> None:
+        lock = self.db.info.setdefault(self.LOCK_KEY, asyncio.Lock())
+        async with lock:
+            batch, self.pending = self.pending, {}
+            if not batch:
+                return
+            try:
+                filters = [self.model.id.in_(list(batch))]
+                if hasattr(self.model, "deleted_at") and not self.include_deleted:
+                    filters.append(self.model.deleted_at.is_(None))
+                result = await self.db.execute(select(self.model).where(*filters))
+                found = {obj.id: obj for obj in result.scalars().all()}
+            except Exception as exc:
+                # Ошибку получат все ожидающие этот пакет (через gather в load_many)
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(exc)
+                return
+            for id, future in batch.items():
+                obj = found.get(id)
+                if obj is not None:
+                    self.cache[id] = obj
+                if not future.done():
+                    future.set_result(obj)
+
+    def _is_cached(self, id: int) -> bool:
+        if id not in self.cache:
+            return False
+        state = inspect(self.cache[id])
+        if state.deleted or state.detached:
+            # Удалён в этом запросе: перечитываем
+            del self.cache[id]
+            return False
+        return True
+
+    def _cached(self, id: int) -> T | None:
+        return self._visible(self.cache.get(id))
+
+    def _visible(self, obj: T | None) -> T | None:
+        """Мягко удалённая в этом запросе запись не видна загрузчику без удалённых."""
+        if obj is not None and not self.include_deleted and getattr(obj, "deleted_at", None) is not None:
+            return None
+        return obj
@@ -0,0 +1,18 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.adapters.repository.base_repository import BaseRepository
+from app.entities import SearchDocumentEntity
+
+
+class SearchDocumentRepository(BaseRepository[SearchDocumentEntity]):
+    def __init__(self, db: AsyncSession) -> None:
+        super().__init__(SearchDocumentEntity, db)
+
+    def default_relationships(self) -> list[Any]:
+        return [
+            selectinload(self.model.image),
+            selectinload(self.model.city),
+        ]
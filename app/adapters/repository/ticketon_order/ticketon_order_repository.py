@@ -1,10 +1,12 @@
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.adapters.repository.base_repository import BaseRepository
 from app.entities import TicketonOrderEntity
+from app.shared.db_value_constants import DbValueConstants
 
 
 class TicketonOrderRepository(BaseRepository[TicketonOrderEntity]):
@@ -16,4 +18,34 @@ class TicketonOrderRepository(BaseRepository[TicketonOrderEntity]):
             selectinload(self.model.status),
             selectinload(self.model.user),
             selectinload(self.model.payment_transaction)
-        ]
\ No newline at end of file
+        ]
+
+    def version_relationships(self) -> list[str]:
+        return ["status", "user", "payment_transaction"]
+
+    async def get_awaiting_sale_confirmation(self, limit: int) -> list[TicketonOrderEntity]:
+        """
+        Возвращает оплаченные, но не подтверждённые в Ticketon заказы.
+
+        В этом состоянии (is_active=True) заказ оставляет сверка платежей;
+        после успешного sale_confirm заказ деактивируется.
+
+        Args:
+            limit: Максимальный размер пакета
+
+        Returns:
+            list[TicketonOrderEntity]: Заказы, начиная с самых старых
+        """
+        result = await self.db.execute(
+            select(self.model)
+            .where(
+                self.model.status_id == DbValueConstants.TicketonOrderStatusPaidAwaitingConfirmationID,
+                self.model.is_paid.is_(True),
+                self.model.is_active.is_(True),
+                self.model.payment_transaction_id.is_not(None),
+                self.model.deleted_at.is_(None),
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
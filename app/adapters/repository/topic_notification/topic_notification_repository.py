@@ -1,5 +1,6 @@
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -16,3 +17,16 @@ class TopicNotificationRepository(BaseRepository[TopicNotificationEntity]):
             selectinload(self.model.image),
             selectinload(self.model.notifications),
         ]
+
+    async def get_subscribed_ids(self, topic_ids: list[int] | None = None) -> list[int]:
+        """
+        ID топиков, рассылки которых входят в ленту клиента.
+
+        Все клиенты подписаны на все топики (push отправляется в общий топик
+        Firebase), поэтому список можно только сузить параметром topic_ids.
+        """
+        query = select(self.model.id).order_by(self.model.id)
+        if topic_ids:
+            query = query.where(self.model.id.in_(topic_ids))
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
@@ -0,0 +1,55 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class UnitOfWork:
+    """
+    Единица работы: несколько записей репозиториев в одной транзакции.
+
+    Внутри блока методы репозиториев (create, update, delete, bulk_*) вместо
+    commit + refresh выполняют flush: первичные ключи возвращает INSERT, а
+    вычисляемые столбцы и серверные значения - только у сущностей с
+    eager_defaults; у остальных они перечитываются запросом после блока.
+    При выходе из блока выполняется один commit,
+    при исключении - rollback всех шагов, поэтому ручной откат созданных
+    записей не нужен.
+
+    Вложенный блок на той же сессии присоединяется к внешнему: фиксирует
+    или откатывает только внешний.
+
+    Пример:
+        async with UnitOfWork(self.db):
+            order = await self.order_repository.create(ProductOrderEntity(...))
+            await self.item_repository.create_many([...])
+    """
+
+    SESSION_KEY = "unit_of_work_depth"
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    @staticmethod
+    def is_active(db: AsyncSession) -> bool:
+        """Открыт ли блок единицы работы на сессии."""
+        return bool(db.info.get(UnitOfWork.SESSION_KEY))
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.db.info[self.SESSION_KEY] = self.db.info.get(self.SESSION_KEY, 0) + 1
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        depth = self.db.info.get(self.SESSION_KEY, 1) - 1
+        if depth:
+            self.db.info[self.SESSION_KEY] = depth
+            return False
+        self.db.info.pop(self.SESSION_KEY, None)
+        if exc_type is not None:
+            await self.db.rollback()
+            return False
+        try:
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        return False
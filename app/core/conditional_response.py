@@ -0,0 +1,143 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from fastapi.responses import Response
+
+from app.shared.cache_control_constants import AppCacheControlConstants
+
+
+def is_not_modified(etag: str, if_none_match: str | None) -> bool:
+    """
+    Проверяет заголовок If-None-Match (слабое сравнение, RFC 9110).
+
+    Args:
+        etag: Текущий ETag ресурса.
+        if_none_match: Значение заголовка запроса.
+
+    Returns:
+        bool: True, если у клиента актуальная версия (ответ 304).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in if_none_match.split(","))
+
+
+def etag_response(
+    body: bytes,
+    etag: str,
+    if_none_match: str | None,
+    cache_control: str = AppCacheControlConstants.ReferenceData,
+) -> Response:
+    """
+    Ответ с готовым JSON-телом и ETag; 304 без тела, если версия клиента актуальна.
+
+    Args:
+        body: Сериализованный JSON.
+        etag: ETag содержимого.
+        if_none_match: Заголовок If-None-Match запроса.
+        cache_control: Значение Cache-Control (по умолчанию - всегда перепроверять).
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if is_not_modified(etag, if_none_match):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+class ResourceVersion:
+    """
+    Валидаторы условного GET, вычисленные из updated_at записи и её связей.
+
+    ETag слабый: он меняется при изменении любой из меток времени, но не
+    зависит от байтов тела. Last-Modified - самая поздняя из меток
+    (время без часового пояса считается UTC).
+
+    Атрибуты:
+        etag: ETag версии ресурса.
+        last_modified: Время последнего изменения ресурса или связей.
+    """
+
+    __slots__ = ("etag", "last_modified")
+
+    def __init__(self, name: str, id: int, timestamps: list[datetime | None]) -> None:
+        known = [timestamp for timestamp in timestamps if timestamp is not None]
+        digest = hashlib.sha1(
+            "|".join(timestamp.isoformat() if timestamp else "" for timestamp in timestamps).encode()
+        ).hexdigest()[:20]
+        self.etag = f'W/"{name}-{id}-{digest}"'
+        self.last_modified: datetime | None = None
+        if known:
+            latest = max(known)
+            # HTTP-даты с точностью до секунды
+            self.last_modified = latest.replace(microsecond=0, tzinfo=latest.tzinfo or timezone.utc)
+
+    def headers(self, cache_control: str) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified.astimezone(timezone.utc), usegmt=True)
+        return headers
+
+    def is_not_modified(self, if_none_match: str | None, if_modified_since: str | None) -> bool:
+        """
+        Проверка предусловий запроса (RFC 9110, 13.2.2): при наличии
+        If-None-Match заголовок If-Modified-Since не учитывается.
+        """
+        if if_none_match:
+            return is_not_modified(self.etag, if_none_match)
+        if not if_modified_since or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return self.last_modified <= since
+
+
+async def conditional_get(
+    response: Response,
+    version: ResourceVersion | None,
+    build: Callable[[], Awaitable[Any]],
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    cache_control: str,
+) -> Any:
+    """
+    Условный GET: 304 до загрузки связей и сборки DTO, если версия клиента актуальна.
+
+    Версия запрашивается лёгким запросом (id и updated_at записи и её связей).
+    Иначе результат build() возвращается как обычно (сериализация по
+    response_model маршрута), а валидаторы добавляются в заголовки ответа.
+    Если записи нет, build() сам сообщает об ошибке.
+
+    Args:
+        response: Ответ эндпоинта (параметр Response) для заголовков.
+        version: Версия ресурса (use case get_version) или None.
+        build: Сборка ответа (use case execute).
+        if_none_match: Заголовок If-None-Match запроса.
+        if_modified_since: Заголовок If-Modified-Since запроса.
+        cache_control: Значение Cache-Control маршрута (AppCacheControlConstants).
+
+    Пример:
+        case = GetProductByIdCase(db)
+        return await conditional_get(
+            response=response,
+            version=await case.get_version(id=id),
+            build=lambda: case.execute(id=id),
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+            cache_control=AppCacheControlConstants.CatalogItem,
+        )
+    """
+    if version is None:
+        return await build()
+    headers = version.headers(cache_control)
+    if version.is_not_modified(if_none_match, if_modified_since):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return await build()
@@ -0,0 +1,94 @@
+import functools
+from typing import Any, Callable
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+from app.adapters.dto.base_pagination_dto import Pagination
+
+
+class FastJSONResponse(Response):
+    """
+    JSON-ответ за один проход сериализации.
+
+    Pydantic-модели сериализуются их собственным сериализатором
+    (model_dump_json, без промежуточных dict), остальное - orjson.
+    Pagination (результат BaseRepository.paginate) собирается из заголовка
+    страницы и уже сериализованного списка items.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _dump_items(items: list[Any]) -> bytes:
+    """Список однотипных DTO - одним вызовом сериализатора, иначе orjson."""
+    if items and isinstance(items[0], BaseModel):
+        model = type(items[0])
+        if all(type(item) is model for item in items):
+            return _list_adapter(model).dump_json(items)
+    return orjson.dumps(items, default=to_jsonable_python)
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    Сериализует результат use case в JSON.
+
+    Args:
+        content: DTO, список DTO, Pagination или JSON-совместимые данные.
+
+    Returns:
+        bytes: Тело ответа.
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    if isinstance(content, Pagination):
+        page = orjson.dumps(
+            {
+                "current_page": content.current_page,
+                "per_page": content.per_page,
+                "last_page": content.last_page,
+                "total_pages": content.total_pages,
+                "total_items": content.total_items,
+            }
+        )
+        return page[:-1] + b',"items":' + _dump_items(content.items) + b"}"
+    if isinstance(content, list):
+        return _dump_items(content)
+    return orjson.dumps(content, default=to_jsonable_python)
+
+
+def fast_response(endpoint: Callable) -> Callable:
+    """
+    Оборачивает эндпоинт: результат отдаётся как FastJSONResponse.
+
+    Use case возвращает уже провалидированные *RDTO, поэтому повторная
+    валидация по response_model пропускается (FastAPI не обрабатывает
+    возвращённый Response), а response_model остаётся для схемы OpenAPI.
+    Сигнатура эндпоинта (зависимости, параметры) сохраняется через __wrapped__.
+
+    Пример:
+        self.router.get(
+            RoutePathConstants.IndexPathName,
+            response_model=PaginationProductWithRelationsRDTO,
+            response_class=FastJSONResponse,
+        )(fast_response(self.paginate))
+    """
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        result = await endpoint(*args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        return FastJSONResponse(result)
+
+    return wrapper
@@ -6,6 +6,9 @@ from app.infrastructure.app_config import app_config
 
 def include_static_files(app):
     for static_path in [app_config.static_folder, app_config.template]:
+        # Загруженные файлы раздаёт nginx/CDN или S3 - воркеры приложения их не отдают
+        if static_path == app_config.static_folder and not app_config.storage_serve_static:
+            continue
         if not os.path.exists(static_path):
             os.makedirs(static_path)
         clean_static_path = static_path.strip("/")  # удаляет начальный слэш
@@ -1,17 +1,28 @@
+import gzip
+import hashlib
+import json
+
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 from fastapi.requests import Request
+from starlette.responses import Response
 from starlette.templating import Jinja2Templates
 
 
+from app.core.route_metadata import route_metadata_index
 from app.infrastructure.app_config import app_config
 from app.shared.role_route_constants import RoleRouteConstant
 
 
 def custom_openapi(app, role: str, role_name: str):
-    routes = [
-        route for route in app.routes if hasattr(route, "roles") and role in route.roles
-    ]
+    if route_metadata_index.is_built:
+        routes = route_metadata_index.get_routes_by_role(role)
+    else:
+        routes = [
+            route
+            for route in app.routes
+            if hasattr(route, "roles") and role in route.roles
+        ]
     openapi_schema = get_openapi(
         title=f"{app_config.app_name}({role_name})",
         description=app_config.app_description,
@@ -21,10 +32,79 @@ def custom_openapi(app, role: str, role_name: str):
     return openapi_schema
 
 
+class RoleOpenApiDocument:
+    """
+    Предварительно сериализованная OpenAPI схема роли.
+
+    Хранит JSON, его gzip-версию и ETag, чтобы отдавать схему без повторной генерации.
+    """
+
+    def __init__(self, schema: dict) -> None:
+        self.body = json.dumps(
+            schema, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        self.gzip_body = gzip.compress(self.body)
+        self.etag = f'"{hashlib.sha256(self.body).hexdigest()}"'
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Формирует ответ с учётом If-None-Match и Accept-Encoding.
+
+        Args:
+            request (Request): Входящий запрос.
+
+        Returns:
+            Response: 304 при совпадении ETag, иначе JSON (gzip при поддержке клиентом).
+        """
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": "public, max-age=0, must-revalidate",
+            "Vary": "Accept-Encoding",
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self.etag in [
+            tag.strip() for tag in if_none_match.split(",")
+        ]:
+            return Response(status_code=304, headers=headers)
+
+        if "gzip" in request.headers.get("accept-encoding", "").lower():
+            headers["Content-Encoding"] = "gzip"
+            return Response(
+                content=self.gzip_body,
+                media_type="application/json",
+                headers=headers,
+            )
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+def build_role_openapi_documents(app) -> dict[str, RoleOpenApiDocument]:
+    """
+    Строит OpenAPI схемы всех ролей один раз после регистрации маршрутов.
+
+    Args:
+        app: Приложение FastAPI.
+
+    Returns:
+        dict[str, RoleOpenApiDocument]: Схемы по тегу роли.
+    """
+    route_metadata_index.build(app)
+    roles = [
+        (RoleRouteConstant.AdministratorTagName, RoleRouteConstant.AdministratorName),
+        (RoleRouteConstant.ClientTagName, RoleRouteConstant.ClientName),
+        (RoleRouteConstant.CommonTagName, RoleRouteConstant.CommonName),
+    ]
+    return {
+        role: RoleOpenApiDocument(custom_openapi(app, role, role_name))
+        for role, role_name in roles
+    }
+
+
 def setup_role_documentation(app) -> None:
     admin_docs_url = f"{app_config.app_docs_url}{app_config.app_administrator_docs_url}"
     client_docs_url = f"{app_config.app_docs_url}{app_config.app_client_docs_url}"
     common_docs_url = f"{app_config.app_docs_url}common"
+    # Схемы строятся один раз: все маршруты и роли уже зарегистрированы
+    role_documents = build_role_openapi_documents(app)
     # Указываем папку с шаблонами
     templates = Jinja2Templates(directory=f"{app_config.template}")
 
@@ -64,21 +144,15 @@ def setup_role_documentation(app) -> None:
 
     # OpenAPI схемы для каждой роли
     @app.get(f"/openapi{admin_docs_url}", include_in_schema=False)
-    async def get_admin_openapi():
-        return custom_openapi(
-            app,
-            RoleRouteConstant.AdministratorTagName,
-            RoleRouteConstant.AdministratorName,
+    async def get_admin_openapi(request: Request):
+        return role_documents[RoleRouteConstant.AdministratorTagName].to_response(
+            request
         )
 
     @app.get(f"/openapi{client_docs_url}", include_in_schema=False)
-    async def get_club_openapi():
-        return custom_openapi(
-            app, RoleRouteConstant.ClientTagName, RoleRouteConstant.ClientName
-        )
+    async def get_club_openapi(request: Request):
+        return role_documents[RoleRouteConstant.ClientTagName].to_response(request)
 
     @app.get(f"/openapi{common_docs_url}", include_in_schema=False)
-    async def get_common_openapi():
-        return custom_openapi(
-            app, RoleRouteConstant.CommonTagName, RoleRouteConstant.CommonName
-        )
+    async def get_common_openapi(request: Request):
+        return role_documents[RoleRouteConstant.CommonTagName].to_response(request)
@@ -0,0 +1,85 @@
+from fastapi.routing import APIRoute
+
+
+class RouteMetadataIndex:
+    """
+    Индекс метаданных маршрутов приложения.
+
+    Строится один раз после регистрации всех маршрутов и назначения ролей.
+    Позволяет получать summary, description и роли эндпоинта по (path, method)
+    без генерации OpenAPI схемы (например, в middleware логирования).
+    """
+
+    DEFAULT_SUMMARY = "..."
+    DEFAULT_DESCRIPTION = "..."
+
+    def __init__(self) -> None:
+        self._items: dict[tuple[str, str], dict] = {}
+        self._routes_by_role: dict[str, list[APIRoute]] = {}
+        self.is_built = False
+
+    def build(self, app) -> None:
+        """
+        Собирает индекс по всем APIRoute приложения.
+
+        Args:
+            app: Приложение FastAPI с уже зарегистрированными маршрутами.
+        """
+        items: dict[tuple[str, str], dict] = {}
+        routes_by_role: dict[str, list[APIRoute]] = {}
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            roles = list(getattr(route, "roles", []) or [])
+            metadata = {
+                "summary": route.summary or route.name.replace("_", " ").title(),
+                "description": route.description or "",
+                "name": route.name,
+                "roles": roles,
+                "include_in_schema": route.include_in_schema,
+            }
+            for method in route.methods or []:
+                items[(route.path, method.lower())] = metadata
+            for role in set(roles):
+                routes_by_role.setdefault(role, []).append(route)
+
+        self._items = items
+        self._routes_by_role = routes_by_role
+        self.is_built = True
+
+    def get(self, path: str, method: str) -> dict:
+        """
+        Возвращает метаданные маршрута.
+
+        Args:
+            path (str): Шаблон пути маршрута (например, "/api/product/get/{id}").
+            method (str): HTTP-метод в любом регистре.
+
+        Returns:
+            dict: Метаданные маршрута либо значения по умолчанию, если маршрут не найден.
+        """
+        metadata = self._items.get((path, method.lower()))
+        if metadata is None:
+            return {
+                "summary": self.DEFAULT_SUMMARY,
+                "description": self.DEFAULT_DESCRIPTION,
+                "name": None,
+                "roles": [],
+                "include_in_schema": False,
+            }
+        return metadata
+
+    def get_routes_by_role(self, role: str) -> list[APIRoute]:
+        """
+        Возвращает маршруты, доступные указанной роли.
+
+        Args:
+            role (str): Тег роли из RoleRouteConstant.
+
+        Returns:
+            list[APIRoute]: Маршруты роли в порядке регистрации.
+        """
+        return list(self._routes_by_role.get(role, []))
+
+
+route_metadata_index = RouteMetadataIndex()
@@ -0,0 +1,78 @@
+from typing import AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.app_config import app_config
+from app.infrastructure.db import AsyncSessionLocal
+
+
+class StreamingExportResponse(StreamingResponse):
+    """
+    Потоковая выгрузка списка DTO: JSON-массив по частям или NDJSON.
+
+    Зависимости с yield (get_db) закрываются до отправки тела StreamingResponse,
+    поэтому выгрузка открывает собственную сессию на время передачи.
+    Элементы сериализуются по одному и отправляются блоками
+    app_export_chunk_size_kb - память не зависит от количества строк.
+
+    Пример:
+        return StreamingExportResponse(
+            lambda db: ExportProductCase(db).execute(filter),
+            export_format=export_format,
+            filename="products",
+        )
+    """
+
+    JSON_FORMAT = "json"
+    NDJSON_FORMAT = "ndjson"
+    MEDIA_TYPES = {
+        JSON_FORMAT: "application/json",
+        NDJSON_FORMAT: "application/x-ndjson",
+    }
+
+    def __init__(
+        self,
+        export: Callable[[AsyncSession], AsyncIterator[BaseModel]],
+        export_format: str = JSON_FORMAT,
+        filename: str | None = None,
+    ) -> None:
+        headers = {}
+        if filename:
+            headers["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+        super().__init__(
+            self._iterate(export, export_format),
+            media_type=self.MEDIA_TYPES[export_format],
+            headers=headers,
+        )
+
+    @classmethod
+    async def _iterate(
+        cls,
+        export: Callable[[AsyncSession], AsyncIterator[BaseModel]],
+        export_format: str,
+    ) -> AsyncIterator[bytes]:
+        chunk_size = app_config.app_export_chunk_size_kb * 1024
+        is_ndjson = export_format == cls.NDJSON_FORMAT
+        buffer = bytearray() if is_ndjson else bytearray(b"[")
+        is_first = True
+
+        async with AsyncSessionLocal() as session:
+            async for item in export(session):
+                if is_ndjson:
+                    buffer += item.model_dump_json().encode()
+                    buffer += b"\n"
+                else:
+                    if not is_first:
+                        buffer += b","
+                    buffer += item.model_dump_json().encode()
+                is_first = False
+                if len(buffer) >= chunk_size:
+                    yield bytes(buffer)
+                    buffer.clear()
+
+        if not is_ndjson:
+            buffer += b"]"
+        if buffer:
+            yield bytes(buffer)
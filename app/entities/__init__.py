@@ -24,6 +24,7 @@ from app.entities.firebase_notification_entity import FirebaseNotificationEntity
 from app.entities.modification_type_entity import ModificationTypeEntity
 from app.entities.modification_value_entity import ModificationValueEntity
 from app.entities.notification_entity import NotificationEntity
+from app.entities.notification_read_state_entity import NotificationReadStateEntity
 from app.entities.payment_transaction_entity import PaymentTransactionEntity
 from app.entities.payment_transaction_status_entity import PaymentTransactionStatusEntity
 from app.entities.permission_entity import PermissionEntity
@@ -37,6 +38,7 @@ from app.entities.product_order_item_history_entity import ProductOrderItemHisto
 from app.entities.product_order_item_status_entity import ProductOrderItemStatusEntity
 from app.entities.product_order_item_verification_code_entity import ProductOrderItemVerificationCodeEntity
 from app.entities.product_order_status_entity import ProductOrderStatusEntity
+from app.entities.product_stock_reservation_entity import ProductStockReservationEntity
 from app.entities.product_variant_entity import ProductVariantEntity
 from app.entities.product_variant_modification_entity import (
     ProductVariantModificationEntity,
@@ -46,6 +48,9 @@ from app.entities.request_material_entity import RequestMaterialEntity
 from app.entities.request_to_academy_group_entity import RequestToAcademyGroupEntity
 from app.entities.role_entity import RoleEntity
 from app.entities.role_permission_entity import RolePermissionEntity
+from app.entities.search_document_entity import SearchDocumentEntity
+from app.entities.product_document_entity import ProductDocumentEntity
+from app.entities.outbox_event_entity import OutboxEventEntity
 from app.entities.sport_entity import SportEntity
 from app.entities.student_entity import StudentEntity
 from app.entities.ticketon_order_and_payment_transaction_entity import TicketonOrderAndPaymentTransactionEntity
@@ -105,6 +110,10 @@ __all__ = [
     ProductOrderAndPaymentTransactionEntity.__name__,
     ProductOrderItemHistoryEntity.__name__,
     ProductOrderItemVerificationCodeEntity.__name__,
+    ProductStockReservationEntity.__name__,
+    SearchDocumentEntity.__name__,
+    ProductDocumentEntity.__name__,
+    OutboxEventEntity.__name__,
     BookingFieldPartyStatusEntity.__name__,
     BookingFieldPartyRequestEntity.__name__,
     BookingFieldPartyAndPaymentTransactionEntity.__name__,
@@ -112,6 +121,7 @@ __all__ = [
     FirebaseNotificationEntity.__name__,
     NotificationEntity.__name__,
     ReadNotificationEntity.__name__,
+    NotificationReadStateEntity.__name__,
     UserCodeResetPasswordEntity.__name__,
     YandexAfishaWidgetTicketEntity.__name__,
 ]
@@ -1,13 +1,17 @@
-from sqlalchemy.orm import Mapped
+from sqlalchemy import Index
+from sqlalchemy.orm import Mapped, query_expression
 
 from app.infrastructure.db import Base
-from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants, app_db_computed
 from app.shared.db_table_constants import AppTableNames
 from app.shared.entity_constants import AppEntityNames
 
 
 class AcademyEntity(Base):
     __tablename__ = AppTableNames.AcademyTableName
+    __table_args__ = (
+        Index("ix_academies_location", "location", postgresql_using="gist"),
+    )
 
     id: Mapped[DbColumnConstants.ID]
 
@@ -36,6 +40,14 @@ class AcademyEntity(Base):
     address_kk: Mapped[DbColumnConstants.StandardNullableVarchar]
     address_en: Mapped[DbColumnConstants.StandardNullableVarchar]
 
+    latitude: Mapped[DbColumnConstants.StandardNullableVarchar]
+    longitude: Mapped[DbColumnConstants.StandardNullableVarchar]
+
+    # Точка на карте, вычисляется PostgreSQL из latitude/longitude
+    location: Mapped[DbColumnConstants.StandardComputedGeographyPoint(app_db_computed.geography_point)]
+    # Расстояние до точки поиска в метрах, заполняется только геозапросами
+    distance: Mapped[float | None] = query_expression()
+
     working_time: Mapped[DbColumnConstants.StandardJSONB]
 
     is_active: Mapped[DbColumnConstants.StandardBooleanTrue]
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped
 
 from app.infrastructure.db import Base
@@ -10,6 +11,23 @@ from app.shared.entity_constants import AppEntityNames
 
 class BookingFieldPartyRequestEntity(Base):
     __tablename__ = AppTableNames.BookingFieldPartyRequestTableName
+    __table_args__ = (
+        # Подсчёт занятости слота при бронировании
+        Index(
+            "ix_booking_field_party_requests_active_slot",
+            "field_party_id",
+            "start_at",
+            "end_at",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_booking_field_party_requests_active_reschedule_slot",
+            "field_party_id",
+            "reschedule_start_at",
+            "reschedule_end_at",
+            postgresql_where=text("is_active AND reschedule_start_at IS NOT NULL"),
+        ),
+    )
     id: Mapped[DbColumnConstants.ID]
     status_id: Mapped[
         DbColumnConstants.ForeignKeyNullableInteger(
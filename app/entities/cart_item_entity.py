@@ -8,6 +8,9 @@ from app.shared.entity_constants import AppEntityNames
 
 class CartItemEntity(Base):
     __tablename__ = AppTableNames.CartItemTableName
+    # unit_price/total_price возвращаются UPDATE ... RETURNING во flush: GetUserCartCase
+    # читает суммы элементов, изменённых в UnitOfWork, без перечитывания
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[DbColumnConstants.ID]
 
@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped
 
 from app.infrastructure.db import Base
@@ -8,12 +9,22 @@ from app.shared.entity_constants import AppEntityNames
 
 class FileEntity(Base):
     __tablename__ = AppTableNames.FileTableName
+    __table_args__ = (
+        Index(
+            "ix_files_variants_pending",
+            "id",
+            postgresql_where=text("variants IS NULL"),
+        ),
+    )
     id: Mapped[DbColumnConstants.ID]
     filename: Mapped[DbColumnConstants.StandardVarchar]
     file_path: Mapped[DbColumnConstants.StandardText]
     file_size: Mapped[DbColumnConstants.StandardInteger]
     content_type: Mapped[DbColumnConstants.StandardVarchar]
     is_remote: Mapped[DbColumnConstants.StandardBooleanFalse]
+    # Уменьшенные копии изображения: {"320w": {"width", "height", "webp", "jpeg"}};
+    # NULL - ещё не обработано, {} - копии не нужны или не удалось создать
+    variants: Mapped[DbColumnConstants.StandardNullableJSONB]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
 
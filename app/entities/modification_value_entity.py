@@ -1,3 +1,4 @@
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped
 
 from app.infrastructure.db import Base
@@ -8,6 +9,14 @@ from app.shared.entity_constants import AppEntityNames
 
 class ModificationValueEntity(Base):
     __tablename__ = AppTableNames.ModificationValueTableName
+    __table_args__ = (
+        Index("ix_modification_values_product_id", "product_id"),
+        Index(
+            "ix_modification_values_type_title",
+            "modification_type_id",
+            text("lower(title_ru)"),
+        ),
+    )
 
     id: Mapped[DbColumnConstants.ID]
 
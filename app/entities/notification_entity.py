@@ -1,4 +1,5 @@
-from sqlalchemy.orm import Mapped
+from sqlalchemy import Index, text
+from sqlalchemy.orm import Mapped, query_expression
 
 from app.infrastructure.db import Base
 from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
@@ -8,6 +9,22 @@ from app.shared.entity_constants import AppEntityNames
 
 class NotificationEntity(Base):
     __tablename__ = AppTableNames.NotificationTableName
+    __table_args__ = (
+        # Личные уведомления пользователя и общие рассылки по топикам (см. client_notification_conditions)
+        Index("ix_notifications_user_id_id", "user_id", "id"),
+        Index(
+            "ix_notifications_broadcast_id",
+            "id",
+            postgresql_where=text("user_id IS NULL AND topics IS NOT NULL"),
+        ),
+        # Лента топика для NotificationRepository.get_feed
+        Index(
+            "ix_notifications_topic_timeline",
+            "topic_id",
+            "id",
+            postgresql_where=text("user_id IS NULL AND topics IS NOT NULL AND is_active"),
+        ),
+    )
     id: Mapped[DbColumnConstants.ID]
     topic_id: Mapped[
         DbColumnConstants.ForeignKeyInteger(
@@ -31,6 +48,8 @@ class NotificationEntity(Base):
     inner_action_url: Mapped[DbColumnConstants.StandardNullableVarchar]
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
+    # Прочитано ли уведомление текущим пользователем (заполняется через with_expression)
+    is_read: Mapped[bool | None] = query_expression()
 
     topic: Mapped[AppEntityNames.TopicNotificationEntityName] = (
         DbRelationshipConstants.many_to_one(
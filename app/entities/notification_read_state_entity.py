@@ -0,0 +1,41 @@
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import Mapped
+
+from app.infrastructure.db import Base
+from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_table_constants import AppTableNames
+from app.shared.entity_constants import AppEntityNames
+
+
+class NotificationReadStateEntity(Base):
+    """
+    Отметка прочтения уведомлений пользователя (watermark).
+
+    Одна строка на пользователя. Все доступные пользователю уведомления с
+    id <= read_until_id считаются прочитанными, поэтому "прочитать все"
+    обновляет одну строку вместо вставки записи на каждое общее уведомление.
+    Уведомления выше отметки, прочитанные по одному, хранятся в read_notifications.
+    """
+
+    __tablename__ = AppTableNames.NotificationReadStateTableName
+    __table_args__ = (
+        UniqueConstraint("user_id", name="uq_notification_read_states_user_id"),
+    )
+
+    id: Mapped[DbColumnConstants.ID]
+    user_id: Mapped[
+        DbColumnConstants.ForeignKeyInteger(
+            AppTableNames.UserTableName, onupdate="CASCADE", ondelete="CASCADE"
+        )
+    ]
+    read_until_id: Mapped[DbColumnConstants.StandardIntegerDefaultZero]
+
+    created_at: Mapped[DbColumnConstants.CreatedAt]
+    updated_at: Mapped[DbColumnConstants.UpdatedAt]
+
+    # Relationships
+    user: Mapped[AppEntityNames.UserEntityName] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.UserEntityName,
+        foreign_keys=f"{AppEntityNames.NotificationReadStateEntityName}.user_id",
+        lazy="select",
+    )
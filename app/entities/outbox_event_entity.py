@@ -0,0 +1,36 @@
+from sqlalchemy import Index, text
+from sqlalchemy.orm import Mapped
+
+from app.infrastructure.db import Base
+from app.shared.db_constants import DbColumnConstants
+from app.shared.db_table_constants import AppTableNames
+
+
+class OutboxEventEntity(Base):
+    """
+    Событие transactional outbox.
+
+    Записывается обработчиками событий ORM в той же транзакции, что и основное
+    изменение (одна вставка вместо производной работы внутри flush).
+    Диспетчер публикует необработанные события в шину (published_at, attempts),
+    обработчик выполняет производную работу и в той же транзакции
+    проставляет processed_at - повторная доставка ничего не дублирует.
+    Событие, не обработанное за retry-интервал, публикуется повторно.
+    """
+
+    __tablename__ = AppTableNames.OutboxEventTableName
+    __table_args__ = (
+        Index("ix_outbox_events_pending", "id", postgresql_where=text("processed_at IS NULL")),
+    )
+
+    id: Mapped[DbColumnConstants.ID]
+    event_type: Mapped[DbColumnConstants.StandardVarchar]
+    aggregate_id: Mapped[DbColumnConstants.StandardInteger]
+    payload: Mapped[DbColumnConstants.StandardJSONB]
+    attempts: Mapped[DbColumnConstants.StandardIntegerDefaultZero]
+    last_error: Mapped[DbColumnConstants.StandardNullableText]
+    published_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+    processed_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+
+    created_at: Mapped[DbColumnConstants.CreatedAt]
+    updated_at: Mapped[DbColumnConstants.UpdatedAt]
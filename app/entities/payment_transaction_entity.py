@@ -8,6 +8,9 @@ from app.shared.entity_constants import AppEntityNames
 
 class PaymentTransactionEntity(Base):
     __tablename__ = AppTableNames.PaymentTransactionsTableName
+    # created_at/updated_at возвращаются INSERT ... RETURNING во flush: ответ собирается
+    # из транзакции, созданной в UnitOfWork, без перечитывания
+    __mapper_args__ = {"eager_defaults": True}
     id: Mapped[DbColumnConstants.ID]
     user_id: Mapped[
         DbColumnConstants.ForeignKeyNullableInteger(
@@ -24,7 +27,7 @@ class PaymentTransactionEntity(Base):
         )
     ]
     transaction_type:Mapped[DbColumnConstants.StandardVarcharIndex]
-    order:Mapped[DbColumnConstants.StandardVarcharIndex]
+    order:Mapped[DbColumnConstants.StandardUniqueVarcharIndex]
     nonce:Mapped[DbColumnConstants.StandardNullableVarcharIndex]
     mpi_order:Mapped[DbColumnConstants.StandardNullableVarcharIndex]
     amount:Mapped[DbColumnConstants.StandardPrice]
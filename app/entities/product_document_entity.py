@@ -0,0 +1,46 @@
+from sqlalchemy import Index, UniqueConstraint, text
+from sqlalchemy.orm import Mapped
+
+from app.infrastructure.db import Base
+from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_table_constants import AppTableNames
+from app.shared.entity_constants import AppEntityNames
+
+
+class ProductDocumentEntity(Base):
+    """
+    Материализованная карточка товара (FullProductRDTO), сериализованная в JSON.
+
+    Одна строка на товар. payload содержит готовый ответ GET /product/get-full/{id}
+    со всеми переводами, поэтому один документ обслуживает все локали.
+    Изменение товара или связанных сущностей помечает документ устаревшим
+    (is_stale=True) и увеличивает version; фоновая задача пересобирает документ
+    и снимает флаг, только если version не изменился за время сборки.
+    """
+
+    __tablename__ = AppTableNames.ProductDocumentTableName
+    __table_args__ = (
+        UniqueConstraint("product_id", name="uq_product_documents_product_id"),
+        Index("ix_product_documents_stale", "product_id", postgresql_where=text("is_stale")),
+    )
+
+    id: Mapped[DbColumnConstants.ID]
+    product_id: Mapped[
+        DbColumnConstants.ForeignKeyInteger(
+            AppTableNames.ProductTableName, onupdate="CASCADE", ondelete="CASCADE"
+        )
+    ]
+    payload: Mapped[DbColumnConstants.StandardNullableText]
+    version: Mapped[DbColumnConstants.StandardIntegerDefaultZero]
+    is_stale: Mapped[DbColumnConstants.StandardBooleanTrue]
+    built_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+
+    created_at: Mapped[DbColumnConstants.CreatedAt]
+    updated_at: Mapped[DbColumnConstants.UpdatedAt]
+
+    # Relationships
+    product: Mapped[AppEntityNames.ProductEntityName] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.ProductEntityName,
+        foreign_keys=f"{AppEntityNames.ProductDocumentEntityName}.product_id",
+        lazy="select",
+    )
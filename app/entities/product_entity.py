@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped
 
 from app.infrastructure.db import Base
@@ -6,8 +7,27 @@ from app.shared.db_table_constants import AppTableNames
 from app.shared.entity_constants import AppEntityNames
 
 
+# Казахский язык не поддерживается встроенными словарями PostgreSQL - используется 'simple'
+PRODUCT_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian', coalesce(title_ru, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title_kk, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(sku, '') || ' ' || coalesce(value, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(description_ru, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description_kk, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description_en, '')), 'B')"
+)
+
+
 class ProductEntity(Base):
     __tablename__ = AppTableNames.ProductTableName
+    __table_args__ = (
+        Index("ix_products_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_products_title_ru_trgm", "title_ru", postgresql_using="gin", postgresql_ops={"title_ru": "gin_trgm_ops"}),
+        Index("ix_products_title_kk_trgm", "title_kk", postgresql_using="gin", postgresql_ops={"title_kk": "gin_trgm_ops"}),
+        Index("ix_products_title_en_trgm", "title_en", postgresql_using="gin", postgresql_ops={"title_en": "gin_trgm_ops"}),
+        Index("ix_products_sku_trgm", "sku", postgresql_using="gin", postgresql_ops={"sku": "gin_trgm_ops"}),
+    )
 
     id: Mapped[DbColumnConstants.ID]
     image_id: Mapped[
@@ -54,6 +74,8 @@ class ProductEntity(Base):
     is_recommended: Mapped[DbColumnConstants.StandardBooleanFalse]
     is_active: Mapped[DbColumnConstants.StandardBooleanTrue]
 
+    search_vector: Mapped[DbColumnConstants.StandardComputedTSVector(PRODUCT_SEARCH_VECTOR_EXPRESSION)]
+
     created_at: Mapped[DbColumnConstants.CreatedAt]
     updated_at: Mapped[DbColumnConstants.UpdatedAt]
     deleted_at: Mapped[DbColumnConstants.DeletedAt]
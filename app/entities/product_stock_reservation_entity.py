@@ -0,0 +1,72 @@
+from sqlalchemy import Index, text
+from sqlalchemy.orm import Mapped
+from typing import Optional
+
+from app.infrastructure.db import Base
+from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_table_constants import AppTableNames
+from app.shared.entity_constants import AppEntityNames
+
+
+class ProductStockReservationEntity(Base):
+    """
+    Резерв остатков товара/варианта под заказ.
+
+    Остаток списывается атомарно при создании заказа и удерживается до paid_until.
+    is_active=True - резерв удерживается, is_committed=True - заказ оплачен и списание
+    окончательное, released_at - резерв снят и остаток возвращён.
+    """
+
+    __tablename__ = AppTableNames.ProductStockReservationTableName
+    __table_args__ = (
+        Index("ix_product_stock_reservations_order_id", "order_id"),
+        Index(
+            "ix_product_stock_reservations_active_expires_at",
+            "expires_at",
+            postgresql_where=text("is_active"),
+        ),
+    )
+
+    id: Mapped[DbColumnConstants.ID]
+    order_id: Mapped[
+        DbColumnConstants.ForeignKeyInteger(
+            AppTableNames.ProductOrderTableName, onupdate="CASCADE", ondelete="CASCADE"
+        )
+    ]
+    product_id: Mapped[
+        DbColumnConstants.ForeignKeyInteger(
+            AppTableNames.ProductTableName, onupdate="CASCADE", ondelete="CASCADE"
+        )
+    ]
+    variant_id: Mapped[
+        DbColumnConstants.ForeignKeyNullableInteger(
+            AppTableNames.ProductVariantTableName, onupdate="CASCADE", ondelete="SET NULL"
+        )
+    ]
+    qty: Mapped[DbColumnConstants.StandardInteger]
+    expires_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+    is_active: Mapped[DbColumnConstants.StandardBooleanTrue]
+    is_committed: Mapped[DbColumnConstants.StandardBooleanFalse]
+    released_at: Mapped[DbColumnConstants.StandardNullableDateTime]
+    release_reason: Mapped[DbColumnConstants.StandardNullableText]
+    created_at: Mapped[DbColumnConstants.CreatedAt]
+    updated_at: Mapped[DbColumnConstants.UpdatedAt]
+
+    # Relationships
+    order: Mapped[AppEntityNames.ProductOrderEntityName] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.ProductOrderEntityName,
+        foreign_keys=f"{AppEntityNames.ProductStockReservationEntityName}.order_id",
+        lazy="select",
+    )
+
+    product: Mapped[AppEntityNames.ProductEntityName] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.ProductEntityName,
+        foreign_keys=f"{AppEntityNames.ProductStockReservationEntityName}.product_id",
+        lazy="select",
+    )
+
+    variant: Mapped[Optional[AppEntityNames.ProductVariantEntityName]] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.ProductVariantEntityName,
+        foreign_keys=f"{AppEntityNames.ProductStockReservationEntityName}.variant_id",
+        lazy="select",
+    )
@@ -1,3 +1,4 @@
+from sqlalchemy import UniqueConstraint
 from sqlalchemy.orm import Mapped
 
 from app.infrastructure.db import Base
@@ -8,6 +9,9 @@ from app.shared.entity_constants import AppEntityNames
 
 class ReadNotificationEntity(Base):
     __tablename__ = AppTableNames.ReadNotificationTableName
+    __table_args__ = (
+        UniqueConstraint("user_id", "notification_id", name="uq_read_notifications_user_notification"),
+    )
     id: Mapped[DbColumnConstants.ID]
     notification_id: Mapped[
         DbColumnConstants.ForeignKeyInteger(
@@ -0,0 +1,84 @@
+from sqlalchemy import Index, UniqueConstraint
+from sqlalchemy.orm import Mapped
+
+from app.infrastructure.db import Base
+from app.shared.db_constants import DbColumnConstants, DbRelationshipConstants
+from app.shared.db_table_constants import AppTableNames
+from app.shared.entity_constants import AppEntityNames
+
+
+# Казахский язык не поддерживается встроенными словарями PostgreSQL - используется 'simple'
+SEARCH_DOCUMENT_SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian', coalesce(title_ru, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(title_kk, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(title_en, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(keywords, '')), 'A') || "
+    "setweight(to_tsvector('russian', coalesce(body_ru, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(body_kk, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(body_en, '')), 'B')"
+)
+
+
+class SearchDocumentEntity(Base):
+    """
+    Денормализованный документ единого поиска (товары, поля, академии).
+
+    Одна строка на исходную сущность (entity_type, entity_id). Поддерживается
+    инкрементально обработчиком SearchDocumentEventHandler при создании,
+    изменении и удалении исходных записей.
+    keywords - артикул и уникальное значение, body_* - описание и адрес.
+    """
+
+    __tablename__ = AppTableNames.SearchDocumentTableName
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id", name="uq_search_documents_entity"),
+        Index("ix_search_documents_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_search_documents_title_ru_trgm", "title_ru", postgresql_using="gin", postgresql_ops={"title_ru": "gin_trgm_ops"}),
+        Index("ix_search_documents_title_kk_trgm", "title_kk", postgresql_using="gin", postgresql_ops={"title_kk": "gin_trgm_ops"}),
+        Index("ix_search_documents_title_en_trgm", "title_en", postgresql_using="gin", postgresql_ops={"title_en": "gin_trgm_ops"}),
+    )
+
+    id: Mapped[DbColumnConstants.ID]
+    entity_type: Mapped[DbColumnConstants.StandardVarchar]
+    entity_id: Mapped[DbColumnConstants.StandardInteger]
+
+    image_id: Mapped[
+        DbColumnConstants.ForeignKeyNullableInteger(
+            AppTableNames.FileTableName, onupdate="CASCADE", ondelete="SET NULL"
+        )
+    ]
+    city_id: Mapped[
+        DbColumnConstants.ForeignKeyNullableInteger(
+            AppTableNames.CityTableName, onupdate="CASCADE", ondelete="SET NULL"
+        )
+    ]
+
+    title_ru: Mapped[DbColumnConstants.StandardVarchar]
+    title_kk: Mapped[DbColumnConstants.StandardNullableVarchar]
+    title_en: Mapped[DbColumnConstants.StandardNullableVarchar]
+    value: Mapped[DbColumnConstants.StandardVarchar]
+
+    keywords: Mapped[DbColumnConstants.StandardNullableText]
+    body_ru: Mapped[DbColumnConstants.StandardNullableText]
+    body_kk: Mapped[DbColumnConstants.StandardNullableText]
+    body_en: Mapped[DbColumnConstants.StandardNullableText]
+
+    is_active: Mapped[DbColumnConstants.StandardBooleanTrue]
+
+    search_vector: Mapped[DbColumnConstants.StandardComputedTSVector(SEARCH_DOCUMENT_SEARCH_VECTOR_EXPRESSION)]
+
+    created_at: Mapped[DbColumnConstants.CreatedAt]
+    updated_at: Mapped[DbColumnConstants.UpdatedAt]
+
+    # Relationships
+    image: Mapped[AppEntityNames.FileEntityName] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.FileEntityName,
+        foreign_keys=f"{AppEntityNames.SearchDocumentEntityName}.image_id",
+        lazy="select",
+    )
+
+    city: Mapped[AppEntityNames.CityEntityName] = DbRelationshipConstants.many_to_one(
+        target=AppEntityNames.CityEntityName,
+        foreign_keys=f"{AppEntityNames.SearchDocumentEntityName}.city_id",
+        lazy="select",
+    )
@@ -1,10 +1,45 @@
-from app.entities import CartItemEntity, ProductOrderEntity, ProductOrderItemEntity
+from app.adapters.repository.repository_loader import RepositoryLoader
+from app.entities import (
+    AcademyEntity,
+    CartItemEntity,
+    FieldEntity,
+    FileEntity,
+    NotificationEntity,
+    ProductEntity,
+    ProductOrderEntity,
+    ProductOrderItemEntity,
+    ReadNotificationEntity,
+)
 from app.events.entity_event.cart_item_event.cart_item_event import CartItemEventHandler
+from app.events.entity_event.file_event.file_event import FileUrlEventHandler
+from app.events.entity_event.notification_read_state_event.notification_read_state_event import (
+    NotificationReadStateEventHandler,
+)
+from app.events.entity_event.outbox_event.outbox_event import OutboxEventHandler
+from app.events.entity_event.product_document_event.product_document_event import ProductDocumentEventHandler
 from app.events.entity_event.product_order_event.product_order_event import ProductOrderEventHandler
 from app.events.entity_event.product_order_item_event.product_order_item_event import ProductOrderItemEventHandler
+from app.events.entity_event.reference_data_event.reference_data_event import ReferenceDataEventHandler
+from app.events.entity_event.search_document_event.search_document_event import SearchDocumentEventHandler
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 
 
 def register_events():
+    RepositoryLoader.register_session_events()
     CartItemEventHandler.register(CartItemEntity)
+    FileUrlEventHandler.register(FileEntity)
     ProductOrderEventHandler.register(ProductOrderEntity)
-    ProductOrderItemEventHandler.register(ProductOrderItemEntity)
\ No newline at end of file
+    ProductOrderItemEventHandler.register(ProductOrderItemEntity)
+    OutboxEventHandler.register_session_events()
+    SearchDocumentEventHandler.register(ProductEntity)
+    SearchDocumentEventHandler.register(FieldEntity)
+    SearchDocumentEventHandler.register(AcademyEntity)
+    for entity_cls in ProductDocumentEventHandler.PRODUCT_IDS:
+        ProductDocumentEventHandler.register(entity_cls)
+    ProductDocumentEventHandler.register_session_events()
+    NotificationReadStateEventHandler.register(NotificationEntity)
+    NotificationReadStateEventHandler.register(ReadNotificationEntity)
+    NotificationReadStateEventHandler.register_session_events()
+    for entity_cls in reference_data_registry.entities:
+        ReferenceDataEventHandler.register(entity_cls)
+    ReferenceDataEventHandler.register_session_events()
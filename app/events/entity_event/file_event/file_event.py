@@ -0,0 +1,47 @@
+from sqlalchemy import event, inspect
+
+from app.infrastructure.service.storage_service.storage_factory import get_storage
+
+
+class FileUrlEventHandler:
+    """
+    Заполнение ссылок на файл при загрузке FileEntity из базы.
+
+    Ссылки зависят от хранилища (CDN, статический сервер или подписанная
+    ссылка S3) и не хранятся в таблице: после load/refresh сущность получает
+    непостоянные атрибуты url и variant_urls, которые FileRDTO читает как
+    обычные поля. Так слой DTO не зависит от хранилища, а ссылки строятся
+    для любого пути загрузки (репозиторий, selectinload связей, refresh).
+    """
+
+    @classmethod
+    def register(cls, entity_cls):
+        """Подключает заполнение ссылок к сущности файла."""
+        event.listen(entity_cls, "load", cls.on_load)
+        event.listen(entity_cls, "refresh", cls.on_refresh)
+
+    @staticmethod
+    def on_load(target, context):
+        FileUrlEventHandler.fill_urls(target)
+
+    @staticmethod
+    def on_refresh(target, context, attrs):
+        FileUrlEventHandler.fill_urls(target)
+
+    @staticmethod
+    def fill_urls(target) -> None:
+        """Строит ссылки на файл и его копии по хранилищу, в котором он сохранён."""
+        # Незагруженные колонки не подгружаются: ленивая загрузка недоступна в async
+        if inspect(target).unloaded & {"file_path", "is_remote", "variants"}:
+            return
+        storage = get_storage(target.is_remote)
+        target.url = storage.url(target.file_path)
+        # Копия словаря: variants - отслеживаемое значение колонки
+        target.variant_urls = {
+            name: {
+                **variant,
+                "webp_url": storage.url(variant["webp"]),
+                "jpeg_url": storage.url(variant["jpeg"]),
+            }
+            for name, variant in target.variants.items()
+        } if target.variants else target.variants
@@ -0,0 +1,79 @@
+import logging
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from app.entities import NotificationEntity
+from app.events.entity_event.entity_event_handler import EntityEventHandler
+from app.infrastructure.service.redis_service import RedisService
+
+logger = logging.getLogger("NotificationReadStateEventHandler")
+
+
+class NotificationReadStateEventHandler(EntityEventHandler):
+    """
+    Обработчик событий для инвалидации счётчиков непрочитанных уведомлений.
+
+    Регистрируется на NotificationEntity и ReadNotificationEntity. Изменение
+    личного уведомления или записи о прочтении сбрасывает счётчик пользователя,
+    изменение общей рассылки (user_id IS NULL) увеличивает версию рассылок,
+    что сбрасывает счётчики всех пользователей. Redis обновляется после commit.
+
+    Пакетные INSERT/DELETE в обход ORM (ReadNotificationRepository.mark_read,
+    "прочитать все") сбрасывают счётчик через RedisService в use case.
+    """
+
+    USER_IDS_KEY = "notification_unread_user_ids"
+    BROADCAST_KEY = "notification_broadcast_changed"
+
+    redis_service = RedisService()
+
+    @classmethod
+    def register_session_events(cls):
+        """Подключает обновление Redis после commit (один раз для всех сессий)."""
+        event.listen(Session, "after_commit", cls.after_commit)
+        event.listen(Session, "after_rollback", cls.after_rollback)
+
+    @staticmethod
+    def after_insert(mapper: Mapper, connection, target):
+        NotificationReadStateEventHandler._remember(target)
+
+    @staticmethod
+    def after_update(mapper: Mapper, connection, target):
+        NotificationReadStateEventHandler._remember(target)
+
+    @staticmethod
+    def after_delete(mapper: Mapper, connection, target):
+        NotificationReadStateEventHandler._remember(target)
+
+    @staticmethod
+    def after_commit(session: Session):
+        user_ids = session.info.pop(NotificationReadStateEventHandler.USER_IDS_KEY, None)
+        is_broadcast_changed = session.info.pop(NotificationReadStateEventHandler.BROADCAST_KEY, False)
+        try:
+            if is_broadcast_changed:
+                NotificationReadStateEventHandler.redis_service.bump_notification_broadcast_version()
+            if user_ids:
+                NotificationReadStateEventHandler.redis_service.delete_notification_unread_counts(sorted(user_ids))
+        except Exception as exc:
+            # Счётчик истечёт по TTL; ошибка Redis не должна ломать уже закоммиченный запрос
+            logger.warning(f"Не удалось сбросить счётчики непрочитанных уведомлений: {exc}")
+
+    @staticmethod
+    def after_rollback(session: Session):
+        session.info.pop(NotificationReadStateEventHandler.USER_IDS_KEY, None)
+        session.info.pop(NotificationReadStateEventHandler.BROADCAST_KEY, None)
+
+    @staticmethod
+    def _remember(target):
+        session = object_session(target)
+        if session is None:
+            return
+        # Текущий и предыдущий (если изменился в этом flush) получатель
+        user_ids = set(inspect(target).attrs["user_id"].history.deleted)
+        user_ids.add(target.user_id)
+        if isinstance(target, NotificationEntity) and None in user_ids:
+            session.info[NotificationReadStateEventHandler.BROADCAST_KEY] = True
+        user_ids.discard(None)
+        if user_ids:
+            session.info.setdefault(NotificationReadStateEventHandler.USER_IDS_KEY, set()).update(user_ids)
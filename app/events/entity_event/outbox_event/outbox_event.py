@@ -0,0 +1,76 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
+
+from app.adapters.repository.outbox_event.outbox_event_repository import OutboxEventRepository
+
+
+class OutboxEventHandler:
+    """
+    Накопление событий outbox за flush.
+
+    Обработчики событий ORM (after_insert/update/delete) не пишут событие
+    на каждую строку, а добавляют элемент в событие своего агрегата
+    (заказ, корзина) в session.info. В конце flush все накопленные события
+    записываются одним INSERT в той же транзакции: пакетное создание
+    20 элементов заказа даёт одно событие с 20 элементами в payload["items"],
+    и обработчик выполняет производную работу для них за один проход.
+
+    Вне сессии (объект без Session) событие пишется сразу через connection.
+    """
+
+    PENDING_EVENTS_KEY = "outbox_pending_events"
+
+    @classmethod
+    def register_session_events(cls):
+        """Подключает запись накопленных событий (один раз для всех сессий)."""
+        event.listen(Session, "after_flush", cls.after_flush)
+        event.listen(Session, "after_rollback", cls.after_rollback)
+
+    @staticmethod
+    def add(
+        connection,
+        target,
+        event_type: str,
+        aggregate_id: int,
+        item: dict[str, Any],
+        payload: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Добавляет элемент в событие агрегата текущего flush.
+
+        Args:
+            connection: SQLAlchemy connection текущего flush
+            target: Изменённый экземпляр сущности
+            event_type: Тип события (AppEventConstants)
+            aggregate_id: ID агрегата, к которому относится производная работа
+            item: Данные изменённой строки (элемент payload["items"])
+            payload: Общие данные события агрегата
+        """
+        session = object_session(target)
+        if session is None:
+            connection.execute(
+                OutboxEventRepository.add_statement(
+                    event_type=event_type,
+                    aggregate_id=aggregate_id,
+                    payload={**(payload or {}), "items": [item]},
+                )
+            )
+            return
+        pending = session.info.setdefault(OutboxEventHandler.PENDING_EVENTS_KEY, {})
+        pending_event = pending.setdefault(
+            (event_type, aggregate_id),
+            {"event_type": event_type, "aggregate_id": aggregate_id, "payload": {**(payload or {}), "items": []}},
+        )
+        pending_event["payload"]["items"].append(item)
+
+    @staticmethod
+    def after_flush(session: Session, flush_context):
+        pending = session.info.pop(OutboxEventHandler.PENDING_EVENTS_KEY, None)
+        if pending:
+            session.connection().execute(OutboxEventRepository.add_many_statement(list(pending.values())))
+
+    @staticmethod
+    def after_rollback(session: Session):
+        session.info.pop(OutboxEventHandler.PENDING_EVENTS_KEY, None)
@@ -0,0 +1,171 @@
+import logging
+
+from sqlalchemy import event, inspect, or_, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from app.adapters.repository.product_document.product_document_repository import ProductDocumentRepository
+from app.entities import (
+    CityEntity,
+    FileEntity,
+    ModificationTypeEntity,
+    ModificationValueEntity,
+    ProductCategoryEntity,
+    ProductDocumentEntity,
+    ProductEntity,
+    ProductGalleryEntity,
+    ProductVariantEntity,
+    ProductVariantModificationEntity,
+)
+from app.events.entity_event.entity_event_handler import EntityEventHandler
+from app.infrastructure.service.redis_service import RedisService
+
+logger = logging.getLogger("ProductDocumentEventHandler")
+
+
+def _attribute_values(target, attribute: str) -> list[int]:
+    """Текущее и предыдущее (если изменилось в этом flush) значение внешнего ключа."""
+    values = set(inspect(target).attrs[attribute].history.deleted)
+    values.add(getattr(target, attribute))
+    values.discard(None)
+    return list(values)
+
+
+def _owned_product_ids(target):
+    return _attribute_values(target, "product_id")
+
+
+def _variant_modification_product_ids(target: ProductVariantModificationEntity):
+    return select(ProductVariantEntity.product_id).where(
+        ProductVariantEntity.id.in_(_attribute_values(target, "variant_id"))
+    )
+
+
+def _modification_type_product_ids(target: ModificationTypeEntity):
+    return select(ModificationValueEntity.product_id).where(
+        ModificationValueEntity.modification_type_id == target.id
+    )
+
+
+def _category_product_ids(target: ProductCategoryEntity):
+    return select(ProductEntity.id).where(ProductEntity.category_id == target.id)
+
+
+def _city_product_ids(target: CityEntity):
+    return select(ProductEntity.id).where(
+        or_(
+            ProductEntity.city_id == target.id,
+            ProductEntity.id.in_(
+                select(ProductVariantEntity.product_id).where(ProductVariantEntity.city_id == target.id)
+            ),
+        )
+    )
+
+
+def _file_product_ids(target: FileEntity):
+    return select(ProductEntity.id).where(
+        or_(
+            ProductEntity.image_id == target.id,
+            ProductEntity.id.in_(
+                select(ProductVariantEntity.product_id).where(ProductVariantEntity.image_id == target.id)
+            ),
+            ProductEntity.id.in_(
+                select(ProductGalleryEntity.product_id).where(ProductGalleryEntity.file_id == target.id)
+            ),
+        )
+    )
+
+
+class ProductDocumentEventHandler(EntityEventHandler):
+    """
+    Обработчик событий для инвалидации материализованных карточек товаров.
+
+    Любое изменение товара или сущностей, входящих в FullProductRDTO, помечает
+    документы затронутых товаров устаревшими в той же транзакции. После commit
+    ключи этих товаров удаляются из Redis, а сами документы пересобирает
+    фоновая задача rebuild_product_documents.
+
+    Пакетные UPDATE остатков в обход ORM помечают документы через
+    ProductDocumentRepository.mark_stale.
+    """
+
+    # Сущность -> ID затронутых товаров (список или подзапрос)
+    PRODUCT_IDS = {
+        ProductEntity: lambda target: [target.id],
+        ProductGalleryEntity: _owned_product_ids,
+        ProductVariantEntity: _owned_product_ids,
+        ModificationValueEntity: _owned_product_ids,
+        ProductVariantModificationEntity: _variant_modification_product_ids,
+        ModificationTypeEntity: _modification_type_product_ids,
+        ProductCategoryEntity: _category_product_ids,
+        CityEntity: _city_product_ids,
+        FileEntity: _file_product_ids,
+    }
+
+    # Справочники: при вставке на них ещё никто не ссылается
+    REFERENCE_ENTITIES = (ModificationTypeEntity, ProductCategoryEntity, CityEntity, FileEntity)
+
+    redis_service = RedisService()
+
+    @classmethod
+    def register_session_events(cls):
+        """Подключает очистку Redis после commit (один раз для всех сессий)."""
+        event.listen(Session, "after_commit", cls.after_commit)
+        event.listen(Session, "after_rollback", cls.after_rollback)
+
+    @staticmethod
+    def after_insert(mapper: Mapper, connection, target):
+        """Создаёт пустой документ для нового товара или инвалидирует документ владельца."""
+        if isinstance(target, ProductEntity):
+            connection.execute(
+                insert(ProductDocumentEntity)
+                .values(product_id=target.id, version=0, is_stale=True)
+                .on_conflict_do_nothing(constraint="uq_product_documents_product_id")
+            )
+        elif not isinstance(target, ProductDocumentEventHandler.REFERENCE_ENTITIES):
+            ProductDocumentEventHandler._invalidate(connection, target)
+
+    @staticmethod
+    def after_update(mapper: Mapper, connection, target):
+        ProductDocumentEventHandler._invalidate(connection, target)
+
+    @staticmethod
+    def before_delete(mapper: Mapper, connection, target):
+        """Инвалидирует документы до удаления (пока внешние ключи ещё не обнулены)."""
+        if not isinstance(target, ProductEntity):
+            ProductDocumentEventHandler._invalidate(connection, target)
+
+    @staticmethod
+    def after_delete(mapper: Mapper, connection, target):
+        """Документ удалённого товара удаляется каскадно, остаётся очистить Redis."""
+        if isinstance(target, ProductEntity):
+            ProductDocumentEventHandler._remember(target, [target.id])
+
+    @staticmethod
+    def after_commit(session: Session):
+        product_ids = session.info.pop(ProductDocumentRepository.INVALIDATED_IDS_KEY, None)
+        if not product_ids:
+            return
+        try:
+            ProductDocumentEventHandler.redis_service.delete_product_documents(sorted(product_ids))
+        except Exception as exc:
+            # Кеш истечёт по TTL; ошибка Redis не должна ломать уже закоммиченный запрос
+            logger.warning(f"Не удалось удалить карточки товаров из Redis: {exc}")
+
+    @staticmethod
+    def after_rollback(session: Session):
+        session.info.pop(ProductDocumentRepository.INVALIDATED_IDS_KEY, None)
+
+    @staticmethod
+    def _invalidate(connection, target):
+        product_ids = ProductDocumentEventHandler.PRODUCT_IDS[type(target)](target)
+        if isinstance(product_ids, list) and not product_ids:
+            return
+        result = connection.execute(ProductDocumentRepository.mark_stale_statement(product_ids))
+        ProductDocumentEventHandler._remember(target, result.scalars().all())
+
+    @staticmethod
+    def _remember(target, product_ids):
+        session = object_session(target)
+        if session is not None and product_ids:
+            session.info.setdefault(ProductDocumentRepository.INVALIDATED_IDS_KEY, set()).update(product_ids)
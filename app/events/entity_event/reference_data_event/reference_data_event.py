@@ -0,0 +1,68 @@
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import Mapper, Session, object_session
+
+from app.events.entity_event.entity_event_handler import EntityEventHandler
+from app.infrastructure.service.redis_service import RedisService
+from app.infrastructure.service.reference_data_service.reference_data_registry import (
+    reference_data_registry,
+)
+
+logger = logging.getLogger("ReferenceDataEventHandler")
+
+
+class ReferenceDataEventHandler(EntityEventHandler):
+    """
+    Обработчик событий для обновления справочников в памяти.
+
+    Регистрируется на сущностях reference_data_registry (и их зависимостях).
+    Имена изменённых справочников копятся в session.info и после commit
+    публикуются в Redis - каждый процесс API перезагружает свои снимки.
+    """
+
+    NAMES_KEY = "reference_data_changed_names"
+
+    redis_service = RedisService()
+
+    @classmethod
+    def register_session_events(cls):
+        """Подключает оповещение после commit (один раз для всех сессий)."""
+        event.listen(Session, "after_commit", cls.after_commit)
+        event.listen(Session, "after_rollback", cls.after_rollback)
+
+    @staticmethod
+    def after_insert(mapper: Mapper, connection, target):
+        ReferenceDataEventHandler._remember(target)
+
+    @staticmethod
+    def after_update(mapper: Mapper, connection, target):
+        ReferenceDataEventHandler._remember(target)
+
+    @staticmethod
+    def after_delete(mapper: Mapper, connection, target):
+        ReferenceDataEventHandler._remember(target)
+
+    @staticmethod
+    def after_commit(session: Session):
+        names = session.info.pop(ReferenceDataEventHandler.NAMES_KEY, None)
+        if not names:
+            return
+        try:
+            ReferenceDataEventHandler.redis_service.publish_reference_data_changed(sorted(names))
+        except Exception as exc:
+            # Снимки обновятся периодической перезагрузкой
+            logger.warning(f"Не удалось оповестить об изменении справочников {sorted(names)}: {exc}")
+
+    @staticmethod
+    def after_rollback(session: Session):
+        session.info.pop(ReferenceDataEventHandler.NAMES_KEY, None)
+
+    @staticmethod
+    def _remember(target):
+        session = object_session(target)
+        if session is None:
+            return
+        names = reference_data_registry.names_for(type(target))
+        if names:
+            session.info.setdefault(ReferenceDataEventHandler.NAMES_KEY, set()).update(names)
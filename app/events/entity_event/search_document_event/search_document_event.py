@@ -0,0 +1,131 @@
+from sqlalchemy import delete, func, inspect
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapper
+
+from app.entities import AcademyEntity, FieldEntity, ProductEntity, SearchDocumentEntity
+from app.events.entity_event.entity_event_handler import EntityEventHandler
+from app.shared.db_value_constants import DbValueConstants
+
+
+def _join(*parts: str | None) -> str | None:
+    """Склеивает непустые части через пробел (аналог concat_ws в миграции)."""
+    text = " ".join(part for part in parts if part)
+    return text or None
+
+
+def _build_product_document(target: ProductEntity) -> dict:
+    return {
+        "keywords": _join(target.sku, target.value),
+        "body_ru": target.description_ru,
+        "body_kk": target.description_kk,
+        "body_en": target.description_en,
+    }
+
+
+def _build_place_document(target: FieldEntity | AcademyEntity) -> dict:
+    return {
+        "keywords": target.value,
+        "body_ru": _join(target.description_ru, target.address_ru),
+        "body_kk": _join(target.description_kk, target.address_kk),
+        "body_en": _join(target.description_en, target.address_en),
+    }
+
+
+class SearchDocumentEventHandler(EntityEventHandler):
+    """
+    Обработчик событий для инкрементального обновления единого поискового индекса.
+
+    Регистрируется для ProductEntity, FieldEntity и AcademyEntity:
+    - после вставки/обновления выполняется upsert строки search_documents
+    - при мягком (deleted_at) или физическом удалении строка удаляется
+
+    Пакетные UPDATE-запросы (например, списание остатков) события ORM не вызывают,
+    но и не изменяют поисковые поля.
+    """
+
+    # entity_type и построитель специфичных полей для каждой индексируемой сущности
+    DOCUMENT_TYPES = {
+        ProductEntity: (DbValueConstants.SearchDocumentProductType, _build_product_document),
+        FieldEntity: (DbValueConstants.SearchDocumentFieldType, _build_place_document),
+        AcademyEntity: (DbValueConstants.SearchDocumentAcademyType, _build_place_document),
+    }
+
+    # Поля исходных сущностей, изменение которых требует переиндексации
+    TRACKED_FIELDS = (
+        "title_ru", "title_kk", "title_en", "value", "sku",
+        "description_ru", "description_kk", "description_en",
+        "address_ru", "address_kk", "address_en",
+        "image_id", "city_id", "is_active", "deleted_at",
+    )
+
+    @staticmethod
+    def after_insert(mapper: Mapper, connection, target):
+        """Добавляет документ для новой записи."""
+        SearchDocumentEventHandler._sync_document(connection, target)
+
+    @staticmethod
+    def after_update(mapper: Mapper, connection, target):
+        """Переиндексирует запись, если изменились поисковые поля."""
+        if SearchDocumentEventHandler._has_tracked_changes(target):
+            SearchDocumentEventHandler._sync_document(connection, target)
+
+    @staticmethod
+    def after_delete(mapper: Mapper, connection, target):
+        """Удаляет документ физически удалённой записи."""
+        SearchDocumentEventHandler._delete_document(connection, target)
+
+    @staticmethod
+    def _has_tracked_changes(target) -> bool:
+        state = inspect(target)
+        return any(
+            state.attrs[field].history.has_changes()
+            for field in SearchDocumentEventHandler.TRACKED_FIELDS
+            if field in state.attrs
+        )
+
+    @staticmethod
+    def _sync_document(connection, target):
+        """
+        Синхронизирует документ с исходной записью одним upsert-запросом.
+
+        Args:
+            connection: SQLAlchemy connection текущего flush
+            target: Экземпляр индексируемой сущности
+        """
+        if target.deleted_at is not None:
+            SearchDocumentEventHandler._delete_document(connection, target)
+            return
+
+        entity_type, build_document = SearchDocumentEventHandler.DOCUMENT_TYPES[type(target)]
+        values = {
+            "entity_type": entity_type,
+            "entity_id": target.id,
+            "image_id": target.image_id,
+            "city_id": target.city_id,
+            "title_ru": target.title_ru,
+            "title_kk": target.title_kk,
+            "title_en": target.title_en,
+            "value": target.value,
+            "is_active": target.is_active,
+            **build_document(target),
+        }
+        statement = insert(SearchDocumentEntity).values(**values)
+        connection.execute(
+            statement.on_conflict_do_update(
+                constraint="uq_search_documents_entity",
+                set_={
+                    **{key: statement.excluded[key] for key in values if key not in ("entity_type", "entity_id")},
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    @staticmethod
+    def _delete_document(connection, target):
+        entity_type, _ = SearchDocumentEventHandler.DOCUMENT_TYPES[type(target)]
+        connection.execute(
+            delete(SearchDocumentEntity).where(
+                SearchDocumentEntity.entity_type == entity_type,
+                SearchDocumentEntity.entity_id == target.id,
+            )
+        )
@@ -424,6 +424,8 @@ class FormParserHelper:
         address_ru: Optional[str] = Form(None, description="Адрес на русском"),
         address_kk: Optional[str] = Form(None, description="Адрес на казахском"),
         address_en: Optional[str] = Form(None, description="Адрес на английском"),
+        latitude: Optional[str] = Form(None, description="Широта"),
+        longitude: Optional[str] = Form(None, description="Долгота"),
         working_time: str = Form(..., description="Рабочее время в формате JSON"),
         is_active: bool = Form(True, description="Флаг активности академии"),
         gender: int = Form(..., description="Пол: 0-оба, 1-мужской, 2-женский"),
@@ -461,6 +463,8 @@ class FormParserHelper:
             address_ru=address_ru,
             address_kk=address_kk,
             address_en=address_en,
+            latitude=latitude,
+            longitude=longitude,
             working_time=working_time_parsed,
             is_active=is_active,
             gender=gender,
@@ -1,4 +1,5 @@
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
 
 from app.infrastructure.app_config import app_config
 
@@ -16,6 +17,19 @@ def get_redis_client() -> Redis:
     )
 
 
+def get_async_redis_client() -> AsyncRedis:
+    """
+    Создаем асинхронный клиент Redis (подписки pub/sub в цикле событий приложения).
+    """
+    return AsyncRedis(
+        host=app_config.redis_host,
+        port=app_config.redis_port,
+        password=app_config.redis_password,
+        db=app_config.redis_db,
+        decode_responses=True,
+    )
+
+
 redis_client = get_redis_client()
 
 
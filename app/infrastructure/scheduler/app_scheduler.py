@@ -3,11 +3,19 @@ import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR
 
+from app.adapters.repository.repository_loader import RepositoryLoader
 from app.infrastructure.app_config import app_config
+from app.events.entity_event.product_document_event.product_document_event import ProductDocumentEventHandler
 from app.infrastructure.db import AsyncSessionLocal
+from app.infrastructure.scheduler.outbox_worker import run_outbox_worker
 from app.infrastructure.service.sota_service.sota_remote_service import SotaRemoteService
 from app.use_case.booking_field_party_request.scheduler.check_booking_field_party_request_case import \
     CheckBookingFieldPartyRequestCase
+from app.use_case.file.scheduler.generate_file_variants_case import GenerateFileVariantsCase
+from app.use_case.outbox_event.scheduler.purge_outbox_events_case import PurgeOutboxEventsCase
+from app.use_case.payment_transaction.scheduler.reconcile_payment_transaction_case import \
+    ReconcilePaymentTransactionCase
+from app.use_case.product.scheduler.rebuild_product_documents_case import RebuildProductDocumentsCase
 from app.use_case.product_order.scheduler.check_product_order_payment_case import CheckProductOrderPaymentCase
 from app.use_case.ticketon_order.scheduler.check_ticketon_order_case import CheckTicketonOrderTimeCase
 
@@ -52,6 +60,38 @@ async def check_ticketon_order_time_process():
     )
 
 
+async def reconcile_payment_transaction_process():
+    await run_use_case(
+        ReconcilePaymentTransactionCase,
+        "reconcile_payment_transaction_process: Сверка платежей с Alatau завершена.",
+        "reconcile_payment_transaction_process: Ошибка при сверке платежей с Alatau",
+    )
+
+
+async def rebuild_product_documents_process():
+    await run_use_case(
+        RebuildProductDocumentsCase,
+        "rebuild_product_documents_process: Пересборка карточек товаров завершена.",
+        "rebuild_product_documents_process: Ошибка при пересборке карточек товаров",
+    )
+
+
+async def generate_file_variants_process():
+    await run_use_case(
+        GenerateFileVariantsCase,
+        "generate_file_variants_process: Генерация копий изображений завершена.",
+        "generate_file_variants_process: Ошибка при генерации копий изображений",
+    )
+
+
+async def purge_outbox_events_process():
+    await run_use_case(
+        PurgeOutboxEventsCase,
+        "purge_outbox_events_process: Очистка обработанных событий outbox завершена.",
+        "purge_outbox_events_process: Ошибка при очистке событий outbox",
+    )
+
+
 async def preload_data_from_sota():
     """
     Предзагрузка данных SOTA в Redis кеш.
@@ -75,6 +115,9 @@ def job_listener(event):
 
 # Основной цикл
 async def main():
+    # Снятие резервов меняет остатки: ключи карточек товаров удаляются из Redis после commit
+    ProductDocumentEventHandler.register_session_events()
+    RepositoryLoader.register_session_events()
     scheduler = AsyncIOScheduler()
 
     # Все три задачи выполняются ежеминутно
@@ -96,6 +139,34 @@ async def main():
         minutes=1,
         id="check_ticketon_order_time",
     )
+    scheduler.add_job(
+        reconcile_payment_transaction_process,
+        "interval",
+        minutes=app_config.payment_reconciliation_interval_minutes,
+        id="reconcile_payment_transaction",
+        max_instances=1,
+    )
+    scheduler.add_job(
+        rebuild_product_documents_process,
+        "interval",
+        seconds=app_config.product_document_rebuild_interval_seconds,
+        id="rebuild_product_documents",
+        max_instances=1,
+    )
+    scheduler.add_job(
+        generate_file_variants_process,
+        "interval",
+        seconds=app_config.image_variant_interval_seconds,
+        id="generate_file_variants",
+        max_instances=1,
+    )
+    scheduler.add_job(
+        purge_outbox_events_process,
+        "interval",
+        hours=24,
+        id="purge_outbox_events",
+        max_instances=1,
+    )
     scheduler.add_job(
         preload_data_from_sota,
         "interval",
@@ -105,12 +176,15 @@ async def main():
 
     scheduler.add_listener(job_listener, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
     scheduler.start()
+    # Производные данные заказов и корзин: диспетчер и обработчики событий outbox
+    outbox_worker = asyncio.create_task(run_outbox_worker())
     logger.info("Scheduler started. Press Ctrl+C to exit.")
     try:
         while True:
             await asyncio.sleep(3600)
     except (KeyboardInterrupt, SystemExit):
         logger.info("Stopping scheduler...")
+        outbox_worker.cancel()
         scheduler.shutdown()
 
 
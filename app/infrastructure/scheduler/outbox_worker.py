@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from typing import Any
+
+from app.infrastructure.app_config import app_config
+from app.infrastructure.db import AsyncSessionLocal
+from app.infrastructure.service.event_bus_service.event_bus_factory import get_event_bus
+from app.use_case.outbox_event.consumer.handle_outbox_event_case import HandleOutboxEventCase
+from app.use_case.outbox_event.scheduler.dispatch_outbox_events_case import DispatchOutboxEventsCase
+
+logger = logging.getLogger("scheduler")
+
+
+async def handle_outbox_message(message: dict[str, Any]) -> None:
+    async with AsyncSessionLocal() as session:
+        await HandleOutboxEventCase(session).execute(message)
+
+
+async def consume_outbox_events() -> None:
+    """Обработчики событий; перезапускаются при разрыве соединения с брокером."""
+    event_bus = get_event_bus()
+    while True:
+        try:
+            await event_bus.consume(handle_outbox_message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error(f"consume_outbox_events: Обработчик событий остановлен: {exc}")
+            await event_bus.close()
+            await asyncio.sleep(5)
+
+
+async def dispatch_outbox_events() -> None:
+    """Диспетчер: публикует события пачками, при неполной пачке ждёт outbox_poll_interval_seconds."""
+    event_bus = get_event_bus()
+    while True:
+        dispatched = 0
+        try:
+            async with AsyncSessionLocal() as session:
+                dispatched = await DispatchOutboxEventsCase(session, event_bus).execute()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error(f"dispatch_outbox_events: Ошибка публикации событий outbox: {exc}")
+        if dispatched < app_config.outbox_dispatch_batch_size:
+            await asyncio.sleep(app_config.outbox_poll_interval_seconds)
+
+
+async def run_outbox_worker() -> None:
+    """
+    Outbox worker: диспетчер и обработчики событий в одном процессе.
+
+    Запускается из планировщика (app_scheduler) или отдельно:
+        python -m app.infrastructure.scheduler.outbox_worker
+    При event_bus_backend=rabbitmq обработчики можно масштабировать
+    несколькими процессами.
+    """
+    await asyncio.gather(consume_outbox_events(), dispatch_outbox_events())
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_outbox_worker())
@@ -1,3 +1,5 @@
+import asyncio
+
 import httpx
 
 from app.adapters.dto.alatau.alatau_cancel_payment_dto import AlatauCancelPaymentDTO
@@ -54,20 +56,57 @@ class AlatauServiceAPI:
 
     async def get_payment_status(self,dto:AlatauStatusRequestDTO)->AlatauPaymentStatusResponseDTO:
         try:
-            url = app_config.alatau_payment_status_post_url
-            dto.set_signature(app_config.shared_secret)
-            print(dto)
             async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url=url,
-                    data=dto.to_form_data(),
-                    headers={
-                        "Content-Type": "application/x-www-form-urlencoded"
-                    }
-                )
-                xml_response = response.text
-                return AlatauPaymentStatusResponseDTO.from_xml(xml_response)
+                return await self._post_payment_status(client, dto)
         except Exception as e:
             raise AppExceptionResponse.internal_error(
                 message=f"Alatau Refund ERROR: {str(e)}"
-            ) from e
\ No newline at end of file
+            ) from e
+
+    async def get_payment_statuses(
+        self,
+        orders: list[str],
+        concurrency: int = 10,
+        timeout: float = 15.0,
+    ) -> dict[str, AlatauPaymentStatusResponseDTO | None]:
+        """
+        Пакетный запрос статусов платежей с ограничением параллельности.
+
+        Все запросы идут через один HTTP-клиент (общий пул соединений).
+        Ошибка по отдельному заказу не прерывает пакет - для него возвращается None.
+
+        Args:
+            orders: Номера заказов (ORDER) платежных транзакций
+            concurrency: Максимум одновременных запросов к Alatau
+            timeout: Таймаут одного запроса в секундах
+
+        Returns:
+            dict: ORDER -> ответ Alatau или None при ошибке
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+        async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+            async def fetch(order: str) -> tuple[str, AlatauPaymentStatusResponseDTO | None]:
+                async with semaphore:
+                    try:
+                        return order, await self._post_payment_status(client, AlatauStatusRequestDTO(ORDER=order))
+                    except Exception:
+                        return order, None
+
+            results = await asyncio.gather(*(fetch(order) for order in orders))
+        return dict(results)
+
+    async def _post_payment_status(
+        self, client: httpx.AsyncClient, dto: AlatauStatusRequestDTO
+    ) -> AlatauPaymentStatusResponseDTO:
+        url = app_config.alatau_payment_status_post_url
+        dto.set_signature(app_config.shared_secret)
+        response = await client.post(
+            url=url,
+            data=dto.to_form_data(),
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+        )
+        return AlatauPaymentStatusResponseDTO.from_xml(response.text)
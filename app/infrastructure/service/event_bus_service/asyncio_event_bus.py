@@ -0,0 +1,30 @@
+import asyncio
+from typing import Any
+
+from app.infrastructure.service.event_bus_service.base_event_bus import BaseEventBus, EventHandler
+
+
+class AsyncioEventBus(BaseEventBus):
+    """
+    Шина событий внутри процесса (asyncio.Queue).
+
+    Диспетчер и обработчики работают в одном процессе (outbox worker);
+    подходит для разработки, тестов и установок без RabbitMQ.
+    Сообщения в очереди не переживают перезапуск процесса - их
+    публикует повторно диспетчер по outbox_retry_seconds.
+    """
+
+    def __init__(self) -> None:
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+    async def publish(self, messages: list[dict[str, Any]]) -> None:
+        for message in messages:
+            self.queue.put_nowait(message)
+
+    async def consume(self, handler: EventHandler) -> None:
+        while True:
+            message = await self.queue.get()
+            try:
+                await handler(message)
+            finally:
+                self.queue.task_done()
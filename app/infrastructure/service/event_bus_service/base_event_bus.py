@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable
+
+EventHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+class BaseEventBus(ABC):
+    """
+    Базовый класс шины событий outbox.
+
+    Сообщение - словарь {"id", "event_type", "aggregate_id"}: обработчик
+    перечитывает событие из outbox_events, поэтому шина переносит только
+    ссылку на него. Доставка "хотя бы один раз": обработанные события
+    отсекаются по processed_at, потерянные публикуются диспетчером повторно.
+    """
+
+    async def connect(self) -> None:
+        """Подключение к брокеру (если требуется)."""
+
+    async def close(self) -> None:
+        """Закрытие подключения."""
+
+    @abstractmethod
+    async def publish(self, messages: list[dict[str, Any]]) -> None:
+        """Публикует сообщения; возвращает управление после подтверждения брокером."""
+
+    @abstractmethod
+    async def consume(self, handler: EventHandler) -> None:
+        """Передаёт сообщения обработчику, пока задача не будет отменена."""
@@ -0,0 +1,18 @@
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.event_bus_service.asyncio_event_bus import AsyncioEventBus
+from app.infrastructure.service.event_bus_service.base_event_bus import BaseEventBus
+from app.infrastructure.service.event_bus_service.rabbitmq_event_bus import RabbitMQEventBus
+from app.shared.event_constants import AppEventConstants
+
+_event_bus: BaseEventBus | None = None
+
+
+def get_event_bus() -> BaseEventBus:
+    """Возвращает шину событий по настройке event_bus_backend (один экземпляр на процесс)."""
+    global _event_bus
+    if _event_bus is None:
+        if app_config.event_bus_backend == AppEventConstants.RabbitMQBackend:
+            _event_bus = RabbitMQEventBus()
+        else:
+            _event_bus = AsyncioEventBus()
+    return _event_bus
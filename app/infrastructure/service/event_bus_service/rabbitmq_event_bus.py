@@ -0,0 +1,73 @@
+import asyncio
+import json
+from typing import Any
+
+import aio_pika
+
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.event_bus_service.base_event_bus import BaseEventBus, EventHandler
+
+
+class RabbitMQEventBus(BaseEventBus):
+    """
+    Шина событий на RabbitMQ (aio-pika).
+
+    События публикуются в durable topic exchange с ключом маршрутизации,
+    равным типу события, persistent-сообщениями с подтверждением брокера.
+    Обработчики читают общую durable очередь с prefetch event_bus_prefetch;
+    сообщение подтверждается после обработчика в любом случае - ошибки
+    сохраняются в outbox_events и повторяются диспетчером.
+    """
+
+    def __init__(self) -> None:
+        self.connection: aio_pika.abc.AbstractRobustConnection | None = None
+        self.channel: aio_pika.abc.AbstractChannel | None = None
+        self.exchange: aio_pika.abc.AbstractExchange | None = None
+        self.queue: aio_pika.abc.AbstractQueue | None = None
+
+    async def connect(self) -> None:
+        if self.connection is not None:
+            return
+        self.connection = await aio_pika.connect_robust(app_config.rabbitmq_url)
+        self.channel = await self.connection.channel(publisher_confirms=True)
+        await self.channel.set_qos(prefetch_count=app_config.event_bus_prefetch)
+        self.exchange = await self.channel.declare_exchange(
+            app_config.event_bus_exchange, aio_pika.ExchangeType.TOPIC, durable=True
+        )
+        self.queue = await self.channel.declare_queue(app_config.event_bus_queue, durable=True)
+        await self.queue.bind(self.exchange, routing_key="#")
+
+    async def close(self) -> None:
+        if self.connection is not None:
+            await self.connection.close()
+        self.connection = self.channel = self.exchange = self.queue = None
+
+    async def publish(self, messages: list[dict[str, Any]]) -> None:
+        await self.connect()
+        await asyncio.gather(
+            *(
+                self.exchange.publish(
+                    aio_pika.Message(
+                        body=json.dumps(message).encode(),
+                        content_type="application/json",
+                        delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                        message_id=str(message["id"]),
+                    ),
+                    routing_key=message["event_type"],
+                )
+                for message in messages
+            )
+        )
+
+    async def consume(self, handler: EventHandler) -> None:
+        await self.connect()
+
+        async def on_message(message: aio_pika.abc.AbstractIncomingMessage) -> None:
+            async with message.process(requeue=False, ignore_processed=True):
+                await handler(json.loads(message.body))
+
+        consumer_tag = await self.queue.consume(on_message)
+        try:
+            await asyncio.Future()
+        finally:
+            await self.queue.cancel(consumer_tag)
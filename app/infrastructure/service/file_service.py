@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import os
 import uuid
@@ -11,11 +12,19 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import FileEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.storage_service.base_storage import BaseStorage
+from app.infrastructure.service.storage_service.storage_factory import get_storage
 from app.shared.app_file_constants import AppFileExtensionConstants
 
 
 class FileService:
-    """📌 Сервис работы с файлами"""
+    """
+    📌 Сервис работы с файлами
+
+    Файлы хранятся в хранилище storage_backend (локальный диск или S3),
+    FileEntity.file_path - ключ файла в хранилище, FileEntity.is_remote -
+    признак S3. Ввод-вывод хранилища выполняется вне цикла событий.
+    """
 
     UPLOAD_FOLDER = f"{app_config.static_folder}/{app_config.upload_folder}"
     ALLOWED_EXTENSIONS: dict = AppFileExtensionConstants.ALL_EXTENSIONS
@@ -24,6 +33,8 @@ class FileService:
 
     def __init__(self, db: AsyncSession) -> None:
         self.db = db
+        # Хранилище для новых файлов
+        self.storage: BaseStorage = get_storage()
 
     def change_max_size(self, max_size_mb: float):
         self.MAX_FILE_SIZE_MB = max_size_mb
@@ -40,6 +51,43 @@ class FileService:
         safe_filename = f"{uuid.uuid4().hex}_{Path(filename).name}"
         return os.path.join(directory, safe_filename)
 
+    @staticmethod
+    async def remove_variants(variants: dict | None, is_remote: bool) -> None:
+        """
+        Удаляет уменьшенные копии изображения из хранилища.
+
+        :param variants: FileEntity.variants.
+        :param is_remote: FileEntity.is_remote.
+        """
+        storage = get_storage(is_remote)
+        for variant in (variants or {}).values():
+            for key in ("webp", "jpeg"):
+                if variant.get(key):
+                    await asyncio.to_thread(storage.delete, variant[key])
+
+    @staticmethod
+    async def remove_stored_object(file_path: str, is_remote: bool, variants: dict | None) -> None:
+        """
+        Удаляет файл и его уменьшенные копии из хранилища, в котором он сохранён.
+
+        :param file_path: Ключ файла в хранилище.
+        :param is_remote: Признак хранения в S3.
+        :param variants: Уменьшенные копии изображения.
+        """
+        await asyncio.to_thread(get_storage(is_remote).delete, file_path)
+        await FileService.remove_variants(variants, is_remote)
+
+    @staticmethod
+    async def remove_stored_file(file_record: FileEntity) -> None:
+        """
+        Удаляет файл и его уменьшенные копии из хранилища, в котором он сохранён.
+
+        :param file_record: Модель файла.
+        """
+        await FileService.remove_stored_object(
+            file_record.file_path, file_record.is_remote, file_record.variants
+        )
+
     @staticmethod
     def validate_file(file: UploadFile, extensions=None):
         """
@@ -74,7 +122,7 @@ class FileService:
         self, file: UploadFile, uploaded_folder: str, extensions: Optional[dict] = None
     ) -> FileEntity:
         """
-        Сохраняет файл в статичной папке и создает запись в базе данных.
+        Сохраняет файл в хранилище и создает запись в базе данных.
 
         :param file: Загружаемый файл.
         :param uploaded_folder: Папка для загрузки.
@@ -84,19 +132,21 @@ class FileService:
         # try:
         FileService.validate_file(file, extensions)
 
-        upload_directory = os.path.join(FileService.UPLOAD_FOLDER, uploaded_folder)
-        os.makedirs(upload_directory, exist_ok=True)
-
-        file_path = FileService.generate_file_path(file.filename, upload_directory)
+        file_path = FileService.generate_file_path(
+            file.filename, os.path.join(self.storage.upload_prefix, uploaded_folder)
+        )
 
-        with open(file_path, "wb") as f:
-            f.write(await file.read())
+        # Потоковая запись вне цикла событий: файл не загружается в память целиком
+        file_size = await asyncio.to_thread(
+            self.storage.save_stream, file.file, file_path, file.content_type
+        )
 
         file_record = FileEntity(
             filename=file.filename,
             file_path=file_path,
-            file_size=os.path.getsize(file_path),
+            file_size=file_size,
             content_type=file.content_type,
+            is_remote=self.storage.is_remote,
         )
         self.db.add(file_record)
         await self.db.commit()
@@ -113,7 +163,7 @@ class FileService:
 
     async def delete_file(self, file_id: int) -> bool:
         """
-        Удаляет файл с диска и из базы данных.
+        Удаляет файл из хранилища и из базы данных.
 
         :param file_id: ID файла.
         :param db: Сессия базы данных.
@@ -124,8 +174,7 @@ class FileService:
             if not file_record:
                 return False
 
-            if os.path.exists(file_record.file_path):
-                os.remove(file_record.file_path)
+            await FileService.remove_stored_file(file_record)
 
             await self.db.delete(file_record)
             await self.db.commit()
@@ -146,7 +195,7 @@ class FileService:
         extensions: Optional[dict] = None,
     ) -> FileEntity:
         """
-        Обновляет файл на диске и запись в базе данных.
+        Обновляет файл в хранилище и запись в базе данных.
 
         :param file_id: ID файла.
         :param new_file: Новый файл.
@@ -154,41 +203,44 @@ class FileService:
         :param extensions: Разрешенные расширения (если переданы).
         :return: Обновленная модель файла.
         """
-        try:
-            existing_file = await self.db.get(FileEntity, file_id)
-            if not existing_file:
-                raise AppExceptionResponse.bad_request(message=i18n.gettext("file_not_found"))
-
-            if os.path.exists(existing_file.file_path):
-                os.remove(existing_file.file_path)
+        existing_file = await self.db.get(FileEntity, file_id)
+        if not existing_file:
+            raise AppExceptionResponse.bad_request(message=i18n.gettext("file_not_found"))
 
-            FileService.validate_file(new_file, extensions)
+        FileService.validate_file(new_file, extensions)
 
-            upload_directory = os.path.join(FileService.UPLOAD_FOLDER, uploaded_folder)
-            os.makedirs(upload_directory, exist_ok=True)
-
-            new_file_path = FileService.generate_file_path(
-                new_file.filename, upload_directory
+        # Старый объект удаляется только после сохранения нового и commit:
+        # при ошибке загрузки запись продолжает ссылаться на существующий файл
+        previous_object = (existing_file.file_path, existing_file.is_remote, existing_file.variants)
+        new_file_path = FileService.generate_file_path(
+            new_file.filename, os.path.join(self.storage.upload_prefix, uploaded_folder)
+        )
+        try:
+            file_size = await asyncio.to_thread(
+                self.storage.save_stream, new_file.file, new_file_path, new_file.content_type
             )
 
-            with open(new_file_path, "wb") as f:
-                f.write(await new_file.read())
-
             existing_file.filename = new_file.filename
             existing_file.file_path = new_file_path
-            existing_file.file_size = os.path.getsize(new_file_path)
+            existing_file.file_size = file_size
             existing_file.content_type = new_file.content_type
+            existing_file.is_remote = self.storage.is_remote
+            # Копии нового изображения создаст задача generate_file_variants
+            existing_file.variants = None
             await self.db.commit()
             await self.db.refresh(existing_file)
-            return existing_file
         except Exception as exc:
             await self.db.rollback()
+            await asyncio.to_thread(self.storage.delete, new_file_path)
             raise AppExceptionResponse.internal_error(
                 message=i18n.gettext("file_update_error"),
                 extra={"file_id": file_id, "details": str(exc)},
                 is_custom=True,
             )
 
+        await FileService.remove_stored_object(*previous_object)
+        return existing_file
+
     async def read_file_base64(self, file_id: int) -> str:
         """
         Читает файл из хранилища и возвращает его в кодировке Base64.
@@ -197,13 +249,13 @@ class FileService:
         :return: Строка Base64 с содержимым файла.
         """
         file_record = await self.db.get(FileEntity, file_id)
-        if not file_record or not os.path.exists(file_record.file_path):
+        storage = get_storage(file_record.is_remote) if file_record else None
+        if not file_record or not await asyncio.to_thread(storage.exists, file_record.file_path):
             raise AppExceptionResponse.bad_request(message="Файл не найден")
 
         try:
-            with open(file_record.file_path, "rb") as f:
-                encoded_file = base64.b64encode(f.read()).decode("utf-8")
-            return encoded_file
+            file_bytes = await asyncio.to_thread(storage.read_bytes, file_record.file_path)
+            return base64.b64encode(file_bytes).decode("utf-8")
         except Exception as e:
             raise AppExceptionResponse.internal_error(
                 message=f"{i18n.gettext('file_read_error')}: {str(e)}"
@@ -236,19 +288,10 @@ class FileService:
         """
         try:
 
-            # ✅ Создаём папку, если её нет
-            upload_directory = os.path.join(
-                app_config.static_folder, app_config.upload_folder, uploaded_folder
+            # ✅ Генерируем уникальный ключ файла
+            file_path = FileService.generate_file_path(
+                filename, os.path.join(self.storage.upload_prefix, uploaded_folder)
             )
-            os.makedirs(upload_directory, exist_ok=True)
-
-            # ✅ Генерируем уникальное имя файла
-            unique_filename = f"{uuid.uuid4().hex}_{filename}"
-            file_path = os.path.join(upload_directory, unique_filename)
-
-            # ✅ Сохраняем файл (ПРЯМО ИЗ `bytes`)
-            with open(file_path, "wb") as file:
-                file.write(file_bytes)
 
             # ✅ Определяем MIME-тип (по расширению)
             content_type = (
@@ -257,12 +300,16 @@ class FileService:
                 else "application/octet-stream"
             )
 
+            # ✅ Сохраняем файл (ПРЯМО ИЗ `bytes`)
+            await asyncio.to_thread(self.storage.save_bytes, file_bytes, file_path, content_type)
+
             # ✅ Создаём запись в БД
             file_record = FileEntity(
                 filename=filename,
                 file_path=file_path,
                 file_size=len(file_bytes),
                 content_type=content_type,
+                is_remote=self.storage.is_remote,
             )
             self.db.add(file_record)
             await self.db.commit()
@@ -0,0 +1,112 @@
+import logging
+import os
+import secrets
+import threading
+import time
+
+from app.infrastructure.service.redis_service import RedisService
+
+logger = logging.getLogger(__name__)
+
+
+class IdentifierService:
+    """
+    Генератор числовых идентификаторов платежей (ORDER и NONCE для Alatau).
+
+    Схема Snowflake: миллисекунды от собственной эпохи (41 бит) + ID воркера (10 бит)
+    + счётчик внутри миллисекунды (12 бит), поэтому проверочные SELECT
+    к payment_transactions не нужны.
+    ID воркера выдаётся каждому процессу счётчиком Redis (INCR) при первой
+    генерации, в том числе заново после fork. Последний рубеж - уникальный
+    индекс payment_transactions.order: повтор ORDER не будет сохранён.
+    Максимальное значение - 19 цифр, что укладывается в ограничение ORDER (6–22 цифры).
+    """
+
+    EPOCH_MS = 1704067200000  # 2024-01-01 00:00:00 UTC
+    WORKER_BITS = 10
+    SEQUENCE_BITS = 12
+    MAX_WORKER_ID = (1 << WORKER_BITS) - 1
+    MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+    NONCE_RANDOM_DIGITS = 12
+
+    def __init__(self, worker_id: int | None = None) -> None:
+        self.worker_id = worker_id & self.MAX_WORKER_ID if worker_id is not None else None
+        self._worker_pid = os.getpid() if worker_id is not None else None
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._sequence = 0
+
+    def _fetch_worker_id(self) -> int:
+        """
+        Следующий номер воркера из Redis по модулю 1024 (вызывается вне _lock).
+
+        Если Redis недоступен, берётся случайный ID (с предупреждением в лог);
+        совпадение ORDER тогда отсекает уникальный индекс.
+        """
+        try:
+            return RedisService().next_payment_identifier_worker() & self.MAX_WORKER_ID
+        except Exception as exc:
+            worker_id = secrets.randbelow(self.MAX_WORKER_ID + 1)
+            logger.warning(f"IdentifierService: ID воркера не получен из Redis ({exc}), случайный ID {worker_id}")
+            return worker_id
+
+    def _has_worker_id(self, pid: int) -> bool:
+        return self.worker_id is not None and self._worker_pid == pid
+
+    def next_id(self) -> int:
+        """Возвращает следующий уникальный идентификатор."""
+        pid = os.getpid()
+        fetched_worker_id = None
+        with self._lock:
+            has_worker_id = self._has_worker_id(pid)
+        if not has_worker_id:
+            # Сетевой запрос к Redis - вне блокировки, чтобы другие потоки не ждали его;
+            # если ID успел назначить другой поток, полученный номер не используется
+            fetched_worker_id = self._fetch_worker_id()
+        with self._lock:
+            if not self._has_worker_id(pid):
+                self.worker_id = fetched_worker_id
+                self._worker_pid = pid
+                self._last_ms = -1
+                self._sequence = 0
+            worker_id = self.worker_id
+            now_ms = int(time.time() * 1000)
+            # При переводе часов назад продолжаем с последней выданной миллисекунды
+            if now_ms < self._last_ms:
+                now_ms = self._last_ms
+            if now_ms == self._last_ms:
+                self._sequence = (self._sequence + 1) & self.MAX_SEQUENCE
+                if self._sequence == 0:
+                    # Счётчик исчерпан - переходим к следующей миллисекунде без ожидания
+                    # (не блокируем цикл событий, даже если часы отстают от _last_ms)
+                    now_ms = self._last_ms + 1
+            else:
+                self._sequence = 0
+            self._last_ms = now_ms
+            return (
+                ((now_ms - self.EPOCH_MS) << (self.WORKER_BITS + self.SEQUENCE_BITS))
+                | (worker_id << self.SEQUENCE_BITS)
+                | self._sequence
+            )
+
+    def generate_order(self) -> str:
+        """
+        Генерирует номер заказа для платёжной системы.
+
+        Returns:
+            str: Строка из цифр длиной до 19 символов.
+        """
+        return str(self.next_id())
+
+    def generate_nonce(self) -> str:
+        """
+        Генерирует NONCE: уникальная часть + криптографически случайный хвост.
+
+        Returns:
+            str: Строка из цифр длиной до 31 символа.
+        """
+        random_part = secrets.randbelow(10 ** self.NONCE_RANDOM_DIGITS)
+        return f"{self.next_id()}{random_part:0{self.NONCE_RANDOM_DIGITS}d}"
+
+
+identifier_service = IdentifierService()
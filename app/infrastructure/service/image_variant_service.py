@@ -0,0 +1,95 @@
+import asyncio
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+from app.entities import FileEntity
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.storage_service.storage_factory import get_storage
+
+
+def render_image_variants(data: bytes, widths: list[int], quality: int) -> list[dict]:
+    """
+    Создаёт уменьшенные копии изображения в WebP и JPEG.
+
+    Выполняется в отдельном процессе (CPU-bound), поэтому функция верхнего уровня.
+    Ширины не меньше ширины оригинала пропускаются.
+
+    :param data: Оригинал изображения.
+    :param widths: Ширины копий в пикселях.
+    :param quality: Качество сжатия (1-100).
+    :return: [{"width", "height", "webp": bytes, "jpeg": bytes}, ...]
+    """
+    variants = []
+    with Image.open(io.BytesIO(data)) as original:
+        # Учитываем поворот из EXIF (фото с телефонов)
+        image = ImageOps.exif_transpose(original)
+        has_alpha = image.mode in ("RGBA", "LA", "P")
+        for width in sorted(set(widths)):
+            if width >= image.width:
+                break
+            height = max(1, round(image.height * width / image.width))
+            resized = image.resize((width, height), Image.Resampling.LANCZOS)
+
+            webp = io.BytesIO()
+            resized.convert("RGBA" if has_alpha else "RGB").save(
+                webp, "WEBP", quality=quality, method=4
+            )
+            jpeg = io.BytesIO()
+            resized.convert("RGB").save(
+                jpeg, "JPEG", quality=quality, optimize=True, progressive=True
+            )
+            variants.append(
+                {"width": width, "height": height, "webp": webp.getvalue(), "jpeg": jpeg.getvalue()}
+            )
+    return variants
+
+
+class ImageVariantService:
+    """📌 Генерация уменьшенных копий изображений в пуле процессов"""
+
+    _executor: ProcessPoolExecutor | None = None
+
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        """Пул процессов создаётся один раз на процесс планировщика."""
+        if cls._executor is None:
+            cls._executor = ProcessPoolExecutor(max_workers=app_config.image_variant_workers)
+        return cls._executor
+
+    async def generate(self, file: FileEntity) -> dict:
+        """
+        Генерирует копии изображения и сохраняет их в хранилище файла,
+        не блокируя цикл событий.
+
+        :param file: Модель файла-оригинала.
+        :return: {"320w": {"width", "height", "webp", "jpeg"}, ...} с ключами копий в хранилище.
+        """
+        storage = get_storage(file.is_remote)
+        data = await asyncio.to_thread(storage.read_bytes, file.file_path)
+        loop = asyncio.get_running_loop()
+        rendered = await loop.run_in_executor(
+            self.get_executor(),
+            render_image_variants,
+            data,
+            app_config.image_variant_widths,
+            app_config.image_variant_quality,
+        )
+
+        stem, _ = os.path.splitext(file.file_path)
+        variants = {}
+        for variant in rendered:
+            name = f"{variant['width']}w"
+            webp_key = f"{stem}_{name}.webp"
+            jpeg_key = f"{stem}_{name}.jpg"
+            await asyncio.to_thread(storage.save_bytes, variant["webp"], webp_key, "image/webp")
+            await asyncio.to_thread(storage.save_bytes, variant["jpeg"], jpeg_key, "image/jpeg")
+            variants[name] = {
+                "width": variant["width"],
+                "height": variant["height"],
+                "webp": webp_key,
+                "jpeg": jpeg_key,
+            }
+        return variants
@@ -2,6 +2,7 @@ from datetime import timedelta
 
 from app.infrastructure.app_config import app_config
 from app.infrastructure.redis_client import get_redis_client
+from app.shared.app_redis_keys import AppRedisKeys
 
 
 class RedisService:
@@ -31,3 +32,143 @@ class RedisService:
             str | None: Токен или None если не найден
         """
         return self.redis_client.get(name=name)
+
+    def get_product_document(self, product_id: int) -> str | None:
+        """
+        Получает материализованную карточку товара (готовый JSON).
+
+        Args:
+            product_id: ID товара
+
+        Returns:
+            str | None: JSON карточки или None, если ключа нет
+        """
+        return self.redis_client.get(name=AppRedisKeys.product_document_key(product_id))
+
+    def set_product_document(self, product_id: int, payload: str) -> None:
+        """
+        Сохраняет материализованную карточку товара с TTL.
+
+        Args:
+            product_id: ID товара
+            payload: JSON карточки
+        """
+        ttl_seconds = app_config.product_document_redis_ttl_minutes * 60
+        self.redis_client.setex(
+            name=AppRedisKeys.product_document_key(product_id), time=ttl_seconds, value=payload
+        )
+
+    def delete_product_documents(self, product_ids: list[int]) -> None:
+        """
+        Удаляет карточки товаров из кеша.
+
+        Args:
+            product_ids: ID товаров
+        """
+        if product_ids:
+            self.redis_client.delete(*[AppRedisKeys.product_document_key(product_id) for product_id in product_ids])
+
+    def get_academy_profile(self, academy_id: int) -> str | None:
+        """
+        Получает кешированный профиль академии (готовый JSON).
+
+        Args:
+            academy_id: ID академии
+
+        Returns:
+            str | None: JSON профиля или None, если ключа нет
+        """
+        return self.redis_client.get(name=AppRedisKeys.academy_profile_key(academy_id))
+
+    def set_academy_profile(self, academy_id: int, payload: str, ttl_seconds: int) -> None:
+        """
+        Сохраняет профиль академии.
+
+        Args:
+            academy_id: ID академии
+            payload: JSON профиля
+            ttl_seconds: Время жизни ключа
+        """
+        self.redis_client.setex(
+            name=AppRedisKeys.academy_profile_key(academy_id), time=ttl_seconds, value=payload
+        )
+
+    def delete_academy_profiles(self, academy_ids: list[int | None]) -> None:
+        """
+        Инвалидирует профили академий после изменения академии, галереи, группы или расписания.
+
+        Args:
+            academy_ids: ID академий (None пропускаются)
+        """
+        keys = {AppRedisKeys.academy_profile_key(academy_id) for academy_id in academy_ids if academy_id}
+        if keys:
+            self.redis_client.delete(*keys)
+
+    def get_notification_broadcast_version(self) -> int:
+        """Текущая версия общих рассылок уведомлений."""
+        return int(self.redis_client.get(name=AppRedisKeys.NOTIFICATION_BROADCAST_VERSION) or 0)
+
+    def bump_notification_broadcast_version(self) -> None:
+        """Сбрасывает счётчики непрочитанных всех пользователей после изменения общей рассылки."""
+        self.redis_client.incr(name=AppRedisKeys.NOTIFICATION_BROADCAST_VERSION)
+
+    def get_notification_unread_count(self, user_id: int) -> int | None:
+        """
+        Получает кешированный счётчик непрочитанных уведомлений.
+
+        Args:
+            user_id: ID пользователя
+
+        Returns:
+            int | None: Количество или None, если ключа нет
+        """
+        value = self.redis_client.get(
+            name=AppRedisKeys.notification_unread_count_key(user_id, self.get_notification_broadcast_version())
+        )
+        return int(value) if value is not None else None
+
+    def set_notification_unread_count(self, user_id: int, count: int, broadcast_version: int) -> None:
+        """
+        Сохраняет счётчик непрочитанных уведомлений.
+
+        Args:
+            user_id: ID пользователя
+            count: Количество непрочитанных уведомлений
+            broadcast_version: Версия общих рассылок, прочитанная до подсчёта
+        """
+        self.redis_client.setex(
+            name=AppRedisKeys.notification_unread_count_key(user_id, broadcast_version),
+            time=timedelta(minutes=app_config.notification_unread_count_redis_ttl_minutes),
+            value=count,
+        )
+
+    def delete_notification_unread_counts(self, user_ids: list[int]) -> None:
+        """
+        Инвалидирует счётчики пользователей после прочтения или личного уведомления.
+
+        Args:
+            user_ids: ID пользователей
+        """
+        if user_ids:
+            broadcast_version = self.get_notification_broadcast_version()
+            self.redis_client.delete(
+                *[AppRedisKeys.notification_unread_count_key(user_id, broadcast_version) for user_id in user_ids]
+            )
+
+    def publish_reference_data_changed(self, names: list[str]) -> None:
+        """
+        Оповещает процессы приложения об изменении справочников.
+
+        Args:
+            names: Имена справочников (имена таблиц)
+        """
+        self.redis_client.publish(AppRedisKeys.REFERENCE_DATA_CHANNEL, ",".join(names))
+
+    def next_payment_identifier_worker(self) -> int:
+        """
+        Выдаёт следующий номер воркера генератора платёжных идентификаторов (INCR).
+
+        Returns:
+            int: Порядковый номер процесса, запросившего ID воркера
+        """
+        return int(self.redis_client.incr(AppRedisKeys.PAYMENT_IDENTIFIER_WORKER_SEQUENCE))
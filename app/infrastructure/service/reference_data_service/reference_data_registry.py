@@ -0,0 +1,243 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy.orm import selectinload
+
+from app.adapters.dto.booking_field_party_status.booking_field_party_status_dto import (
+    BookingFieldPartyStatusWithRelationsRDTO,
+)
+from app.adapters.dto.city.city_dto import CityWithRelationsRDTO
+from app.adapters.dto.country.country_dto import CountryRDTO
+from app.adapters.dto.payment_transaction_status.payment_transaction_status_dto import (
+    PaymentTransactionStatusRDTO,
+)
+from app.adapters.dto.permission.permission_dto import PermissionRDTO
+from app.adapters.dto.product_order_item_status.product_order_item_status_dto import (
+    ProductOrderItemStatusWithRelationsRDTO,
+)
+from app.adapters.dto.product_order_status.product_order_status_dto import (
+    ProductOrderStatusWithRelationsRDTO,
+)
+from app.adapters.dto.role.role_dto import RoleRDTO
+from app.adapters.dto.sport.sport_dto import SportRDTO
+from app.adapters.dto.ticketon_order_status.ticketon_order_status_dto import TicketonOrderStatusRDTO
+from app.adapters.dto.topic_notification.topic_notification_dto import (
+    TopicNotificationWithRelationsRDTO,
+)
+from app.adapters.repository.booking_field_party_status.booking_field_party_status_repository import (
+    BookingFieldPartyStatusRepository,
+)
+from app.adapters.repository.city.city_repository import CityRepository
+from app.adapters.repository.country.country_repository import CountryRepository
+from app.adapters.repository.payment_transaction_status.payment_transaction_status_repository import (
+    PaymentTransactionStatusRepository,
+)
+from app.adapters.repository.permission.permission_repository import PermissionRepository
+from app.adapters.repository.product_order_item_status.product_order_item_status_repository import (
+    ProductOrderItemStatusRepository,
+)
+from app.adapters.repository.product_order_status.product_order_status_repository import (
+    ProductOrderStatusRepository,
+)
+from app.adapters.repository.role.role_repository import RoleRepository
+from app.adapters.repository.sport.sport_repository import SportRepository
+from app.adapters.repository.ticketon_order_status.ticketon_order_status_repository import (
+    TicketonOrderStatusRepository,
+)
+from app.adapters.repository.topic_notification.topic_notification_repository import (
+    TopicNotificationRepository,
+)
+from app.entities import (
+    BookingFieldPartyStatusEntity,
+    CityEntity,
+    CountryEntity,
+    PaymentTransactionStatusEntity,
+    PermissionEntity,
+    ProductOrderItemStatusEntity,
+    ProductOrderStatusEntity,
+    RoleEntity,
+    SportEntity,
+    TicketonOrderStatusEntity,
+    TopicNotificationEntity,
+)
+from app.infrastructure.app_config import app_config
+from app.infrastructure.db import AsyncSessionLocal
+from app.infrastructure.redis_client import get_async_redis_client
+from app.infrastructure.service.reference_data_service.reference_data_snapshot import (
+    ReferenceDataSet,
+    ReferenceDataSnapshot,
+)
+from app.shared.app_redis_keys import AppRedisKeys
+
+logger = logging.getLogger("ReferenceDataRegistry")
+
+
+class ReferenceDataRegistry:
+    """
+    📌 Справочники в памяти процесса API
+
+    Небольшие редко меняющиеся таблицы (города, страны, виды спорта, роли,
+    права, топики уведомлений, статусы) загружаются фоновой задачей listen()
+    при старте в неизменяемые снимки. Запись через ORM (админские CRUD use case)
+    после commit публикует имена изменённых справочников в Redis
+    (ReferenceDataEventHandler), каждый
+    процесс перезагружает только их. Раз в reference_data_refresh_seconds
+    справочники перезагружаются полностью на случай потерянного оповещения.
+
+    Пока снимок не загружен (старт, другой процесс, ошибка загрузки), get() возвращает
+    None и вызывающий код читает из базы как раньше.
+    """
+
+    def __init__(self) -> None:
+        self._sets: dict[str, ReferenceDataSet] = {}
+        self._snapshots: dict[str, ReferenceDataSnapshot] = {}
+
+    def register(self, data_set: ReferenceDataSet) -> None:
+        self._sets[data_set.name] = data_set
+
+    @property
+    def entities(self) -> list[Any]:
+        """Сущности, изменение которых требует перезагрузки справочников."""
+        entities = []
+        for data_set in self._sets.values():
+            for entity in (data_set.entity, *data_set.depends_on):
+                if entity not in entities:
+                    entities.append(entity)
+        return entities
+
+    def names_for(self, entity: Any) -> set[str]:
+        """Справочники, которые нужно перезагрузить после изменения entity."""
+        return {
+            name
+            for name, data_set in self._sets.items()
+            if data_set.entity is entity or entity in data_set.depends_on
+        }
+
+    def get(self, entity: Any) -> ReferenceDataSnapshot | None:
+        """Текущий снимок справочника или None, если он не загружен."""
+        return self._snapshots.get(entity.__tablename__)
+
+    def get_by_id(self, entity: Any, id: int) -> BaseModel | None:
+        """Элемент справочника по id из памяти (None - нет снимка или элемента)."""
+        snapshot = self.get(entity)
+        return snapshot.by_id.get(id) if snapshot else None
+
+    async def exists(self, entity: Any, id: int, repository: Any) -> bool:
+        """
+        Проверка существования записи справочника.
+
+        Попадание в снимок - без запроса к базе; промах перепроверяется
+        репозиторием, чтобы только что созданная запись не была отклонена
+        до прихода оповещения.
+        """
+        if self.get_by_id(entity, id) is not None:
+            return True
+        return (await repository.get(id)) is not None
+
+    def get_for_filter(self, entity: Any, filter: Any) -> ReferenceDataSnapshot | None:
+        """
+        Снимок для ответа /all, если фильтр его не сужает: без условий,
+        без удалённых записей и с сортировкой по id по возрастанию.
+        """
+        snapshot = self.get(entity)
+        if (
+            snapshot is None
+            or getattr(filter, "is_show_deleted", False)
+            or (filter.order_by or "id") != "id"
+            or (filter.order_direction or "asc").lower() != "asc"
+            or filter.apply()
+        ):
+            return None
+        return snapshot
+
+    async def load(self, names: set[str] | None = None) -> None:
+        """Загружает (перезагружает) снимки справочников; ошибка одного не мешает остальным."""
+        for name in sorted(names if names is not None else self._sets):
+            data_set = self._sets.get(name)
+            if data_set is None:
+                continue
+            try:
+                async with AsyncSessionLocal() as session:
+                    repository = data_set.repository_class(session)
+                    models = await repository.get_all(
+                        options=[
+                            selectinload(getattr(data_set.entity, relationship))
+                            for relationship in data_set.relationships
+                        ],
+                    )
+                    items = [data_set.dto.model_validate(model) for model in models]
+                self._snapshots[name] = ReferenceDataSnapshot(name, items)
+            except Exception as exc:
+                # Устаревший снимок хуже, чем чтение из базы: убираем его
+                self._snapshots.pop(name, None)
+                logger.warning(f"Не удалось загрузить справочник {name}: {exc}")
+
+    async def listen(self) -> None:
+        """
+        Фоновая задача процесса API: подписка на оповещения об изменениях
+        и периодическая полная перезагрузка.
+
+        Снимки загружаются только после подписки (при старте и после
+        переподключения), поэтому изменение между загрузкой и подпиской
+        не теряется. До первой загрузки запросы читают справочники из базы.
+        """
+        refresh_seconds = app_config.reference_data_refresh_seconds
+        while True:
+            client = get_async_redis_client()
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(AppRedisKeys.REFERENCE_DATA_CHANNEL)
+                # Изменения, сделанные до подписки, не были получены
+                await self.load()
+                refreshed_at = time.monotonic()
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        await self.load(set(message["data"].split(",")))
+                    if time.monotonic() - refreshed_at >= refresh_seconds:
+                        await self.load()
+                        refreshed_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(f"Подписка на изменения справочников прервана: {exc}")
+                await asyncio.sleep(5)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+
+reference_data_registry = ReferenceDataRegistry()
+for reference_data_set in (
+    ReferenceDataSet(CountryEntity, CountryRepository, CountryRDTO),
+    ReferenceDataSet(
+        CityEntity, CityRepository, CityWithRelationsRDTO,
+        relationships=("country",), depends_on=(CountryEntity,),
+    ),
+    ReferenceDataSet(SportEntity, SportRepository, SportRDTO),
+    ReferenceDataSet(RoleEntity, RoleRepository, RoleRDTO),
+    ReferenceDataSet(PermissionEntity, PermissionRepository, PermissionRDTO),
+    # Замена файла изображения без изменения топика подхватывается периодической перезагрузкой
+    ReferenceDataSet(
+        TopicNotificationEntity, TopicNotificationRepository, TopicNotificationWithRelationsRDTO,
+        relationships=("image",),
+    ),
+    ReferenceDataSet(
+        ProductOrderStatusEntity, ProductOrderStatusRepository, ProductOrderStatusWithRelationsRDTO,
+        relationships=("previous_status", "next_status"),
+    ),
+    ReferenceDataSet(
+        ProductOrderItemStatusEntity, ProductOrderItemStatusRepository, ProductOrderItemStatusWithRelationsRDTO,
+        relationships=("previous_status", "next_status"),
+    ),
+    ReferenceDataSet(PaymentTransactionStatusEntity, PaymentTransactionStatusRepository, PaymentTransactionStatusRDTO),
+    ReferenceDataSet(TicketonOrderStatusEntity, TicketonOrderStatusRepository, TicketonOrderStatusRDTO),
+    ReferenceDataSet(
+        BookingFieldPartyStatusEntity, BookingFieldPartyStatusRepository, BookingFieldPartyStatusWithRelationsRDTO,
+        relationships=("previous_status", "next_status"),
+    ),
+):
+    reference_data_registry.register(reference_data_set)
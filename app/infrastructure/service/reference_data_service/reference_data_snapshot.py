@@ -0,0 +1,65 @@
+import hashlib
+from types import MappingProxyType
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.fast_json_response import dump_json
+
+
+class ReferenceDataSet:
+    """
+    Описание справочника, хранимого в памяти.
+
+    Атрибуты:
+        entity: Сущность справочника; имя таблицы - имя справочника.
+        repository_class: Репозиторий для загрузки.
+        dto: DTO элементов (как в ответе эндпоинта /all).
+        relationships: Связи, входящие в DTO (загружаются selectinload).
+        depends_on: Сущности, изменение которых меняет DTO справочника
+            (например, страна в составе города).
+    """
+
+    def __init__(
+        self,
+        entity: Any,
+        repository_class: Any,
+        dto: type[BaseModel],
+        relationships: tuple[str, ...] = (),
+        depends_on: tuple[Any, ...] = (),
+    ) -> None:
+        self.entity = entity
+        self.name: str = entity.__tablename__
+        self.repository_class = repository_class
+        self.dto = dto
+        self.relationships = relationships
+        self.depends_on = depends_on
+
+
+class ReferenceDataSnapshot:
+    """
+    Неизменяемый снимок справочника.
+
+    Создаётся целиком при загрузке и заменяется новым при изменении таблицы,
+    поэтому читатели всегда видят согласованное состояние без блокировок.
+    Элементы (DTO) общие для всех запросов - изменять их нельзя.
+
+    Атрибуты:
+        items: Элементы по возрастанию id.
+        by_id: Элементы по id.
+        by_value: Элементы по value (если у DTO есть поле value).
+        body: Готовый JSON-массив элементов для ответа /all.
+        etag: Сильный ETag содержимого.
+    """
+
+    __slots__ = ("name", "items", "by_id", "by_value", "body", "etag")
+
+    def __init__(self, name: str, items: list[BaseModel]) -> None:
+        self.name = name
+        self.items: tuple[BaseModel, ...] = tuple(sorted(items, key=lambda item: item.id))
+        self.by_id: MappingProxyType = MappingProxyType({item.id: item for item in self.items})
+        self.by_value: MappingProxyType = MappingProxyType(
+            {item.value: item for item in self.items if getattr(item, "value", None) is not None}
+        )
+        self.body: bytes = dump_json(list(self.items))
+        self.etag = f'"{name}-{hashlib.sha1(self.body).hexdigest()[:20]}"'
@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO
+
+
+class BaseStorage(ABC):
+    """
+    Базовый класс хранилища файлов.
+
+    Ключ файла - значение FileEntity.file_path. Методы синхронные (файловый
+    ввод-вывод или boto3), поэтому из async-кода вызываются через asyncio.to_thread.
+
+    Атрибуты:
+        is_remote (bool): Значение FileEntity.is_remote для файлов этого хранилища.
+        upload_prefix (str): Префикс ключей загружаемых файлов.
+    """
+
+    is_remote: bool = False
+    upload_prefix: str = ""
+
+    @abstractmethod
+    def save_stream(self, source: BinaryIO, key: str, content_type: str | None = None) -> int:
+        """
+        Сохраняет поток блоками, не загружая его в память целиком.
+
+        :return: Размер сохранённого файла в байтах.
+        """
+
+    @abstractmethod
+    def save_bytes(self, data: bytes, key: str, content_type: str | None = None) -> None:
+        """Сохраняет байты под ключом key."""
+
+    @abstractmethod
+    def read_bytes(self, key: str) -> bytes:
+        """Читает файл целиком."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Удаляет файл (отсутствующий файл не считается ошибкой)."""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Проверяет наличие файла."""
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """Публичная ссылка (CDN, статический сервер или подписанная ссылка)."""
+
+    @property
+    def has_stable_urls(self) -> bool:
+        """Ссылки не истекают, их можно хранить в кешированных ответах."""
+        return True
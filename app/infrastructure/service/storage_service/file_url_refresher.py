@@ -0,0 +1,49 @@
+from typing import Any
+
+import orjson
+
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.storage_service.storage_factory import get_storage
+
+
+def refresh_file_urls(payload: str) -> str:
+    """
+    Обновляет подписанные ссылки на файлы в готовом JSON ответа.
+
+    Материализованные карточки товаров и профили академий хранят FileRDTO
+    вместе с ключом файла (file_path, variants.webp/jpeg). Подписанные ссылки
+    S3 истекают, поэтому для файлов S3 без storage_public_base_url ссылки url,
+    webp_url и jpeg_url строятся заново при выдаче. Если все ссылки постоянные
+    (CDN, публичный бакет, локальное хранилище), JSON возвращается без разбора.
+
+    Args:
+        payload: JSON ответа с вложенными FileRDTO
+
+    Returns:
+        str: JSON с актуальными ссылками
+    """
+    if not app_config.s3_bucket:
+        return payload
+    storage = get_storage(True)
+    if storage.has_stable_urls:
+        return payload
+    data = orjson.loads(payload)
+    _refresh(data, storage)
+    return orjson.dumps(data).decode()
+
+
+def _refresh(node: Any, storage: Any) -> None:
+    if isinstance(node, list):
+        for child in node:
+            _refresh(child, storage)
+        return
+    if not isinstance(node, dict):
+        return
+    if node.get("is_remote") is True and "file_path" in node and "url" in node:
+        node["url"] = storage.url(node["file_path"])
+        for variant in (node.get("variants") or {}).values():
+            variant["webp_url"] = storage.url(variant["webp"])
+            variant["jpeg_url"] = storage.url(variant["jpeg"])
+        return
+    for child in node.values():
+        _refresh(child, storage)
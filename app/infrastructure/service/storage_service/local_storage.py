@@ -0,0 +1,46 @@
+import os
+import shutil
+from pathlib import Path
+from typing import BinaryIO
+
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.storage_service.base_storage import BaseStorage
+
+
+class LocalStorage(BaseStorage):
+    """
+    Хранилище на локальном диске (static/upload).
+
+    Ключ - путь относительно рабочей директории приложения. Ссылки строятся от
+    storage_public_base_url: по умолчанию это StaticFiles приложения ("/static/..."),
+    в продакшене - nginx или CDN перед общей директорией, чтобы статика не
+    проходила через воркеры приложения.
+    """
+
+    is_remote = False
+    upload_prefix = f"{app_config.static_folder}/{app_config.upload_folder}"
+
+    def save_stream(self, source: BinaryIO, key: str, content_type: str | None = None) -> int:
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        source.seek(0)
+        with open(key, "wb") as f:
+            shutil.copyfileobj(source, f, app_config.app_upload_chunk_size_kb * 1024)
+            return f.tell()
+
+    def save_bytes(self, data: bytes, key: str, content_type: str | None = None) -> None:
+        os.makedirs(os.path.dirname(key), exist_ok=True)
+        with open(key, "wb") as f:
+            f.write(data)
+
+    def read_bytes(self, key: str) -> bytes:
+        return Path(key).read_bytes()
+
+    def delete(self, key: str) -> None:
+        if os.path.exists(key):
+            os.remove(key)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(key)
+
+    def url(self, key: str) -> str:
+        return f"{app_config.storage_public_base_url.rstrip('/')}/{key.lstrip('/')}"
@@ -0,0 +1,81 @@
+from typing import BinaryIO
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.storage_service.base_storage import BaseStorage
+
+
+class S3Storage(BaseStorage):
+    """
+    S3-совместимое хранилище (AWS S3, MinIO и т.п.).
+
+    s3_endpoint_url позволяет работать с локальной заглушкой (MinIO, moto server).
+    Ссылки строятся от storage_public_base_url (CDN или публичный бакет); если он
+    не задан - выдаются подписанные ссылки на s3_presigned_url_expire_seconds.
+    """
+
+    is_remote = True
+    upload_prefix = app_config.upload_folder
+
+    def __init__(self) -> None:
+        self.bucket = app_config.s3_bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=app_config.s3_endpoint_url,
+            region_name=app_config.s3_region,
+            aws_access_key_id=app_config.s3_access_key_id,
+            aws_secret_access_key=app_config.s3_secret_access_key,
+        )
+        # Загрузка частями по размеру блока потоковой записи
+        chunk_size = app_config.app_upload_chunk_size_kb * 1024
+        self.transfer_config = TransferConfig(
+            multipart_threshold=max(chunk_size, 5 * 1024 * 1024),
+            multipart_chunksize=max(chunk_size, 5 * 1024 * 1024),
+        )
+
+    def save_stream(self, source: BinaryIO, key: str, content_type: str | None = None) -> int:
+        source.seek(0, 2)
+        size = source.tell()
+        source.seek(0)
+        self.client.upload_fileobj(
+            source,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type} if content_type else None,
+            Config=self.transfer_config,
+        )
+        return size
+
+    def save_bytes(self, data: bytes, key: str, content_type: str | None = None) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=data, **extra)
+
+    def read_bytes(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError:
+            return False
+
+    def url(self, key: str) -> str:
+        if app_config.storage_public_base_url:
+            return f"{app_config.storage_public_base_url.rstrip('/')}/{key}"
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=app_config.s3_presigned_url_expire_seconds,
+        )
+
+    @property
+    def has_stable_urls(self) -> bool:
+        # Подписанные ссылки истекают через s3_presigned_url_expire_seconds
+        return bool(app_config.storage_public_base_url)
@@ -0,0 +1,21 @@
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.storage_service.base_storage import BaseStorage
+from app.infrastructure.service.storage_service.local_storage import LocalStorage
+from app.infrastructure.service.storage_service.s3_storage import S3Storage
+from app.shared.app_file_constants import AppFileExtensionConstants
+
+_storages: dict[bool, BaseStorage] = {}
+
+
+def get_storage(is_remote: bool | None = None) -> BaseStorage:
+    """
+    Возвращает хранилище файлов (один экземпляр на процесс).
+
+    :param is_remote: FileEntity.is_remote существующего файла; None - хранилище
+        для новых файлов по настройке storage_backend.
+    """
+    if is_remote is None:
+        is_remote = app_config.storage_backend == AppFileExtensionConstants.S3StorageBackend
+    if is_remote not in _storages:
+        _storages[is_remote] = S3Storage() if is_remote else LocalStorage()
+    return _storages[is_remote]
@@ -1,6 +1,6 @@
 import asyncio
 import os
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI, Depends
@@ -13,6 +13,7 @@ from app.infrastructure.app_config import app_config
 from app.infrastructure.redis_client import check_redis_connection
 from app.infrastructure.scheduler.app_scheduler_runner import start_scheduler
 from app.infrastructure.service.firebase_service.firebase_service import initialize_firebase
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.middleware.auth_wrapper_core import AuthWrapper
 from app.middleware.registry_middleware import registry_middleware
 from app.routes.registry_route import enable_routes
@@ -32,9 +33,14 @@ async def lifespan(app: FastAPI):
     await run_seeders()
     register_events()
     check_redis_connection()
+    # Справочники в памяти: подписка на изменения и загрузка снимков сразу после неё
+    reference_data_listener = asyncio.create_task(reference_data_registry.listen())
     start_scheduler()
     await initialize_firebase()
     yield
+    reference_data_listener.cancel()
+    with suppress(asyncio.CancelledError):
+        await reference_data_listener
 
 
 # Инициализация FastAPI приложения
@@ -55,6 +61,8 @@ include_static_files(app)
 
 # 📌 Настройка статических файлов
 for static_path in [app_config.static_folder, app_config.template]:
+    if static_path == app_config.static_folder and not app_config.storage_serve_static:
+        continue
     if not os.path.exists(static_path):
         os.makedirs(static_path)
     app.mount(
@@ -6,6 +6,7 @@ from loguru import logger
 from datetime import datetime
 import time
 import json
+from app.core.route_metadata import route_metadata_index
 from app.infrastructure.app_config import app_config
 
 """
@@ -13,6 +14,7 @@ from app.infrastructure.app_config import app_config
 
 Настраивает файловое и консольное логирование, сохраняет подробные сведения о каждом запросе,
 включая тело, параметры, пользователя (если доступен JWT), время выполнения, путь и описание маршрута.
+Описание маршрута берётся из RouteMetadataIndex, построенного при старте.
 """
 logger.remove()
 logger.add(
@@ -41,7 +43,7 @@ async def log_requests(request: Request, call_next):
     Middleware-функция для логирования HTTP-запросов FastAPI.
 
     Сохраняет информацию о запросе: IP клиента, параметры, тело, а также данные пользователя из JWT-токена (если есть).
-    Логирует время выполнения, путь, метод, статус ответа, summary и description эндпоинта из OpenAPI.
+    Логирует время выполнения, путь, метод, статус ответа, summary и description эндпоинта из индекса маршрутов.
 
     Args:
         request (Request): Входящий HTTP-запрос FastAPI.
@@ -118,7 +120,10 @@ async def log_requests(request: Request, call_next):
 
 def get_summary(route_path, method):
     """
-    Получает summary и description для маршрута из OpenAPI схемы FastAPI.
+    Получает summary и description для маршрута из индекса метаданных маршрутов.
+
+    Индекс строится один раз при старте приложения, поэтому генерация OpenAPI схемы
+    на пути запроса не выполняется.
 
     Args:
         route_path (str): Путь маршрута (например, "/api/items").
@@ -127,27 +132,8 @@ def get_summary(route_path, method):
     Returns:
         dict: Словарь с ключами "summary" и "description".
     """
-    from app.main import app
-
-    actions_descriptions = {
-        "summary": "...",
-        "description": "...",
+    metadata = route_metadata_index.get(route_path, method)
+    return {
+        "summary": metadata["summary"],
+        "description": metadata["description"],
     }
-    if not app.openapi_schema:
-        app.openapi()
-    if app.openapi_schema:
-        summary = (
-            app.openapi_schema.get("paths", {})
-            .get(route_path, {})
-            .get(method, {})
-            .get("summary", "")
-        )
-        actions_descriptions["summary"] = summary
-        description = (
-            app.openapi_schema.get("paths", {})
-            .get(route_path, {})
-            .get(method, {})
-            .get("description", "")
-        )
-        actions_descriptions["description"] = description
-    return actions_descriptions
@@ -52,6 +52,7 @@ from app.routes.read_notification.read_notification_route import assign_read_not
 from app.routes.topic_notification.topic_notification_route import assign_topic_notification_roles
 from app.routes.firebase_notification.firebase_notification_route import assign_firebase_notification_roles
 from app.routes.yandex_afisha_widget_ticket.yandex_afisha_widget_ticket_route import assign_yandex_afisha_widget_ticket_roles
+from app.routes.search_document.search_document_route import assign_search_document_roles
 
 
 def assign_roles_to_all_routes(app) -> None:
@@ -143,3 +144,6 @@ def assign_roles_to_all_routes(app) -> None:
 
     # Yandex Afisha Widget Ticket routes
     assign_yandex_afisha_widget_ticket_roles(app)
+
+    # Unified search routes
+    assign_search_document_roles(app)
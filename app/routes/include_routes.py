@@ -67,6 +67,7 @@ from app.adapters.api.firebase_notification.firebase_notification_api import Fir
 from app.adapters.api.notification.notification_api import NotificationApi
 from app.adapters.api.read_notification.read_notification_api import ReadNotificationApi
 from app.adapters.api.yandex_afisha_widget_ticket.yandex_afisha_widget_ticket_api import YandexAfishaWidgetTicketApi
+from app.adapters.api.search_document.search_document_api import SearchDocumentApi
 from app.shared.route_constants import RoutePathConstants
 
 
@@ -396,3 +397,10 @@ def include_routers(app) -> None:
         prefix=f"{RoutePathConstants.BasePathName}/yandex-afisha-widget-ticket",
         tags=["Билеты Яндекс.Афиша"],
     )
+
+    # Unified search routes
+    app.include_router(
+        SearchDocumentApi().router,
+        prefix=f"{RoutePathConstants.BasePathName}/search",
+        tags=["Единый поиск"],
+    )
@@ -60,6 +60,14 @@ def assign_notification_roles(app) -> None:
             RoleRouteConstant.ClientTagName,
         ],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}/client/feed",
+        roles=[
+            RoleRouteConstant.AdministratorTagName,
+            RoleRouteConstant.ClientTagName,
+        ],
+    )
     assign_roles_to_route(
         app=app,
         path=f"{base_url}/client/get/{{id}}",
@@ -68,3 +76,19 @@ def assign_notification_roles(app) -> None:
             RoleRouteConstant.ClientTagName,
         ],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}/client/unread-count",
+        roles=[
+            RoleRouteConstant.AdministratorTagName,
+            RoleRouteConstant.ClientTagName,
+        ],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}/client/read-all",
+        roles=[
+            RoleRouteConstant.AdministratorTagName,
+            RoleRouteConstant.ClientTagName,
+        ],
+    )
@@ -15,6 +15,19 @@ def assign_product_roles(app) -> None:
         path=f"{base_url}{RoutePathConstants.AllPathName}",
         roles=[RoleRouteConstant.AdministratorTagName],
     )
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}{RoutePathConstants.ExportPathName}",
+        roles=[RoleRouteConstant.AdministratorTagName],
+    )
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}{RoutePathConstants.FacetsPathName}",
+        roles=[
+            RoleRouteConstant.AdministratorTagName,
+            RoleRouteConstant.ClientTagName,
+        ],
+    )
     assign_roles_to_route(
         app=app,
         path=f"{base_url}{RoutePathConstants.CreatePathName}",
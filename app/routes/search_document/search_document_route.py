@@ -0,0 +1,15 @@
+from app.routes.base_route import assign_roles_to_route
+from app.shared.role_route_constants import RoleRouteConstant
+from app.shared.route_constants import RoutePathConstants
+
+
+def assign_search_document_roles(app) -> None:
+    base_url = f"{RoutePathConstants.BasePathName}/search"
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}{RoutePathConstants.IndexPathName}",
+        roles=[
+            RoleRouteConstant.AdministratorTagName,
+            RoleRouteConstant.ClientTagName,
+        ],
+    )
@@ -20,6 +20,13 @@ def assign_ticketon_order_roles(app) -> None:
         roles=[RoleRouteConstant.AdministratorTagName],
     )
     
+    # Streaming export endpoint - Admin only
+    assign_roles_to_route(
+        app=app,
+        path=f"{base_url}{RoutePathConstants.ExportPathName}",
+        roles=[RoleRouteConstant.AdministratorTagName],
+    )
+    
     # Get by ID endpoint - Admin only (read-only API)
     assign_roles_to_route(
         app=app,
@@ -17,6 +17,10 @@ class AppFileExtensionConstants:
     RequestMaterialFolderName = "request_materials"
     YandexAfishaWidgetTicketFolderName = "yandex_afisha_widget_tickets"
 
+    # Хранилища файлов (app_config.storage_backend)
+    LocalStorageBackend = "local"
+    S3StorageBackend = "s3"
+
     # Расширения для изображений
     IMAGE_EXTENSIONS: typing.ClassVar = {
         ".jpg",
@@ -31,6 +35,15 @@ class AppFileExtensionConstants:
         ".heic",
     }
 
+    # MIME-типы изображений, для которых генерируются уменьшенные копии
+    IMAGE_VARIANT_CONTENT_TYPES: typing.ClassVar = {
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "image/bmp",
+        "image/tiff",
+    }
+
     # Расширения для видео
     VIDEO_EXTENSIONS: typing.ClassVar = {
         ".mp4",
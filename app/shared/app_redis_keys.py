@@ -25,6 +25,25 @@ class AppRedisKeys:
     TICKETON_SHOW_LEVEL_PREFIX = "ticketon_show_level"
     TICKETON_LEVEL_PREFIX = "ticketon_level"
 
+    # === Product Document Keys ===
+    PRODUCT_DOCUMENT_PREFIX = "product_document"
+
+    # === Academy Profile Keys ===
+    ACADEMY_PROFILE_PREFIX = "academy_profile"
+
+    # === Notification Unread Count Keys ===
+    NOTIFICATION_UNREAD_COUNT_PREFIX = "notification_unread_count"
+    # Версия общих рассылок: увеличивается при изменении уведомлений с user_id IS NULL
+    NOTIFICATION_BROADCAST_VERSION = "notification_broadcast_version"
+
+    # === Payment Identifier Keys ===
+    # Счётчик ID воркеров генератора ORDER/NONCE (INCR при старте процесса)
+    PAYMENT_IDENTIFIER_WORKER_SEQUENCE = "payment_identifier_worker_sequence"
+
+    # === Reference Data Keys ===
+    # Канал pub/sub: имена изменённых справочников (через запятую)
+    REFERENCE_DATA_CHANNEL = "reference_data_changed"
+
     @staticmethod
     def sota_countries_key(lang: str, **params) -> str:
         """
@@ -174,3 +193,46 @@ class AppRedisKeys:
             str: Redis ключ
         """
         return f"{AppRedisKeys.TICKETON_SINGLE_SHOW_PREFIX}_{show_id}_{i18n}"
+
+    @staticmethod
+    def product_document_key(product_id: int) -> str:
+        """
+        Генерирует ключ материализованной карточки товара.
+
+        Args:
+            product_id: ID товара
+
+        Returns:
+            str: Redis ключ
+        """
+        return f"{AppRedisKeys.PRODUCT_DOCUMENT_PREFIX}_{product_id}"
+
+    @staticmethod
+    def academy_profile_key(academy_id: int) -> str:
+        """
+        Генерирует ключ кешированного профиля академии (GetFullAcademyDTO).
+
+        Args:
+            academy_id: ID академии
+
+        Returns:
+            str: Redis ключ
+        """
+        return f"{AppRedisKeys.ACADEMY_PROFILE_PREFIX}_{academy_id}"
+
+    @staticmethod
+    def notification_unread_count_key(user_id: int, broadcast_version: int) -> str:
+        """
+        Генерирует ключ счётчика непрочитанных уведомлений пользователя.
+
+        Версия общих рассылок входит в ключ, поэтому новая рассылка сбрасывает
+        счётчики всех пользователей одним INCR.
+
+        Args:
+            user_id: ID пользователя
+            broadcast_version: Текущая версия общих рассылок
+
+        Returns:
+            str: Redis ключ
+        """
+        return f"{AppRedisKeys.NOTIFICATION_UNREAD_COUNT_PREFIX}_{user_id}_{broadcast_version}"
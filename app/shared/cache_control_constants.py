@@ -0,0 +1,18 @@
+"""
+Значения заголовка Cache-Control для ответов с валидаторами (ETag / Last-Modified).
+Все ответы API требуют авторизации, поэтому кэширование только в клиенте (private).
+"""
+
+
+class AppCacheControlConstants:
+    """Константы Cache-Control маршрутов"""
+
+    # Справочники /all: всегда перепроверять по ETag
+    ReferenceData = "private, no-cache"
+
+    # Карточки каталога (товар, поле, академия, группа): меняются редко,
+    # минуту клиент использует копию без запроса, затем перепроверяет
+    CatalogItem = "private, max-age=60, must-revalidate"
+
+    # Заказы: статус меняется после оплаты - всегда перепроверять
+    Order = "private, no-cache"
@@ -2,7 +2,7 @@ from datetime import datetime, time, date
 from decimal import Decimal
 from typing import Annotated, Any, Text
 
-from geoalchemy2 import Geometry
+from geoalchemy2 import Geography, Geometry
 from sqlalchemy import (
     text,
     String,
@@ -18,7 +18,7 @@ from sqlalchemy import (
     Numeric,
     ARRAY,
 )
-from sqlalchemy.dialects.postgresql import BYTEA, JSONB
+from sqlalchemy.dialects.postgresql import BYTEA, JSONB, TSVECTOR
 from sqlalchemy.orm import mapped_column, relationship
 
 from app.infrastructure.app_config import app_config
@@ -37,7 +37,7 @@ class DbColumnConstants:
     UpdatedAt = Annotated[
         datetime,
         mapped_column(
-            server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now()
+            server_default=text("CURRENT_TIMESTAMP"), onupdate=datetime.now
         ),
     ]
     DeletedAt = Annotated[
@@ -50,6 +50,12 @@ class DbColumnConstants:
     StandardVarcharIndex = Annotated[
         str, mapped_column(String(length=FieldConstants.STANDARD_LENGTH), index=True)
     ]
+    StandardUniqueVarcharIndex = Annotated[
+        str,
+        mapped_column(
+            String(length=FieldConstants.STANDARD_LENGTH), unique=True, index=True
+        ),
+    ]
     StandardNullableVarchar = Annotated[
         str, mapped_column(String(length=FieldConstants.STANDARD_LENGTH), nullable=True)
     ]
@@ -373,6 +379,33 @@ class DbColumnConstants:
         ),
     ]
 
+    # Вычисляемый tsvector для полнотекстового поиска (не загружается по умолчанию)
+    StandardComputedTSVector = lambda table_exp: Annotated[
+        Any,
+        mapped_column(
+            TSVECTOR,
+            Computed(
+                f"{table_exp}",
+                persisted=True,
+            ),
+            deferred=True,
+        ),
+    ]
+
+    # Вычисляемая точка geography (не загружается по умолчанию, GiST-индекс задаётся в __table_args__)
+    StandardComputedGeographyPoint = lambda table_exp: Annotated[
+        Any,
+        mapped_column(
+            Geography(geometry_type="POINT", srid=4326, spatial_index=False),
+            Computed(
+                f"{table_exp}",
+                persisted=True,
+            ),
+            nullable=True,
+            deferred=True,
+        ),
+    ]
+
     StandardNullableJSONB = Annotated[dict | None, mapped_column(JSONB, nullable=True)]
     StandardJSONB = Annotated[dict, mapped_column(JSONB, nullable=False)]
 
@@ -650,5 +683,21 @@ class DbComputedConstants:
         """Вычисление Total Price * qty (алиас для count_total_price)."""
         return self.count_total_price_with_shipping_price
 
+    @property
+    def geography_point(self) -> str:
+        """
+        Вычисление точки geography(POINT, 4326) из строковых latitude/longitude.
+
+        Нечисловые значения и координаты вне допустимого диапазона дают NULL.
+        """
+        number_pattern = "'^-?[0-9]+([.][0-9]+)?$'"
+        lat, lng = "btrim(latitude)", "btrim(longitude)"
+        return (
+            f"CASE WHEN {lat} ~ {number_pattern} AND {lng} ~ {number_pattern} THEN "
+            f"CASE WHEN abs({lat}::double precision) <= 90 AND abs({lng}::double precision) <= 180 THEN "
+            f"ST_SetSRID(ST_MakePoint({lng}::double precision, {lat}::double precision), 4326)::geography "
+            "END END"
+        )
+
 
 app_db_computed = DbComputedConstants()
@@ -58,6 +58,11 @@ class AppTableNames:
     NotificationTableName = "notifications"
     UserNotificationTableName = "user_notifications"
     ReadNotificationTableName = "read_notifications"
+    NotificationReadStateTableName = "notification_read_states"
     UserCodeResetPasswordTableName = "user_code_reset_passwords"
     YandexAfishaWidgetTicketTableName = "yandex_afisha_widget_tickets"
+    ProductStockReservationTableName = "product_stock_reservations"
+    SearchDocumentTableName = "search_documents"
+    ProductDocumentTableName = "product_documents"
+    OutboxEventTableName = "outbox_events"
 
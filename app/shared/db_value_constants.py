@@ -134,6 +134,11 @@ class DbValueConstants:
     TopicNotificationPaymentID = 5
     TopicNotificationPaymentValue = "payment"
 
+    # Типы документов единого поиска
+    SearchDocumentProductType = "product"
+    SearchDocumentFieldType = "field"
+    SearchDocumentAcademyType = "academy"
+
     @staticmethod
     def get_value(title: str):
         return slugify(
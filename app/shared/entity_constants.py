@@ -71,6 +71,10 @@ class AppEntityNames:
     ProductOrderAndPaymentTransactionEntityName = "ProductOrderAndPaymentTransactionEntity"
     ProductOrderItemHistoryEntityName = "ProductOrderItemHistoryEntity"
     ProductOrderItemVerificationCodeEntityName = "ProductOrderItemVerificationCodeEntity"
+    ProductStockReservationEntityName = "ProductStockReservationEntity"
+    SearchDocumentEntityName = "SearchDocumentEntity"
+    ProductDocumentEntityName = "ProductDocumentEntity"
+    OutboxEventEntityName = "OutboxEventEntity"
 
     # Booking Party
     BookingFieldPartyStatusEntityName = "BookingFieldPartyStatusEntity"
@@ -82,6 +86,7 @@ class AppEntityNames:
     FirebaseNotificationEntityName = "FirebaseNotificationEntity"
     NotificationEntityName = "NotificationEntity"
     ReadNotificationEntityName = "ReadNotificationEntity"
+    NotificationReadStateEntityName = "NotificationReadStateEntity"
     UserCodeResetPasswordEntityName = "UserCodeResetPasswordEntity"
 
     # Yandex Afisha entities
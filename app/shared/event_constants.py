@@ -0,0 +1,22 @@
+"""
+Типы событий transactional outbox и бэкенды шины событий.
+Тип события - ключ маршрутизации при публикации в RabbitMQ.
+Событие относится к агрегату (заказ, корзина) и содержит элементы,
+изменённые за один flush, в payload["items"].
+"""
+
+
+class AppEventConstants:
+    """Константы шины событий"""
+
+    # Бэкенды шины (app_config.event_bus_backend)
+    RabbitMQBackend = "rabbitmq"
+    AsyncioBackend = "asyncio"
+
+    # Элементы заказа (aggregate_id - ID заказа): история, коды верификации, суммы и статус заказа
+    ProductOrderItemCreated = "product_order_item.created"
+    ProductOrderItemUpdated = "product_order_item.updated"
+    ProductOrderItemDeleted = "product_order_item.deleted"
+
+    # Элементы корзины (aggregate_id - ID корзины): сумма и снимок cart_items корзины
+    CartItemChanged = "cart_item.changed"
@@ -0,0 +1,21 @@
+"""
+Именованные профили подгрузки связей репозиториев (BaseRepository.loading_profiles).
+Профиль определяет, какие связи подгружаются запросом (selectinload),
+чтобы списки не загружали связи, нужные только карточке или админке.
+"""
+
+
+class AppLoadingProfileConstants:
+    """Константы профилей подгрузки связей"""
+
+    # Без связей: проверки существования, служебные выборки
+    Minimal = "minimal"
+
+    # Списки и страницы пагинации: только то, что выводится в строке списка
+    List = "list"
+
+    # Карточка записи
+    Detail = "detail"
+
+    # Администрирование: все связи, включая удалённые и служебные записи
+    Admin = "admin"
@@ -70,6 +70,16 @@ class AppQueryConstants:
             description=description,
         )
 
+    @staticmethod
+    def StandardExportFormatQuery(
+        description: str | None = "Формат выгрузки: json (массив) или ndjson (объект на строку)",
+    ) -> Query:
+        return Query(
+            default="json",
+            regex="^(json|ndjson)$",
+            description=description,
+        )
+
     @staticmethod
     def StandardOptionalIntegerQuery(
         description: str | None = "Опциональное числовое значение",
@@ -90,6 +100,28 @@ class AppQueryConstants:
             description=description,
         )
 
+    @staticmethod
+    def StandardOptionalLatitudeQuery(
+        description: str | None = "Широта точки поиска",
+    ) -> Query:
+        return Query(
+            default=None,
+            ge=-90,
+            le=90,
+            description=description,
+        )
+
+    @staticmethod
+    def StandardOptionalLongitudeQuery(
+        description: str | None = "Долгота точки поиска",
+    ) -> Query:
+        return Query(
+            default=None,
+            ge=-180,
+            le=180,
+            description=description,
+        )
+
     @staticmethod
     def StandardBooleanQuery(description: str | None = "Логическое значение") -> Query:
         return Query(
@@ -58,10 +58,12 @@ class RoutePathConstants:
 
     IndexPathName = "/"
     AllPathName = "/all"
+    ExportPathName = "/export"
     CreatePathName = "/create"
     UpdatePathName = "/update/{id}"
     GetByIdPathName = "/get/{id}"
     GetFullProductByIdPathName = "/get-full-product/{id}"
+    FacetsPathName = "/facets"
     DeleteByIdPathName = "/delete/{id}"
     RecoverByIdPathName = "/recover/{id}"
     GetByValuePathName = "/get-by-value/{value}"
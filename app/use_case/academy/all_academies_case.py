@@ -46,9 +46,10 @@ class AllAcademiesCase(BaseUseCase[list[AcademyWithRelationsRDTO]]):
         models = await self.repository.get_with_filters(
             order_by=filter.order_by,
             order_direction=filter.order_direction,
-            options=self.repository.default_relationships(),
+            options=self.repository.default_relationships() + filter.get_options(),
             filters=filter.apply(),
             include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
         )
         return [AcademyWithRelationsRDTO.from_orm(model) for model in models]
 
@@ -10,9 +10,10 @@ from app.adapters.repository.academy.academy_repository import AcademyRepository
 from app.adapters.repository.city.city_repository import CityRepository
 from app.adapters.repository.file.file_repository import FileRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import AcademyEntity
+from app.entities import AcademyEntity, CityEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
@@ -101,8 +102,7 @@ class CreateAcademyCase(BaseUseCase[AcademyWithRelationsRDTO]):
 
         # Проверка существования города (если указан)
         if dto.city_id:
-            city = await self.city_repository.get(dto.city_id)
-            if not city:
+            if not await reference_data_registry.exists(CityEntity, dto.city_id, self.city_repository):
                 raise AppExceptionResponse.bad_request(
                     message=i18n.gettext("city_not_found")
                 )
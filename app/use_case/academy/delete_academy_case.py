@@ -5,6 +5,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.use_case.base_case import BaseUseCase
 
 
@@ -30,6 +31,7 @@ class DeleteAcademyCase(BaseUseCase[bool]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyRepository(db)
+        self.redis_service = RedisService()
         self.file_service = FileService(db)
         self.model: AcademyEntity | None = None
 
@@ -57,6 +59,8 @@ class DeleteAcademyCase(BaseUseCase[bool]):
             await self.file_service.delete_file(file_id=self.model.image_id)
 
         result = await self.repository.delete(id, force_delete=force_delete)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([id])
         return result
 
     async def validate(self, id: int, force_delete: bool = False) -> None:
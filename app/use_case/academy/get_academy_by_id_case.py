@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.academy.academy_dto import AcademyRDTO
 from app.adapters.repository.academy.academy_repository import AcademyRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
 
@@ -55,6 +56,21 @@ class GetAcademyByIdCase(BaseUseCase[AcademyRDTO]):
 
         return AcademyRDTO.from_orm(model)
 
+    async def get_version(self, id: int) -> ResourceVersion | None:
+        """
+        Версия академии для условного GET (ETag / Last-Modified) без сборки DTO.
+
+        Args:
+            id (int): ID академии.
+
+        Returns:
+            ResourceVersion | None: Версия или None, если запись не найдена.
+        """
+        return await self.repository.get_version(
+            filters=[self.repository.model.id == id],
+            include_deleted_filter=True,
+        )
+
     async def validate(self, id: int) -> None:
         """
         Валидация входных данных.
@@ -1,36 +1,48 @@
+from datetime import date, datetime, time, timedelta
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.academy.academy_dto import GetFullAcademyDTO, AcademyWithRelationsRDTO
+from app.adapters.dto.academy_gallery.academy_gallery_dto import AcademyGalleryWithRelationsRDTO
+from app.adapters.dto.academy_group.academy_group_dto import AcademyGroupWithRelationsRDTO
+from app.adapters.dto.academy_group_schedule.academy_group_schedule_dto import AcademyGroupScheduleWithRelationsRDTO
 from app.adapters.repository.academy.academy_repository import AcademyRepository
-from app.adapters.repository.academy_gallery.academy_gallery_repository import AcademyGalleryRepository
-from app.adapters.repository.academy_group.academy_group_repository import AcademyGroupRepository
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyEntity
 from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.redis_service import RedisService
+from app.infrastructure.service.storage_service.file_url_refresher import refresh_file_urls
 from app.use_case.base_case import BaseUseCase
 
 
-class GetFullAcademyByIdCase(BaseUseCase[GetFullAcademyDTO]):
+class GetFullAcademyByIdCase(BaseUseCase[str]):
     """
     Класс Use Case для получения полной информации об академии по ID.
 
+    Профиль (академия, галереи, группы и расписание групп на текущую неделю)
+    собирается одним вызовом AcademyRepository.get_full_profile и кешируется
+    в Redis как готовый JSON GetFullAcademyDTO. Кеш сбрасывается use case'ами
+    изменения академии, галерей, групп и расписания, а его TTL не выходит
+    за конец текущей недели.
+
     Использует:
         - Репозиторий `AcademyRepository` для работы с базой данных академий.
-        - Репозиторий `AcademyGalleryRepository` для работы с галереей академии.
-        - Репозиторий `AcademyGroupRepository` для работы с группами академии.
+        - Сервис `RedisService` для кеширования профиля.
         - DTO `GetFullAcademyDTO` для возврата полных данных академии.
 
     Атрибуты:
         academy_repository (AcademyRepository): Репозиторий для работы с академиями.
-        gallery_repository (AcademyGalleryRepository): Репозиторий для работы с галереей.
-        group_repository (AcademyGroupRepository): Репозиторий для работы с группами.
+        redis_service (RedisService): Сервис Redis.
         academy_model (AcademyEntity | None): Найденная модель академии.
 
     Методы:
-        execute(id: int) -> GetFullAcademyDTO:
-            Выполняет поиск академии по ID и возвращает полную информацию.
+        execute(id: int) -> str:
+            Возвращает JSON полной информации об академии.
         validate(id: int):
-            Проверяет существование академии с указанным ID.
+            Загружает профиль и проверяет существование академии.
+        transform() -> str:
+            Преобразует профиль в JSON GetFullAcademyDTO.
     """
 
     def __init__(self, db: AsyncSession) -> None:
@@ -41,11 +53,13 @@ class GetFullAcademyByIdCase(BaseUseCase[GetFullAcademyDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.academy_repository = AcademyRepository(db)
-        self.gallery_repository = AcademyGalleryRepository(db)
-        self.group_repository = AcademyGroupRepository(db)
+        self.redis_service = RedisService()
         self.academy_model: AcademyEntity | None = None
+        today = date.today()
+        self.week_start = today - timedelta(days=today.weekday())
+        self.week_end = self.week_start + timedelta(days=6)
 
-    async def execute(self, id: int) -> GetFullAcademyDTO:
+    async def execute(self, id: int) -> str:
         """
         Выполняет операцию получения полной информации об академии по ID.
 
@@ -53,42 +67,19 @@ class GetFullAcademyByIdCase(BaseUseCase[GetFullAcademyDTO]):
             id (int): Идентификатор академии.
 
         Returns:
-            GetFullAcademyDTO: Полная информация об академии с галереями и группами.
+            str: JSON GetFullAcademyDTO.
 
         Raises:
             AppExceptionResponse: Если академия не найдена.
         """
-        await self.validate(id=id)
-
-        # Получаем основную информацию об академии
-        academy_dto = AcademyWithRelationsRDTO.from_orm(self.academy_model)
-
-        # Получаем галереи академии
-        galleries = await self.gallery_repository.get_all(
-            filters=[self.gallery_repository.model.academy_id == id],
-            options=self.gallery_repository.default_relationships(),
-            include_deleted_filter=False
-        )
-
-        # Получаем группы академии
-        groups = await self.group_repository.get_all(
-            filters=[self.group_repository.model.academy_id == id],
-            options=self.group_repository.default_relationships(),
-            include_deleted_filter=False
-        )
-
-        # Конвертируем в DTO
-        from app.adapters.dto.academy_gallery.academy_gallery_dto import AcademyGalleryWithRelationsRDTO
-        from app.adapters.dto.academy_group.academy_group_dto import AcademyGroupWithRelationsRDTO
-
-        gallery_dtos = [AcademyGalleryWithRelationsRDTO.from_orm(gallery) for gallery in galleries]
-        group_dtos = [AcademyGroupWithRelationsRDTO.from_orm(group) for group in groups]
+        payload = self.redis_service.get_academy_profile(id)
+        if payload is not None:
+            return refresh_file_urls(payload)
 
-        return GetFullAcademyDTO(
-            academy=academy_dto,
-            galleries=gallery_dtos,
-            groups=group_dtos
-        )
+        await self.validate(id=id)
+        payload = await self.transform()
+        self.redis_service.set_academy_profile(id, payload, ttl_seconds=self._cache_ttl_seconds())
+        return payload
 
     async def validate(self, id: int) -> None:
         """
@@ -100,10 +91,33 @@ class GetFullAcademyByIdCase(BaseUseCase[GetFullAcademyDTO]):
         Raises:
             AppExceptionResponse: Если академия не найдена.
         """
-        self.academy_model = await self.academy_repository.get(
-            id,
-            options=self.academy_repository.default_relationships(),
-            include_deleted_filter=True,
+        self.academy_model = await self.academy_repository.get_full_profile(
+            id, schedule_from=self.week_start, schedule_to=self.week_end
         )
         if not self.academy_model:
-            raise AppExceptionResponse.bad_request(message=i18n.gettext("not_found"))
\ No newline at end of file
+            raise AppExceptionResponse.bad_request(message=i18n.gettext("not_found"))
+
+    async def transform(self) -> str:
+        """
+        Преобразует загруженный профиль в JSON GetFullAcademyDTO.
+
+        Returns:
+            str: JSON GetFullAcademyDTO.
+        """
+        groups = self.academy_model.academy_groups
+        schedules = sorted(
+            (schedule for group in groups for schedule in group.academy_group_schedules),
+            key=lambda schedule: (schedule.training_date, schedule.start_at),
+        )
+        return GetFullAcademyDTO(
+            academy=AcademyWithRelationsRDTO.from_orm(self.academy_model),
+            galleries=[AcademyGalleryWithRelationsRDTO.from_orm(gallery) for gallery in self.academy_model.academy_galleries],
+            groups=[AcademyGroupWithRelationsRDTO.from_orm(group) for group in groups],
+            schedules=[AcademyGroupScheduleWithRelationsRDTO.from_orm(schedule) for schedule in schedules],
+        ).model_dump_json()
+
+    def _cache_ttl_seconds(self) -> int:
+        """TTL кеша: не дольше настройки и не позже начала следующей недели."""
+        next_week = datetime.combine(self.week_end + timedelta(days=1), time.min)
+        seconds_left = int((next_week - datetime.now()).total_seconds())
+        return max(1, min(app_config.academy_profile_redis_ttl_minutes * 60, seconds_left))
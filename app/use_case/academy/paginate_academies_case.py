@@ -54,9 +54,10 @@ class PaginateAcademiesCase(BaseUseCase[PaginationAcademyWithRelationsRDTO]):
             order_direction=filter.order_direction,
             page=filter.page,
             per_page=filter.per_page,
-            options=self.repository.default_relationships(),
+            options=self.repository.default_relationships() + filter.get_options(),
             filters=filter.apply(),
             include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
         )
         return pagination_result
 
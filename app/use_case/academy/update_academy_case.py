@@ -13,9 +13,11 @@ from app.adapters.repository.academy.academy_repository import AcademyRepository
 from app.adapters.repository.city.city_repository import CityRepository
 from app.adapters.repository.file.file_repository import FileRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import AcademyEntity
+from app.entities import AcademyEntity, CityEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
+from app.infrastructure.service.redis_service import RedisService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -48,6 +50,7 @@ class UpdateAcademyCase(BaseUseCase[AcademyWithRelationsRDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyRepository(db)
+        self.redis_service = RedisService()
         self.city_repository = CityRepository(db)
         self.file_repository = FileRepository(db)
         self.file_service = FileService(db)
@@ -75,6 +78,8 @@ class UpdateAcademyCase(BaseUseCase[AcademyWithRelationsRDTO]):
         await self.validate(id=id, dto=dto, file=file)
         await self.transform(id=id, dto=dto, file=file)
         model = await self.repository.update(obj=self.model, dto=dto)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([model.id])
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
@@ -103,8 +108,7 @@ class UpdateAcademyCase(BaseUseCase[AcademyWithRelationsRDTO]):
 
         # Проверка существования города (если указан для обновления)
         if dto.city_id is not None and dto.city_id:
-            city = await self.city_repository.get(dto.city_id)
-            if not city:
+            if not await reference_data_registry.exists(CityEntity, dto.city_id, self.city_repository):
                 raise AppExceptionResponse.bad_request(
                     message=i18n.gettext("city_not_found")
                 )
@@ -10,6 +10,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -44,6 +45,7 @@ class UpdateAcademyMainPhotoCase(BaseUseCase[AcademyWithRelationsRDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyRepository(db)
+        self.redis_service = RedisService()
         self.file_service = FileService(db)
         self.model: AcademyEntity | None = None
         self.upload_folder: str | None = None
@@ -68,6 +70,8 @@ class UpdateAcademyMainPhotoCase(BaseUseCase[AcademyWithRelationsRDTO]):
 
         # Обновляем академию используя repository.update
         self.model = await self.repository.update(obj=self.model, dto=dto)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([self.model.id])
 
         # Получаем обновленную академию с отношениями
         self.model = await self.repository.get(
@@ -18,6 +18,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGalleryEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -52,6 +53,7 @@ class CreateAcademyGalleryCase(BaseUseCase[AcademyGalleryWithRelationsRDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGalleryRepository(db)
+        self.redis_service = RedisService()
         self.academy_repository = AcademyRepository(db)
         self.group_repository = AcademyGroupRepository(db)
         self.file_repository = FileRepository(db)
@@ -79,6 +81,8 @@ class CreateAcademyGalleryCase(BaseUseCase[AcademyGalleryWithRelationsRDTO]):
         await self.validate(dto=dto, file=file)
         await self.transform(dto=dto, file=file)
         model = await self.repository.create(self.model)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([model.academy_id])
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
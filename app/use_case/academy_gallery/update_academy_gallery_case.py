@@ -16,6 +16,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGalleryEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -48,6 +49,7 @@ class UpdateAcademyGalleryCase(BaseUseCase[AcademyGalleryWithRelationsRDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGalleryRepository(db)
+        self.redis_service = RedisService()
         self.group_repository = AcademyGroupRepository(db)
         self.file_repository = FileRepository(db)
         self.file_service = FileService(db)
@@ -74,7 +76,10 @@ class UpdateAcademyGalleryCase(BaseUseCase[AcademyGalleryWithRelationsRDTO]):
         """
         await self.validate(id=id, dto=dto, file=file)
         await self.transform(id=id, dto=dto, file=file)
+        previous_academy_id = self.model.academy_id
         model = await self.repository.update(obj=self.model, dto=dto)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([previous_academy_id, model.academy_id])
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
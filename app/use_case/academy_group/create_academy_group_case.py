@@ -16,6 +16,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGroupEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
@@ -49,6 +50,7 @@ class CreateAcademyGroupCase(BaseUseCase[AcademyGroupWithRelationsRDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGroupRepository(db)
+        self.redis_service = RedisService()
         self.academy_repository = AcademyRepository(db)
         self.file_repository = FileRepository(db)
         self.file_service = FileService(db)
@@ -75,6 +77,8 @@ class CreateAcademyGroupCase(BaseUseCase[AcademyGroupWithRelationsRDTO]):
         await self.validate(dto=dto, file=file)
         await self.transform(dto=dto, file=file)
         model = await self.repository.create(self.model)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([model.academy_id])
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
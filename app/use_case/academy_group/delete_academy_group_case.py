@@ -7,6 +7,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGroupEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.use_case.base_case import BaseUseCase
 
 
@@ -32,6 +33,7 @@ class DeleteAcademyGroupCase(BaseUseCase[bool]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGroupRepository(db)
+        self.redis_service = RedisService()
         self.file_service = FileService(db)
         self.model: AcademyGroupEntity | None = None
 
@@ -58,7 +60,10 @@ class DeleteAcademyGroupCase(BaseUseCase[bool]):
         if delete_image and self.model.image_id:
             await self.file_service.delete_file(file_id=self.model.image_id)
 
+        academy_id = self.model.academy_id
         result = await self.repository.delete(id, force_delete=force_delete)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([academy_id])
         return result
 
     async def validate(self, id: int, force_delete: bool = False) -> None:
@@ -5,6 +5,7 @@ from app.adapters.repository.academy_group.academy_group_repository import (
     AcademyGroupRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
 
@@ -59,6 +60,21 @@ class GetAcademyGroupByIdCase(BaseUseCase[AcademyGroupRDTO]):
 
         return AcademyGroupRDTO.from_orm(model)
 
+    async def get_version(self, id: int) -> ResourceVersion | None:
+        """
+        Версия группы академии для условного GET (ETag / Last-Modified) без сборки DTO.
+
+        Args:
+            id (int): ID группы академии.
+
+        Returns:
+            ResourceVersion | None: Версия или None, если запись не найдена.
+        """
+        return await self.repository.get_version(
+            filters=[self.repository.model.id == id],
+            include_deleted_filter=True,
+        )
+
     async def validate(self, id: int) -> None:
         """
         Валидация входных данных.
@@ -6,6 +6,7 @@ from app.adapters.repository.academy_group.academy_group_repository import (
     AcademyGroupRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
 
@@ -63,6 +64,21 @@ class GetAcademyGroupByValueCase(BaseUseCase[AcademyGroupRDTO]):
 
         return AcademyGroupRDTO.from_orm(model)
 
+    async def get_version(self, value: str) -> ResourceVersion | None:
+        """
+        Версия группы академии для условного GET (ETag / Last-Modified) без сборки DTO.
+
+        Args:
+            value (str): Уникальное значение группы академии.
+
+        Returns:
+            ResourceVersion | None: Версия или None, если запись не найдена.
+        """
+        return await self.repository.get_version(
+            filters=[func.lower(self.repository.model.value) == value.lower()],
+            include_deleted_filter=True,
+        )
+
     async def validate(self, value: str) -> None:
         """
         Валидация входных данных.
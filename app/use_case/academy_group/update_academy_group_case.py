@@ -15,6 +15,7 @@ from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGroupEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.redis_service import RedisService
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -45,6 +46,7 @@ class UpdateAcademyGroupCase(BaseUseCase[AcademyGroupWithRelationsRDTO]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGroupRepository(db)
+        self.redis_service = RedisService()
         self.file_repository = FileRepository(db)
         self.file_service = FileService(db)
         self.model: AcademyGroupEntity | None = None
@@ -71,6 +73,8 @@ class UpdateAcademyGroupCase(BaseUseCase[AcademyGroupWithRelationsRDTO]):
         await self.validate(id=id, dto=dto, file=file)
         await self.transform(id=id, dto=dto, file=file)
         model = await self.repository.update(obj=self.model, dto=dto)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles([model.academy_id])
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
@@ -15,6 +15,7 @@ from app.adapters.repository.academy_group_schedule.academy_group_schedule_repos
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGroupScheduleEntity
 from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.redis_service import RedisService
 from app.use_case.base_case import BaseUseCase
 
 
@@ -44,6 +45,7 @@ class CreateAcademyGroupScheduleCase(
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGroupScheduleRepository(db)
+        self.redis_service = RedisService()
         self.group_repository = AcademyGroupRepository(db)
         self.model: AcademyGroupScheduleEntity | None = None
 
@@ -65,6 +67,8 @@ class CreateAcademyGroupScheduleCase(
         await self.validate(dto=dto)
         await self.transform(dto=dto)
         model = await self.repository.create(self.model)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles(await self.group_repository.get_academy_ids([model.group_id]))
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
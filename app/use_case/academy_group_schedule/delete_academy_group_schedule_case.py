@@ -1,12 +1,14 @@
 from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.adapters.repository.academy_group.academy_group_repository import AcademyGroupRepository
 from app.adapters.repository.academy_group_schedule.academy_group_schedule_repository import (
     AcademyGroupScheduleRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGroupScheduleEntity
 from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.redis_service import RedisService
 from app.use_case.base_case import BaseUseCase
 
 
@@ -30,6 +32,8 @@ class DeleteAcademyGroupScheduleCase(BaseUseCase[bool]):
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGroupScheduleRepository(db)
+        self.group_repository = AcademyGroupRepository(db)
+        self.redis_service = RedisService()
         self.model: AcademyGroupScheduleEntity | None = None
 
     async def execute(self, id: int, force_delete: bool = False) -> bool:
@@ -48,7 +52,10 @@ class DeleteAcademyGroupScheduleCase(BaseUseCase[bool]):
         """
         await self.validate(id=id, force_delete=force_delete)
 
+        academy_ids = await self.group_repository.get_academy_ids([self.model.group_id])
         result = await self.repository.delete(id, force_delete=force_delete)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles(academy_ids)
         return result
 
     async def validate(self, id: int, force_delete: bool = False) -> None:
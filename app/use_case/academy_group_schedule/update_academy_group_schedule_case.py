@@ -6,12 +6,14 @@ from app.adapters.dto.academy_group_schedule.academy_group_schedule_dto import (
     AcademyGroupScheduleUpdateDTO,
     AcademyGroupScheduleWithRelationsRDTO,
 )
+from app.adapters.repository.academy_group.academy_group_repository import AcademyGroupRepository
 from app.adapters.repository.academy_group_schedule.academy_group_schedule_repository import (
     AcademyGroupScheduleRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import AcademyGroupScheduleEntity
 from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.redis_service import RedisService
 from app.use_case.base_case import BaseUseCase
 
 
@@ -39,6 +41,8 @@ class UpdateAcademyGroupScheduleCase(
             db (AsyncSession): Асинхронная сессия базы данных.
         """
         self.repository = AcademyGroupScheduleRepository(db)
+        self.group_repository = AcademyGroupRepository(db)
+        self.redis_service = RedisService()
         self.model: AcademyGroupScheduleEntity | None = None
 
     async def execute(
@@ -59,7 +63,12 @@ class UpdateAcademyGroupScheduleCase(
         """
         await self.validate(id=id, dto=dto)
         await self.transform(id=id, dto=dto)
+        previous_group_id = self.model.group_id
         model = await self.repository.update(obj=self.model, dto=dto)
+        # Сбрасываем кеш профиля академии (GetFullAcademyByIdCase)
+        self.redis_service.delete_academy_profiles(
+            await self.group_repository.get_academy_ids([previous_group_id, model.group_id])
+        )
         model = await self.repository.get(
             model.id, options=self.repository.default_relationships()
         )
@@ -8,8 +8,10 @@ from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
 from app.adapters.repository.role.role_repository import RoleRepository
 from app.adapters.repository.user.user_repository import UserRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.entities import RoleEntity
 from app.core.auth_core import get_password_hash
 from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -49,7 +51,10 @@ class RegisterCase(BaseUseCase[UserWithRelationsRDTO]):
     async def validate(self, dto: RegisterDTO) -> None:
         if not dto.role_id:
             dto.role_id = DbValueConstants.ClientRoleConstantID
-        role = await self.role_repository.get(dto.role_id)
+        # Роль из справочника в памяти, при промахе - из базы
+        role = reference_data_registry.get_by_id(
+            RoleEntity, dto.role_id
+        ) or await self.role_repository.get(dto.role_id)
         if not role:
             raise AppExceptionResponse.bad_request(
                 message=i18n.gettext("role_not_found")
@@ -1,6 +1,7 @@
 import traceback
 from datetime import datetime, timedelta
 
+from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.alatau.alatau_create_order_dto import AlatauCreateResponseOrderDTO
@@ -18,11 +19,13 @@ from app.adapters.repository.booking_field_party_and_payment_transaction.booking
 from app.adapters.repository.booking_field_party_request.booking_field_party_request_repository import BookingFieldPartyRequestRepository
 from app.adapters.repository.field_party.field_party_repository import FieldPartyRepository
 from app.adapters.repository.payment_transaction.payment_transaction_repository import PaymentTransactionRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import BookingFieldPartyRequestEntity, FieldPartyEntity, PaymentTransactionEntity, \
-    BookingFieldPartyAndPaymentTransactionEntity
+    BookingFieldPartyAndPaymentTransactionEntity, FieldPartyScheduleSettingsEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.identifier_service import identifier_service
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
 from app.use_case.field_party_schedule.preview_field_party_schedule_case import PreviewFieldPartyScheduleCase
@@ -53,6 +56,7 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
         Args:
             db: Асинхронная сессия базы данных
         """
+        self.db = db
         self.booking_field_party_request_repository = BookingFieldPartyRequestRepository(db)
         self.field_party_repository = FieldPartyRepository(db)
         self.payment_transaction_repository = PaymentTransactionRepository(db)
@@ -67,6 +71,7 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
         self.start_at:datetime|None = None
         self.end_at:datetime|None = None
         self.active_schedule:ScheduleRecordDTO|None = None
+        self.settings:FieldPartyScheduleSettingsEntity|None = None
         self.response:CreateBookingFieldPartyResponseDTO = CreateBookingFieldPartyResponseDTO()
         self.unique_order = "00000000000000000000"
 
@@ -103,8 +108,8 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
         - Корректность формата даты и времени
         - Временной слот находится в будущем
         - Существование и активность партии поля
-        - Доступность временного слота в расписании
-        - Слот не забронирован другим пользователем
+        - Наличие временного слота в расписании (без генерации занятости за весь день)
+        - Слот не заполнен до booked_limit
 
         Raises:
             AppExceptionResponse.bad_request: При невалидных данных или недоступном слоте
@@ -131,26 +136,31 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
             raise AppExceptionResponse.bad_request(i18n.gettext('field_party_is_not_active'))
 
         try:
-            schedule_response = await self.preview_field_party_schedule_case.execute(self.dto.field_party_id, self.dto.day)
-            if schedule_response.schedule_records == None or len(schedule_response.schedule_records) == 0:
-                raise AppExceptionResponse.bad_request(i18n.gettext('field_party_schedule_is_not_active'))
-            for record in schedule_response.schedule_records:
-                if record.start_at == self.dto.start_at and record.end_at == self.dto.end_at:
-                    self.active_schedule = record
-                    break
+            self.settings, self.active_schedule = await self.preview_field_party_schedule_case.find_slot(
+                self.dto.field_party_id, self.dto.day, self.dto.start_at, self.dto.end_at
+            )
         except Exception as exc:
             raise AppExceptionResponse.bad_request(i18n.gettext('there_is_no_schedule'))
 
+        if self.settings == None:
+            raise AppExceptionResponse.bad_request(i18n.gettext('field_party_schedule_is_not_active'))
         if self.active_schedule == None:
             raise AppExceptionResponse.bad_request(i18n.gettext('there_is_no_schedule'))
 
+        # Предварительная проверка занятости слота (окончательная - под блокировкой в transform)
+        booked_count = await self.booking_field_party_request_repository.count_booked_in_slot(
+            self.field_party.id, self.start_at, self.end_at
+        )
+        if booked_count >= self.settings.booked_limit:
+            raise AppExceptionResponse.bad_request(i18n.gettext('booking_slot_is_full'))
+
 
     async def transform(self) -> None:
         """
         Трансформирует и сохраняет данные заявки и платежной транзакции.
 
         Выполняет следующие шаги:
-        1. Создает заявку на бронирование со статусом "Ожидание оплаты"
+        1. Создает заявку на бронирование со статусом "Ожидание оплаты" под блокировкой слота
         2. Генерирует уникальный номер заказа и nonce для платежной системы
         3. Формирует DTO для платежной системы Alatau с цифровой подписью
         4. Создает запись платежной транзакции в базе данных
@@ -172,15 +182,21 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
                     end_at=self.end_at,
                     paid_until=datetime.now() + timedelta(hours=1)
                 )
-            self.booking_field_entity = await self.booking_field_party_request_repository.create(
-                self.booking_field_party_request_repository.model(**dto.dict())
+            # Заявка создается под блокировкой слота, чтобы не превысить booked_limit
+            self.booking_field_entity = await self.booking_field_party_request_repository.create_in_slot(
+                self.booking_field_party_request_repository.model(**dto.dict()),
+                booked_limit=self.settings.booked_limit
             )
+            if self.booking_field_entity is None:
+                raise AppExceptionResponse.bad_request(i18n.gettext('booking_slot_is_full'))
             self.booking_field_entity = await self.booking_field_party_request_repository.get(
                 self.booking_field_entity.id,
                 options=self.booking_field_party_request_repository.default_relationships()
             )
 
             self.response.field_booking_request = BookingFieldPartyRequestWithRelationsRDTO.from_orm(self.booking_field_entity)
+        except HTTPException:
+            raise
         except Exception as exc:
 
             raise AppExceptionResponse.bad_request(i18n.gettext('booking_field_not_created' + traceback.format_exc()))
@@ -188,8 +204,8 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
         # 2. Создадим платежную транзакцию
         try:
             # Генерируем уникальный номер заказа для платежной системы
-            self.unique_order = await self.payment_transaction_repository.generate_unique_order(min_len=6, max_len=22)
-            nonce = await self.payment_transaction_repository.generate_unique_noncense()
+            self.unique_order = identifier_service.generate_order()
+            nonce = identifier_service.generate_nonce()
             user_name = f"{self.current_user.first_name or ''} {self.current_user.last_name or ''}".strip()
 
             # Создаем DTO для платежной системы Alatau
@@ -232,22 +248,24 @@ class CreateClientBookingFieldRequestCase(BaseUseCase[CreateBookingFieldPartyRes
                 expired_at=self.booking_field_entity.paid_until
             )
 
-            # Создаем запись платежной транзакции в базе данных
-            self.payment_transaction_entity = await self.payment_transaction_repository.create(
-                PaymentTransactionEntity(**payment_cdto.model_dump())
-            )
+            # Платежная транзакция и связь с заявкой фиксируются одним commit
+            async with UnitOfWork(self.db):
+                # Создаем запись платежной транзакции в базе данных
+                self.payment_transaction_entity = await self.payment_transaction_repository.create(
+                    PaymentTransactionEntity(**payment_cdto.model_dump())
+                )
 
-            # 5. Создаем связь между заказом и платежной транзакцией
-            await self.booking_field_party_and_payment_transaction_repository.create(
-                BookingFieldPartyAndPaymentTransactionEntity(
-                    request_id=self.booking_field_entity.id,
-                    payment_transaction_id=self.payment_transaction_entity.id,
-                    link_type="initial",  # Тип связи: первоначальная транзакция
-                    link_reason="Initial order creation",
-                    is_primary=True,  # Основная транзакция для заказа
-                    is_active=True
+                # 5. Создаем связь между заказом и платежной транзакцией
+                await self.booking_field_party_and_payment_transaction_repository.create(
+                    BookingFieldPartyAndPaymentTransactionEntity(
+                        request_id=self.booking_field_entity.id,
+                        payment_transaction_id=self.payment_transaction_entity.id,
+                        link_type="initial",  # Тип связи: первоначальная транзакция
+                        link_reason="Initial order creation",
+                        is_primary=True,  # Основная транзакция для заказа
+                        is_active=True
+                    )
                 )
-            )
 
             # Заполняем успешный ответ
             self.response.order = self.order_dto
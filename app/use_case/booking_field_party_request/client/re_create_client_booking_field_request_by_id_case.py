@@ -23,6 +23,7 @@ from app.entities import BookingFieldPartyRequestEntity, FieldPartyEntity, Payme
     BookingFieldPartyAndPaymentTransactionEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.identifier_service import identifier_service
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -193,8 +194,8 @@ class ReCreateClientBookingFieldRequestByIdCase(BaseUseCase[CreateBookingFieldPa
         # 2. Создадим платежную транзакцию
         try:
             # Генерируем уникальный номер заказа для платежной системы
-            self.unique_order = await self.payment_transaction_repository.generate_unique_order(min_len=6, max_len=22)
-            nonce = await self.payment_transaction_repository.generate_unique_noncense()
+            self.unique_order = identifier_service.generate_order()
+            nonce = identifier_service.generate_nonce()
             user_name = f"{self.current_user.first_name or ''} {self.current_user.last_name or ''}".strip()
 
             # Создаем DTO для платежной системы Alatau
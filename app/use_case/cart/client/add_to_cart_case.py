@@ -31,6 +31,7 @@ from app.adapters.repository.cart.cart_repository import CartRepository
 from app.adapters.repository.cart_item.cart_item_repository import CartItemRepository
 from app.adapters.repository.product.product_repository import ProductRepository
 from app.adapters.repository.product_variant.product_variant_repository import ProductVariantRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import CartEntity, ProductVariantEntity, ProductEntity, CartItemEntity
 from app.i18n.i18n_wrapper import i18n
@@ -81,6 +82,7 @@ class AddToCartCase(BaseUseCase[CartActionResponseDTO]):
             и заполняются в процессе выполнения execute() метода.
         """
         # Инициализация репозиториев для работы с данными
+        self.db = db
         self.cart_repository = CartRepository(db)
         self.cart_item_repository = CartItemRepository(db)
         self.product_repository = ProductRepository(db)
@@ -134,14 +136,12 @@ class AddToCartCase(BaseUseCase[CartActionResponseDTO]):
         # Валидируем входные данные и доступность товара
         await self.validate()
 
-        # Выполняем бизнес-логику добавления в корзину
-        await self.transform()
+        # Выполняем бизнес-логику добавления в корзину: создание корзины и запись
+        # элемента фиксируются одним commit
+        async with UnitOfWork(self.db):
+            await self.transform()
 
-        # Получаем обновленную корзину с relationships для возврата
-        self.cart_entity = await self.cart_repository.get_first_with_filters(
-            filters=[self.cart_repository.model.user_id == self.current_user.id],
-            options=self.cart_repository.default_relationships()
-        )
+        # Корзина с relationships уже загружена в transform(); перечитываем только элементы
         if self.cart_entity:
             self.cart_items_entity = await self.cart_item_repository.get_with_filters(
                 filters=[self.cart_item_repository.model.cart_id == self.cart_entity.id],
@@ -156,9 +156,15 @@ class AddToCartCase(BaseUseCase[CartActionResponseDTO]):
                 cart_items_dto.append(CartItemWithRelationsRDTO.from_orm(cart_item))
                 calculated_total_price += float(cart_item.total_price)
 
+        # total_price и снимок cart_items корзины в базе пересчитывает событие outbox
+        # после commit - в ответе они собираются по текущим элементам
+        cart_dto = CartWithRelationsRDTO.from_orm(self.cart_entity)
+        cart_dto.total_price = Decimal(str(calculated_total_price))
+        cart_dto.cart_items = await self.cart_repository.build_items_snapshot(self.cart_entity.id)
+
         # Формируем ответ с актуальными данными и рассчитанной общей стоимостью
         return CartActionResponseDTO(
-            cart=CartWithRelationsRDTO.from_orm(self.cart_entity),
+            cart=cart_dto,
             cart_items=cart_items_dto,
             total_price=calculated_total_price,
         )
@@ -205,15 +211,11 @@ class AddToCartCase(BaseUseCase[CartActionResponseDTO]):
 
         # Если указан variant_id, проверяем вариант товара
         if self.dto.variant_id:
-            # Получаем вариант товара, который принадлежит указанному продукту
-            self.current_product_variant_entity = await self.product_item_repository.get_first_with_filters(
-                filters=[
-                    and_(
-                        self.product_item_repository.model.product_id == self.current_product.id,
-                        self.product_item_repository.model.id == self.dto.variant_id
-                    )
-                ]
-            )
+            # Получаем вариант товара (загрузчик запроса) и проверяем, что он принадлежит указанному продукту
+            self.current_product_variant_entity = await self.product_item_repository.get(self.dto.variant_id)
+            if (self.current_product_variant_entity and
+                    self.current_product_variant_entity.product_id != self.current_product.id):
+                self.current_product_variant_entity = None
             if not self.current_product_variant_entity:
                 raise AppExceptionResponse.bad_request(message=i18n.gettext("product_variant_not_found"))
 
@@ -250,16 +252,17 @@ class AddToCartCase(BaseUseCase[CartActionResponseDTO]):
             Использует computed поля для автоматического расчета unit_price и total_price.
             Корректно обрабатывает случаи с variant_id=None (товары без вариантов).
         """
-        # Ищем существующую корзину пользователя
+        # Ищем существующую корзину пользователя (сразу со связями для ответа execute())
         self.cart_entity = await self.cart_repository.get_first_with_filters(
-            filters=[self.cart_repository.model.user_id == self.current_user.id]
+            filters=[self.cart_repository.model.user_id == self.current_user.id],
+            options=self.cart_repository.default_relationships()
         )
 
         # Если корзины нет - создаем новую
         if not self.cart_entity:
-            await self.cart_repository.create(CartEntity(user_id=self.current_user.id))
-            self.cart_entity = await self.cart_repository.get_first_with_filters(
-                filters=[self.cart_repository.model.user_id == self.current_user.id]
+            cart_entity = await self.cart_repository.create(CartEntity(user_id=self.current_user.id))
+            self.cart_entity = await self.cart_repository.get(
+                cart_entity.id, options=self.cart_repository.default_relationships()
             )
 
         # Проверяем, что корзина успешно создана/найдена
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +9,7 @@ from app.adapters.dto.cart_item.cart_item_dto import CartItemWithRelationsRDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
 from app.adapters.repository.cart.cart_repository import CartRepository
 from app.adapters.repository.cart_item.cart_item_repository import CartItemRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import CartEntity, CartItemEntity
 from app.i18n.i18n_wrapper import i18n
@@ -32,6 +34,7 @@ class GetUserCartCase(BaseUseCase[CartActionResponseDTO]):
 
     def __init__(self, db: AsyncSession) -> None:
         # Инициализация репозитория для работы с корзинами
+        self.db = db
         self.cart_repository = CartRepository(db)
         self.cart_items_repository = CartItemRepository(db)
 
@@ -72,18 +75,9 @@ class GetUserCartCase(BaseUseCase[CartActionResponseDTO]):
         # Выполняем валидацию актуальности товаров и вариантов
         await self.transform()
 
-        # Получаем обновленную корзину после возможных изменений
-        self.cart_entity = await self.cart_repository.get_first_with_filters(
-            filters=[self.cart_repository.model.user_id == self.current_user.id],
-            options=self.cart_repository.default_relationships()
-        )
-        if self.cart_entity:
-            self.cart_items_entity = await self.cart_items_repository.get_with_filters(
-                filters=[self.cart_items_repository.model.cart_id == self.cart_entity.id],
-                options=self.cart_items_repository.default_relationships(),
-                order_by="id",
-                order_direction="desc"
-            )
+        # Корзина и элементы уже загружены в validate() со связями; изменения transform()
+        # применены к этим же объектам (UnitOfWork без refresh), удалённые убраны из списка
+        self.cart_items_entity = sorted(self.cart_items_entity, key=lambda item: item.id, reverse=True)
 
         # Вычисляем общую стоимость корзины вручную
         calculated_total_price = 0.0
@@ -93,9 +87,15 @@ class GetUserCartCase(BaseUseCase[CartActionResponseDTO]):
                 cart_items_dto.append(CartItemWithRelationsRDTO.from_orm(cart_item))
                 calculated_total_price += float(cart_item.total_price)
 
+        # total_price и снимок cart_items корзины в базе пересчитывает событие outbox
+        # после commit - в ответе они собираются по текущим элементам
+        cart_dto = CartWithRelationsRDTO.from_orm(self.cart_entity)
+        cart_dto.total_price = Decimal(str(calculated_total_price))
+        cart_dto.cart_items = await self.cart_repository.build_items_snapshot(self.cart_entity.id)
+
         # Формируем ответ с актуальными данными и рассчитанной общей стоимостью
         return CartActionResponseDTO(
-            cart=CartWithRelationsRDTO.from_orm(self.cart_entity),
+            cart=cart_dto,
             cart_items=cart_items_dto,
             total_price=calculated_total_price,
         )
@@ -227,30 +227,29 @@ class GetUserCartCase(BaseUseCase[CartActionResponseDTO]):
                         'delta_price': updated_delta_price
                     })
 
-            # Удаляем неактивные элементы корзины
-            for item in items_to_remove:
-                await self.cart_items_repository.delete(item.id, force_delete=True)
-                # Убираем из локального списка
-                self.cart_items_entity.remove(item)
+            # Удаления и обновления фиксируются одним commit без перечитывания объектов
+            async with UnitOfWork(self.db):
+                # Удаляем неактивные элементы корзины
+                for item in items_to_remove:
+                    await self.cart_items_repository.delete(item.id, force_delete=True)
+                    # Убираем из локального списка
+                    self.cart_items_entity.remove(item)
 
-            # Обновляем цены элементов корзины
-            for update_data in items_to_update:
-                cart_item = update_data['cart_item']
+                # Обновляем цены элементов корзины
+                for update_data in items_to_update:
+                    cart_item = update_data['cart_item']
 
-                # Создаем DTO для обновления
-                cart_item_dto = CartItemCDTO.from_orm(cart_item)
+                    # Создаем DTO для обновления
+                    cart_item_dto = CartItemCDTO.from_orm(cart_item)
 
-                # Обновляем цены если они изменились
-                if update_data['product_price'] is not None:
-                    cart_item_dto.product_price = update_data['product_price']
+                    # Обновляем цены если они изменились
+                    if update_data['product_price'] is not None:
+                        cart_item_dto.product_price = update_data['product_price']
 
-                if update_data['delta_price'] is not None:
-                    cart_item_dto.delta_price = update_data['delta_price']
+                    if update_data['delta_price'] is not None:
+                        cart_item_dto.delta_price = update_data['delta_price']
 
-                # Сохраняем обновления (пересчет unit_price и total_price происходит автоматически)
-                await self.cart_items_repository.update(obj=cart_item, dto=cart_item_dto)
+                    # Сохраняем обновления (пересчет unit_price и total_price происходит автоматически)
+                    await self.cart_items_repository.update(obj=cart_item, dto=cart_item_dto)
 
             # Пересчет общей суммы корзины происходит автоматически через CartItemEventHandler
-
-
-
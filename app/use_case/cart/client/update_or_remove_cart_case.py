@@ -98,9 +98,15 @@ class UpdateOrRemoveCartCase(BaseUseCase[CartActionResponseDTO]):
                 cart_items_dto.append(CartItemWithRelationsRDTO.from_orm(cart_item))
                 calculated_total_price += float(cart_item.total_price)
 
+        # total_price и снимок cart_items корзины в базе пересчитывает событие outbox
+        # после commit - в ответе они собираются по текущим элементам
+        cart_dto = CartWithRelationsRDTO.from_orm(self.cart_entity)
+        cart_dto.total_price = Decimal(str(calculated_total_price))
+        cart_dto.cart_items = await self.cart_repository.build_items_snapshot(self.cart_entity.id)
+
         # Формируем ответ с актуальными данными и рассчитанной общей стоимостью
         return CartActionResponseDTO(
-            cart=CartWithRelationsRDTO.from_orm(self.cart_entity),
+            cart=cart_dto,
             cart_items=cart_items_dto,
             total_price=calculated_total_price,
         )
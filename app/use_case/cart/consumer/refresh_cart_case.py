@@ -0,0 +1,34 @@
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.cart.cart_repository import CartRepository
+from app.entities import OutboxEventEntity
+from app.use_case.base_case import BaseUseCase
+
+
+class RefreshCartCase(BaseUseCase[None]):
+    """
+    Use Case обработчика события CartItemChanged (outbox).
+
+    Пересчитывает total_price и снимок cart_items корзины по текущим
+    элементам в транзакции обработчика (без commit). Несколько событий
+    одной корзины дают одинаковый результат; корзина, удалённая к моменту
+    обработки, не обновляется.
+
+    Attributes:
+        cart_repository: Репозиторий корзин
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.cart_repository = CartRepository(db)
+
+    async def execute(self, event: OutboxEventEntity) -> None:
+        """
+        Args:
+            event: Заблокированное событие outbox (aggregate_id - ID корзины)
+        """
+        await self.cart_repository.refresh_summary(event.aggregate_id)
+
+    async def validate(self, *args: Any, **kwargs: Any):
+        pass
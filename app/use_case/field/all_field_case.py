@@ -43,14 +43,15 @@ class AllFieldCase(BaseUseCase[list[FieldWithRelationsRDTO]]):
         Returns:
             list[FieldWithRelationsRDTO]: Список объектов полей с связями.
         """
-        models = await self.repository.get_with_filters(
+        return await self.repository.get_projected(
+            dto=FieldWithRelationsRDTO,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
-            options=self.repository.default_relationships(),
+            extra_columns=filter.get_projection_columns(),
             filters=filter.apply(),
             include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
         )
-        return [FieldWithRelationsRDTO.from_orm(model) for model in models]
 
     async def validate(self) -> None:
         """
@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.field.field_dto import FieldWithRelationsRDTO
 from app.adapters.repository.field.field_repository import FieldRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
 from app.entities import FieldEntity
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
@@ -54,6 +55,22 @@ class GetFieldByValueCase(BaseUseCase[FieldWithRelationsRDTO]):
         await self.validate(value=value)
         return FieldWithRelationsRDTO.from_orm(self.model)
 
+    async def get_version(self, value: str) -> ResourceVersion | None:
+        """
+        Версия поля для условного GET (ETag / Last-Modified) без сборки DTO.
+
+        Args:
+            value (str): Уникальное значение поля.
+
+        Returns:
+            ResourceVersion | None: Версия или None, если запись не найдена.
+        """
+        return await self.repository.get_version(
+            filters=[func.lower(self.repository.model.value) == value.lower()],
+            relationships=self.repository.version_relationships(),
+            include_deleted_filter=True,
+        )
+
     async def validate(self, value: str) -> None:
         """
         Валидация перед выполнением.
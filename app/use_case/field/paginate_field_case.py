@@ -47,15 +47,17 @@ class PaginateFieldCase(BaseUseCase[PaginationFieldWithRelationsRDTO]):
         Returns:
             PaginationFieldWithRelationsRDTO: Пагинированный список полей с связями.
         """
-        models = await self.repository.paginate(
+        # Проекция: только столбцы DTO, связи одним LEFT JOIN, без ORM-объектов
+        models = await self.repository.paginate_projected(
             dto=FieldWithRelationsRDTO,
             page=filter.page,
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
-            options=self.repository.default_relationships(),
+            extra_columns=filter.get_projection_columns(),
             filters=filter.apply(),
             include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
         )
         return models
 
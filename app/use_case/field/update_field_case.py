@@ -7,9 +7,10 @@ from app.adapters.repository.field.field_repository import FieldRepository
 from app.adapters.repository.city.city_repository import CityRepository
 from app.adapters.repository.file.file_repository import FileRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import FieldEntity
+from app.entities import CityEntity, FieldEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
@@ -112,8 +113,7 @@ class UpdateFieldCase(BaseUseCase[FieldWithRelationsRDTO]):
 
         # Проверка существования города
         if dto.city_id:
-            city = await self.city_repository.get(dto.city_id)
-            if not city:
+            if not await reference_data_registry.exists(CityEntity, dto.city_id, self.city_repository):
                 raise AppExceptionResponse.bad_request(
                     message=i18n.gettext("city_not_found")
                 )
@@ -50,7 +50,9 @@ class AllFieldPartyCase(BaseUseCase[list[FieldPartyWithRelationsRDTO]]):
         models = await self.repository.get_with_filters(
             order_by=filter.order_by,
             order_direction=filter.order_direction,
-            options=self.repository.default_relationships(),
+            options=self.repository.relationships_for(
+                FieldPartyWithRelationsRDTO, filter.loading_profile
+            ),
             filters=filter.apply(),
             include_deleted_filter=filter.is_show_deleted,
         )
@@ -75,7 +75,7 @@ class CreateFieldPartyCase(BaseUseCase[FieldPartyWithRelationsRDTO]):
         await self.transform(dto=dto, file=file)
         model = await self.repository.create(self.model)
         model = await self.repository.get(
-            model.id, options=self.repository.default_relationships()
+            model.id, options=self.repository.relationships_for(FieldPartyWithRelationsRDTO)
         )
         return FieldPartyWithRelationsRDTO.from_orm(model)
 
@@ -67,7 +67,7 @@ class GetFieldPartyByIdCase(BaseUseCase[FieldPartyWithRelationsRDTO]):
         """
         self.model = await self.repository.get(
             id,
-            options=self.repository.default_relationships(),
+            options=self.repository.relationships_for(FieldPartyWithRelationsRDTO),
             include_deleted_filter=True,
         )
         if not self.model:
@@ -68,7 +68,7 @@ class GetFieldPartyByValueCase(BaseUseCase[FieldPartyWithRelationsRDTO]):
         """
         self.model = await self.repository.get_first_with_filters(
             filters=[func.lower(self.repository.model.value) == value.lower()],
-            options=self.repository.default_relationships(),
+            options=self.repository.relationships_for(FieldPartyWithRelationsRDTO),
             include_deleted_filter=True,
         )
         if not self.model:
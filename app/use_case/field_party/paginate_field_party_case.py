@@ -57,7 +57,9 @@ class PaginateFieldPartyCase(BaseUseCase[PaginationFieldPartyWithRelationsRDTO])
             per_page=filter.per_page,
             order_by=filter.order_by,
             order_direction=filter.order_direction,
-            options=self.repository.default_relationships(),
+            options=self.repository.relationships_for(
+                FieldPartyWithRelationsRDTO, filter.loading_profile
+            ),
             filters=filter.apply(),
             include_deleted_filter=filter.is_show_deleted,
         )
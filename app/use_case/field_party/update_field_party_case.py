@@ -76,7 +76,7 @@ class UpdateFieldPartyCase(BaseUseCase[FieldPartyWithRelationsRDTO]):
         await self.transform(id=id, dto=dto, file=file)
         model = await self.repository.update(obj=self.model, dto=dto)
         model = await self.repository.get(
-            model.id, options=self.repository.default_relationships()
+            model.id, options=self.repository.relationships_for(FieldPartyWithRelationsRDTO)
         )
         return FieldPartyWithRelationsRDTO.from_orm(model)
 
@@ -73,7 +73,7 @@ class UpdateFieldPartyMainPhotoCase(BaseUseCase[FieldPartyWithRelationsRDTO]):
 
         # Получаем обновленную площадку поля с отношениями
         self.model = await self.repository.get(
-            id=self.model.id, options=self.repository.default_relationships()
+            id=self.model.id, options=self.repository.relationships_for(FieldPartyWithRelationsRDTO)
         )
         return FieldPartyWithRelationsRDTO.from_orm(self.model)
 
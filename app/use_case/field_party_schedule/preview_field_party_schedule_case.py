@@ -113,6 +113,41 @@ class PreviewFieldPartyScheduleCase(BaseUseCase[ScheduleGeneratorResponseDTO]):
 
         return response
 
+    async def find_slot(
+        self, field_party_id: int, day: str, start_at: str, end_at: str
+    ) -> tuple[FieldPartyScheduleSettingsEntity | None, ScheduleRecordDTO | None]:
+        """
+        Находит один слот расписания без подсчёта бронирований за весь день.
+
+        Используется при бронировании: занятость слота проверяется отдельно
+        по индексу заявок (см. BookingFieldPartyRequestRepository.count_booked_in_slot).
+
+        Args:
+            field_party_id: ID партии поля
+            day: Дата в формате "YYYY-MM-DD"
+            start_at: Время начала слота "HH:MM"
+            end_at: Время окончания слота "HH:MM"
+
+        Returns:
+            tuple: Настройки расписания и найденный слот (или None, если слота нет)
+        """
+        await self.validate(field_party_id=field_party_id, day=day)
+        target_date = datetime.strptime(day, "%Y-%m-%d").date()
+        settings = await self._get_settings_for_party(field_party_id)
+        if not settings:
+            return None, None
+        if (
+            not (settings.active_start_at <= target_date <= settings.active_end_at)
+            or target_date.isoweekday() not in settings.working_days
+            or (settings.excluded_dates and target_date in settings.excluded_dates)
+        ):
+            return settings, None
+
+        for slot in await self._generate_schedule_slots_for_date(settings, target_date):
+            if slot["start_at"].strftime("%H:%M") == start_at and slot["end_at"].strftime("%H:%M") == end_at:
+                return settings, self._convert_slots_to_dto([slot], settings.booked_limit)[0]
+        return settings, None
+
     async def validate(self, field_party_id: int, day: str) -> None:
         """Валидация входных параметров."""
         if field_party_id <= 0:
@@ -364,6 +399,7 @@ class PreviewFieldPartyScheduleCase(BaseUseCase[ScheduleGeneratorResponseDTO]):
         try:
             # 1. Получаем забронированные слоты из FieldSchedule
             schedule_filters = [
+                FieldPartyScheduleEntity.party_id == settings.party_id,
                 FieldPartyScheduleEntity.day == target_date,
                 FieldPartyScheduleEntity.is_booked == True,
                 FieldPartyScheduleEntity.deleted_at.is_(None)
@@ -372,6 +408,7 @@ class PreviewFieldPartyScheduleCase(BaseUseCase[ScheduleGeneratorResponseDTO]):
 
             # 2. Получаем активные заявки на бронирование
             booking_filters = [
+                BookingFieldPartyRequestEntity.field_party_id == settings.party_id,
                 BookingFieldPartyRequestEntity.is_active == True,
                 BookingFieldPartyRequestEntity.status_id.in_([
                     DbValueConstants.BookingFieldPartyStatusCreatedAwaitingPaymentID,
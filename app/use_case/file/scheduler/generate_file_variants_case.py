@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.file.file_repository import FileRepository
+from app.adapters.repository.product_document.product_document_repository import ProductDocumentRepository
+from app.entities import FileEntity
+from app.events.entity_event.product_document_event.product_document_event import ProductDocumentEventHandler
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.image_variant_service import ImageVariantService
+from app.infrastructure.service.storage_service.storage_factory import get_storage
+from app.use_case.base_case import BaseUseCase
+
+logger = logging.getLogger("scheduler")
+
+
+class GenerateFileVariantsCase(BaseUseCase[int]):
+    """
+    Use Case для фоновой генерации уменьшенных копий изображений.
+
+    За один проход обрабатывает до image_variant_batch_size файлов с variants IS NULL:
+    1. Для растровых изображений создаёт копии WebP/JPEG в пуле процессов
+       и сохраняет их в хранилище оригинала (локальный диск или S3)
+    2. Сохраняет FileEntity.variants ({} для остальных файлов и при ошибке)
+    3. Помечает устаревшими карточки товаров, в которых используется файл
+
+    Файлы, загруженные до появления копий, обрабатываются этой же задачей.
+
+    Attributes:
+        repository: Репозиторий файлов
+        document_repository: Репозиторий карточек товаров
+        image_variant_service: Генерация копий изображений
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.repository = FileRepository(db)
+        self.document_repository = ProductDocumentRepository(db)
+        self.image_variant_service = ImageVariantService()
+
+    async def execute(self) -> int:
+        """
+        Выполняет один проход генерации.
+
+        Returns:
+            int: Количество файлов, для которых созданы копии
+        """
+        files = await self.repository.get_pending_variant_batch(
+            limit=app_config.image_variant_batch_size
+        )
+        generated = 0
+        for file in files:
+            variants = await self.transform(file=file)
+            try:
+                is_saved = await self.repository.save_variants(file.id, file.file_path, variants)
+                if is_saved and variants:
+                    await self.document_repository.mark_stale(
+                        ProductDocumentEventHandler.PRODUCT_IDS[FileEntity](file)
+                    )
+                await self.db.commit()
+            except Exception as exc:
+                await self.db.rollback()
+                logger.error(f"GenerateFileVariantsCase: ошибка сохранения файла {file.id}: {exc}")
+                is_saved = False
+            if not is_saved:
+                # Файл заменили во время обработки - копии старого файла не нужны
+                await FileService.remove_variants(variants, file.is_remote)
+            elif variants:
+                generated += 1
+
+        if files:
+            logger.info(f"GenerateFileVariantsCase: созданы копии для {generated} из {len(files)} файлов")
+        return generated
+
+    async def validate(self, *args: Any, **kwargs: Any):
+        pass
+
+    async def transform(self, file: FileEntity) -> dict:
+        """Создаёт копии изображения; для остальных файлов и при ошибке возвращает {}."""
+        if not self.repository.is_variant_source(file):
+            return {}
+        try:
+            if not await asyncio.to_thread(get_storage(file.is_remote).exists, file.file_path):
+                return {}
+            return await self.image_variant_service.generate(file)
+        except Exception as exc:
+            logger.warning(f"GenerateFileVariantsCase: не удалось обработать файл {file.id}: {exc}")
+            return {}
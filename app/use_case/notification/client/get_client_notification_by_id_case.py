@@ -1,17 +1,19 @@
-from sqlalchemy import or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.dto.notification.notification_dto import (
     NotificationWithRelationsRDTO,
 )
 from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
+from app.adapters.filters.notification.client_notification_conditions import visible_to_user_condition
 from app.adapters.repository.notification.notification_repository import (
     NotificationRepository,
 )
 from app.adapters.repository.read_notification.read_notification_repository import ReadNotificationRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import NotificationEntity, ReadNotificationEntity
+from app.entities import NotificationEntity
 from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.redis_service import RedisService
 from app.use_case.base_case import BaseUseCase
 
 
@@ -19,13 +21,10 @@ class GetClientNotificationByIdCase(BaseUseCase[NotificationWithRelationsRDTO]):
     """
     Use Case для получения уведомления клиента по ID с автоматической отметкой о прочтении.
 
-    ⚠️ ВАЖНОЕ ЗАМЕЧАНИЕ: Параметр id передаётся, но НЕ используется для поиска уведомления!
-    Вместо этого ищется ПЕРВОЕ уведомление, доступное пользователю.
-
     Логика работы:
-    1. Ищет ПЕРВОЕ уведомление, доступное пользователю (личное или общее через топики)
-    2. При успешном получении автоматически создаёт запись о прочтении (side-effect)
-    3. Запись о прочтении создаётся только если её ещё нет
+    1. Ищет уведомление по ID среди доступных пользователю (личное или общее через топики)
+    2. Отмечает его прочитанным одним INSERT ... ON CONFLICT DO NOTHING (side-effect)
+    3. Запись не создаётся, если уведомление уже прочитано или покрыто отметкой "прочитать все"
 
     Типы уведомлений:
     - Личные: user_id == текущий пользователь
@@ -33,8 +32,10 @@ class GetClientNotificationByIdCase(BaseUseCase[NotificationWithRelationsRDTO]):
     """
 
     def __init__(self, db: AsyncSession) -> None:
+        self.db = db
         self.repository = NotificationRepository(db)
         self.read_notification_repository = ReadNotificationRepository(db)
+        self.redis_service = RedisService()
         self.model: NotificationEntity | None = None
 
     async def execute(self, id: int, user: UserWithRelationsRDTO) -> NotificationWithRelationsRDTO:
@@ -42,7 +43,7 @@ class GetClientNotificationByIdCase(BaseUseCase[NotificationWithRelationsRDTO]):
         Главный метод выполнения use case.
 
         Args:
-            id: ID уведомления (используется только для создания записи о прочтении!)
+            id: ID уведомления
             user: Текущий пользователь
 
         Returns:
@@ -52,69 +53,48 @@ class GetClientNotificationByIdCase(BaseUseCase[NotificationWithRelationsRDTO]):
             AppExceptionResponse: Если уведомление не найдено
         """
         await self.validate(id=id, user=user)
-        return NotificationWithRelationsRDTO.from_orm(self.model)
+        return await self.transform(user=user)
 
     async def validate(self, id: int, user: UserWithRelationsRDTO) -> None:
         """
-        Валидация, получение уведомления и автоматическая отметка о прочтении.
-
-        ⚠️ КРИТИЧЕСКОЕ ЗАМЕЧАНИЕ: Параметр id НЕ используется для поиска!
-
-        Логика поиска:
-        - Ищет ПЕРВОЕ уведомление по условию OR:
-          1. Личное уведомление: user_id == текущий пользователь
-          2. Общее через топики: user_id IS NULL AND topics IS NOT NULL
-
-        Side-effect:
-        - Автоматически создаёт запись ReadNotification при первом чтении
-        - Запись связывает user_id с notification_id
+        Валидация и получение уведомления.
 
         Args:
-            id: ID уведомления (используется ТОЛЬКО для создания ReadNotification!)
+            id: ID уведомления
             user: Текущий пользователь
 
         Raises:
             AppExceptionResponse: Если уведомление не найдено
         """
-        # ВНИМАНИЕ: id НЕ используется в фильтре! Ищется ПЕРВОЕ доступное уведомление
         self.model = await self.repository.get_first_with_filters(
             filters=[
                 self.repository.model.id == id,
-                or_(
-                    self.repository.model.user_id == user.id,
-                    and_(
-                        self.repository.model.user_id.is_(None),
-                        self.repository.model.topics.isnot(None),
-                    )
-                )
+                visible_to_user_condition(user.id),
             ],
             include_deleted_filter=True,
-            options=self.repository.default_relationships(),
+            options=self.repository.client_relationships(user.id),
         )
 
         if not self.model:
             raise AppExceptionResponse.bad_request(message=i18n.gettext("not_found"))
 
-        # Автоматическая отметка о прочтении (side-effect)
-        # Проверяем, читал ли пользователь это уведомление ранее
-        notification_read = await self.read_notification_repository.get_first_with_filters(
-            filters=[
-                self.read_notification_repository.model.user_id == user.id,
-                self.read_notification_repository.model.notification_id == id,
-            ]
-        )
+    async def transform(self, user: UserWithRelationsRDTO) -> NotificationWithRelationsRDTO:
+        """
+        Отмечает уведомление прочитанным и формирует ответ.
 
-        # Если не читал - создаём запись о прочтении
-        if not notification_read:
-            await self.read_notification_repository.create(
-                ReadNotificationEntity(
-                    user_id=user.id,
-                    notification_id=id
-                )
-            )
+        Args:
+            user: Текущий пользователь
 
-    async def transform(self) -> None:
-        """
-        Метод transform() требуется паттерном BaseUseCase, но не используется.
+        Returns:
+            NotificationWithRelationsRDTO: Уведомление с is_read=True
         """
-        pass
+        result = NotificationWithRelationsRDTO.from_orm(self.model)
+        if not self.model.is_read:
+            async with UnitOfWork(self.db):
+                is_marked = await self.read_notification_repository.mark_read(
+                    user_id=user.id, notification_id=self.model.id
+                )
+            if is_marked:
+                self.redis_service.delete_notification_unread_counts([user.id])
+        result.is_read = True
+        return result
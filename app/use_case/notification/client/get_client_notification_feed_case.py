@@ -0,0 +1,65 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.notification.notification_dto import (
+    NotificationFeedRDTO,
+    NotificationWithRelationsRDTO,
+)
+from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
+from app.adapters.filters.notification.notification_feed_filter import NotificationFeedFilter
+from app.adapters.repository.notification.notification_repository import (
+    NotificationRepository,
+)
+from app.adapters.repository.topic_notification.topic_notification_repository import (
+    TopicNotificationRepository,
+)
+from app.use_case.base_case import BaseUseCase
+
+
+class GetClientNotificationFeedCase(BaseUseCase[NotificationFeedRDTO]):
+    """
+    Use Case для получения ленты уведомлений клиента с курсорной пагинацией.
+
+    В отличие от PaginateClientNotificationCase (OR-фильтр по всей таблице,
+    OFFSET и COUNT) лента читает личный инбокс пользователя и ленты топиков,
+    на которые он подписан, каждую по своему индексу от курсора, и сливает их
+    по id. Страница читает не больше per_page строк из каждой ленты.
+
+    Использование курсора:
+    - первая страница: без cursor
+    - следующая страница: cursor = next_cursor из предыдущего ответа
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.repository = NotificationRepository(db)
+        self.topic_repository = TopicNotificationRepository(db)
+
+    async def execute(
+        self, filter: NotificationFeedFilter, user: UserWithRelationsRDTO
+    ) -> NotificationFeedRDTO:
+        """
+        Главный метод выполнения use case.
+
+        Args:
+            filter: Курсор, размер страницы и топики
+            user: Текущий пользователь
+
+        Returns:
+            NotificationFeedRDTO: Уведомления страницы и курсор следующей
+        """
+        topic_ids = await self.topic_repository.get_subscribed_ids(filter.topic_ids)
+        # Лишняя запись показывает, есть ли следующая страница
+        models = await self.repository.get_feed(
+            user_id=user.id,
+            topic_ids=topic_ids,
+            cursor_filters=filter.apply(),
+            limit=filter.per_page + 1,
+        )
+        return await self.transform(models=models, per_page=filter.per_page)
+
+    async def validate(self) -> None:
+        pass
+
+    async def transform(self, models: list, per_page: int) -> NotificationFeedRDTO:
+        items = [NotificationWithRelationsRDTO.from_orm(model) for model in models[:per_page]]
+        next_cursor = items[-1].id if len(models) > per_page else None
+        return NotificationFeedRDTO(items=items, next_cursor=next_cursor)
@@ -0,0 +1,60 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.notification.notification_dto import NotificationUnreadCountRDTO
+from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
+from app.adapters.repository.notification.notification_repository import (
+    NotificationRepository,
+)
+from app.core.app_exception_response import AppExceptionResponse
+from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.redis_service import RedisService
+from app.use_case.base_case import BaseUseCase
+
+
+class GetClientUnreadNotificationCountCase(BaseUseCase[NotificationUnreadCountRDTO]):
+    """
+    Use Case для получения количества непрочитанных уведомлений клиента.
+
+    Счётчик читается из Redis (notification_unread_count_{user_id}_{версия рассылок}).
+    При промахе считается SQL-запросом только по уведомлениям выше отметки
+    прочтения пользователя и кешируется. Ключ сбрасывается после прочтения,
+    "прочитать все" и нового личного уведомления; новая общая рассылка
+    увеличивает версию и тем самым сбрасывает счётчики всех пользователей.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.repository = NotificationRepository(db)
+        self.redis_service = RedisService()
+
+    async def execute(self, user: UserWithRelationsRDTO) -> NotificationUnreadCountRDTO:
+        """
+        Главный метод выполнения use case.
+
+        Args:
+            user: Текущий пользователь
+
+        Returns:
+            NotificationUnreadCountRDTO: Количество непрочитанных уведомлений
+        """
+        await self.validate(user=user)
+        count = self.redis_service.get_notification_unread_count(user.id)
+        if count is None:
+            # Версия читается до подсчёта: рассылка, созданная во время подсчёта, сменит ключ
+            broadcast_version = self.redis_service.get_notification_broadcast_version()
+            count = await self.repository.count_unread(user.id)
+            self.redis_service.set_notification_unread_count(user.id, count, broadcast_version)
+        return await self.transform(count=count)
+
+    async def validate(self, user: UserWithRelationsRDTO) -> None:
+        """
+        Проверяет, что запрос выполняет авторизованный пользователь.
+
+        Raises:
+            AppExceptionResponse: Если пользователь не определён
+        """
+        if user.id is None:
+            raise AppExceptionResponse.bad_request(message=i18n.gettext("user_not_found"))
+
+    async def transform(self, count: int) -> NotificationUnreadCountRDTO:
+        """Формирует ответ со счётчиком непрочитанных уведомлений."""
+        return NotificationUnreadCountRDTO(unread_count=count)
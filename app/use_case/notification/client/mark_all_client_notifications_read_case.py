@@ -0,0 +1,67 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.notification.notification_dto import NotificationUnreadCountRDTO
+from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
+from app.adapters.repository.notification.notification_repository import (
+    NotificationRepository,
+)
+from app.adapters.repository.notification_read_state.notification_read_state_repository import (
+    NotificationReadStateRepository,
+)
+from app.adapters.repository.read_notification.read_notification_repository import ReadNotificationRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
+from app.core.app_exception_response import AppExceptionResponse
+from app.i18n.i18n_wrapper import i18n
+from app.infrastructure.service.redis_service import RedisService
+from app.use_case.base_case import BaseUseCase
+
+
+class MarkAllClientNotificationsReadCase(BaseUseCase[NotificationUnreadCountRDTO]):
+    """
+    Use Case для отметки всех уведомлений клиента прочитанными.
+
+    Вместо вставки записи на каждое уведомление поднимает отметку прочтения
+    пользователя до ID последнего доступного ему уведомления и удаляет
+    ставшие лишними записи read_notifications. Стоимость не зависит от
+    количества уведомлений и пользователей.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.repository = NotificationRepository(db)
+        self.read_state_repository = NotificationReadStateRepository(db)
+        self.read_notification_repository = ReadNotificationRepository(db)
+        self.redis_service = RedisService()
+
+    async def execute(self, user: UserWithRelationsRDTO) -> NotificationUnreadCountRDTO:
+        """
+        Главный метод выполнения use case.
+
+        Args:
+            user: Текущий пользователь
+
+        Returns:
+            NotificationUnreadCountRDTO: Количество непрочитанных уведомлений (0)
+        """
+        await self.validate(user=user)
+        last_id = await self.repository.get_last_visible_id(user.id)
+        if last_id is not None:
+            async with UnitOfWork(self.db):
+                read_until_id = await self.read_state_repository.advance(user.id, last_id)
+                await self.read_notification_repository.delete_until(user.id, read_until_id)
+            self.redis_service.delete_notification_unread_counts([user.id])
+        return await self.transform()
+
+    async def validate(self, user: UserWithRelationsRDTO) -> None:
+        """
+        Проверяет, что запрос выполняет авторизованный пользователь.
+
+        Raises:
+            AppExceptionResponse: Если пользователь не определён
+        """
+        if user.id is None:
+            raise AppExceptionResponse.bad_request(message=i18n.gettext("user_not_found"))
+
+    async def transform(self) -> NotificationUnreadCountRDTO:
+        """После отметки всех уведомлений непрочитанных не остаётся."""
+        return NotificationUnreadCountRDTO(unread_count=0)
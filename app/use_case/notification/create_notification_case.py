@@ -34,7 +34,7 @@ class CreateNotificationCase(BaseUseCase[NotificationWithRelationsRDTO]):
         await self.validate(dto)
         model = await self.repository.create(self.model)
         model = await self.repository.get(
-            model.id, options=self.repository.default_relationships()
+            model.id, options=self.repository.relationships_for(NotificationWithRelationsRDTO)
         )
         return NotificationWithRelationsRDTO.from_orm(model)
 
@@ -29,7 +29,7 @@ class GetNotificationByIdCase(BaseUseCase[NotificationWithRelationsRDTO]):
         self.model = await self.repository.get(
             id,
             include_deleted_filter=True,
-            options=self.repository.default_relationships(),
+            options=self.repository.relationships_for(NotificationWithRelationsRDTO),
         )
         if not self.model:
             raise AppExceptionResponse.bad_request(message=i18n.gettext("not_found"))
@@ -34,7 +34,7 @@ class UpdateNotificationCase(BaseUseCase[NotificationWithRelationsRDTO]):
         await self.validate(id=id, dto=dto)
         model = await self.repository.update(obj=self.model, dto=dto)
         model = await self.repository.get(
-            model.id, options=self.repository.default_relationships()
+            model.id, options=self.repository.relationships_for(NotificationWithRelationsRDTO)
         )
         return NotificationWithRelationsRDTO.from_orm(model)
 
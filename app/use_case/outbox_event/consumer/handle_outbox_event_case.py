@@ -0,0 +1,73 @@
+import logging
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.outbox_event.outbox_event_repository import OutboxEventRepository
+from app.shared.event_constants import AppEventConstants
+from app.use_case.base_case import BaseUseCase
+from app.use_case.cart.consumer.refresh_cart_case import RefreshCartCase
+from app.use_case.product_order_item.consumer.apply_product_order_item_event_case import (
+    ApplyProductOrderItemEventCase,
+)
+
+logger = logging.getLogger("scheduler")
+
+
+class HandleOutboxEventCase(BaseUseCase[bool]):
+    """
+    Use Case обработки сообщения шины событий.
+
+    1. Блокирует событие в outbox_events (FOR UPDATE); уже обработанное
+       событие (повторная доставка) пропускается
+    2. Выполняет производную работу обработчика по типу события
+    3. Отмечает processed_at и фиксирует всё одной транзакцией -
+       повторная доставка не повторяет результат
+
+    При ошибке транзакция откатывается, текст ошибки сохраняется в событии,
+    а диспетчер публикует его повторно через outbox_retry_seconds.
+
+    Attributes:
+        repository: Репозиторий outbox
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.repository = OutboxEventRepository(db)
+        self.handlers = {
+            AppEventConstants.ProductOrderItemCreated: ApplyProductOrderItemEventCase,
+            AppEventConstants.ProductOrderItemUpdated: ApplyProductOrderItemEventCase,
+            AppEventConstants.ProductOrderItemDeleted: ApplyProductOrderItemEventCase,
+            AppEventConstants.CartItemChanged: RefreshCartCase,
+        }
+
+    async def execute(self, message: dict[str, Any]) -> bool:
+        """
+        Args:
+            message: Сообщение шины {"id", "event_type", "aggregate_id"}
+
+        Returns:
+            bool: True, если событие обработано этим вызовом
+        """
+        try:
+            event = await self.repository.lock_unprocessed(message["id"])
+            if event is None:
+                await self.db.rollback()
+                return False
+            await self.validate(event_type=event.event_type)
+            await self.handlers[event.event_type](self.db).execute(event)
+            event.processed_at = datetime.now()
+            event.last_error = None
+            await self.db.commit()
+            return True
+        except Exception as exc:
+            await self.db.rollback()
+            logger.error(f"Ошибка обработки события outbox {message.get('id')}: {exc}")
+            await self.repository.mark_failed(message["id"], str(exc))
+            await self.db.commit()
+            return False
+
+    async def validate(self, event_type: str) -> None:
+        if event_type not in self.handlers:
+            raise ValueError(f"Нет обработчика для события {event_type}")
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.outbox_event.outbox_event_repository import OutboxEventRepository
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.event_bus_service.base_event_bus import BaseEventBus
+from app.use_case.base_case import BaseUseCase
+
+
+class DispatchOutboxEventsCase(BaseUseCase[int]):
+    """
+    Use Case публикации событий outbox в шину.
+
+    За один проход:
+    1. Отмечает до outbox_dispatch_batch_size необработанных событий
+       опубликованными (новые и не обработанные за outbox_retry_seconds)
+    2. Фиксирует отметку и публикует ссылки на события в шину
+
+    Если процесс упадёт между commit и публикацией, события будут
+    опубликованы повторно после outbox_retry_seconds. События с
+    outbox_max_attempts попытками остаются в таблице с last_error.
+
+    Attributes:
+        repository: Репозиторий outbox
+        event_bus: Шина событий
+    """
+
+    def __init__(self, db: AsyncSession, event_bus: BaseEventBus) -> None:
+        self.db = db
+        self.repository = OutboxEventRepository(db)
+        self.event_bus = event_bus
+
+    async def execute(self) -> int:
+        """
+        Returns:
+            int: Количество опубликованных событий
+        """
+        await self.validate()
+        events = await self.repository.claim_for_dispatch(
+            limit=app_config.outbox_dispatch_batch_size,
+            retry_before=datetime.now() - timedelta(seconds=app_config.outbox_retry_seconds),
+            max_attempts=app_config.outbox_max_attempts,
+        )
+        await self.db.commit()
+        if events:
+            await self.event_bus.publish(await self.transform(events))
+        return len(events)
+
+    async def validate(self) -> None:
+        """Проверка настроек прохода: без шины или с пустым пакетом события не будут опубликованы."""
+        if self.event_bus is None:
+            raise RuntimeError("DispatchOutboxEventsCase: шина событий не настроена")
+        if app_config.outbox_dispatch_batch_size <= 0:
+            raise RuntimeError("DispatchOutboxEventsCase: outbox_dispatch_batch_size должен быть больше нуля")
+
+    async def transform(self, events: list[Any]) -> list[dict[str, Any]]:
+        return [
+            {"id": event.id, "event_type": event.event_type, "aggregate_id": event.aggregate_id}
+            for event in events
+        ]
@@ -0,0 +1,41 @@
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.outbox_event.outbox_event_repository import OutboxEventRepository
+from app.infrastructure.app_config import app_config
+from app.use_case.base_case import BaseUseCase
+
+
+class PurgeOutboxEventsCase(BaseUseCase[int]):
+    """
+    Use Case очистки outbox: удаляет события, обработанные раньше
+    outbox_retention_days дней назад, пачками с commit после каждой.
+
+    Attributes:
+        repository: Репозиторий outbox
+    """
+
+    BATCH_SIZE = 1000
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.repository = OutboxEventRepository(db)
+
+    async def execute(self) -> int:
+        """
+        Returns:
+            int: Количество удалённых событий
+        """
+        before = datetime.now() - timedelta(days=app_config.outbox_retention_days)
+        purged = 0
+        while True:
+            deleted = await self.repository.purge_processed(before=before, limit=self.BATCH_SIZE)
+            await self.db.commit()
+            purged += deleted
+            if deleted < self.BATCH_SIZE:
+                return purged
+
+    async def validate(self, *args: Any, **kwargs: Any):
+        pass
@@ -0,0 +1,381 @@
+import datetime
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.alatau.alatau_status_response_dto import AlatauPaymentStatusResponseDTO
+from app.adapters.repository.booking_field_party_and_payment_transaction.booking_field_party_and_payment_transaction_repository import \
+    BookingFieldPartyAndPaymentTransactionRepository
+from app.adapters.repository.booking_field_party_request.booking_field_party_request_repository import \
+    BookingFieldPartyRequestRepository
+from app.adapters.repository.outbox_event.outbox_event_repository import OutboxEventRepository
+from app.adapters.repository.payment_transaction.payment_transaction_repository import PaymentTransactionRepository
+from app.adapters.repository.product_order.product_order_repository import ProductOrderRepository
+from app.adapters.repository.product_order_and_payment_transaction.product_order_and_payment_transaction_repository import \
+    ProductOrderAndPaymentTransactionRepository
+from app.adapters.repository.product_order_item.product_order_item_repository import ProductOrderItemRepository
+from app.adapters.repository.product_stock_reservation.product_stock_reservation_repository import \
+    ProductStockReservationRepository
+from app.adapters.repository.ticketon_order.ticketon_order_repository import TicketonOrderRepository
+from app.adapters.repository.ticketon_order_and_payment_transaction.ticketon_order_and_payment_transaction_repository import \
+    TicketonOrderAndPaymentTransactionRepository
+from app.entities import PaymentTransactionEntity
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.alatau_service.alatau_service_api import AlatauServiceAPI
+from app.shared.db_value_constants import DbValueConstants
+from app.shared.event_constants import AppEventConstants
+from app.use_case.base_case import BaseUseCase
+from app.use_case.ticketon_order.client.ticketon_confirm_sale import TicketonConfirmCase
+
+logger = logging.getLogger("scheduler")
+
+
+class ReconcilePaymentTransactionCase(BaseUseCase[int]):
+    """
+    Use Case для сверки ожидающих оплаты транзакций со статусами Alatau.
+
+    Исправляет последствия потерянных back-reference вызовов:
+    1. Выбирает пакет транзакций в статусе "Ожидание оплаты" (заказы товаров, бронирования, Ticketon)
+    2. Запрашивает статусы в Alatau с ограниченной параллельностью через общий HTTP-клиент
+    3. Применяет оплаченные результаты пакетными UPDATE в одной транзакции БД
+       с теми же последствиями, что и callback оплаты: статусы элементов заказа,
+       события outbox (история элементов, суммы заказа), списание резервов остатков
+    4. Подтверждает в Ticketon оплаченные продажи (TicketonConfirmCase.confirm_sale)
+
+    Транзакция считается оплаченной, только если связанный заказ или заявка
+    перешли в оплаченный статус (или уже оплачены этой транзакцией). Если
+    заказ успел истечь или отмениться, списанные деньги некуда зачесть:
+    транзакция переводится в "Ожидает возврата" и попадает в лог.
+
+    Заказы Ticketon переводятся в "Оплачен, ожидает подтверждения" и остаются
+    активными до успешного sale_confirm; неподтверждённые продажи повторяются
+    при следующей сверке.
+
+    Attributes:
+        payment_transaction_repository: Репозиторий платежных транзакций
+        alatau_service_api: Клиент API Alatau
+        ticketon_confirm_case: Подтверждение продаж Ticketon
+    """
+
+    # Статус операции Alatau, означающий успешное списание
+    PAID_OPERATION_STATUS = "S"
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.payment_transaction_repository = PaymentTransactionRepository(db)
+        self.product_order_repository = ProductOrderRepository(db)
+        self.product_order_item_repository = ProductOrderItemRepository(db)
+        self.product_order_and_payment_transaction_repository = ProductOrderAndPaymentTransactionRepository(db)
+        self.stock_reservation_repository = ProductStockReservationRepository(db)
+        self.outbox_event_repository = OutboxEventRepository(db)
+        self.booking_field_party_request_repository = BookingFieldPartyRequestRepository(db)
+        self.booking_field_party_and_payment_transaction_repository = BookingFieldPartyAndPaymentTransactionRepository(db)
+        self.ticketon_order_repository = TicketonOrderRepository(db)
+        self.ticketon_order_and_payment_transaction_repository = TicketonOrderAndPaymentTransactionRepository(db)
+        self.ticketon_confirm_case = TicketonConfirmCase(db)
+        self.alatau_service_api = AlatauServiceAPI()
+        self.now: datetime.datetime | None = None
+
+    async def execute(self) -> int:
+        """
+        Выполняет одну итерацию сверки.
+
+        Returns:
+            int: Количество транзакций, переведенных в статус "Оплачено"
+        """
+        self.now = datetime.datetime.now()
+        settled = await self._reconcile_pending()
+        await self._confirm_ticketon_sales()
+        return settled
+
+    async def validate(self, *args: Any, **kwargs: Any):
+        pass
+
+    async def _reconcile_pending(self) -> int:
+        pending = await self.payment_transaction_repository.get_pending_for_reconciliation(
+            created_since=self.now - datetime.timedelta(hours=app_config.payment_reconciliation_lookback_hours),
+            limit=app_config.payment_reconciliation_batch_size,
+        )
+        if not pending:
+            return 0
+
+        statuses = await self.alatau_service_api.get_payment_statuses(
+            [transaction.order for transaction in pending],
+            concurrency=app_config.payment_reconciliation_concurrency,
+        )
+        paid = [
+            (transaction, statuses.get(transaction.order))
+            for transaction in pending
+            if self._is_paid(statuses.get(transaction.order))
+        ]
+        if not paid:
+            return 0
+
+        try:
+            settled = await self._apply_paid(paid)
+            await self.db.commit()
+        except Exception:
+            await self.db.rollback()
+            raise
+        logger.info(f"ReconcilePaymentTransactionCase: подтверждено оплат {settled} из {len(pending)}")
+        return settled
+
+    def _is_paid(self, status: AlatauPaymentStatusResponseDTO | None) -> bool:
+        return (
+            status is not None
+            and status.code == 0
+            and status.operation is not None
+            and status.operation.status == self.PAID_OPERATION_STATUS
+        )
+
+    async def _apply_paid(
+        self, paid: list[tuple[PaymentTransactionEntity, AlatauPaymentStatusResponseDTO]]
+    ) -> int:
+        """
+        Пакетно применяет оплаченные статусы к заказам и транзакциям.
+
+        Returns:
+            int: Количество транзакций, зачтенных в оплату заказов
+        """
+        transactions_by_type: dict[str, dict[int, PaymentTransactionEntity]] = {}
+        for transaction, _ in paid:
+            transactions_by_type.setdefault(transaction.transaction_type, {})[transaction.id] = transaction
+
+        settled_ids = {
+            *await self._apply_product_orders(transactions_by_type.get(DbValueConstants.PaymentMerchType, {})),
+            *await self._apply_booking_requests(transactions_by_type.get(DbValueConstants.PaymentBookingFieldType, {})),
+            *await self._apply_ticketon_orders(transactions_by_type.get(DbValueConstants.PaymentTicketonType, {})),
+        }
+
+        refund_orders = [transaction.order for transaction, _ in paid if transaction.id not in settled_ids]
+        if refund_orders:
+            logger.warning(
+                "ReconcilePaymentTransactionCase: оплата без ожидающего заказа, "
+                f"транзакции переведены в ожидание возврата: {', '.join(refund_orders)}"
+            )
+
+        await self.payment_transaction_repository.bulk_update(
+            [
+                {
+                    "id": transaction.id,
+                    "status_id": (
+                        DbValueConstants.PaymentTransactionStatusPaidID
+                        if transaction.id in settled_ids
+                        else DbValueConstants.PaymentTransactionStatusAwaitingRefundID
+                    ),
+                    "is_paid": True,
+                    "is_active": False,
+                    "res_code": "0",
+                    "res_desc": status.operation.status_desc or status.description,
+                    "mpi_order": status.operation.mpi_order or transaction.mpi_order,
+                }
+                for transaction, status in paid
+            ],
+            commit=False,
+        )
+        return len(settled_ids)
+
+    async def _apply_product_orders(self, transactions: dict[int, PaymentTransactionEntity]) -> set[int]:
+        """
+        Переводит ожидающие оплаты заказы в "Оплачен" так же, как AcceptPaymentProductOrderCase.
+
+        Returns:
+            set[int]: ID транзакций, чьи заказы оплачены (сейчас или ранее этой транзакцией)
+        """
+        if not transactions:
+            return set()
+        links = await self.product_order_and_payment_transaction_repository.get_with_filters(
+            filters=[
+                self.product_order_and_payment_transaction_repository.model.payment_transaction_id.in_(list(transactions))
+            ]
+        )
+        transaction_by_order = {link.product_order_id: transactions[link.payment_transaction_id] for link in links}
+        # Блокировка заказов до commit сверки: параллельная отмена не вернёт их остатки
+        orders = await self.product_order_repository.get_for_update(
+            filters=[self.product_order_repository.model.id.in_(list(transaction_by_order))],
+        )
+        order_ids = [
+            order.id for order in orders
+            if order.status_id == DbValueConstants.ProductOrderStatusCreatedAwaitingPaymentID
+        ]
+        settled_ids = {transaction_by_order[order_id].id for order_id in order_ids} | {
+            order.payment_transaction_id
+            for order in orders
+            if order.status_id == DbValueConstants.ProductOrderStatusPaidID
+            and order.payment_transaction_id == transaction_by_order[order.id].id
+        }
+        if not order_ids:
+            return settled_ids
+
+        await self.product_order_repository.bulk_update(
+            [
+                {
+                    "id": order_id,
+                    "status_id": DbValueConstants.ProductOrderStatusPaidID,
+                    "payment_transaction_id": transaction_by_order[order_id].id,
+                    "paid_order": transaction_by_order[order_id].order,
+                    "is_paid": True,
+                    "paid_at": self.now,
+                }
+                for order_id in order_ids
+            ],
+            commit=False,
+        )
+
+        # Пакетный UPDATE обходит ProductOrderEventHandler и ProductOrderItemEventHandler,
+        # поэтому статусы элементов и событие outbox (история, суммы заказа) пишутся явно
+        items = await self.product_order_item_repository.get_with_filters(
+            filters=[self.product_order_item_repository.model.order_id.in_(order_ids)],
+        )
+        await self.product_order_item_repository.update_with_filters(
+            filters=[
+                self.product_order_item_repository.model.order_id.in_(order_ids),
+                self.product_order_item_repository.model.deleted_at.is_(None),
+            ],
+            values={
+                "status_id": DbValueConstants.ProductOrderItemStatusPaidAwaitingConfirmationID,
+                "is_paid": True,
+            },
+            commit=False,
+        )
+        events: dict[int, dict[str, Any]] = {}
+        for item in items:
+            if item.status_id == DbValueConstants.ProductOrderItemStatusPaidAwaitingConfirmationID:
+                continue
+            event = events.setdefault(
+                item.order_id,
+                {
+                    "event_type": AppEventConstants.ProductOrderItemUpdated,
+                    "aggregate_id": item.order_id,
+                    "payload": {"order_id": item.order_id, "items": []},
+                },
+            )
+            event["payload"]["items"].append(
+                {
+                    "id": item.id,
+                    "old_status_id": item.status_id,
+                    "status_id": DbValueConstants.ProductOrderItemStatusPaidAwaitingConfirmationID,
+                    "cancel_reason": None,
+                }
+            )
+        await self.outbox_event_repository.add_many(list(events.values()))
+        await self.stock_reservation_repository.commit_for_orders(order_ids, commit=False)
+        return settled_ids
+
+    async def _apply_booking_requests(self, transactions: dict[int, PaymentTransactionEntity]) -> set[int]:
+        """
+        Переводит ожидающие оплаты заявки на бронирование в "Оплачено".
+
+        Returns:
+            set[int]: ID транзакций, чьи заявки оплачены (сейчас или ранее этой транзакцией)
+        """
+        if not transactions:
+            return set()
+        links = await self.booking_field_party_and_payment_transaction_repository.get_with_filters(
+            filters=[
+                self.booking_field_party_and_payment_transaction_repository.model.payment_transaction_id.in_(list(transactions))
+            ]
+        )
+        transaction_by_request = {link.request_id: transactions[link.payment_transaction_id] for link in links}
+        requests = await self.booking_field_party_request_repository.get_with_filters(
+            filters=[self.booking_field_party_request_repository.model.id.in_(list(transaction_by_request))],
+            include_deleted_filter=True,
+        )
+        awaiting = [
+            request for request in requests
+            if request.status_id == DbValueConstants.BookingFieldPartyStatusCreatedAwaitingPaymentID
+        ]
+        await self.booking_field_party_request_repository.bulk_update(
+            [
+                {
+                    "id": request.id,
+                    "status_id": DbValueConstants.BookingFieldPartyStatusPaidID,
+                    "payment_transaction_id": transaction_by_request[request.id].id,
+                    "paid_order": transaction_by_request[request.id].order,
+                    "is_paid": True,
+                    "paid_at": self.now,
+                }
+                for request in awaiting
+            ],
+            commit=False,
+        )
+        return {transaction_by_request[request.id].id for request in awaiting} | {
+            request.payment_transaction_id
+            for request in requests
+            if request.status_id == DbValueConstants.BookingFieldPartyStatusPaidID
+            and request.payment_transaction_id == transaction_by_request[request.id].id
+        }
+
+    async def _apply_ticketon_orders(self, transactions: dict[int, PaymentTransactionEntity]) -> set[int]:
+        """
+        Переводит ожидающие оплаты заказы Ticketon в "Оплачен, ожидает подтверждения".
+
+        Заказ остается активным: продажу подтверждает _confirm_ticketon_sales.
+
+        Returns:
+            set[int]: ID транзакций, чьи заказы оплачены (сейчас или ранее этой транзакцией)
+        """
+        if not transactions:
+            return set()
+        links = await self.ticketon_order_and_payment_transaction_repository.get_with_filters(
+            filters=[
+                self.ticketon_order_and_payment_transaction_repository.model.payment_transaction_id.in_(list(transactions))
+            ]
+        )
+        transaction_by_order = {link.ticketon_order_id: transactions[link.payment_transaction_id] for link in links}
+        orders = await self.ticketon_order_repository.get_with_filters(
+            filters=[self.ticketon_order_repository.model.id.in_(list(transaction_by_order))],
+            include_deleted_filter=True,
+        )
+        awaiting = [
+            order for order in orders
+            if order.status_id == DbValueConstants.TicketonOrderStatusBookingCreatedID
+            and order.is_active
+            and not order.is_canceled
+        ]
+        await self.ticketon_order_repository.bulk_update(
+            [
+                {
+                    "id": order.id,
+                    "status_id": DbValueConstants.TicketonOrderStatusPaidAwaitingConfirmationID,
+                    "payment_transaction_id": transaction_by_order[order.id].id,
+                    "is_paid": True,
+                    "is_active": True,
+                }
+                for order in awaiting
+            ],
+            commit=False,
+        )
+        return {transaction_by_order[order.id].id for order in awaiting} | {
+            order.payment_transaction_id
+            for order in orders
+            if order.status_id in (
+                DbValueConstants.TicketonOrderStatusPaidConfirmedID,
+                DbValueConstants.TicketonOrderStatusPaidAwaitingConfirmationID,
+            )
+            and order.payment_transaction_id == transaction_by_order[order.id].id
+        }
+
+    async def _confirm_ticketon_sales(self) -> None:
+        """
+        Подтверждает в Ticketon продажи, оплата которых зачтена сверкой.
+
+        Каждая продажа сохраняется отдельным commit; при ошибке Ticketon
+        заказ остается активным и повторяется следующей сверкой.
+        """
+        orders = await self.ticketon_order_repository.get_awaiting_sale_confirmation(
+            limit=app_config.payment_reconciliation_batch_size
+        )
+        confirmed = 0
+        # После rollback объекты пакета истекают, поэтому заказ перечитывается по ID
+        for order_id in [order.id for order in orders]:
+            try:
+                order = await self.ticketon_order_repository.get(order_id)
+                await self.ticketon_confirm_case.confirm_sale(order, order.payment_transaction_id)
+                confirmed += 1
+            except Exception as exc:
+                await self.db.rollback()
+                logger.error(f"ReconcilePaymentTransactionCase: продажа Ticketon {order_id} не подтверждена: {exc}")
+        if orders:
+            logger.info(f"ReconcilePaymentTransactionCase: подтверждено продаж Ticketon {confirmed} из {len(orders)}")
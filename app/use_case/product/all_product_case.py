@@ -43,14 +43,14 @@ class AllProductCase(BaseUseCase[list[ProductWithRelationsRDTO]]):
         Returns:
             list[ProductWithRelationsRDTO]: Список объектов товаров с отношениями.
         """
-        models = await self.repository.get_with_filters(
+        return await self.repository.get_projected(
+            dto=ProductWithRelationsRDTO,
             filters=filter.apply(),
-            options=self.repository.default_relationships(),
             order_by=filter.order_by,
             order_direction=filter.order_direction,
             include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
         )
-        return [ProductWithRelationsRDTO.from_orm(model) for model in models]
 
     async def validate(self) -> None:
         """
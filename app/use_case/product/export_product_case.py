@@ -0,0 +1,59 @@
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.product.product_dto import ProductWithRelationsRDTO
+from app.adapters.filters.product.product_filter import ProductFilter
+from app.adapters.repository.product.product_repository import ProductRepository
+from app.infrastructure.app_config import app_config
+from app.use_case.base_case import BaseUseCase
+
+
+class ExportProductCase(BaseUseCase[AsyncIterator[ProductWithRelationsRDTO]]):
+    """
+    Класс Use Case для потоковой выгрузки товаров.
+
+    В отличие от AllProductCase, не загружает таблицу в память целиком:
+    строки читаются серверным курсором пачками app_export_batch_size
+    и отдаются по одной.
+
+    Атрибуты:
+        repository (ProductRepository): Репозиторий для работы с товарами.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Инициализация Use Case.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия базы данных.
+        """
+        self.repository = ProductRepository(db)
+
+    async def execute(self, filter: ProductFilter) -> AsyncIterator[ProductWithRelationsRDTO]:
+        """
+        Выполняет потоковую выгрузку товаров.
+
+        Args:
+            filter (ProductFilter): Фильтр для поиска и сортировки.
+
+        Yields:
+            ProductWithRelationsRDTO: Товар с отношениями.
+        """
+        models = self.repository.stream_with_filters(
+            filters=filter.apply(),
+            options=self.repository.default_relationships(),
+            order_by=filter.order_by,
+            order_direction=filter.order_direction,
+            include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
+            batch_size=app_config.app_export_batch_size,
+        )
+        async for model in models:
+            yield ProductWithRelationsRDTO.from_orm(model)
+
+    async def validate(self) -> None:
+        """
+        Валидация перед выполнением (пока не используется).
+        """
+        pass
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.product.product_dto import ProductWithRelationsRDTO
 from app.adapters.repository.product.product_repository import ProductRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
 from app.entities import ProductEntity
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
@@ -53,6 +54,22 @@ class GetProductByIdCase(BaseUseCase[ProductWithRelationsRDTO]):
         await self.validate(id=id)
         return ProductWithRelationsRDTO.from_orm(self.model)
 
+    async def get_version(self, id: int) -> ResourceVersion | None:
+        """
+        Версия товара для условного GET (ETag / Last-Modified) без сборки DTO.
+
+        Args:
+            id (int): ID товара.
+
+        Returns:
+            ResourceVersion | None: Версия или None, если запись не найдена.
+        """
+        return await self.repository.get_version(
+            filters=[self.repository.model.id == id],
+            relationships=self.repository.version_relationships(),
+            include_deleted_filter=True,
+        )
+
     async def validate(self, id: int) -> None:
         """
         Валидирует существование товара с данным ID.
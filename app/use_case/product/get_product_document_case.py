@@ -0,0 +1,91 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.product_document.product_document_repository import ProductDocumentRepository
+from app.entities import ProductDocumentEntity
+from app.infrastructure.service.redis_service import RedisService
+from app.infrastructure.service.storage_service.file_url_refresher import refresh_file_urls
+from app.use_case.base_case import BaseUseCase
+from app.use_case.product.get_full_product_by_id_case import GetFullProductByIdCase
+
+
+class GetProductDocumentCase(BaseUseCase[str]):
+    """
+    Use Case для получения полной карточки товара из материализованного документа.
+
+    Возвращает готовый JSON FullProductRDTO без ORM-гидратации и валидации Pydantic
+    (подписанные ссылки S3 обновляются при выдаче, см. refresh_file_urls):
+    1. Ключ Redis product_document_{id}
+    2. Актуальный документ из таблицы product_documents (и прогрев Redis)
+    3. Если документа нет или он устарел - синхронная сборка через
+       GetFullProductByIdCase с сохранением документа (обычно документ уже
+       пересобран фоновой задачей rebuild_product_documents)
+
+    Атрибуты:
+        document_repository (ProductDocumentRepository): Репозиторий карточек товаров.
+        redis_service (RedisService): Сервис Redis.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Инициализация Use Case.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия базы данных.
+        """
+        self.db = db
+        self.document_repository = ProductDocumentRepository(db)
+        self.full_product_case = GetFullProductByIdCase(db)
+        self.redis_service = RedisService()
+
+    async def execute(self, id: int) -> str:
+        """
+        Выполняет получение карточки товара.
+
+        Args:
+            id (int): Идентификатор товара.
+
+        Returns:
+            str: JSON FullProductRDTO.
+
+        Raises:
+            AppExceptionResponse: Если товар не найден.
+        """
+        payload = self.redis_service.get_product_document(id)
+        if payload is not None:
+            return refresh_file_urls(payload)
+
+        document = await self.document_repository.get_first_with_filters(
+            filters=[ProductDocumentEntity.product_id == id],
+        )
+        if document and not document.is_stale and document.payload is not None:
+            self.redis_service.set_product_document(id, document.payload)
+            return refresh_file_urls(document.payload)
+
+        return await self.transform(id=id, document=document)
+
+    async def validate(self, id: int) -> None:
+        pass
+
+    async def transform(self, id: int, document: ProductDocumentEntity | None) -> str:
+        """
+        Собирает документ заново и сохраняет его, если за время сборки он не устарел.
+
+        Args:
+            id (int): Идентификатор товара.
+            document (ProductDocumentEntity | None): Текущий документ.
+
+        Returns:
+            str: JSON FullProductRDTO.
+        """
+        version = document.version if document else None
+        # Проверяет существование товара до создания документа
+        payload = (await self.full_product_case.execute(id=id)).model_dump_json()
+        if version is None:
+            version = await self.document_repository.get_or_create_version(id)
+
+        is_saved = await self.document_repository.save_payload(id, version, payload)
+        await self.db.commit()
+        if is_saved:
+            # Кеш заполняет следующее чтение из таблицы, а не сборка
+            self.redis_service.delete_product_documents([id])
+        return payload
@@ -0,0 +1,87 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.product.product_facet_dto import (
+    FacetValueRDTO,
+    ModificationFacetValueRDTO,
+    PriceFacetRDTO,
+    ProductFacetsRDTO,
+)
+from app.adapters.filters.product.product_facet import ProductFacet
+from app.adapters.filters.product.product_filter import ProductFilter
+from app.adapters.repository.product.product_repository import ProductRepository
+from app.use_case.base_case import BaseUseCase
+
+
+class GetProductFacetsCase(BaseUseCase[ProductFacetsRDTO]):
+    """
+    Класс Use Case для получения счётчиков фасетов каталога товаров.
+
+    Все фасеты (категории, города, цена, пол, детские товары, значения модификаций)
+    считаются одним запросом к БД. Счётчик каждого фасета учитывает все выбранные
+    фильтры, кроме собственного, поэтому показывает доступные альтернативы.
+
+    Атрибуты:
+        repository (ProductRepository): Репозиторий для работы с товарами.
+    """
+
+    # Фасет -> поле ответа и преобразование ключа
+    VALUE_FACETS = {
+        ProductFacet.Category: ("categories", int),
+        ProductFacet.City: ("cities", int),
+        ProductFacet.Gender: ("genders", int),
+        ProductFacet.IsForChildren: ("is_for_children", lambda key: key == "true"),
+    }
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Инициализация Use Case.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия базы данных.
+        """
+        self.repository = ProductRepository(db)
+
+    async def execute(self, filter: ProductFilter) -> ProductFacetsRDTO:
+        """
+        Выполняет подсчёт фасетов.
+
+        Args:
+            filter (ProductFilter): Текущие фильтры каталога.
+
+        Returns:
+            ProductFacetsRDTO: Счётчики по всем фасетам.
+        """
+        rows = await self.repository.get_facets(
+            common_filters=filter.get_common_filters(),
+            facet_filters=filter.get_facet_filters(),
+            include_deleted_filter=filter.is_show_deleted,
+        )
+        facets = ProductFacetsRDTO(total=0)
+        for row in rows:
+            if row.facet == ProductFacet.Total:
+                facets.total = row.count
+            elif row.facet == ProductFacet.Price:
+                facets.price = PriceFacetRDTO(
+                    min_price=row.min_price, max_price=row.max_price, count=row.count
+                )
+            elif row.facet == ProductFacet.Modification:
+                facets.modifications.append(
+                    ModificationFacetValueRDTO(
+                        modification_type_id=row.group_id, title_ru=row.key, count=row.count
+                    )
+                )
+            elif row.facet in self.VALUE_FACETS:
+                field, convert = self.VALUE_FACETS[row.facet]
+                getattr(facets, field).append(
+                    FacetValueRDTO(
+                        value=convert(row.key) if row.key is not None else None,
+                        count=row.count,
+                    )
+                )
+        facets.modifications.sort(key=lambda item: (item.modification_type_id, -item.count))
+        return facets
+
+    async def validate(self) -> None:
+        """
+        Валидация перед выполнением (пока не используется).
+        """
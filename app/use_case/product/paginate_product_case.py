@@ -49,15 +49,16 @@ class PaginateProductCase(BaseUseCase[PaginationProductWithRelationsRDTO]):
         Returns:
             PaginationProductWithRelationsRDTO: Объект пагинации с товарами.
         """
-        pagination = await self.repository.paginate(
+        # Проекция: только столбцы DTO, связи одним LEFT JOIN, без ORM-объектов
+        pagination = await self.repository.paginate_projected(
             dto=ProductWithRelationsRDTO,
             page=filter.page,
             per_page=filter.per_page,
             filters=filter.apply(),
-            options=self.repository.default_relationships(),
             order_by=filter.order_by,
             order_direction=filter.order_direction,
             include_deleted_filter=filter.is_show_deleted,
+            order_expressions=filter.get_order_expressions(),
         )
         return pagination
 
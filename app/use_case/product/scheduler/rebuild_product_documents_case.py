@@ -0,0 +1,70 @@
+import logging
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.product_document.product_document_repository import ProductDocumentRepository
+from app.infrastructure.app_config import app_config
+from app.infrastructure.service.redis_service import RedisService
+from app.use_case.base_case import BaseUseCase
+from app.use_case.product.get_full_product_by_id_case import GetFullProductByIdCase
+
+logger = logging.getLogger("scheduler")
+
+
+class RebuildProductDocumentsCase(BaseUseCase[int]):
+    """
+    Use Case для фоновой пересборки устаревших карточек товаров.
+
+    За один проход обрабатывает до product_document_rebuild_batch_size документов:
+    1. Выбирает (product_id, version) документов с is_stale=True
+    2. Собирает FullProductRDTO и сериализует его в JSON
+    3. Сохраняет документ, если version не изменился за время сборки, и удаляет
+       ключ Redis: его заново заполняет чтение из таблицы (GetProductDocumentCase),
+       поэтому запоздавшая запись не перетирает кеш более новой версии
+
+    Каждый документ сохраняется отдельной транзакцией, чтобы не удерживать
+    блокировки строк, которые параллельно помечают изменения товаров.
+
+    Attributes:
+        document_repository: Репозиторий карточек товаров
+        full_product_case: Сборка полной карточки товара
+        redis_service: Сервис Redis
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+        self.document_repository = ProductDocumentRepository(db)
+        self.full_product_case = GetFullProductByIdCase(db)
+        self.redis_service = RedisService()
+
+    async def execute(self) -> int:
+        """
+        Выполняет один проход пересборки.
+
+        Returns:
+            int: Количество сохранённых документов
+        """
+        stale = await self.document_repository.get_stale_batch(
+            limit=app_config.product_document_rebuild_batch_size
+        )
+        rebuilt = 0
+        for product_id, version in stale:
+            try:
+                payload = (await self.full_product_case.execute(id=product_id)).model_dump_json()
+                is_saved = await self.document_repository.save_payload(product_id, version, payload)
+                await self.db.commit()
+            except Exception as exc:
+                await self.db.rollback()
+                logger.error(f"RebuildProductDocumentsCase: ошибка сборки товара {product_id}: {exc}")
+                continue
+            if is_saved:
+                self.redis_service.delete_product_documents([product_id])
+                rebuilt += 1
+
+        if stale:
+            logger.info(f"RebuildProductDocumentsCase: пересобрано карточек {rebuilt} из {len(stale)}")
+        return rebuilt
+
+    async def validate(self, *args: Any, **kwargs: Any):
+        pass
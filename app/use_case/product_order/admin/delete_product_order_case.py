@@ -1,6 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.adapters.repository.product_order.product_order_repository import ProductOrderRepository
+from app.adapters.repository.product_stock_reservation.product_stock_reservation_repository import \
+    ProductStockReservationRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
@@ -14,10 +17,12 @@ class DeleteProductOrderCase(BaseUseCase[bool]):
     - Удаляет заказ (мягкое или жесткое удаление)
     - Проверяет существование заказа
     - Поддерживает force_delete для полного удаления
+    - Возвращает остатки по активным (неоплаченным) резервам заказа
     - Доступ только для администраторов
 
     Attributes:
         product_order_repository: Репозиторий для работы с заказами
+        stock_reservation_repository: Репозиторий резервов остатков
         order_id: ID заказа для удаления
         force_delete: Флаг для полного удаления
 
@@ -35,7 +40,9 @@ class DeleteProductOrderCase(BaseUseCase[bool]):
         Args:
             db: Активная сессия базы данных для выполнения операций
         """
+        self.db = db
         self.product_order_repository = ProductOrderRepository(db)
+        self.stock_reservation_repository = ProductStockReservationRepository(db)
         self.order_id: int | None = None
         self.force_delete: bool = False
 
@@ -98,10 +105,18 @@ class DeleteProductOrderCase(BaseUseCase[bool]):
             bool: True при успешном удалении
         """
         try:
-            await self.product_order_repository.delete(
-                id=self.order_id,
-                force_delete=self.force_delete
-            )
+            # Возврат остатков и удаление - одна транзакция под блокировкой заказа
+            async with UnitOfWork(self.db):
+                await self.product_order_repository.get_for_update(
+                    filters=[self.product_order_repository.model.id == self.order_id]
+                )
+                await self.stock_reservation_repository.release_for_orders(
+                    [self.order_id], reason="Заказ удален администратором"
+                )
+                await self.product_order_repository.delete(
+                    id=self.order_id,
+                    force_delete=self.force_delete
+                )
             return True
         except Exception:
             raise AppExceptionResponse.internal_error(
@@ -18,8 +18,11 @@ from app.adapters.repository.product_order_and_payment_transaction.product_order
     ProductOrderAndPaymentTransactionRepository
 from app.adapters.repository.product_order_item.product_order_item_repository import ProductOrderItemRepository
 from app.adapters.repository.product_order_item_history import product_order_item_history_repository
+from app.adapters.repository.product_stock_reservation.product_stock_reservation_repository import \
+    ProductStockReservationRepository
 from app.adapters.repository.product_order_item_history.product_order_item_history_repository import \
     ProductOrderItemHistoryRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import ProductOrderEntity, PaymentTransactionEntity, ProductOrderItemHistoryEntity
 from app.i18n.i18n_wrapper import i18n
@@ -119,11 +122,13 @@ class AcceptPaymentProductOrderCase(BaseUseCase[ProductOrderWithPaymentTransacti
 
     def __init__(self, db: AsyncSession) -> None:
         # Инициализация репозиториев для работы с данными
+        self.db = db
         self.product_order_repository = ProductOrderRepository(db)
         self.product_order_item_repository = ProductOrderItemRepository(db)
         self.product_order_item_history_repository = ProductOrderItemHistoryRepository(db)
         self.payment_transaction_repository = PaymentTransactionRepository(db)
         self.product_order_and_payment_transaction_repository = ProductOrderAndPaymentTransactionRepository(db)
+        self.stock_reservation_repository = ProductStockReservationRepository(db)
         self.firebase_service = FireBaseService(db)
 
         self.current_product_order: ProductOrderEntity | None = None
@@ -189,63 +194,92 @@ class AcceptPaymentProductOrderCase(BaseUseCase[ProductOrderWithPaymentTransacti
         if not self.current_product_order:
             raise AppExceptionResponse.bad_request(message=i18n.gettext("product_order_not_found"))
 
-        if self.current_product_order.status_id == DbValueConstants.ProductOrderStatusCreatedAwaitingPaymentID:
-            self.should_update = True
-
     async def transform(self) -> None:
         try:
-            if self.should_update:
-                #Если оплачен товар то можно обновить статус заказа продуктов
-                payment_transaction_cdto = PaymentTransactionCDTO.from_orm(self.payment_transaction_entity)
-                payment_transaction_cdto.mpi_order = self.dto.mpi_order
-                payment_transaction_cdto.res_desc = self.dto.res_desc
-                payment_transaction_cdto.res_code = self.dto.res_code
-                payment_transaction_cdto.paid_p_sign = self.dto.sign
-                payment_transaction_cdto.is_active = False
-                payment_transaction_cdto.is_paid = self.paid
-                if self.paid:
-                    payment_transaction_cdto.status_id = DbValueConstants.PaymentTransactionStatusPaidID
-                else:
-                    payment_transaction_cdto.status_id = DbValueConstants.PaymentTransactionStatusFailedID
-                self.payment_transaction_entity = await self.payment_transaction_repository.update(
-                    obj=self.payment_transaction_entity,
-                    dto=payment_transaction_cdto
+            stock_secured = False
+            async with UnitOfWork(self.db):
+                # Блокировка заказа до конца транзакции: планировщик и отмена не вернут
+                # его остатки, пока оплата применяется. Статус проверяется уже под блокировкой.
+                locked_orders = await self.product_order_repository.get_for_update(
+                    filters=[self.product_order_repository.model.id == self.current_product_order.id]
+                )
+                if not locked_orders:
+                    return
+                self.current_product_order = locked_orders[0]
+                self.should_update = (
+                    self.current_product_order.status_id == DbValueConstants.ProductOrderStatusCreatedAwaitingPaymentID
                 )
-                if not self.payment_transaction_entity:
-                    raise AppExceptionResponse.bad_request(message=i18n.gettext("payment_transaction_not_updated"))
-                if self.paid:
-                    product_order_cdto = ProductOrderCDTO.from_orm(self.current_product_order)
-                    product_order_cdto.status_id = DbValueConstants.ProductOrderStatusPaidID
-                    product_order_cdto.payment_transaction_id = self.payment_transaction_entity.id
-                    product_order_cdto.paid_order = self.dto.order
-                    product_order_cdto.is_paid = self.paid
-                    product_order_cdto.paid_at = datetime.datetime.now()
-                    self.current_product_order = await self.product_order_repository.update(
-                        obj=self.current_product_order,
-                        dto=product_order_cdto
+                if self.should_update:
+                    if self.paid:
+                        # Оплата прошла - резерв остатков становится окончательным списанием.
+                        # Если резерв уже снят, остатки списываются заново; если их не хватает,
+                        # заказ отменяется с ожиданием возврата денег
+                        committed = await self.stock_reservation_repository.commit_for_order(
+                            self.current_product_order.id
+                        )
+                        stock_secured = bool(committed) or await self.stock_reservation_repository.reacquire_for_order(
+                            self.current_product_order.id
+                        )
+                    #Если оплачен товар то можно обновить статус заказа продуктов
+                    payment_transaction_cdto = PaymentTransactionCDTO.from_orm(self.payment_transaction_entity)
+                    payment_transaction_cdto.mpi_order = self.dto.mpi_order
+                    payment_transaction_cdto.res_desc = self.dto.res_desc
+                    payment_transaction_cdto.res_code = self.dto.res_code
+                    payment_transaction_cdto.paid_p_sign = self.dto.sign
+                    payment_transaction_cdto.is_active = False
+                    payment_transaction_cdto.is_paid = self.paid
+                    if self.paid and stock_secured:
+                        payment_transaction_cdto.status_id = DbValueConstants.PaymentTransactionStatusPaidID
+                    elif self.paid:
+                        payment_transaction_cdto.status_id = DbValueConstants.PaymentTransactionStatusAwaitingRefundID
+                    else:
+                        payment_transaction_cdto.status_id = DbValueConstants.PaymentTransactionStatusFailedID
+                    self.payment_transaction_entity = await self.payment_transaction_repository.update(
+                        obj=self.payment_transaction_entity,
+                        dto=payment_transaction_cdto
                     )
-                    await self.firebase_service.send_payment_product_successfull_notification(
-                        self.current_product_order.user_id, self.current_product_order)
+                    if not self.payment_transaction_entity:
+                        raise AppExceptionResponse.bad_request(message=i18n.gettext("payment_transaction_not_updated"))
+                    if self.paid:
+                        product_order_cdto = ProductOrderCDTO.from_orm(self.current_product_order)
+                        product_order_cdto.payment_transaction_id = self.payment_transaction_entity.id
+                        product_order_cdto.paid_order = self.dto.order
+                        product_order_cdto.is_paid = self.paid
+                        product_order_cdto.paid_at = datetime.datetime.now()
+                        if stock_secured:
+                            product_order_cdto.status_id = DbValueConstants.ProductOrderStatusPaidID
+                        else:
+                            product_order_cdto.status_id = DbValueConstants.ProductOrderStatusCancelledAwaitingRefundID
+                            product_order_cdto.is_canceled = True
+                            product_order_cdto.is_active = False
+                            product_order_cdto.cancel_reason = "Недостаточно остатков на момент оплаты"
+                        self.current_product_order = await self.product_order_repository.update(
+                            obj=self.current_product_order,
+                            dto=product_order_cdto
+                        )
 
-                    # Обновляем is_paid = True для всех элементов заказа при успешной оплате
-                    order_items = await self.product_order_item_repository.get_with_filters(
-                        filters=[self.product_order_item_repository.model.order_id == self.current_product_order.id],
-                        include_deleted_filter=True
-                    )
-                    for item in order_items:
-                        item_cdto = ProductOrderItemCDTO.from_orm(item)
-                        item_cdto.is_paid = True
-                        product_item_updated = await self.product_order_item_repository.update(
-                            obj=item,
-                            dto=item_cdto
+                        # Обновляем is_paid = True для всех элементов заказа при успешной оплате
+                        order_items = await self.product_order_item_repository.get_with_filters(
+                            filters=[self.product_order_item_repository.model.order_id == self.current_product_order.id],
+                            include_deleted_filter=True
                         )
-                        # if product_item_updated :
-                        #     await self.product_order_item_history_repository.create(
-                        #         obj=ProductOrderItemHistoryEntity(
-                        #             order_item_id=product_item_updated.id,
-                        #             status_id=DbValueConstants.ProductOrderItemStatusPaidAwaitingConfirmationID
-                        #     ))
-
-                self.response.message = self.dto.res_desc
+                        for item in order_items:
+                            item_cdto = ProductOrderItemCDTO.from_orm(item)
+                            item_cdto.is_paid = True
+                            product_item_updated = await self.product_order_item_repository.update(
+                                obj=item,
+                                dto=item_cdto
+                            )
+                            # if product_item_updated :
+                            #     await self.product_order_item_history_repository.create(
+                            #         obj=ProductOrderItemHistoryEntity(
+                            #             order_item_id=product_item_updated.id,
+                            #             status_id=DbValueConstants.ProductOrderItemStatusPaidAwaitingConfirmationID
+                            #     ))
+
+                    self.response.message = self.dto.res_desc
+            if self.should_update and self.paid and stock_secured:
+                await self.firebase_service.send_payment_product_successfull_notification(
+                    self.current_product_order.user_id, self.current_product_order)
         except Exception as exc:
             traceback.print_exc()
@@ -3,6 +3,9 @@ from app.adapters.dto.product_order.product_order_dto import  ProductOrderCDTO
 from app.adapters.dto.user.user_dto import UserWithRelationsRDTO
 from app.adapters.repository.product_order.product_order_repository import ProductOrderRepository
 from app.adapters.repository.product_order_item.product_order_item_repository import ProductOrderItemRepository
+from app.adapters.repository.product_stock_reservation.product_stock_reservation_repository import \
+    ProductStockReservationRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.i18n.i18n_wrapper import i18n
 from app.shared.db_value_constants import DbValueConstants
@@ -13,8 +16,10 @@ class CancelOrDeleteOrderCase(BaseUseCase[bool]):
 
     def __init__(self, db: AsyncSession) -> None:
         # Инициализация репозиториев для работы с данными
+        self.db = db
         self.product_order_repository = ProductOrderRepository(db)
         self.product_order_item_repository = ProductOrderItemRepository(db)
+        self.stock_reservation_repository = ProductStockReservationRepository(db)
 
         self.current_user: UserWithRelationsRDTO | None = None  # Текущий пользователь
         self.product_order_id: int | None = None  # ID заказа для пересоздания
@@ -56,47 +61,54 @@ class CancelOrDeleteOrderCase(BaseUseCase[bool]):
             raise AppExceptionResponse.bad_request(message=i18n.gettext("product_order_is_not_active"))
 
     async def transform(self) -> bool:
-        try:
-            if self.current_product_order.status_id == DbValueConstants.ProductOrderStatusPaidID:
-                self.future_status_id = DbValueConstants.ProductOrderStatusCancelledAwaitingRefundID
-                self.future_item_status_id = DbValueConstants.ProductOrderItemStatusCancelledAwaitingRefundID
-                self.is_delete = False
-            else:
-                self.future_status_id = DbValueConstants.ProductOrderStatusCancelledID
+        if self.current_product_order.status_id == DbValueConstants.ProductOrderStatusPaidID:
+            self.future_status_id = DbValueConstants.ProductOrderStatusCancelledAwaitingRefundID
+            self.future_item_status_id = DbValueConstants.ProductOrderItemStatusCancelledAwaitingRefundID
+            self.is_delete = False
+        else:
+            self.future_status_id = DbValueConstants.ProductOrderStatusCancelledID
+
+        # Статус заказа и возврат резерва - одна транзакция под блокировкой заказа,
+        # чтобы параллельный callback оплаты не списал уже возвращённые остатки
+        async with UnitOfWork(self.db):
+            locked_orders = await self.product_order_repository.get_for_update(
+                filters=[self.product_order_repository.model.id == self.product_order_id]
+            )
+            if not locked_orders or locked_orders[0].status_id != self.current_product_order.status_id:
+                raise AppExceptionResponse.bad_request(message=i18n.gettext("product_order_is_not_active"))
+            self.current_product_order = locked_orders[0]
 
             if self.is_delete:
-                await self.product_order_repository.delete(id=self.product_order_id, force_delete=True)
-                return True
-            else:
-                product_cdto = ProductOrderCDTO.from_orm(self.current_product_order)
-                product_cdto.is_active = False
-                product_cdto.is_canceled = True
-                product_cdto.status_id = self.future_status_id
-                product_cdto.canceled_by_id = self.current_user.id
-                await self.product_order_repository.update(obj=self.current_product_order, dto=product_cdto)
-
-                product_items = await self.product_order_item_repository.get_with_filters(
-                    filters=[
-                        self.product_order_item_repository.model.order_id == self.product_order_id]
+                # Резервы удаляются вместе с заказом, поэтому остатки возвращаются до удаления
+                await self.stock_reservation_repository.release_for_orders(
+                    [self.product_order_id], reason="Заказ удален пользователем"
                 )
-                if product_items:
-                    for item in product_items:
-                        await self.product_order_item_repository.update(
-                            obj=item,
-                            dto={
-                                "status_id": self.future_item_status_id,
-                            }
-                        )
+                await self.product_order_repository.delete(id=self.product_order_id, force_delete=True)
                 return True
 
+            product_cdto = ProductOrderCDTO.from_orm(self.current_product_order)
+            product_cdto.is_active = False
+            product_cdto.is_canceled = True
+            product_cdto.status_id = self.future_status_id
+            product_cdto.canceled_by_id = self.current_user.id
+            await self.product_order_repository.update(obj=self.current_product_order, dto=product_cdto)
+
+            if self.future_status_id == DbValueConstants.ProductOrderStatusCancelledID:
+                # Неоплаченный заказ отменён - возвращаем зарезервированные остатки
+                await self.stock_reservation_repository.release_for_orders(
+                    [self.product_order_id], reason="Заказ отменен пользователем"
+                )
 
-        except Exception as exc:
-            return False
-
-
-
-
-
-
-
-
+            product_items = await self.product_order_item_repository.get_with_filters(
+                filters=[
+                    self.product_order_item_repository.model.order_id == self.product_order_id]
+            )
+            if product_items:
+                for item in product_items:
+                    await self.product_order_item_repository.update(
+                        obj=item,
+                        dto={
+                            "status_id": self.future_item_status_id,
+                        }
+                    )
+        return True
@@ -22,12 +22,16 @@ from app.adapters.repository.product_order_item_history.product_order_item_histo
     ProductOrderItemHistoryRepository
 from app.adapters.repository.product_order_item_status import ProductOrderItemStatusRepository
 from app.adapters.repository.product_order_status import ProductOrderStatusRepository
+from app.adapters.repository.product_stock_reservation.product_stock_reservation_repository import \
+    ProductStockReservationRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import ProductOrderEntity, \
     ProductOrderItemEntity, PaymentTransactionEntity, ProductOrderAndPaymentTransactionEntity
 from app.adapters.dto.product_order_response.product_order_response_dto import ProductOrderResponseDTO
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.identifier_service import identifier_service
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
 from app.use_case.cart.client.get_user_cart_case import GetUserCartCase
@@ -40,6 +44,7 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
     Основная функциональность:
     - Валидирует корзину пользователя и её содержимое
     - Создает заказ (ProductOrder) на основе данных корзины
+    - Атомарно резервирует остатки товаров и вариантов до paid_until
     - Создает элементы заказа (ProductOrderItem) для каждого товара
     - Генерирует платежную транзакцию и интегрируется с платежной системой Alatau
     - Устанавливает связь между заказом и платежной транзакцией
@@ -53,6 +58,7 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
         product_order_status_repository: Репозиторий для статусов заказа
         product_order_item_status_repository: Репозиторий для статусов элементов заказа
         product_order_payment_transaction_repository: Репозиторий для связи заказ-платеж
+        stock_reservation_repository: Репозиторий резервов остатков
         payment_transaction_repository: Репозиторий для платежных транзакций
         cart_repository: Репозиторий для корзин
         get_user_cart_use_case: Use Case для получения корзины пользователя
@@ -91,7 +97,9 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
         self.product_order_item_status_repository = ProductOrderItemStatusRepository(db)
         self.product_order_payment_transaction_repository = ProductOrderAndPaymentTransactionRepository(db)
         self.payment_transaction_repository = PaymentTransactionRepository(db)
+        self.db = db
         self.cart_repository = CartRepository(db)
+        self.stock_reservation_repository = ProductStockReservationRepository(db)
         self.get_user_cart_use_case = GetUserCartCase(db)
 
         # Переменные для хранения сущностей, полученных в процессе выполнения
@@ -221,6 +229,10 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
            - Устанавливает срок оплаты (по умолчанию 24 часа)
            - Сохраняет снапшот корзины в поле order_items
 
+        1.1. **Резервирование остатков**:
+           - Условно списывает stock товаров и вариантов одной транзакцией
+           - При нехватке остатка откатывает транзакцию и возвращает ошибку
+
         2. **Создание элементов заказа (ProductOrderItem)**:
            - Для каждого элемента корзины создает соответствующий элемент заказа
            - Устанавливает статус "Создан, ожидает оплаты"
@@ -242,13 +254,12 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
 
         Raises:
             AppExceptionResponse: При ошибках создания заказа или элементов заказа.
-                В случае ошибки выполняется откат с удалением созданного заказа.
+                Шаги 1-3 выполняются в одной UnitOfWork и при ошибке откатываются целиком.
 
         Note:
-            Метод использует try-catch блоки для обеспечения целостности данных.
-            При любой ошибке в создании элементов заказа, созданный заказ удаляется.
+            Шаги 1-3 фиксируются одним commit, шаги 4-5 - вторым.
             Ошибки в создании платежной транзакции обрабатываются мягко и записываются
-            в response.message без прерывания выполнения.
+            в response.message без прерывания выполнения; заказ при этом остается.
 
         Warning:
             Метод изменяет состояние response объекта, устанавливая:
@@ -257,34 +268,35 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
             - is_success: Флаг успешного выполнения
             - message: Сообщение об ошибке (если есть)
         """
-        # 1. Создаем основной заказ (ProductOrder)
-        try:
+        # 1-3. Заказ, резерв остатков, элементы заказа и удаление корзины - одна транзакция:
+        # при любой ошибке UnitOfWork откатывает все шаги
+        async with UnitOfWork(self.db):
+            # 1. Создаем основной заказ (ProductOrder)
             self.current_product_order = await self.product_order_repository.create(
                 ProductOrderEntity(
                     user_id=self.current_user.id,
                     status_id=DbValueConstants.ProductOrderStatusCreatedAwaitingPaymentID,
                     total_price=self.data.total_price,
-                    order_items_snapshot=self.data.cart.cart_items,
+                    # Снимок корзины в cart_items обновляется асинхронно (outbox) - собираем актуальный
+                    order_items_snapshot=await self.cart_repository.build_items_snapshot(self.data.cart.id),
                     email=self.email,
                     phone=self.phone,
                     paid_until=self.current_time + timedelta(minutes=self.paid_at_minutes)
                 ))
-        except Exception as e:
-            # Откат: удаляем созданный заказ при ошибке
-            if self.current_product_order:
-                await self.product_order_repository.delete(self.current_product_order.id, force_delete=True)
-            raise e
 
-        # Проверяем что заказ успешно создан
-        if not self.current_product_order:
-            raise AppExceptionResponse.bad_request(message=i18n.gettext("order_not_formed"))
+            # 1.1 Резервируем остатки до истечения срока оплаты
+            is_reserved = await self.stock_reservation_repository.reserve_for_order(
+                order_id=self.current_product_order.id,
+                lines=[(item.product_id, item.variant_id, item.qty) for item in self.data.cart_items],
+                expires_at=self.current_product_order.paid_until,
+            )
+            if not is_reserved:
+                raise AppExceptionResponse.bad_request(message=i18n.gettext("product_not_available"))
 
-        # 2. Создаем элементы заказа (ProductOrderItem) для каждого товара в корзине
-        try:
-            product_order_items = []
-            # Создаем элемент заказа для каждого товара в корзине
-            for item in self.data.cart_items:
-                product_order_item = await self.product_order_item_repository.create(
+            # 2. Создаем элементы заказа (ProductOrderItem) одним пакетным INSERT;
+            # история, коды верификации и сумма заказа создаются одним событием outbox на заказ
+            product_order_items = await self.product_order_item_repository.create_many(
+                [
                     ProductOrderItemEntity(
                         order_id=self.current_product_order.id,
                         status_id=DbValueConstants.ProductOrderItemStatusCreatedAwaitingPaymentID,
@@ -297,23 +309,19 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
                         product_price=item.product_price,
                         delta_price=item.delta_price,
                     )
-                )
-                product_order_items.append(product_order_item)
-        except Exception as e:
-            # Откат: удаляем заказ если не удалось создать элементы
-            if self.current_product_order:
-                await self.product_order_repository.delete(self.current_product_order.id, force_delete=True)
-            raise e
+                    for item in self.data.cart_items
+                ]
+            )
 
-        # 3. Удаляем корзину после успешного создания заказа
-        if self.current_product_order and product_order_items:
-            await self.cart_repository.delete(self.data.cart.id, force_delete=True)
+            # 3. Удаляем корзину после успешного создания заказа
+            if product_order_items:
+                await self.cart_repository.delete(self.data.cart.id, force_delete=True)
 
         # 4. Создаем платежную транзакцию и интеграцию с платежной системой Alatau
         try:
             # Генерируем уникальный номер заказа для платежной системы
-            self.unique_order = await self.payment_transaction_repository.generate_unique_order(min_len=6, max_len=22)
-            nonce = await self.payment_transaction_repository.generate_unique_noncense()
+            self.unique_order = identifier_service.generate_order()
+            nonce = identifier_service.generate_nonce()
             user_name = f"{self.current_user.first_name or ''} {self.current_user.last_name or ''}".strip()
 
             # Создаем DTO для платежной системы Alatau
@@ -355,22 +363,24 @@ class CreateProductOrderCase(BaseUseCase[ProductOrderResponseDTO]):
                 expired_at=self.current_product_order.paid_until
             )
 
-            # Создаем запись платежной транзакции в базе данных
-            self.payment_transaction_entity = await self.payment_transaction_repository.create(
-                PaymentTransactionEntity(**payment_cdto.model_dump())
-            )
+            # Платежная транзакция и связь с заказом фиксируются одним commit
+            async with UnitOfWork(self.db):
+                # Создаем запись платежной транзакции в базе данных
+                self.payment_transaction_entity = await self.payment_transaction_repository.create(
+                    PaymentTransactionEntity(**payment_cdto.model_dump())
+                )
 
-            # 5. Создаем связь между заказом и платежной транзакцией
-            await self.product_order_payment_transaction_repository.create(
-                ProductOrderAndPaymentTransactionEntity(
-                    product_order_id=self.current_product_order.id,
-                    payment_transaction_id=self.payment_transaction_entity.id,
-                    link_type="initial",  # Тип связи: первоначальная транзакция
-                    link_reason="Initial order creation",
-                    is_primary=True,  # Основная транзакция для заказа
-                    is_active=True
+                # 5. Создаем связь между заказом и платежной транзакцией
+                await self.product_order_payment_transaction_repository.create(
+                    ProductOrderAndPaymentTransactionEntity(
+                        product_order_id=self.current_product_order.id,
+                        payment_transaction_id=self.payment_transaction_entity.id,
+                        link_type="initial",  # Тип связи: первоначальная транзакция
+                        link_reason="Initial order creation",
+                        is_primary=True,  # Основная транзакция для заказа
+                        is_active=True
+                    )
                 )
-            )
 
             # Заполняем успешный ответ
             self.response.order = self.order_dto
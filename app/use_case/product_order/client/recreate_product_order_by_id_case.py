@@ -24,6 +24,7 @@ from app.entities import ProductOrderEntity, \
 from app.adapters.dto.product_order_response.product_order_response_dto import ProductOrderResponseDTO
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.identifier_service import identifier_service
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
 from app.use_case.cart.client.get_user_cart_case import GetUserCartCase
@@ -278,8 +279,8 @@ class RecreateProductOrderByIdCase(BaseUseCase[ProductOrderResponseDTO]):
             на основе настроек существующего заказа.
         """
         # Генерируем уникальный номер заказа для платежной системы
-        self.unique_order = await self.payment_transaction_repository.generate_unique_order(min_len=6, max_len=22)
-        nonce = await self.payment_transaction_repository.generate_unique_noncense()
+        self.unique_order = identifier_service.generate_order()
+        nonce = identifier_service.generate_nonce()
         user_name = f"{self.current_user.first_name or ''} {self.current_user.last_name or ''}".strip()
 
         # Создаем DTO для платежной системы Alatau
@@ -20,6 +20,7 @@ from app.adapters.repository.product_order_item_history.product_order_item_histo
 from app.adapters.repository.product_order_item_verification_code.product_order_item_verification_code_repository import (
     ProductOrderItemVerificationCodeRepository,
 )
+from app.adapters.repository.unit_of_work import UnitOfWork
 from app.core.app_exception_response import AppExceptionResponse
 from app.entities import ProductOrderItemEntity
 from app.i18n.i18n_wrapper import i18n
@@ -312,12 +313,14 @@ class ChangeDeliveryProductOrderItemCase(
         Returns:
             ProductOrderItemWithRelationsRDTO: Обновленный элемент заказа
         """
-        if self.dto.is_passed is None:
-            # Действие: "Принять в обработку"
-            await self._take_to_work()
-        else:
-            # Действие: "Принять решение"
-            await self._make_decision()
+        # Запись истории и смена статуса элемента фиксируются одним commit
+        async with UnitOfWork(self.db):
+            if self.dto.is_passed is None:
+                # Действие: "Принять в обработку"
+                await self._take_to_work()
+            else:
+                # Действие: "Принять решение"
+                await self._make_decision()
 
         # Загружаем обновленный элемент заказа со всеми связями
         self.current_order_item = await self.product_order_item_repository.get(
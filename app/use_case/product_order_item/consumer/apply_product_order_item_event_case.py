@@ -0,0 +1,164 @@
+import random
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.repository.product_order.product_order_repository import ProductOrderRepository
+from app.adapters.repository.product_order_item.product_order_item_repository import ProductOrderItemRepository
+from app.adapters.repository.product_order_item_history.product_order_item_history_repository import (
+    ProductOrderItemHistoryRepository,
+)
+from app.adapters.repository.product_order_item_verification_code.product_order_item_verification_code_repository import (
+    ProductOrderItemVerificationCodeRepository,
+)
+from app.entities import OutboxEventEntity
+from app.shared.db_value_constants import DbValueConstants
+from app.shared.event_constants import AppEventConstants
+from app.use_case.base_case import BaseUseCase
+
+
+class ApplyProductOrderItemEventCase(BaseUseCase[None]):
+    """
+    Use Case обработчика событий элементов заказа (outbox).
+
+    Событие относится к заказу и содержит все элементы, изменённые за один
+    flush (payload["items"]). Производная работа выполняется пакетно
+    в транзакции обработчика события (без commit):
+    - Создание: один INSERT записей истории, один INSERT кодов верификации,
+      один пересчёт total_price заказа
+    - Обновление: один INSERT истории смены статусов (при переходе 1 -> 2
+      дополнительно запись об успешной оплате), пересчёт total_price и статуса заказа
+    - Удаление: пересчёт total_price и статуса заказа
+
+    Суммы и статус заказа пересчитываются по текущему состоянию элементов,
+    поэтому порядок обработки событий одного заказа не важен. Время записей
+    истории - время события, а не обработки.
+
+    Attributes:
+        order_repository: Репозиторий заказов
+        item_repository: Репозиторий элементов заказа
+        history_repository: Репозиторий истории элементов заказа
+        verification_code_repository: Репозиторий кодов верификации
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.order_repository = ProductOrderRepository(db)
+        self.item_repository = ProductOrderItemRepository(db)
+        self.history_repository = ProductOrderItemHistoryRepository(db)
+        self.verification_code_repository = ProductOrderItemVerificationCodeRepository(db)
+
+    async def execute(self, event: OutboxEventEntity) -> None:
+        """
+        Обрабатывает событие элементов заказа.
+
+        Args:
+            event: Заблокированное событие outbox (aggregate_id - ID заказа)
+        """
+        order_id = event.payload["order_id"]
+        if event.event_type != AppEventConstants.ProductOrderItemDeleted:
+            await self.transform(event)
+        await self.order_repository.recalculate_totals(order_id)
+        if event.event_type != AppEventConstants.ProductOrderItemCreated:
+            await self.order_repository.refresh_cancel_status(order_id)
+
+    async def validate(self, *args: Any, **kwargs: Any):
+        pass
+
+    async def transform(self, event: OutboxEventEntity) -> None:
+        """Записи истории и коды верификации для элементов, которые ещё существуют."""
+        items = event.payload["items"]
+        if event.event_type == AppEventConstants.ProductOrderItemUpdated:
+            items = [item for item in items if "status_id" in item]
+        if not items:
+            return
+        # Элементы могли быть удалены (откат создания заказа) до обработки события
+        existing = await self.item_repository.get_with_filters(
+            filters=[self.item_repository.model.id.in_([item["id"] for item in items])],
+            include_deleted_filter=True,
+        )
+        existing_ids = {item.id for item in existing}
+        items = [item for item in items if item["id"] in existing_ids]
+        if not items:
+            return
+
+        if event.event_type == AppEventConstants.ProductOrderItemCreated:
+            await self.history_repository.bulk_create(
+                [
+                    self._history_row(
+                        event,
+                        order_item_id=item["id"],
+                        status_id=item["status_id"],
+                        messages=("Товар добавлен в заказ", "Тауар тапсырысқа қосылды", "Item added to order"),
+                    )
+                    for item in items
+                ],
+                commit=False,
+            )
+            await self.verification_code_repository.bulk_create(
+                [
+                    {
+                        "order_item_id": item["id"],
+                        "responsible_user_id": None,
+                        "code": str(random.randint(1000, 9999)),
+                        "is_active": True,
+                    }
+                    for item in items
+                ],
+                commit=False,
+            )
+            return
+
+        history_rows = []
+        for item in items:
+            # Особая логика для перехода на статус 2 (оплачен): запись для статуса 1 с is_passed=True
+            if (item["old_status_id"] == DbValueConstants.ProductOrderItemStatusCreatedAwaitingPaymentID and
+                    item["status_id"] == DbValueConstants.ProductOrderItemStatusPaidAwaitingConfirmationID):
+                history_rows.append(
+                    self._history_row(
+                        event,
+                        order_item_id=item["id"],
+                        status_id=DbValueConstants.ProductOrderItemStatusCreatedAwaitingPaymentID,
+                        messages=("Заказ успешно оплачен", "Тапсырыс сәтті төленді", "Order successfully paid"),
+                        is_passed=True,
+                        taken_at=event.created_at,
+                        passed_at=event.created_at,
+                    )
+                )
+            # Обычная запись истории для нового статуса
+            history_rows.append(
+                self._history_row(
+                    event,
+                    order_item_id=item["id"],
+                    status_id=item["status_id"],
+                    messages=("Статус товара изменен", "Тауар күйі өзгертілді", "Item status changed"),
+                    cancel_reason=item["cancel_reason"],
+                )
+            )
+        await self.history_repository.bulk_create(history_rows, commit=False)
+
+    @staticmethod
+    def _history_row(
+        event: OutboxEventEntity,
+        order_item_id: int,
+        status_id: int,
+        messages: tuple[str, str, str],
+        is_passed: bool | None = None,
+        cancel_reason: str | None = None,
+        taken_at: Any = None,
+        passed_at: Any = None,
+    ) -> dict[str, Any]:
+        """Строка истории; набор полей одинаков для всех строк пакета."""
+        message_ru, message_kk, message_en = messages
+        return {
+            "order_item_id": order_item_id,
+            "status_id": status_id,
+            "responsible_user_id": None,
+            "message_ru": message_ru,
+            "message_kk": message_kk,
+            "message_en": message_en,
+            "is_passed": is_passed,
+            "cancel_reason": cancel_reason,
+            "taken_at": taken_at,
+            "passed_at": passed_at,
+            "created_at": event.created_at,
+        }
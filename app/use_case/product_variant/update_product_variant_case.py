@@ -13,9 +13,10 @@ from app.adapters.repository.product_variant.product_variant_repository import (
     ProductVariantRepository,
 )
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import ProductVariantEntity
+from app.entities import CityEntity, ProductVariantEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
@@ -147,7 +148,7 @@ class UpdateProductVariantCase(BaseUseCase[ProductVariantWithRelationsRDTO]):
 
         # Проверка существования города (если указан новый)
         if dto.city_id is not None:
-            if (await self.city_repository.get(dto.city_id)) is None:
+            if not await reference_data_registry.exists(CityEntity, dto.city_id, self.city_repository):
                 raise AppExceptionResponse.bad_request(
                     message=i18n.gettext("city_not_found_by_id")
                 )
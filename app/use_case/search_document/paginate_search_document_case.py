@@ -0,0 +1,60 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.pagination_dto import PaginationSearchDocumentWithRelationsRDTO
+from app.adapters.dto.search_document.search_document_dto import SearchDocumentWithRelationsRDTO
+from app.adapters.filters.search_document.search_document_pagination_filter import (
+    SearchDocumentPaginationFilter,
+)
+from app.adapters.repository.search_document.search_document_repository import SearchDocumentRepository
+from app.use_case.base_case import BaseUseCase
+
+
+class PaginateSearchDocumentCase(BaseUseCase[PaginationSearchDocumentWithRelationsRDTO]):
+    """
+    Класс Use Case для единого поиска по товарам, полям и академиям.
+
+    Выполняет один ранжированный запрос к денормализованной таблице search_documents
+    вместо отдельных поисков по каждой сущности. Каждый результат содержит
+    entity_type и entity_id для перехода к исходной записи.
+
+    Атрибуты:
+        repository (SearchDocumentRepository): Репозиторий поисковых документов.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Инициализация Use Case.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия базы данных.
+        """
+        self.repository = SearchDocumentRepository(db)
+
+    async def execute(
+        self, filter: SearchDocumentPaginationFilter
+    ) -> PaginationSearchDocumentWithRelationsRDTO:
+        """
+        Выполняет единый поиск с пагинацией.
+
+        Args:
+            filter (SearchDocumentPaginationFilter): Параметры поиска, фильтрации и пагинации.
+
+        Returns:
+            PaginationSearchDocumentWithRelationsRDTO: Найденные документы, отсортированные по релевантности.
+        """
+        pagination = await self.repository.paginate(
+            dto=SearchDocumentWithRelationsRDTO,
+            page=filter.page,
+            per_page=filter.per_page,
+            filters=filter.apply(),
+            options=self.repository.default_relationships(),
+            order_by=filter.order_by,
+            order_direction=filter.order_direction,
+            order_expressions=filter.get_order_expressions(),
+        )
+        return pagination
+
+    async def validate(self) -> None:
+        """
+        Валидация перед выполнением (пока не используется).
+        """
@@ -0,0 +1,58 @@
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.student.student_dto import StudentWithRelationsRDTO
+from app.adapters.filters.student.student_filter import StudentFilter
+from app.adapters.repository.student.student_repository import StudentRepository
+from app.infrastructure.app_config import app_config
+from app.use_case.base_case import BaseUseCase
+
+
+class ExportStudentCase(BaseUseCase[AsyncIterator[StudentWithRelationsRDTO]]):
+    """
+    Класс Use Case для потоковой выгрузки студентов.
+
+    В отличие от AllStudentCase, не загружает таблицу в память целиком:
+    строки читаются серверным курсором пачками app_export_batch_size
+    и отдаются по одной.
+
+    Атрибуты:
+        repository (StudentRepository): Репозиторий для работы с студентами.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Инициализация Use Case.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия базы данных.
+        """
+        self.repository = StudentRepository(db)
+
+    async def execute(self, filter: StudentFilter) -> AsyncIterator[StudentWithRelationsRDTO]:
+        """
+        Выполняет потоковую выгрузку студентов.
+
+        Args:
+            filter (StudentFilter): Фильтр для поиска и сортировки.
+
+        Yields:
+            StudentWithRelationsRDTO: Студент с отношениями.
+        """
+        models = self.repository.stream_with_filters(
+            filters=filter.apply(),
+            options=self.repository.default_relationships(),
+            order_by=filter.order_by,
+            order_direction=filter.order_direction,
+            include_deleted_filter=filter.is_show_deleted,
+            batch_size=app_config.app_export_batch_size,
+        )
+        async for model in models:
+            yield StudentWithRelationsRDTO.from_orm(model)
+
+    async def validate(self) -> None:
+        """
+        Валидация перед выполнением (пока не используется).
+        """
+        pass
@@ -9,9 +9,10 @@ from app.adapters.repository.city.city_repository import CityRepository
 from app.adapters.repository.file.file_repository import FileRepository
 from app.adapters.repository.student.student_repository import StudentRepository
 from app.core.app_exception_response import AppExceptionResponse
-from app.entities import StudentEntity
+from app.entities import CityEntity, StudentEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.shared.db_value_constants import DbValueConstants
 from app.use_case.base_case import BaseUseCase
@@ -121,7 +122,7 @@ class UpdateStudentCase(BaseUseCase[StudentWithRelationsRDTO]):
 
         # Проверка существования города (если указан новый)
         if dto.city_id is not None:
-            if (await self.city_repository.get(dto.city_id)) is None:
+            if not await reference_data_registry.exists(CityEntity, dto.city_id, self.city_repository):
                 raise AppExceptionResponse.bad_request(
                     message=i18n.gettext("city_not_found_by_id")
                 )
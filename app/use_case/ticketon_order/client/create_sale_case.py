@@ -21,6 +21,7 @@ from app.entities.ticketon_order_and_payment_transaction_entity import TicketonO
 from app.helpers.alatau_helper import AlatauHelper
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.identifier_service import identifier_service
 from app.infrastructure.service.alatau_service.alatau_service_api import AlatauServiceAPI
 from app.infrastructure.service.ticketon_service.ticketon_service_api import TicketonServiceAPI
 from app.shared.db_constants import DbColumnConstants
@@ -51,7 +52,7 @@ class CreateSaleTicketonAndOrderCase(BaseUseCase[TicketonResponseForSaleDTO]):
     async def execute(self, dto: TicketonBookingRequestDTO, user: UserWithRelationsRDTO) -> TicketonResponseForSaleDTO:
         self.user = user
         self.ticketon_request_dto = dto
-        self.unique_order = await self.payment_transaction_repository.generate_unique_order(min_len=6, max_len=22)
+        self.unique_order = identifier_service.generate_order()
         await self.validate()
         await self.transform()
         await self.create_transaction()
@@ -134,7 +135,7 @@ class CreateSaleTicketonAndOrderCase(BaseUseCase[TicketonResponseForSaleDTO]):
             self.order_dto.DESC = "Покупка билетов на мероприятие"
             self.order_dto.DESC_ORDER = AlatauHelper.make_desc(self.ticketon_booking_result, self.show)
             self.order_dto.EMAIL = self.ticketon_request_dto.email
-            self.order_dto.NONCE = await self.payment_transaction_repository.generate_unique_noncense()
+            self.order_dto.NONCE = identifier_service.generate_nonce()
             
             if self.user:
                 self.order_dto.CLIENT_ID = self.user.id
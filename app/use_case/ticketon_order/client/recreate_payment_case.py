@@ -22,6 +22,7 @@ from app.entities.ticketon_order_and_payment_transaction_entity import TicketonO
 from app.helpers.alatau_helper import AlatauHelper
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.app_config import app_config
+from app.infrastructure.service.identifier_service import identifier_service
 from app.infrastructure.service.alatau_service.alatau_service_api import AlatauServiceAPI
 from app.infrastructure.service.ticketon_service.ticketon_service_api import TicketonServiceAPI
 from app.shared.db_value_constants import DbValueConstants
@@ -66,7 +67,7 @@ class RecreatePaymentForTicketonOrderCase(BaseUseCase[TicketonResponseForSaleDTO
         Returns:
             TicketonResponseForSaleDTO с данными для оплаты
         """
-        self.unique_order = await self.payment_transaction_repository.generate_unique_order(min_len=6, max_len=22)
+        self.unique_order = identifier_service.generate_order()
         self.user = user
         await self.validate(ticketon_order_id)
         await self.transform()
@@ -152,7 +153,7 @@ class RecreatePaymentForTicketonOrderCase(BaseUseCase[TicketonResponseForSaleDTO
             self.order_dto.DESC_ORDER = AlatauHelper.make_desc(self.ticketon_booking_result, show)
             self.order_dto.EMAIL = self.ticketon_order.email
             # Note: PHONE не используется в AlatauCreateResponseOrderDTO для платежной системы
-            self.order_dto.NONCE = await self.payment_transaction_repository.generate_unique_noncense()
+            self.order_dto.NONCE = identifier_service.generate_nonce()
 
             if self.user:
                 self.order_dto.CLIENT_ID = self.user.id
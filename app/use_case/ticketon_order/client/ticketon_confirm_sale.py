@@ -117,6 +117,54 @@ class TicketonConfirmCase(BaseUseCase[AlatauBackrefResponseDTO]):
         return self.response
 
 
+    async def confirm_sale(
+        self, ticketon_order_entity: TicketonOrderEntity, payment_transaction_id: int
+    ) -> TicketonOrderEntity:
+        """
+        Подтверждает оплаченную продажу в Ticketon и сохраняет билеты.
+
+        Используется callback'ом оплаты и сверкой платежей
+        (ReconcilePaymentTransactionCase) для продаж, оплата которых
+        подтверждена без callback'а.
+
+        Args:
+            ticketon_order_entity: Оплаченный заказ Ticketon
+            payment_transaction_id: ID платежной транзакции заказа
+
+        Returns:
+            TicketonOrderEntity: Обновленный заказ со связями
+        """
+        ticketon_confirm_request = TicketonConfirmSaleRequestDTO(
+            sale=ticketon_order_entity.sale,
+            email=ticketon_order_entity.email,
+            phone=ticketon_order_entity.phone
+        )
+        ticketon_confirm_response:TicketonConfirmSaleResponseDTO = await self.ticketon_service_api.sale_confirm(dto=ticketon_confirm_request)
+        ticketon_udto = TicketonOrderCDTO.from_orm(ticketon_order_entity)
+        ticketon_udto.sale = ticketon_confirm_response.sale
+        ticketon_udto.price = ticketon_confirm_response.price
+        ticketon_udto.expire = ticketon_confirm_response.expire
+        ticketon_udto.sum = ticketon_confirm_response.sum
+        ticketon_udto.show = ticketon_confirm_response.show
+        ticketon_udto.is_active = False
+        ticketon_udto.is_paid = True
+        ticketon_udto.payment_transaction_id = payment_transaction_id
+        ticketon_udto.tickets = [ticket.model_dump() if hasattr(ticket, 'model_dump') else ticket for ticket in ticketon_confirm_response.tickets] if ticketon_confirm_response.tickets else None
+        if ticketon_confirm_response.status == 1:
+            ticketon_udto.status_id = DbValueConstants.TicketonOrderStatusPaidConfirmedID
+        else:
+            ticketon_udto.status_id = DbValueConstants.TicketonOrderStatusPaidAwaitingConfirmationID
+        updated_ticketon_order_entity = await self.ticketon_order_repository.update(obj=ticketon_order_entity, dto=ticketon_udto)
+        ticketon_order_entity = await self.ticketon_order_repository.get_first_with_filters(
+            filters=[
+                self.ticketon_order_repository.model.id == updated_ticketon_order_entity.id
+            ],
+            options=self.ticketon_order_repository.default_relationships(),
+            include_deleted_filter=True,
+        )
+        await self.firebase_service.send_ticketon_notification(user_id=ticketon_order_entity.user_id, ticketon=ticketon_order_entity)
+        return ticketon_order_entity
+
 
     async def validate(self) -> None:
         # Проверяем обязательные поля
@@ -209,35 +257,9 @@ class TicketonConfirmCase(BaseUseCase[AlatauBackrefResponseDTO]):
 
         if is_paid:
             try:
-                ticketon_confirm_request = TicketonConfirmSaleRequestDTO(
-                    sale=self.ticketon_order_entity.sale,
-                    email=self.ticketon_order_entity.email,
-                    phone=self.ticketon_order_entity.phone
-                )
-                ticketon_confirm_response:TicketonConfirmSaleResponseDTO = await self.ticketon_service_api.sale_confirm(dto=ticketon_confirm_request)
-                ticketon_udto = TicketonOrderCDTO.from_orm(self.ticketon_order_entity)
-                ticketon_udto.sale = ticketon_confirm_response.sale
-                ticketon_udto.price = ticketon_confirm_response.price
-                ticketon_udto.expire = ticketon_confirm_response.expire
-                ticketon_udto.sum = ticketon_confirm_response.sum
-                ticketon_udto.show = ticketon_confirm_response.show
-                ticketon_udto.is_active = False
-                ticketon_udto.is_paid = True
-                ticketon_udto.payment_transaction_id = self.payment_transaction_entity.id
-                ticketon_udto.tickets = [ticket.model_dump() if hasattr(ticket, 'model_dump') else ticket for ticket in ticketon_confirm_response.tickets] if ticketon_confirm_response.tickets else None
-                if ticketon_confirm_response.status == 1:
-                    ticketon_udto.status_id = DbValueConstants.TicketonOrderStatusPaidConfirmedID
-                else:
-                    ticketon_udto.status_id = DbValueConstants.TicketonOrderStatusPaidAwaitingConfirmationID
-                updated_ticketon_order_entity = await self.ticketon_order_repository.update(obj=self.ticketon_order_entity, dto=ticketon_udto)
-                self.ticketon_order_entity = await self.ticketon_order_repository.get_first_with_filters(
-                    filters=[
-                        self.ticketon_order_repository.model.id == updated_ticketon_order_entity.id
-                    ],
-                    options=self.ticketon_order_repository.default_relationships(),
-                    include_deleted_filter=True,
+                self.ticketon_order_entity = await self.confirm_sale(
+                    self.ticketon_order_entity, self.payment_transaction_entity.id
                 )
-                await self.firebase_service.send_ticketon_notification(user_id=self.ticketon_order_entity.user_id, ticketon=self.ticketon_order_entity)
             except Exception as e:
                 error_message = str(e)
 
@@ -0,0 +1,57 @@
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.dto.ticketon_order.ticketon_order_dto import TicketonOrderRDTO
+from app.adapters.filters.ticketon_order.ticketon_order_filter import TicketonOrderFilter
+from app.adapters.repository.ticketon_order.ticketon_order_repository import TicketonOrderRepository
+from app.infrastructure.app_config import app_config
+from app.use_case.base_case import BaseUseCase
+
+
+class ExportTicketonOrderCase(BaseUseCase[AsyncIterator[TicketonOrderRDTO]]):
+    """
+    Класс Use Case для потоковой выгрузки заказов Ticketon.
+
+    В отличие от AllTicketonOrderCase, не загружает таблицу в память целиком:
+    строки читаются серверным курсором пачками app_export_batch_size
+    и отдаются по одной.
+
+    Атрибуты:
+        repository (TicketonOrderRepository): Репозиторий для работы с заказами.
+    """
+
+    def __init__(self, db: AsyncSession) -> None:
+        """
+        Инициализация Use Case.
+
+        Args:
+            db (AsyncSession): Асинхронная сессия базы данных.
+        """
+        self.repository = TicketonOrderRepository(db)
+
+    async def execute(self, filter: TicketonOrderFilter) -> AsyncIterator[TicketonOrderRDTO]:
+        """
+        Выполняет потоковую выгрузку заказов Ticketon.
+
+        Args:
+            filter (TicketonOrderFilter): Фильтр для поиска и сортировки.
+
+        Yields:
+            TicketonOrderRDTO: Заказ Ticketon.
+        """
+        models = self.repository.stream_with_filters(
+            filters=filter.apply(),
+            order_by=filter.order_by,
+            order_direction=filter.order_direction,
+            include_deleted_filter=filter.is_show_deleted,
+            batch_size=app_config.app_export_batch_size,
+        )
+        async for model in models:
+            yield TicketonOrderRDTO.model_validate(model)
+
+    async def validate(self) -> None:
+        """
+        Валидация перед выполнением (пока не используется).
+        """
+        pass
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.adapters.dto.ticketon_order.ticketon_order_dto import TicketonOrderRDTO
 from app.adapters.repository.ticketon_order.ticketon_order_repository import TicketonOrderRepository
 from app.core.app_exception_response import AppExceptionResponse
+from app.core.conditional_response import ResourceVersion
 from app.entities import TicketonOrderEntity
 from app.i18n.i18n_wrapper import i18n
 from app.use_case.base_case import BaseUseCase
@@ -38,6 +39,21 @@ class GetTicketonOrderByIdCase(BaseUseCase[TicketonOrderRDTO]):
         await self.validate(id=id)
         return TicketonOrderRDTO.model_validate(self.model)
 
+    async def get_version(self, id: int) -> ResourceVersion | None:
+        """
+        Версия заказа Ticketon для условного GET (ETag / Last-Modified) без сборки DTO.
+
+        Args:
+            id (int): ID заказа Ticketon.
+
+        Returns:
+            ResourceVersion | None: Версия или None, если запись не найдена.
+        """
+        return await self.repository.get_version(
+            filters=[self.repository.model.id == id],
+            include_deleted_filter=True,
+        )
+
     async def validate(self, id: int) -> None:
         """
         Валидация поиска заказа Ticketon по ID.
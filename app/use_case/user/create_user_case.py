@@ -7,9 +7,10 @@ from app.adapters.repository.role.role_repository import RoleRepository
 from app.adapters.repository.user.user_repository import UserRepository
 from app.core.app_exception_response import AppExceptionResponse
 from app.core.auth_core import get_password_hash
-from app.entities import UserEntity
+from app.entities import RoleEntity, UserEntity
 from app.i18n.i18n_wrapper import i18n
 from app.infrastructure.service.file_service import FileService
+from app.infrastructure.service.reference_data_service.reference_data_registry import reference_data_registry
 from app.shared.app_file_constants import AppFileExtensionConstants
 from app.use_case.base_case import BaseUseCase
 
@@ -64,7 +65,7 @@ class CreateUserCase(BaseUseCase[UserWithRelationsRDTO]):
                 raise AppExceptionResponse.bad_request(
                     message=i18n.gettext("iin_exists")
                 )
-        if (await self.role_repository.get(dto.role_id)) is None:
+        if not await reference_data_registry.exists(RoleEntity, dto.role_id, self.role_repository):
             raise AppExceptionResponse.bad_request(
                 message=i18n.gettext("role_not_found_by_id")
             )
@@ -0,0 +1,127 @@
+"""
+Бенчмарк ответа со списком товаров: response_model + JSONResponse против FastJSONResponse.
+
+Поднимает в процессе приложение FastAPI с двумя маршрутами, возвращающими одну
+и ту же страницу Pagination из ProductWithRelationsRDTO (с изображением), и
+запрашивает их через ASGI-транспорт httpx без сети и базы данных. Выводит
+задержку (p50/p95/max), пропускную способность и размер ответа для каждого
+размера страницы.
+
+    default  - прежний путь: повторная валидация по response_model + stdlib json
+    fast     - fast_response: model_dump_json/orjson за один проход
+
+Использование:
+    python -m benchmarks.fast_json_response_benchmark
+    python -m benchmarks.fast_json_response_benchmark --per-page 100 500 1000 --repeat 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime
+from decimal import Decimal
+
+import httpx
+from fastapi import FastAPI
+
+from app.adapters.dto.base_pagination_dto import Pagination
+from app.adapters.dto.pagination_dto import PaginationProductWithRelationsRDTO
+from app.adapters.dto.product.product_dto import ProductWithRelationsRDTO
+from app.core.fast_json_response import FastJSONResponse, fast_response
+
+
+def build_page(per_page: int) -> Pagination:
+    now = datetime.now()
+    items = [
+        ProductWithRelationsRDTO.model_validate({
+            "id": index,
+            "image_id": index,
+            "title_ru": f"Мяч Jankuier {index}",
+            "title_en": f"Jankuier ball {index}",
+            "description_ru": "Официальный мяч клуба. Подходит для тренировок и матчей.",
+            "value": f"bench-product-{index}",
+            "sku": f"BENCH-{index:06d}",
+            "base_price": Decimal("15990.00"),
+            "old_price": Decimal("19990.00"),
+            "stock": 12,
+            "gender": 0,
+            "created_at": now,
+            "updated_at": now,
+            "image": {
+                "id": index,
+                "filename": f"ball-{index}.jpg",
+                "file_path": f"static/upload/product/ball-{index}.jpg",
+                "file_size": 150_000,
+                "content_type": "image/jpeg",
+                "variants": {
+                    "320w": {
+                        "width": 320,
+                        "height": 320,
+                        "webp": f"static/upload/product/ball-{index}_320w.webp",
+                        "jpeg": f"static/upload/product/ball-{index}_320w.jpg",
+                    },
+                },
+                "created_at": now,
+                "updated_at": now,
+            },
+        })
+        for index in range(per_page)
+    ]
+    return Pagination(items=items, total_pages=100, total_items=per_page * 100, per_page=per_page, page=1)
+
+
+def build_app(page: Pagination) -> FastAPI:
+    app = FastAPI()
+
+    async def default() -> PaginationProductWithRelationsRDTO:
+        return page
+
+    async def fast() -> PaginationProductWithRelationsRDTO:
+        return page
+
+    app.get("/default", response_model=PaginationProductWithRelationsRDTO)(default)
+    app.get(
+        "/fast", response_model=PaginationProductWithRelationsRDTO, response_class=FastJSONResponse
+    )(fast_response(fast))
+    return app
+
+
+async def measure(client: httpx.AsyncClient, name: str, per_page: int, repeat: int) -> bytes:
+    latencies: list[float] = []
+    body = b""
+    started_total = time.perf_counter()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        response = await client.get(f"/{name}")
+        latencies.append((time.perf_counter() - started) * 1000)
+        body = response.content
+    elapsed = time.perf_counter() - started_total
+
+    latencies.sort()
+    print(f"\n[{name}] элементов на странице: {per_page}, запросов: {repeat}")
+    print(
+        f"  Задержка, мс: p50={statistics.median(latencies):.2f} "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} max={latencies[-1]:.2f}"
+    )
+    print(f"  Пропускная способность: {repeat / elapsed:.1f} запр/с, {repeat * per_page / elapsed:.0f} элем/с")
+    print(f"  Размер ответа: {len(body) / 1024:.1f} КБ")
+    return body
+
+
+async def main(page_sizes: list[int], repeat: int) -> None:
+    for per_page in page_sizes:
+        app = build_app(build_page(per_page))
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            default_body = await measure(client, "default", per_page, repeat)
+            fast_body = await measure(client, "fast", per_page, repeat)
+        if httpx.Response(200, content=default_body).json() != httpx.Response(200, content=fast_body).json():
+            print("  ВНИМАНИЕ: ответы default и fast различаются")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение сериализации ответа со списком товаров")
+    parser.add_argument("--per-page", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.per_page, args.repeat))
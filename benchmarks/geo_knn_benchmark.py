@@ -0,0 +1,180 @@
+"""
+Бенчмарк поиска ближайших полей: расчёт на клиенте против KNN по GiST-индексу.
+
+Наполняет таблицу fields временными полями (по умолчанию 50 000) со строковыми
+координатами по территории Казахстана, выполняет поиск 20 ближайших к случайным
+точкам в нескольких режимах и выводит задержки (p50/p95/max) и план KNN-запроса.
+Временные поля удаляются после прогона.
+
+    client  - прежний способ: загрузка всех координат и расчёт расстояний в Python
+    scan    - ORDER BY ST_Distance(location, point) без использования индекса
+    knn     - field_geo_search.nearest: ORDER BY location <-> point (GiST)
+    radius  - field_geo_search.within: ST_DWithin в радиусе --radius метров + KNN
+
+Требуется применённая миграция b2d7e4a91c35 (location и GiST-индексы).
+
+Использование:
+    python -m benchmarks.geo_knn_benchmark
+    python -m benchmarks.geo_knn_benchmark --locations 50000 --repeat 50 --radius 3000
+"""
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, insert, select, text
+
+from app.adapters.filters.field.field_geo_search import field_geo_search
+from app.entities import FieldEntity
+from app.infrastructure.db import AsyncSessionLocal
+
+# Центры крупных городов: большая часть полей сосредоточена вокруг них
+CITY_CENTERS = [
+    (43.2383, 76.9454),  # Алматы
+    (51.1605, 71.4704),  # Астана
+    (42.3417, 69.5901),  # Шымкент
+    (49.8047, 73.1094),  # Караганда
+    (50.2839, 57.1669),  # Актобе
+]
+KAZAKHSTAN_BOUNDS = ((40.6, 55.4), (46.5, 87.3))
+LIMIT = 20
+EARTH_RADIUS_M = 6_371_000
+
+
+def random_location() -> tuple[float, float]:
+    if random.random() < 0.8:
+        lat, lng = random.choice(CITY_CENTERS)
+        return lat + random.gauss(0, 0.08), lng + random.gauss(0, 0.1)
+    (lat_min, lat_max), (lng_min, lng_max) = KAZAKHSTAN_BOUNDS
+    return random.uniform(lat_min, lat_max), random.uniform(lng_min, lng_max)
+
+
+async def seed(count: int, prefix: str) -> None:
+    """Вставляет временные поля пачками."""
+    batch_size = 5000
+    async with AsyncSessionLocal() as session:
+        for start in range(0, count, batch_size):
+            rows = []
+            for index in range(start, min(start + batch_size, count)):
+                lat, lng = random_location()
+                rows.append({
+                    "title_ru": f"Поле {index}",
+                    "value": f"{prefix}-{index}",
+                    "latitude": f"{lat:.6f}",
+                    "longitude": f"{lng:.6f}",
+                })
+            await session.execute(insert(FieldEntity), rows)
+            await session.commit()
+        await session.execute(text("ANALYZE fields"))
+        await session.commit()
+
+
+async def cleanup(prefix: str) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(FieldEntity).where(FieldEntity.value.like(f"{prefix}-%")))
+        await session.commit()
+
+
+def haversine(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    d_lat, d_lng = math.radians(lat2 - lat1), math.radians(lng2 - lng1)
+    a = (
+        math.sin(d_lat / 2) ** 2
+        + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(d_lng / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+async def client_side(session, lat: float, lng: float, radius: float) -> list[tuple[float, int]]:
+    result = await session.execute(
+        select(FieldEntity.id, FieldEntity.latitude, FieldEntity.longitude).where(
+            FieldEntity.deleted_at.is_(None)
+        )
+    )
+    distances = []
+    for field_id, latitude, longitude in result:
+        try:
+            distances.append((haversine(lat, lng, float(latitude), float(longitude)), field_id))
+        except (TypeError, ValueError):
+            continue
+    distances.sort()
+    return distances[:LIMIT]
+
+
+def scan_query(lat: float, lng: float, radius: float):
+    return (
+        select(FieldEntity.id, field_geo_search.distance(lat, lng).label("distance"))
+        .where(FieldEntity.location.is_not(None), FieldEntity.deleted_at.is_(None))
+        .order_by(text("distance"))
+        .limit(LIMIT)
+    )
+
+
+def knn_query(lat: float, lng: float, radius: float):
+    return (
+        select(FieldEntity.id, field_geo_search.distance(lat, lng).label("distance"))
+        .where(FieldEntity.deleted_at.is_(None))
+        .order_by(field_geo_search.nearest(lat, lng))
+        .limit(LIMIT)
+    )
+
+
+def radius_query(lat: float, lng: float, radius: float):
+    return knn_query(lat, lng, radius).where(field_geo_search.within(lat, lng, radius))
+
+
+async def measure(name: str, run, repeat: int, radius: float, build_query=None) -> None:
+    points = [random_location() for _ in range(repeat)]
+    latencies: list[float] = []
+    plan_lines: list[str] = []
+    async with AsyncSessionLocal() as session:
+        for lat, lng in points:
+            started = time.perf_counter()
+            await run(session, lat, lng, radius)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        if build_query is not None:
+            compiled = build_query(*points[0], radius).compile(compile_kwargs={"literal_binds": True})
+            plan = await session.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))
+            plan_lines = [row[0] for row in plan]
+
+    latencies.sort()
+    print(f"\n[{name}] запросов: {len(latencies)}")
+    print(
+        f"  Задержка, мс: p50={statistics.median(latencies):.2f} "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} max={latencies[-1]:.2f}"
+    )
+    if plan_lines:
+        print("  План запроса:")
+        for line in plan_lines[:12]:
+            print(f"    {line}")
+
+
+def sql_runner(build_query):
+    async def run(session, lat: float, lng: float, radius: float) -> None:
+        (await session.execute(build_query(lat, lng, radius))).all()
+    return run
+
+
+async def main(locations: int, repeat: int, radius: float) -> None:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    print(f"Наполнение {locations} полей...")
+    await seed(locations, prefix)
+    try:
+        await measure("client", client_side, max(repeat // 10, 3), radius)
+        await measure("scan", sql_runner(scan_query), repeat, radius, scan_query)
+        await measure("knn", sql_runner(knn_query), repeat, radius, knn_query)
+        await measure("radius", sql_runner(radius_query), repeat, radius, radius_query)
+    finally:
+        await cleanup(prefix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение способов поиска ближайших полей")
+    parser.add_argument("--locations", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--radius", type=float, default=5000, help="Радиус для режима radius, м")
+    args = parser.parse_args()
+    asyncio.run(main(args.locations, args.repeat, args.radius))
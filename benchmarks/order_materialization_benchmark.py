@@ -0,0 +1,219 @@
+"""
+Бенчмарк создания элементов крупного заказа и производной работы по ним.
+
+Создаёт временного пользователя и товар, затем для каждого заказа из --orders
+создаёт --items элементов в двух режимах и обрабатывает события outbox так же,
+как outbox worker (HandleOutboxEventCase):
+
+    per_item  - прежний способ: repository.create на каждый элемент (commit + refresh),
+                событие и его обработка на каждый элемент
+    batched   - repository.create_many: один пакетный INSERT и один commit,
+                одно событие на заказ с пакетной записью истории и кодов
+
+Для каждого режима выводит число SQL-запросов и commit на заказ и задержки
+(p50/p95/max) создания элементов и обработки событий. Заказы создаются
+последовательно, чтобы счётчики запросов относились к одному заказу.
+Временные данные удаляются после прогона.
+
+Использование:
+    python -m benchmarks.order_materialization_benchmark
+    python -m benchmarks.order_materialization_benchmark --orders 50 --items 100
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, event, select
+
+from app.adapters.repository.product_order_item.product_order_item_repository import ProductOrderItemRepository
+from app.entities import (
+    OutboxEventEntity,
+    ProductEntity,
+    ProductOrderEntity,
+    ProductOrderItemEntity,
+    UserEntity,
+)
+from app.events.entity_event.outbox_event.outbox_event import OutboxEventHandler
+from app.events.entity_event.product_order_item_event.product_order_item_event import (
+    ProductOrderItemEventHandler,
+)
+from app.infrastructure.db import AsyncSessionLocal, engine_async
+from app.shared.db_value_constants import DbValueConstants
+from app.use_case.outbox_event.consumer.handle_outbox_event_case import HandleOutboxEventCase
+
+
+class QueryCounter:
+    """Счётчик SQL-запросов и commit движка."""
+
+    def __init__(self) -> None:
+        self.statements = 0
+        self.commits = 0
+        event.listen(engine_async.sync_engine, "before_cursor_execute", self.on_statement)
+        event.listen(engine_async.sync_engine, "commit", self.on_commit)
+
+    def on_statement(self, *args) -> None:
+        self.statements += 1
+
+    def on_commit(self, *args) -> None:
+        self.commits += 1
+
+    def reset(self) -> None:
+        self.statements = 0
+        self.commits = 0
+
+
+async def create_fixture(prefix: str) -> tuple[int, int]:
+    """Создаёт временного пользователя и товар."""
+    async with AsyncSessionLocal() as session:
+        user = UserEntity(
+            first_name="Benchmark",
+            last_name="Benchmark",
+            email=f"{prefix}@example.com",
+            phone=prefix,
+            username=prefix,
+        )
+        product = ProductEntity(
+            title_ru=f"Benchmark {prefix}",
+            value=prefix,
+            sku=prefix.upper(),
+            base_price=1000,
+            stock=0,
+        )
+        session.add_all([user, product])
+        await session.commit()
+        return user.id, product.id
+
+
+async def drop_fixture(user_id: int, product_id: int, order_ids: list[int]) -> None:
+    """Удаляет временные заказы (элементы, история и коды удаляются каскадом), события, товар и пользователя."""
+    async with AsyncSessionLocal() as session:
+        if order_ids:
+            await session.execute(
+                delete(OutboxEventEntity).where(
+                    OutboxEventEntity.event_type.like("product_order_item.%"),
+                    OutboxEventEntity.aggregate_id.in_(order_ids),
+                )
+            )
+        await session.execute(delete(ProductOrderEntity).where(ProductOrderEntity.user_id == user_id))
+        await session.execute(delete(ProductEntity).where(ProductEntity.id == product_id))
+        await session.execute(delete(UserEntity).where(UserEntity.id == user_id))
+        await session.commit()
+
+
+async def create_order(user_id: int) -> int:
+    async with AsyncSessionLocal() as session:
+        order = ProductOrderEntity(
+            user_id=user_id,
+            status_id=DbValueConstants.ProductOrderStatusCreatedAwaitingPaymentID,
+            total_price=0,
+        )
+        session.add(order)
+        await session.commit()
+        return order.id
+
+
+def build_items(order_id: int, product_id: int, items: int) -> list[ProductOrderItemEntity]:
+    return [
+        ProductOrderItemEntity(
+            order_id=order_id,
+            status_id=DbValueConstants.ProductOrderItemStatusCreatedAwaitingPaymentID,
+            product_id=product_id,
+            qty=1 + index % 3,
+            product_price=1000,
+            delta_price=0,
+        )
+        for index in range(items)
+    ]
+
+
+async def per_item_create(order_id: int, product_id: int, items: int) -> None:
+    async with AsyncSessionLocal() as session:
+        repository = ProductOrderItemRepository(session)
+        for item in build_items(order_id, product_id, items):
+            await repository.create(item)
+
+
+async def batched_create(order_id: int, product_id: int, items: int) -> None:
+    async with AsyncSessionLocal() as session:
+        await ProductOrderItemRepository(session).create_many(build_items(order_id, product_id, items))
+
+
+async def process_events(order_id: int) -> int:
+    """Обрабатывает события заказа так же, как outbox worker; возвращает их число."""
+    async with AsyncSessionLocal() as session:
+        event_ids = (
+            await session.scalars(
+                select(OutboxEventEntity.id).where(
+                    OutboxEventEntity.aggregate_id == order_id,
+                    OutboxEventEntity.event_type.like("product_order_item.%"),
+                    OutboxEventEntity.processed_at.is_(None),
+                )
+            )
+        ).all()
+    for event_id in event_ids:
+        async with AsyncSessionLocal() as session:
+            await HandleOutboxEventCase(session).execute({"id": event_id})
+    return len(event_ids)
+
+
+def percentiles(values: list[float]) -> str:
+    values = sorted(values)
+    p95 = values[max(int(len(values) * 0.95) - 1, 0)]
+    return f"p50={statistics.median(values):.2f} p95={p95:.2f} max={values[-1]:.2f}"
+
+
+async def run_mode(name, create, counter, user_id, product_id, orders, items, order_ids):
+    """Запускает один режим и печатает отчёт."""
+    create_latencies: list[float] = []
+    process_latencies: list[float] = []
+    create_statements = process_statements = create_commits = process_commits = events = 0
+
+    for _ in range(orders):
+        order_id = await create_order(user_id)
+        order_ids.append(order_id)
+
+        counter.reset()
+        started = time.perf_counter()
+        await create(order_id, product_id, items)
+        create_latencies.append((time.perf_counter() - started) * 1000)
+        create_statements += counter.statements
+        create_commits += counter.commits
+
+        counter.reset()
+        started = time.perf_counter()
+        events += await process_events(order_id)
+        process_latencies.append((time.perf_counter() - started) * 1000)
+        process_statements += counter.statements
+        process_commits += counter.commits
+
+    print(f"\n[{name}]")
+    print(f"  Заказов:                 {orders} по {items} элементов")
+    print(f"  Событий outbox на заказ: {events / orders:.1f}")
+    print(f"  Создание, запросов:      {create_statements / orders:.1f} на заказ, commit: {create_commits / orders:.1f}")
+    print(f"  Обработка, запросов:     {process_statements / orders:.1f} на заказ, commit: {process_commits / orders:.1f}")
+    print(f"  Создание, мс:            {percentiles(create_latencies)}")
+    print(f"  Обработка, мс:           {percentiles(process_latencies)}")
+
+
+async def main(orders: int, items: int) -> None:
+    ProductOrderItemEventHandler.register(ProductOrderItemEntity)
+    OutboxEventHandler.register_session_events()
+    counter = QueryCounter()
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    user_id, product_id = await create_fixture(prefix)
+    order_ids: list[int] = []
+    try:
+        await run_mode("per_item", per_item_create, counter, user_id, product_id, orders, items, order_ids)
+        await run_mode("batched", batched_create, counter, user_id, product_id, orders, items, order_ids)
+    finally:
+        await drop_fixture(user_id, product_id, order_ids)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Создание элементов крупных заказов")
+    parser.add_argument("--orders", type=int, default=20)
+    parser.add_argument("--items", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.orders, args.items))
@@ -0,0 +1,125 @@
+"""
+Бенчмарк поиска товаров: ILIKE по восьми столбцам против tsvector + pg_trgm.
+
+Наполняет таблицу products временными товарами (по умолчанию 100 000),
+выполняет набор поисковых запросов в двух режимах и выводит задержки (p50/p95/max)
+и план выполнения одного запроса. Временные товары удаляются после прогона.
+
+    ilike  - прежний фильтр: OR(col ILIKE '%term%') по title_*, description_*, sku, value
+    fts    - product_search: tsvector с префиксами + trigram по названиям и SKU, ранжирование
+
+Требуется применённая миграция 7b3e9d1f2a64 (search_vector и GIN-индексы).
+
+Использование:
+    python -m benchmarks.product_search_benchmark
+    python -m benchmarks.product_search_benchmark --products 100000 --repeat 20
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, insert, or_, select, text
+
+from app.adapters.filters.product.product_search import product_search
+from app.entities import ProductEntity
+from app.infrastructure.db import AsyncSessionLocal
+
+WORDS_RU = ["мяч", "кроссовки", "футболка", "шорты", "гетры", "бутсы", "перчатки", "форма", "шарф", "кепка"]
+WORDS_EN = ["ball", "sneakers", "shirt", "shorts", "socks", "boots", "gloves", "kit", "scarf", "cap"]
+BRANDS = ["Кайрат", "Астана", "Тобол", "Ордабасы", "Актобе", "Jankuier", "Nike", "Adidas", "Puma", "Joma"]
+QUERIES = ["мяч", "крос", "футболки кайрат", "boots", "Jankuier", "перчатки вратаря", "scarf astana", "ша"]
+SEARCH_COLUMNS = [
+    "title_ru", "title_kk", "title_en", "description_ru",
+    "description_kk", "description_en", "sku", "value",
+]
+
+
+async def seed(count: int, prefix: str) -> None:
+    """Вставляет временные товары пачками."""
+    batch_size = 5000
+    async with AsyncSessionLocal() as session:
+        for start in range(0, count, batch_size):
+            rows = []
+            for index in range(start, min(start + batch_size, count)):
+                word_ru, word_en, brand = random.choice(WORDS_RU), random.choice(WORDS_EN), random.choice(BRANDS)
+                rows.append({
+                    "title_ru": f"{word_ru.capitalize()} {brand} {index}",
+                    "title_kk": f"{brand} {word_ru} {index}",
+                    "title_en": f"{brand} {word_en} {index}",
+                    "description_ru": f"Официальный {word_ru} клуба {brand}. Подходит для тренировок и матчей.",
+                    "description_en": f"Official {brand} {word_en} for training and matchdays.",
+                    "value": f"{prefix}-{index}",
+                    "sku": f"{prefix.upper()}-{index:06d}",
+                    "base_price": random.randint(1000, 60000),
+                    "stock": random.randint(0, 100),
+                })
+            await session.execute(insert(ProductEntity), rows)
+            await session.commit()
+        await session.execute(text("ANALYZE products"))
+        await session.commit()
+
+
+async def cleanup(prefix: str) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(ProductEntity).where(ProductEntity.value.like(f"{prefix}-%")))
+        await session.commit()
+
+
+def ilike_query(search: str):
+    condition = or_(*[getattr(ProductEntity, column).ilike(f"%{search}%") for column in SEARCH_COLUMNS])
+    return select(ProductEntity.id).where(condition, ProductEntity.deleted_at.is_(None)).order_by(ProductEntity.id).limit(20)
+
+
+def fts_query(search: str):
+    return (
+        select(ProductEntity.id)
+        .where(product_search.filter(search), ProductEntity.deleted_at.is_(None))
+        .order_by(product_search.rank(search).desc(), ProductEntity.id)
+        .limit(20)
+    )
+
+
+async def measure(name: str, build_query, repeat: int) -> None:
+    latencies: list[float] = []
+    async with AsyncSessionLocal() as session:
+        for _ in range(repeat):
+            for search in QUERIES:
+                started = time.perf_counter()
+                await session.execute(build_query(search))
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        compiled = build_query(QUERIES[1]).compile(compile_kwargs={"literal_binds": True})
+        plan = await session.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))
+        plan_lines = [row[0] for row in plan]
+
+    latencies.sort()
+    print(f"\n[{name}] запросов: {len(latencies)}")
+    print(
+        f"  Задержка, мс: p50={statistics.median(latencies):.2f} "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} max={latencies[-1]:.2f}"
+    )
+    print("  План запроса:")
+    for line in plan_lines[:12]:
+        print(f"    {line}")
+
+
+async def main(products: int, repeat: int) -> None:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    print(f"Наполнение {products} товаров...")
+    await seed(products, prefix)
+    try:
+        await measure("ilike", ilike_query, repeat)
+        await measure("fts", fts_query, repeat)
+    finally:
+        await cleanup(prefix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение ILIKE и полнотекстового поиска товаров")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.products, args.repeat))
@@ -0,0 +1,182 @@
+"""
+Бенчмарк списков товаров и полей: ORM + from_orm против выборки проекцией.
+
+Наполняет таблицы products и fields временными записями (по умолчанию по 20 000)
+с главными изображениями, запрашивает страницы списка в трёх режимах и выводит
+задержку (p50/p95/max), процессорное время и объём выделенной памяти на элемент.
+Временные записи удаляются после прогона.
+
+    orm         - прежний способ: paginate + selectinload связей + DTO.from_orm
+    projection  - paginate_projected: столбцы DTO и LEFT JOIN связей, DTO из словарей
+    dict        - paginate_projected(as_dict=True): словари без валидации DTO
+
+Использование:
+    python -m benchmarks.projection_list_benchmark
+    python -m benchmarks.projection_list_benchmark --rows 20000 --per-page 100 --repeat 30
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+import uuid
+
+from sqlalchemy import delete, insert, text
+
+from app.adapters.dto.field.field_dto import FieldWithRelationsRDTO
+from app.adapters.dto.product.product_dto import ProductWithRelationsRDTO
+from app.adapters.repository.field.field_repository import FieldRepository
+from app.adapters.repository.product.product_repository import ProductRepository
+from app.entities import FieldEntity, FileEntity, ProductEntity
+from app.infrastructure.db import AsyncSessionLocal
+
+IMAGES = 200
+
+
+async def seed(count: int, prefix: str) -> None:
+    """Вставляет временные изображения, товары и поля пачками."""
+    batch_size = 5000
+    async with AsyncSessionLocal() as session:
+        image_ids = list(
+            (
+                await session.execute(
+                    insert(FileEntity).returning(FileEntity.id),
+                    [
+                        {
+                            "filename": f"{prefix}-{index}.jpg",
+                            "file_path": f"static/upload/{prefix}/{index}.jpg",
+                            "file_size": 150_000,
+                            "content_type": "image/jpeg",
+                        }
+                        for index in range(IMAGES)
+                    ],
+                )
+            ).scalars()
+        )
+        for start in range(0, count, batch_size):
+            indexes = range(start, min(start + batch_size, count))
+            await session.execute(insert(ProductEntity), [
+                {
+                    "title_ru": f"Товар {index}",
+                    "description_ru": "Официальная продукция клуба. Подходит для тренировок и матчей.",
+                    "value": f"{prefix}-{index}",
+                    "sku": f"{prefix.upper()}-{index:06d}",
+                    "base_price": random.randint(1000, 60000),
+                    "stock": random.randint(0, 100),
+                    "image_id": random.choice(image_ids),
+                }
+                for index in indexes
+            ])
+            await session.execute(insert(FieldEntity), [
+                {
+                    "title_ru": f"Поле {index}",
+                    "description_ru": "Искусственный газон, раздевалки, освещение.",
+                    "value": f"{prefix}-{index}",
+                    "address_ru": f"ул. Абая, {index}",
+                    "phone": "+77001234567",
+                    "image_id": random.choice(image_ids),
+                }
+                for index in indexes
+            ])
+            await session.commit()
+        await session.execute(text("ANALYZE products"))
+        await session.execute(text("ANALYZE fields"))
+        await session.commit()
+
+
+async def cleanup(prefix: str) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(ProductEntity).where(ProductEntity.value.like(f"{prefix}-%")))
+        await session.execute(delete(FieldEntity).where(FieldEntity.value.like(f"{prefix}-%")))
+        await session.execute(delete(FileEntity).where(FileEntity.filename.like(f"{prefix}-%")))
+        await session.commit()
+
+
+def list_runner(repository_class, dto, mode: str, prefix: str, per_page: int):
+    async def run(session, page: int) -> int:
+        repository = repository_class(session)
+        filters = [repository.model.value.like(f"{prefix}-%")]
+        if mode == "orm":
+            pagination = await repository.paginate(
+                dto=dto,
+                page=page,
+                per_page=per_page,
+                filters=filters,
+                options=repository.default_relationships(),
+                order_by="id",
+            )
+        else:
+            pagination = await repository.paginate_projected(
+                dto=dto,
+                page=page,
+                per_page=per_page,
+                filters=filters,
+                order_by="id",
+                as_dict=mode == "dict",
+            )
+        return len(pagination.items)
+    return run
+
+
+async def measure(name: str, run, repeat: int, pages: int) -> None:
+    latencies: list[float] = []
+    cpu_time = 0.0
+    items = 0
+    # Отдельная сессия на запрос: identity map не переиспользуется между страницами
+    for _ in range(repeat):
+        page = random.randint(1, pages)
+        async with AsyncSessionLocal() as session:
+            started, started_cpu = time.perf_counter(), time.process_time()
+            items += await run(session, page)
+            cpu_time += time.process_time() - started_cpu
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    allocated = 0
+    traced_items = 0
+    for _ in range(max(repeat // 5, 3)):
+        async with AsyncSessionLocal() as session:
+            tracemalloc.start()
+            traced_items += await run(session, random.randint(1, pages))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            allocated += peak
+
+    latencies.sort()
+    print(f"\n[{name}] запросов: {len(latencies)}, элементов: {items}")
+    print(
+        f"  Задержка, мс: p50={statistics.median(latencies):.2f} "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1]:.2f} max={latencies[-1]:.2f}"
+    )
+    print(f"  CPU на элемент, мкс: {cpu_time / max(items, 1) * 1_000_000:.1f}")
+    print(f"  Пик памяти на элемент, КБ: {allocated / max(traced_items, 1) / 1024:.2f}")
+
+
+async def main(rows: int, per_page: int, repeat: int) -> None:
+    prefix = f"bench-{uuid.uuid4().hex[:8]}"
+    pages = max(rows // per_page, 1)
+    print(f"Наполнение {rows} товаров и {rows} полей...")
+    await seed(rows, prefix)
+    try:
+        for title, repository_class, dto in (
+            ("products", ProductRepository, ProductWithRelationsRDTO),
+            ("fields", FieldRepository, FieldWithRelationsRDTO),
+        ):
+            for mode in ("orm", "projection", "dict"):
+                await measure(
+                    f"{title}/{mode}",
+                    list_runner(repository_class, dto, mode, prefix, per_page),
+                    repeat,
+                    pages,
+                )
+    finally:
+        await cleanup(prefix)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сравнение ORM-списков и выборки проекцией")
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.per_page, args.repeat))
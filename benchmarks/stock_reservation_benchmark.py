@@ -0,0 +1,174 @@
+"""
+Бенчмарк конкурентного списания остатков (симуляция флеш-распродажи).
+
+Создаёт временный товар с одним вариантом и ограниченным остатком, затем
+запускает N параллельных покупателей (у каждого своя сессия БД) в двух режимах:
+
+    naive   - чтение остатка и запись нового значения (как раньше, без резерва)
+    atomic  - условный UPDATE из ProductStockReservationRepository.decrement_stock
+
+Для каждого режима выводит число успешных покупок, перепроданное количество,
+итоговый остаток и задержки (p50/p95/max). После прогона временные данные удаляются.
+
+Использование:
+    python -m benchmarks.stock_reservation_benchmark
+    python -m benchmarks.stock_reservation_benchmark --buyers 500 --stock 50
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from sqlalchemy import delete, select, update
+
+from app.adapters.repository.product_stock_reservation.product_stock_reservation_repository import (
+    ProductStockReservationRepository,
+)
+from app.entities import ProductEntity, ProductVariantEntity
+from app.infrastructure.db import AsyncSessionLocal
+
+
+async def create_fixture(stock: int) -> tuple[int, int]:
+    """Создаёт временный товар и вариант с заданным остатком."""
+    suffix = uuid.uuid4().hex[:12]
+    async with AsyncSessionLocal() as session:
+        product = ProductEntity(
+            title_ru=f"Benchmark {suffix}",
+            value=f"benchmark-{suffix}",
+            sku=f"BENCH-{suffix}",
+            base_price=1000,
+            stock=stock,
+        )
+        session.add(product)
+        await session.flush()
+        variant = ProductVariantEntity(
+            product_id=product.id,
+            title_ru=f"Benchmark variant {suffix}",
+            value=f"benchmark-variant-{suffix}",
+            stock=stock,
+        )
+        session.add(variant)
+        await session.commit()
+        return product.id, variant.id
+
+
+async def reset_stock(product_id: int, variant_id: int, stock: int) -> None:
+    """Возвращает остатки к исходному значению между прогонами."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(
+            update(ProductEntity).where(ProductEntity.id == product_id).values(stock=stock)
+        )
+        await session.execute(
+            update(ProductVariantEntity)
+            .where(ProductVariantEntity.id == variant_id)
+            .values(stock=stock)
+        )
+        await session.commit()
+
+
+async def drop_fixture(product_id: int) -> None:
+    """Удаляет временный товар (вариант удаляется каскадом)."""
+    async with AsyncSessionLocal() as session:
+        await session.execute(delete(ProductEntity).where(ProductEntity.id == product_id))
+        await session.commit()
+
+
+async def naive_buyer(product_id: int, variant_id: int) -> bool:
+    """Покупка через чтение остатка и запись вычисленного значения."""
+    async with AsyncSessionLocal() as session:
+        variant_stock = await session.scalar(
+            select(ProductVariantEntity.stock).where(ProductVariantEntity.id == variant_id)
+        )
+        product_stock = await session.scalar(
+            select(ProductEntity.stock).where(ProductEntity.id == product_id)
+        )
+        if variant_stock < 1 or product_stock < 1:
+            return False
+        # Точка переключения: здесь другие покупатели успевают прочитать тот же остаток
+        await asyncio.sleep(0)
+        await session.execute(
+            update(ProductVariantEntity)
+            .where(ProductVariantEntity.id == variant_id)
+            .values(stock=variant_stock - 1)
+        )
+        await session.execute(
+            update(ProductEntity)
+            .where(ProductEntity.id == product_id)
+            .values(stock=product_stock - 1)
+        )
+        await session.commit()
+        return True
+
+
+async def atomic_buyer(product_id: int, variant_id: int) -> bool:
+    """Покупка через условное списание репозитория резервов."""
+    async with AsyncSessionLocal() as session:
+        repository = ProductStockReservationRepository(session)
+        if not await repository.decrement_stock(product_id, variant_id, 1):
+            await session.rollback()
+            return False
+        await session.commit()
+        return True
+
+
+async def run_mode(name, buyer, product_id, variant_id, buyers, stock, concurrency):
+    """Запускает один режим и печатает отчёт."""
+    await reset_stock(product_id, variant_id, stock)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    errors = 0
+
+    async def attempt() -> bool:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                return await buyer(product_id, variant_id)
+            except Exception:
+                errors += 1
+                return False
+            finally:
+                latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(attempt() for _ in range(buyers)))
+    elapsed = time.perf_counter() - started
+
+    async with AsyncSessionLocal() as session:
+        final_stock = await session.scalar(
+            select(ProductVariantEntity.stock).where(ProductVariantEntity.id == variant_id)
+        )
+
+    sold = sum(results)
+    latencies.sort()
+    p95 = latencies[max(int(len(latencies) * 0.95) - 1, 0)]
+    print(f"\n[{name}]")
+    print(f"  Покупателей:        {buyers} (параллельно {concurrency})")
+    print(f"  Успешных покупок:   {sold} из остатка {stock}")
+    print(f"  Перепродано:        {max(sold - stock, 0)}")
+    print(f"  Итоговый остаток:   {final_stock} (ожидается {max(stock - sold, 0)})")
+    print(f"  Ошибок:             {errors}")
+    print(
+        f"  Задержка, мс:       p50={statistics.median(latencies):.2f} "
+        f"p95={p95:.2f} max={latencies[-1]:.2f}"
+    )
+    print(f"  Общее время:        {elapsed:.2f} c")
+
+
+async def main(buyers: int, stock: int, concurrency: int) -> None:
+    product_id, variant_id = await create_fixture(stock)
+    try:
+        await run_mode("naive", naive_buyer, product_id, variant_id, buyers, stock, concurrency)
+        await run_mode("atomic", atomic_buyer, product_id, variant_id, buyers, stock, concurrency)
+    finally:
+        await drop_fixture(product_id)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Флеш-распродажа одного варианта")
+    parser.add_argument("--buyers", type=int, default=200)
+    parser.add_argument("--stock", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.buyers, args.stock, args.concurrency))
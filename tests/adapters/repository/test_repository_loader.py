@@ -0,0 +1,106 @@
+"""
+RepositoryLoader: пакетная загрузка по ID и инвалидация кеша загрузчика.
+
+Найденные записи запоминаются до конца запроса, промахи - нет (запись,
+созданная позже в этой же сессии, будет найдена), rollback сессии сбрасывает кеш.
+"""
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+from app.adapters.repository.repository_loader import RepositoryLoader
+
+pytestmark = pytest.mark.asyncio
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class LoaderItemEntity(Base):
+    __tablename__ = "loader_items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    deleted_at: Mapped[datetime | None]
+
+
+@pytest.fixture
+def table(db, mocker):
+    """Строки "таблицы" по ID; db.execute возвращает строки, запрошенные в WHERE id IN (...)."""
+    rows: dict[int, LoaderItemEntity] = {}
+
+    async def execute(statement):
+        requested = next(value for value in statement.compile().params.values() if isinstance(value, list))
+        found = [rows[id] for id in requested if id in rows]
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: found))
+
+    db.execute = mocker.AsyncMock(side_effect=execute)
+    return rows
+
+
+def loader(db, include_deleted: bool = False) -> RepositoryLoader:
+    return RepositoryLoader.for_session(LoaderItemEntity, db, include_deleted=include_deleted)
+
+
+async def test_loads_of_one_tick_are_batched(db, table):
+    table.update({1: LoaderItemEntity(id=1), 2: LoaderItemEntity(id=2)})
+
+    first, second, again = await asyncio.gather(loader(db).load(1), loader(db).load(2), loader(db).load(2))
+
+    assert (first, second, again) == (table[1], table[2], table[2])
+    db.execute.assert_awaited_once()
+
+
+async def test_found_record_is_cached(db, table):
+    table[1] = LoaderItemEntity(id=1)
+
+    assert await loader(db).load(1) is table[1]
+    assert await loader(db).load(1) is table[1]
+
+    db.execute.assert_awaited_once()
+
+
+async def test_miss_is_not_cached(db, table):
+    assert await loader(db).load(3) is None
+
+    # Запись создана позже в этой же сессии (например, пакетным INSERT мимо ORM)
+    table[3] = LoaderItemEntity(id=3)
+
+    assert await loader(db).load(3) is table[3]
+    assert db.execute.await_count == 2
+
+
+async def test_rollback_clears_loaders(db, table):
+    table[1] = LoaderItemEntity(id=1)
+    before_rollback = loader(db)
+    await before_rollback.load(1)
+
+    RepositoryLoader.after_rollback(SimpleNamespace(info=db.info))
+
+    assert loader(db) is not before_rollback
+    assert await loader(db).load(1) is table[1]
+    assert db.execute.await_count == 2
+
+
+async def test_soft_deleted_record_is_hidden_without_query(db, table):
+    table[1] = LoaderItemEntity(id=1)
+    item = await loader(db).load(1)
+    await loader(db, include_deleted=True).load(1)
+
+    item.deleted_at = datetime.now()
+
+    assert await loader(db).load(1) is None
+    assert await loader(db, include_deleted=True).load(1) is item
+    assert db.execute.await_count == 2
+
+
+async def test_query_error_reaches_every_waiting_load(db, table):
+    db.execute.side_effect = ConnectionError("connection lost")
+
+    results = await asyncio.gather(loader(db).load(1), loader(db).load(2), return_exceptions=True)
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+    db.execute.assert_awaited_once()
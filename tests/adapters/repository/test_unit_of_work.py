@@ -0,0 +1,94 @@
+"""
+UnitOfWork: записи репозиториев внутри блока фиксируются одним commit,
+а при любой ошибке откатываются целиком одним rollback.
+"""
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.adapters.repository.base_repository import BaseRepository
+from app.adapters.repository.unit_of_work import UnitOfWork
+from app.entities import CartItemEntity
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_block_is_committed_once(db):
+    async with UnitOfWork(db):
+        assert UnitOfWork.is_active(db)
+
+    db.commit.assert_awaited_once()
+    db.rollback.assert_not_awaited()
+    assert not UnitOfWork.is_active(db)
+
+
+async def test_error_rolls_back_block(db):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(db):
+            raise RuntimeError("step failed")
+
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_awaited()
+    assert not UnitOfWork.is_active(db)
+
+
+async def test_commit_failure_rolls_back_and_raises(db):
+    db.commit.side_effect = ConnectionError("connection lost")
+
+    with pytest.raises(ConnectionError):
+        async with UnitOfWork(db):
+            pass
+
+    db.rollback.assert_awaited_once()
+
+
+async def test_nested_block_joins_outer_transaction(db):
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(db):
+            async with UnitOfWork(db):
+                pass
+            db.commit.assert_not_awaited()
+            async with UnitOfWork(db):
+                raise RuntimeError("inner step failed")
+
+    db.commit.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+
+
+async def test_repository_writes_flush_inside_block(db):
+    repository = BaseRepository(CartItemEntity, db)
+    cart_item = SimpleNamespace(qty=1)
+
+    async with UnitOfWork(db):
+        await repository.update(obj=cart_item, dto={"qty": 2})
+        db.commit.assert_not_awaited()
+
+    assert cart_item.qty == 2
+    db.flush.assert_awaited_once()
+    db.refresh.assert_not_awaited()
+    db.commit.assert_awaited_once()
+
+
+async def test_repository_error_rolls_back_whole_block_once(db):
+    repository = BaseRepository(CartItemEntity, db)
+    db.flush.side_effect = [None, IntegrityError("UPDATE", {}, Exception("duplicate key: uq_cart_items"))]
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork(db):
+            await repository.update(obj=SimpleNamespace(qty=1), dto={"qty": 2})
+            await repository.update(obj=SimpleNamespace(qty=1), dto={"qty": 3})
+
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+async def test_repository_commits_outside_block(db):
+    repository = BaseRepository(CartItemEntity, db)
+    cart_item = SimpleNamespace(qty=1)
+
+    await repository.update(obj=cart_item, dto={"qty": 2})
+
+    db.flush.assert_not_awaited()
+    db.commit.assert_awaited_once()
+    db.refresh.assert_awaited_once_with(cart_item)
@@ -0,0 +1,17 @@
+"""
+Общие фикстуры тестов.
+
+Тесты не подключаются к PostgreSQL и Redis: сессия базы заменяется mock-объектом,
+репозитории - mock-объектами с заданными ответами. Модули приложения читают
+настройки из .env, как и само приложение.
+"""
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+@pytest.fixture
+def db(mocker):
+    """Сессия без подключения к базе: фиксирует вызовы commit, rollback, flush и execute."""
+    session = mocker.MagicMock(spec=AsyncSession)
+    session.info = {}
+    return session
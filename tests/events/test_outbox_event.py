@@ -0,0 +1,57 @@
+"""
+Накопление событий outbox за flush: изменения строк одного агрегата дают одно
+событие, а откат транзакции не оставляет событий без изменений, которые их породили.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.events.entity_event.outbox_event import outbox_event
+from app.events.entity_event.outbox_event.outbox_event import OutboxEventHandler
+
+EVENT_TYPE = "order_item_changed"
+
+
+@pytest.fixture
+def session(mocker):
+    session = SimpleNamespace(info={}, connection=mocker.MagicMock())
+    mocker.patch.object(outbox_event, "object_session", return_value=session)
+    return session
+
+
+@pytest.fixture
+def add_many_statement(mocker):
+    return mocker.patch.object(outbox_event.OutboxEventRepository, "add_many_statement")
+
+
+def test_items_of_one_aggregate_are_written_as_one_event(session, add_many_statement):
+    for item_id in (1, 2, 3):
+        OutboxEventHandler.add(None, object(), EVENT_TYPE, aggregate_id=10, item={"id": item_id})
+    OutboxEventHandler.add(None, object(), EVENT_TYPE, aggregate_id=11, item={"id": 4})
+
+    OutboxEventHandler.after_flush(session, None)
+
+    (events,), _ = add_many_statement.call_args
+    assert [(event["aggregate_id"], event["payload"]["items"]) for event in events] == [
+        (10, [{"id": 1}, {"id": 2}, {"id": 3}]),
+        (11, [{"id": 4}]),
+    ]
+    session.connection.return_value.execute.assert_called_once_with(add_many_statement.return_value)
+
+
+def test_flush_writes_each_event_once(session, add_many_statement):
+    OutboxEventHandler.add(None, object(), EVENT_TYPE, aggregate_id=10, item={"id": 1})
+
+    OutboxEventHandler.after_flush(session, None)
+    OutboxEventHandler.after_flush(session, None)
+
+    add_many_statement.assert_called_once()
+
+
+def test_rollback_drops_pending_events(session, add_many_statement):
+    OutboxEventHandler.add(None, object(), EVENT_TYPE, aggregate_id=10, item={"id": 1})
+
+    OutboxEventHandler.after_rollback(session)
+    OutboxEventHandler.after_flush(session, None)
+
+    add_many_statement.assert_not_called()
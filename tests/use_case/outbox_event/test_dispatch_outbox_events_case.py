@@ -0,0 +1,75 @@
+"""
+Публикация событий outbox: отметка публикации фиксируется до отправки в шину,
+поэтому сбой после commit приводит к повторной публикации, а не к потере события.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.use_case.outbox_event.scheduler.dispatch_outbox_events_case import DispatchOutboxEventsCase
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def event_bus(mocker):
+    bus = mocker.MagicMock()
+    bus.publish = mocker.AsyncMock()
+    return bus
+
+
+@pytest.fixture
+def case(db, event_bus, mocker):
+    case = DispatchOutboxEventsCase(db, event_bus)
+    case.repository = mocker.MagicMock()
+    case.repository.claim_for_dispatch = mocker.AsyncMock(
+        return_value=[
+            SimpleNamespace(id=1, event_type="cart_item_changed", aggregate_id=3),
+            SimpleNamespace(id=2, event_type="order_item_changed", aggregate_id=4),
+        ]
+    )
+    return case
+
+
+async def test_claim_is_committed_before_publishing(case, db, event_bus, mocker):
+    calls = mocker.MagicMock()
+    calls.attach_mock(case.repository.claim_for_dispatch, "claim")
+    calls.attach_mock(db.commit, "commit")
+    calls.attach_mock(event_bus.publish, "publish")
+
+    assert await case.execute() == 2
+
+    assert [call[0] for call in calls.mock_calls] == ["claim", "commit", "publish"]
+    event_bus.publish.assert_awaited_once_with(
+        [
+            {"id": 1, "event_type": "cart_item_changed", "aggregate_id": 3},
+            {"id": 2, "event_type": "order_item_changed", "aggregate_id": 4},
+        ]
+    )
+
+
+async def test_publish_failure_leaves_claim_for_retry(case, db, event_bus):
+    event_bus.publish.side_effect = ConnectionError("broker is down")
+
+    with pytest.raises(ConnectionError):
+        await case.execute()
+
+    db.commit.assert_awaited_once()
+    db.rollback.assert_not_awaited()
+
+
+async def test_empty_batch_is_not_published(case, event_bus):
+    case.repository.claim_for_dispatch.return_value = []
+
+    assert await case.execute() == 0
+
+    event_bus.publish.assert_not_awaited()
+
+
+async def test_missing_event_bus_is_rejected_before_claim(case):
+    case.event_bus = None
+
+    with pytest.raises(RuntimeError):
+        await case.execute()
+
+    case.repository.claim_for_dispatch.assert_not_awaited()
@@ -0,0 +1,85 @@
+"""
+Идемпотентная обработка событий outbox: повторная доставка того же сообщения
+не повторяет производную работу, а событие с ошибкой остаётся для повтора.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from app.use_case.outbox_event.consumer.handle_outbox_event_case import HandleOutboxEventCase
+
+pytestmark = pytest.mark.asyncio
+
+EVENT_TYPE = "order_item_changed"
+
+
+class InMemoryOutboxRepository:
+    """Таблица outbox_events с семантикой lock_unprocessed и mark_failed репозитория."""
+
+    def __init__(self, *events: SimpleNamespace) -> None:
+        self.events = {event.id: event for event in events}
+
+    async def lock_unprocessed(self, id: int) -> SimpleNamespace | None:
+        event = self.events.get(id)
+        if event is None or event.processed_at is not None:
+            return None
+        return event
+
+    async def mark_failed(self, id: int, error: str) -> None:
+        self.events[id].last_error = error
+
+
+def outbox_event(id: int = 1, event_type: str = EVENT_TYPE) -> SimpleNamespace:
+    return SimpleNamespace(id=id, event_type=event_type, aggregate_id=5, processed_at=None, last_error=None)
+
+
+@pytest.fixture
+def handler(mocker):
+    handler_cls = mocker.MagicMock()
+    handler_cls.return_value.execute = mocker.AsyncMock()
+    return handler_cls
+
+
+@pytest.fixture
+def case(db, handler):
+    case = HandleOutboxEventCase(db)
+    case.repository = InMemoryOutboxRepository(outbox_event())
+    case.handlers = {EVENT_TYPE: handler}
+    return case
+
+
+async def test_redelivered_event_is_handled_once(case, db, handler):
+    message = {"id": 1, "event_type": EVENT_TYPE, "aggregate_id": 5}
+
+    assert await case.execute(message) is True
+    assert await case.execute(message) is False
+
+    handler.return_value.execute.assert_awaited_once()
+    assert case.repository.events[1].processed_at is not None
+    db.commit.assert_awaited_once()
+
+
+async def test_failed_event_is_kept_for_retry(case, db, handler):
+    message = {"id": 1, "event_type": EVENT_TYPE, "aggregate_id": 5}
+    handler.return_value.execute.side_effect = [RuntimeError("lock timeout"), None]
+
+    assert await case.execute(message) is False
+    event = case.repository.events[1]
+    assert event.processed_at is None
+    assert event.last_error == "lock timeout"
+    db.rollback.assert_awaited_once()
+
+    assert await case.execute(message) is True
+    assert event.processed_at is not None
+    assert event.last_error is None
+    assert handler.return_value.execute.await_count == 2
+
+
+async def test_unknown_event_type_is_not_processed(case, handler):
+    case.repository = InMemoryOutboxRepository(outbox_event(event_type="unknown"))
+
+    assert await case.execute({"id": 1}) is False
+
+    handler.return_value.execute.assert_not_awaited()
+    assert case.repository.events[1].processed_at is None
+    assert "unknown" in case.repository.events[1].last_error
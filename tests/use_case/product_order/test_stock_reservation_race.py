@@ -0,0 +1,162 @@
+"""
+Гонка резерва остатков между callback оплаты и возвратом резерва
+(отмена пользователем или планировщик просроченных заказов).
+
+Оба пути блокируют заказ (get_for_update) и меняют статус и резерв одной
+транзакцией, поэтому возвращённый резерв не списывается повторно, а оплата
+заказа без остатков не теряется.
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.shared.db_value_constants import DbValueConstants
+from app.use_case.product_order.client import accept_payment_product_order_case, cancel_or_delete_order_case
+from app.use_case.product_order.client.accept_payment_product_order_case import AcceptPaymentProductOrderCase
+from app.use_case.product_order.client.cancel_or_delete_order_case import CancelOrDeleteOrderCase
+
+pytestmark = pytest.mark.asyncio
+
+ORDER_ID = 1
+USER_ID = 7
+
+
+def awaiting_payment_order(status_id: int = DbValueConstants.ProductOrderStatusCreatedAwaitingPaymentID):
+    return SimpleNamespace(id=ORDER_ID, user_id=USER_ID, status_id=status_id)
+
+
+@pytest.fixture
+def accept_case(db, mocker):
+    mocker.patch.object(accept_payment_product_order_case, "FireBaseService")
+    for dto in ("PaymentTransactionCDTO", "ProductOrderCDTO", "ProductOrderItemCDTO"):
+        mocker.patch.object(accept_payment_product_order_case, dto)
+
+    case = AcceptPaymentProductOrderCase(db)
+    case.dto = mocker.MagicMock(order="ORDER-1", res_desc="OK")
+    case.paid = True
+    case.current_product_order = awaiting_payment_order()
+    case.payment_transaction_entity = SimpleNamespace(id=10)
+
+    case.product_order_repository = mocker.MagicMock()
+    case.product_order_repository.get_for_update = mocker.AsyncMock(return_value=[awaiting_payment_order()])
+    case.product_order_repository.update = mocker.AsyncMock(side_effect=lambda obj, dto: obj)
+    case.payment_transaction_repository = mocker.MagicMock()
+    case.payment_transaction_repository.update = mocker.AsyncMock(return_value=SimpleNamespace(id=10))
+    case.product_order_item_repository = mocker.MagicMock()
+    case.product_order_item_repository.get_with_filters = mocker.AsyncMock(return_value=[])
+    case.stock_reservation_repository = mocker.MagicMock()
+    case.stock_reservation_repository.commit_for_order = mocker.AsyncMock(return_value=2)
+    case.stock_reservation_repository.reacquire_for_order = mocker.AsyncMock(return_value=True)
+    case.firebase_service = mocker.MagicMock()
+    case.firebase_service.send_payment_product_successfull_notification = mocker.AsyncMock()
+    return case
+
+
+def updated_status(repository) -> int:
+    return repository.update.await_args.kwargs["dto"].status_id
+
+
+async def test_accept_commits_existing_reservation(accept_case, db):
+    await accept_case.transform()
+
+    accept_case.stock_reservation_repository.commit_for_order.assert_awaited_once_with(ORDER_ID)
+    accept_case.stock_reservation_repository.reacquire_for_order.assert_not_awaited()
+    assert updated_status(accept_case.product_order_repository) == DbValueConstants.ProductOrderStatusPaidID
+    assert updated_status(accept_case.payment_transaction_repository) == DbValueConstants.PaymentTransactionStatusPaidID
+    db.commit.assert_awaited_once()
+
+
+async def test_accept_reacquires_stock_when_reservation_was_released(accept_case, db):
+    accept_case.stock_reservation_repository.commit_for_order.return_value = 0
+
+    await accept_case.transform()
+
+    accept_case.stock_reservation_repository.reacquire_for_order.assert_awaited_once_with(ORDER_ID)
+    assert updated_status(accept_case.product_order_repository) == DbValueConstants.ProductOrderStatusPaidID
+    accept_case.firebase_service.send_payment_product_successfull_notification.assert_awaited_once()
+    db.commit.assert_awaited_once()
+
+
+async def test_accept_without_stock_cancels_order_awaiting_refund(accept_case, db):
+    accept_case.stock_reservation_repository.commit_for_order.return_value = 0
+    accept_case.stock_reservation_repository.reacquire_for_order.return_value = False
+
+    await accept_case.transform()
+
+    order_dto = accept_case.product_order_repository.update.await_args.kwargs["dto"]
+    assert order_dto.status_id == DbValueConstants.ProductOrderStatusCancelledAwaitingRefundID
+    assert order_dto.is_canceled is True
+    assert (
+        updated_status(accept_case.payment_transaction_repository)
+        == DbValueConstants.PaymentTransactionStatusAwaitingRefundID
+    )
+    accept_case.firebase_service.send_payment_product_successfull_notification.assert_not_awaited()
+    db.commit.assert_awaited_once()
+
+
+async def test_accept_skips_order_cancelled_before_lock(accept_case, db):
+    accept_case.product_order_repository.get_for_update.return_value = [
+        awaiting_payment_order(DbValueConstants.ProductOrderStatusCancelledID)
+    ]
+
+    await accept_case.transform()
+
+    accept_case.stock_reservation_repository.commit_for_order.assert_not_awaited()
+    accept_case.product_order_repository.update.assert_not_awaited()
+    accept_case.payment_transaction_repository.update.assert_not_awaited()
+
+
+@pytest.fixture
+def cancel_case(db, mocker):
+    mocker.patch.object(cancel_or_delete_order_case, "ProductOrderCDTO")
+
+    case = CancelOrDeleteOrderCase(db)
+    case.current_user = SimpleNamespace(id=USER_ID)
+    case.product_order_id = ORDER_ID
+    case.current_product_order = awaiting_payment_order()
+
+    case.product_order_repository = mocker.MagicMock()
+    case.product_order_repository.get_for_update = mocker.AsyncMock(return_value=[awaiting_payment_order()])
+    case.product_order_repository.update = mocker.AsyncMock()
+    case.product_order_item_repository = mocker.MagicMock()
+    case.product_order_item_repository.get_with_filters = mocker.AsyncMock(return_value=[])
+    case.stock_reservation_repository = mocker.MagicMock()
+    case.stock_reservation_repository.release_for_orders = mocker.AsyncMock(return_value=1)
+    return case
+
+
+async def test_cancel_updates_status_before_release_in_one_transaction(cancel_case, db, mocker):
+    calls = mocker.MagicMock()
+    calls.attach_mock(cancel_case.product_order_repository.update, "update_order")
+    calls.attach_mock(cancel_case.stock_reservation_repository.release_for_orders, "release")
+    calls.attach_mock(db.commit, "commit")
+
+    assert await cancel_case.transform() is True
+
+    assert [call[0] for call in calls.mock_calls] == ["update_order", "release", "commit"]
+    db.rollback.assert_not_awaited()
+
+
+async def test_cancel_release_failure_rolls_back_status(cancel_case, db):
+    cancel_case.stock_reservation_repository.release_for_orders.side_effect = RuntimeError("deadlock")
+
+    with pytest.raises(RuntimeError):
+        await cancel_case.transform()
+
+    cancel_case.product_order_repository.update.assert_awaited_once()
+    db.rollback.assert_awaited_once()
+    db.commit.assert_not_awaited()
+
+
+async def test_cancel_rejects_order_paid_before_lock(cancel_case, db):
+    cancel_case.product_order_repository.get_for_update.return_value = [
+        awaiting_payment_order(DbValueConstants.ProductOrderStatusPaidID)
+    ]
+
+    with pytest.raises(HTTPException):
+        await cancel_case.transform()
+
+    cancel_case.stock_reservation_repository.release_for_orders.assert_not_awaited()
+    cancel_case.product_order_repository.update.assert_not_awaited()
+    db.rollback.assert_awaited_once()